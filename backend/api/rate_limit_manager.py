@@ -1,52 +1,188 @@
+import asyncio
 import time
 import threading
+from typing import Any, Dict, Mapping, Tuple
 from backend.utils.logger import setup_logger
 
 logger = setup_logger()
 
+# 요청 우선순위 (숫자가 작을수록 우선)
+PRIORITY_HIGH = 0    # 주문/청산
+PRIORITY_NORMAL = 1  # 캔들 조회 등 일반 요청
+PRIORITY_LOW = 2     # 랭킹/분석용 대량 조회 (weight 40 티커 등)
+
+_PRIORITY_NAMES = {"high": PRIORITY_HIGH, "normal": PRIORITY_NORMAL, "low": PRIORITY_LOW}
+
+# 우선순위별 예약 비율: 버킷 잔량이 (weight + 용량 x 비율) 이상일 때만 소비 가능
+_RESERVE_RATIO = {PRIORITY_HIGH: 0.0, PRIORITY_NORMAL: 0.05, PRIORITY_LOW: 0.2}
+
+# 응답 헤더 → 버킷
+_HEADER_BUCKETS = {
+    "x-mbx-used-weight-1m": "general",
+    "x-mbx-order-count-10s": "orders",
+    "x-mbx-order-count-1m": "orders_1m",
+}
+
+
+class _TokenBucket:
+    """토큰 버킷 (용량 limit, window초에 걸쳐 연속 충전, O(1) 계산)"""
+
+    __slots__ = ("capacity", "rate", "tokens", "updated")
+
+    def __init__(self, limit: int, window: float):
+        self.capacity = float(limit)
+        self.rate = limit / window  # 초당 충전량
+        self.tokens = float(limit)
+        self.updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        if now > self.updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+    def wait_time(self, need: float) -> float:
+        """need만큼 모이기까지 남은 시간 (refill 이후 호출)"""
+        need = min(need, self.capacity)
+        return 0.0 if self.tokens >= need else (need - self.tokens) / self.rate
+
+
 class RateLimitManager:
-    """바이낸스 API Rate Limit 관리"""
-    
+    """
+    바이낸스 API Rate Limit 관리 (카테고리별 토큰 버킷)
+
+    - general: 60초당 2400 weight (X-MBX-USED-WEIGHT-1M)
+    - orders: 주문 1건 = general 1 + 10초당 300건(X-MBX-ORDER-COUNT-10S) + 60초당 1200건(X-MBX-ORDER-COUNT-1M)
+    - 락 안에서는 잔량 계산만 하고 대기는 락 밖에서 수행 (대기 중인 호출이 다른 스레드를 막지 않음)
+    - 우선순위: general 버킷의 일부를 우선순위별로 예약 (low 20%, normal 5%)
+      → weight 40 티커 갱신 등 low 요청이 버킷을 소진해도 주문(high)은 예약분으로 즉시 통과
+    - 응답 헤더로 서버 기준 사용량을 동기화하고, 429/418 응답 시 Retry-After 동안 전체 차단
+    """
+
     def __init__(self):
         self._lock = threading.Lock()
-        # Weight 기반 Rate Limit
         self._weight_limits = {
             "general": {"limit": 2400, "window": 60},  # 60초당 2400 Weight
-            "orders": {"limit": 300, "window": 10},    # 10초당 300 Weight
+            "orders": {"limit": 300, "window": 10},    # 10초당 300 주문
+            "orders_1m": {"limit": 1200, "window": 60},  # 60초당 1200 주문
+        }
+        self._buckets: Dict[str, _TokenBucket] = {
+            name: _TokenBucket(info["limit"], info["window"])
+            for name, info in self._weight_limits.items()
         }
-        self._weight_counts = {category: [] for category in self._weight_limits}
-    
-    def wait_for_permission(self, category: str = "general", weight: int = 1):
-        """Rate Limit을 확인하고 필요시 대기합니다."""
+        self._blocked_until = 0.0  # monotonic 기준 전체 차단 종료 시각 (429/418)
+
+        # 상태 카운터 (모니터링용)
+        self.waits = {PRIORITY_HIGH: 0, PRIORITY_NORMAL: 0, PRIORITY_LOW: 0}
+
+    @staticmethod
+    def _buckets_for(category: str) -> Tuple[str, ...]:
+        if category == "orders":
+            return ("general", "orders", "orders_1m")
+        return ("general",)
+
+    @staticmethod
+    def _resolve_priority(category: str, priority) -> int:
+        if priority is None:
+            return PRIORITY_HIGH if category == "orders" else PRIORITY_NORMAL
+        if isinstance(priority, str):
+            return _PRIORITY_NAMES[priority]
+        return int(priority)
+
+    def _try_acquire(self, category: str, weight: int, priority: int) -> float:
+        """잔량이 충분하면 소비 후 0, 아니면 재시도까지 대기할 시간(초) 반환. 락 안에서 호출."""
+        now = time.monotonic()
+        if now < self._blocked_until:
+            return self._blocked_until - now
+
+        names = self._buckets_for(category)
+        wait = 0.0
+        for name in names:
+            bucket = self._buckets[name]
+            bucket.refill(now)
+            reserve = bucket.capacity * _RESERVE_RATIO[priority] if name == "general" else 0.0
+            wait = max(wait, bucket.wait_time(weight + reserve))
+        if wait > 0:
+            return wait
+
+        for name in names:
+            self._buckets[name].tokens -= weight if name == "general" else 1
+        return 0.0
+
+    def wait_for_permission(self, category: str = "general", weight: int = 1, priority=None):
+        """Rate Limit을 확인하고 필요시 대기합니다 (대기는 락 밖에서 수행)."""
+        prio = self._resolve_priority(category, priority)
         with self._lock:
-            now = time.time()
-            limit_info = self._weight_limits.get(category, self._weight_limits["general"])
-            weight_list = self._weight_counts[category]
-            
-            # 오래된 기록 제거
-            window_start = now - limit_info["window"]
-            self._weight_counts[category] = [w for w in weight_list if w > window_start]
-            
-            # 현재 Weight 합계 계산
-            current_weight = sum(1 for _ in self._weight_counts[category])
-            
-            # Limit 초과 시 대기
-            if current_weight + weight > limit_info["limit"]:
-                if weight_list:
-                    sleep_time = weight_list[0] + limit_info["window"] - now + 0.1
-                    if sleep_time > 0:
-                        logger.debug(f"Rate Limit 대기: {sleep_time:.2f}초")
-                        time.sleep(sleep_time)
-                        # 다시 오래된 기록 제거
-                        now = time.time()
-                        window_start = now - limit_info["window"]
-                        self._weight_counts[category] = [w for w in self._weight_counts[category] if w > window_start]
-            
-            # Weight 기록 추가
-            for _ in range(weight):
-                self._weight_counts[category].append(now)
+            wait = self._try_acquire(category, weight, prio)
+            if wait > 0:
+                self.waits[prio] += 1
+        while wait > 0:
+            logger.debug(f"Rate Limit 대기: {wait:.2f}초 ({category}, weight={weight})")
+            time.sleep(min(wait, 1.0))
+            with self._lock:
+                wait = self._try_acquire(category, weight, prio)
 
-# 전역 인스턴스
-rate_limit_manager = RateLimitManager()
+    async def acquire(self, category: str = "general", weight: int = 1, priority=None):
+        """wait_for_permission()의 비동기 버전 (대기는 asyncio.sleep으로 수행)"""
+        prio = self._resolve_priority(category, priority)
+        with self._lock:
+            wait = self._try_acquire(category, weight, prio)
+            if wait > 0:
+                self.waits[prio] += 1
+        while wait > 0:
+            logger.debug(f"Rate Limit 대기(async): {wait:.2f}초 ({category}, weight={weight})")
+            await asyncio.sleep(min(wait, 1.0))
+            with self._lock:
+                wait = self._try_acquire(category, weight, prio)
 
+    def observe_response(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """
+        응답 헤더로 서버 기준 사용량 동기화 (requests/httpx 응답 모두 사용)
 
+        - X-MBX-USED-WEIGHT-1M / X-MBX-ORDER-COUNT-10S / X-MBX-ORDER-COUNT-1M:
+          버킷 잔량을 (한도 - 서버 사용량) 이하로 낮춘다 (동시 요청의 응답 순서가 섞여도 보수적으로 동작)
+        - 429/418: Retry-After(초) 동안 모든 요청 차단
+        """
+        now = time.monotonic()
+        with self._lock:
+            for key, value in headers.items():
+                name = _HEADER_BUCKETS.get(key.lower())
+                if name is None:
+                    continue
+                try:
+                    used = float(value)
+                except (TypeError, ValueError):
+                    continue
+                bucket = self._buckets[name]
+                bucket.refill(now)
+                bucket.tokens = min(bucket.tokens, bucket.capacity - used)
+
+            if status_code in (418, 429):
+                try:
+                    retry_after = float(headers.get("Retry-After") or 0)
+                except (TypeError, ValueError):
+                    retry_after = 0.0
+                retry_after = retry_after or (60.0 if status_code == 429 else 120.0)
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+                logger.warning(f"Rate Limit 초과 응답({status_code}): {retry_after:.0f}초 동안 요청 차단")
+
+    def get_status(self) -> Dict[str, Any]:
+        """버킷별 잔량/사용량 (API/GUI용)"""
+        now = time.monotonic()
+        with self._lock:
+            buckets = {}
+            for name, bucket in self._buckets.items():
+                bucket.refill(now)
+                buckets[name] = {
+                    "limit": int(bucket.capacity),
+                    "available": round(bucket.tokens, 1),
+                    "used": round(bucket.capacity - bucket.tokens, 1),
+                }
+            return {
+                "buckets": buckets,
+                "blocked_sec": round(max(0.0, self._blocked_until - now), 1),
+                "waits": {"high": self.waits[PRIORITY_HIGH], "normal": self.waits[PRIORITY_NORMAL],
+                          "low": self.waits[PRIORITY_LOW]},
+            }
+
+# 전역 인스턴스
+rate_limit_manager = RateLimitManager()
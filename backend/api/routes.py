@@ -257,6 +257,12 @@ async def get_all_engine_statuses():
     statuses = engine_manager.get_all_statuses()
     return {"status": "success", "data": statuses}
 
+@router.get("/engine/metrics")
+async def get_engine_metrics():
+    """엔진(심볼)별 단계 지연 시간 (fetch/indicators/signal/risk/execution/publish p50/p95/p99) 조회"""
+    engine_manager = get_engine_manager()
+    return {"status": "success", "data": engine_manager.get_latency_metrics()}
+
 # 자금 배분 관리 엔드포인트
 class FundsAllocationRequest(BaseModel):
     engine: str  # "NewModular"
@@ -855,8 +861,12 @@ async def calculate_volatility(symbol: str, binance_client) -> float:
         변동성 (%)
     """
     try:
-        # 24시간 티커 데이터 조회
-        ticker_data = binance_client.get_24hr_ticker(symbol)
+        # 24시간 티커 데이터 조회 (비동기 변형이 있으면 이벤트 루프를 막지 않음)
+        aio = getattr(binance_client, "aio", None)
+        if aio is not None:
+            ticker_data = await aio.get_24hr_ticker(symbol)
+        else:
+            ticker_data = await asyncio.to_thread(binance_client.get_24hr_ticker, symbol)
         
         if isinstance(ticker_data, dict) and "error" in ticker_data:
             logger.warning(f"[VOLATILITY] 티커 데이터 조회 실패: {symbol}")
@@ -873,9 +883,12 @@ async def calculate_volatility(symbol: str, binance_client) -> float:
                 return 0.0
         
         # 변동성 계산: (고가 - 저가) / 현재가 * 100
+        # 현재가는 markPrice 스트림 캐시 우선 (없거나 stale이면 티커의 lastPrice)
         high_price = float(ticker_data.get("highPrice", 0))
         low_price = float(ticker_data.get("lowPrice", 0))
-        current_price = float(ticker_data.get("lastPrice", 0))
+        mark_prices = getattr(binance_client, "mark_prices", None)
+        current_price = (mark_prices.price(symbol) if mark_prices is not None else 0.0) \
+            or float(ticker_data.get("lastPrice", 0))
         
         if current_price == 0:
             logger.warning(f"[VOLATILITY] 현재가가 0: {symbol}")
@@ -0,0 +1,101 @@
+"""전체 심볼 배열 스트림(!markPrice@arr@1s, !ticker@arr 등) 공통 수신 루프 - 재연결/백오프와 배열 디스패치"""
+import asyncio
+import json
+from typing import Optional
+
+import websockets
+
+from backend.utils.logger import setup_logger
+
+logger = setup_logger()
+
+
+class _ArrayStream:
+    """
+    전체 심볼 배열 스트림 수신 베이스
+
+    - 연결 종료/오류 시 지수 백오프로 자동 재연결
+    - url을 로컬 주소로 지정하면 오프라인 테스트용 대체 서버 사용 가능
+    - 하위 클래스는 stream_name과 _apply(이벤트 배열 반영)를 정의 (MarkPriceStream, TickerStream)
+    """
+
+    stream_name = ""
+
+    def __init__(
+        self,
+        base_url: str,
+        reconnect_delay_sec: float = 1.0,
+        max_reconnect_delay_sec: float = 30.0,
+    ):
+        self.url = f"{base_url.rstrip('/')}/{self.stream_name}"
+        self.reconnect_delay_sec = reconnect_delay_sec
+        self.max_reconnect_delay_sec = max_reconnect_delay_sec
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+
+        # 상태 카운터 (모니터링용)
+        self.reconnect_count = 0
+        self.messages_received = 0
+
+    async def start(self) -> None:
+        """백그라운드 수신 태스크 시작"""
+        if self._running:
+            return
+        self._running = True
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"{self.stream_name} 스트림 시작: {self.url}")
+
+    async def stop(self) -> None:
+        if not self._running:
+            return
+        self._running = False
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        logger.info(f"{self.stream_name} 스트림 중지 완료")
+
+    def _apply(self, events) -> int:
+        """이벤트 배열 반영, 반영 건수 반환"""
+        raise NotImplementedError
+
+    def _handle_message(self, raw) -> None:
+        try:
+            message = json.loads(raw)
+        except (TypeError, ValueError):
+            logger.warning(f"잘못된 {self.stream_name} 메시지 수신: {raw!r}")
+            return
+        data = message.get("data", message) if isinstance(message, dict) else message
+        if isinstance(data, dict):
+            data = [data]
+        if not isinstance(data, list):
+            return
+        try:
+            if self._apply(data):
+                self.messages_received += 1
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"{self.stream_name} 메시지 파싱 오류: {e}")
+
+    async def _run(self) -> None:
+        delay = self.reconnect_delay_sec
+        connected_once = False
+
+        while self._running:
+            try:
+                async with websockets.connect(self.url) as ws:
+                    delay = self.reconnect_delay_sec
+                    if connected_once:
+                        self.reconnect_count += 1
+                        logger.info(f"{self.stream_name} 스트림 재연결 완료 (#{self.reconnect_count})")
+                    connected_once = True
+                    async for raw in ws:
+                        self._handle_message(raw)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if self._running:
+                    logger.warning(f"{self.stream_name} 스트림 연결 오류: {e}")
+
+            if self._running:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_reconnect_delay_sec)
@@ -0,0 +1,489 @@
+import asyncio
+import os
+import threading
+import time
+import urllib.parse
+from typing import Optional, Dict, Any, List
+
+import httpx
+
+from backend.utils.logger import setup_logger
+from backend.api.rate_limit_manager import rate_limit_manager
+from backend.api_client.exchange_info import ExchangeInfoCache
+from backend.api_client.response_cache import PublicResponseCache
+from backend.api_client.mark_price_cache import MarkPriceCache
+from backend.api_client.user_data_stream import AccountState
+from backend.api_client.binance_client import (
+    round_qty_by_filters,
+    needs_price_hint,
+    is_margin_type_already_set,
+)
+
+logger = setup_logger()
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class AsyncBinanceClient:
+    """
+    바이낸스 선물 API 비동기 클라이언트 (httpx keep-alive 커넥션 풀, 선택적 HTTP/2)
+
+    BinanceClient(동기 파사드)와 같은 메서드 이름/반환 형식을 그대로 제공하며,
+    API 키, 서버 시간 offset, 거래 필터 캐시는 동기 클라이언트와 공유한다.
+    FastAPI 이벤트 루프 등 async 코드에서는 binance_client.aio로 접근해 await한다.
+
+    Example:
+        ticker = await binance_client.aio.get_24hr_ticker()
+    """
+
+    def __init__(self, sync_client, http2: Optional[bool] = None,
+                 max_connections: int = 50, max_keepalive: int = 20, timeout: float = 10.0):
+        """
+        Args:
+            sync_client: 상태를 공유할 BinanceClient
+            http2: HTTP/2 사용 여부 (None이면 BINANCE_HTTP2 환경변수, h2 패키지 미설치 시 HTTP/1.1)
+            max_connections: 커넥션 풀 최대 연결 수
+            max_keepalive: 유지할 keep-alive 연결 수
+            timeout: 요청 타임아웃 (초)
+        """
+        self._sync = sync_client
+        if http2 is None:
+            http2 = os.getenv("BINANCE_HTTP2", "0") in ("1", "true", "True")
+        if http2 and not _http2_available():
+            logger.warning("h2 패키지가 없어 HTTP/1.1 keep-alive로 동작합니다 (pip install httpx[http2])")
+            http2 = False
+        self.http2 = http2
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=30.0,
+        )
+        self._timeout = timeout
+        # 이벤트 루프별 커넥션 풀 (스케줄러 스레드 루프와 FastAPI 루프가 같은 클라이언트를 공유)
+        self._http_clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+        self._http_lock = threading.Lock()
+
+    # 동기 클라이언트와 공유하는 상태
+    @property
+    def api_key(self) -> Optional[str]:
+        return self._sync.api_key
+
+    @property
+    def secret_key(self) -> Optional[str]:
+        return self._sync.secret_key
+
+    @property
+    def base_url(self) -> str:
+        return self._sync.base_url
+
+    @property
+    def time_offset(self) -> int:
+        return self._sync.time_offset
+
+    @property
+    def exchange_info(self) -> ExchangeInfoCache:
+        return self._sync.exchange_info
+
+    @property
+    def mark_prices(self) -> MarkPriceCache:
+        return self._sync.mark_prices
+
+    @property
+    def account_state(self) -> AccountState:
+        return self._sync.account_state
+
+    @property
+    def public_cache(self) -> PublicResponseCache:
+        return self._sync.public_cache
+
+    def _get_http(self) -> httpx.AsyncClient:
+        """현재 이벤트 루프에 바인딩된 httpx.AsyncClient 반환 (루프마다 1개를 유지하며 재사용)"""
+        loop = asyncio.get_running_loop()
+        with self._http_lock:
+            http = self._http_clients.get(loop)
+            if http is None:
+                # 닫힌 루프의 풀은 소켓이 이미 루프와 함께 정리되었으므로 참조만 해제
+                for old_loop in [l for l in self._http_clients if l.is_closed()]:
+                    del self._http_clients[old_loop]
+                headers = {'X-MBX-APIKEY': self.api_key} if self.api_key else None
+                http = httpx.AsyncClient(
+                    base_url=self.base_url,
+                    headers=headers,
+                    timeout=self._timeout,
+                    limits=self._limits,
+                    http2=self.http2,
+                )
+                self._http_clients[loop] = http
+        return http
+
+    async def aclose(self):
+        """모든 루프의 커넥션 풀 종료 (다른 스레드에서 실행 중인 루프의 풀은 해당 루프에서 닫음)"""
+        current = asyncio.get_running_loop()
+        with self._http_lock:
+            clients = list(self._http_clients.items())
+            self._http_clients.clear()
+        for loop, http in clients:
+            try:
+                if loop is current:
+                    await http.aclose()
+                elif loop.is_running():
+                    await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(http.aclose(), loop))
+            except Exception as e:
+                logger.debug(f"커넥션 풀 종료 실패: {e}")
+
+    async def _sync_server_time(self):
+        """바이낸스 서버 시간과 동기화 (offset은 동기 클라이언트에 저장)"""
+        try:
+            response = await self._get_http().get("/fapi/v1/time", timeout=5)
+            if response.status_code == 200:
+                server_time = response.json()['serverTime']
+                self._sync.time_offset = server_time - int(time.time() * 1000)
+                logger.info(f"바이낸스 서버 시간 동기화 완료. Offset: {self._sync.time_offset}ms")
+            else:
+                logger.warning(f"서버 시간 동기화 실패: {response.status_code}")
+        except httpx.HTTPError as e:
+            logger.warning(f"서버 시간 동기화 중 오류: {e}")
+
+    async def _send_signed_request(self, http_method: str, path: str, params: Optional[dict] = None,
+                                   weight_category: str = "general", weight: int = 1,
+                                   priority: Optional[str] = None) -> Dict[str, Any]:
+        """서명된 프라이빗 API 요청을 전송합니다."""
+        if not self.api_key or not self.secret_key:
+            return {"error": "API 키 또는 시크릿 키가 설정되지 않았습니다."}
+
+        await rate_limit_manager.acquire(category=weight_category, weight=weight, priority=priority)
+
+        if params is None:
+            params = {}
+
+        # 안정성 향상: recvWindow 확장 (네트워크 지연 대비)
+        params['recvWindow'] = 60000
+
+        # -1021 대응을 위한 최대 1회 재시도 로직
+        for attempt in range(2):
+            try:
+                # 매 시도마다 최신 timestamp 재계산
+                params['timestamp'] = int(time.time() * 1000) + self.time_offset
+                url = f"{path}?{self._sync._sign_request(dict(params))}"
+                response = await self._get_http().request(http_method, url)
+                rate_limit_manager.observe_response(response.status_code, response.headers)
+                response.raise_for_status()
+                return response.json()
+            except httpx.HTTPStatusError as e:
+                error_text = e.response.text or ""
+                status_code = e.response.status_code
+                # Binance 시간 오차 -1021 처리: 서버 시간 재동기화 후 1회 재시도
+                if ("-1021" in error_text or "Timestamp for this request is outside of the recvWindow" in error_text) and attempt == 0:
+                    logger.warning("-1021 감지: 서버 시간 재동기화 후 재시도합니다.")
+                    await self._sync_server_time()
+                    continue
+                logger.error(f"HTTP 오류 발생 ({http_method} {path}): {status_code} - {error_text}")
+                return {"error": error_text, "code": status_code}
+            except httpx.HTTPError as e:
+                logger.error(f"API 요청 중 오류 발생 ({http_method} {path}): {e}")
+                return {"error": str(e), "code": -1}
+
+    async def _send_public_request(self, http_method: str, path: str, params: Optional[dict] = None,
+                                   weight_category: str = "general", weight: int = 1,
+                                   priority: Optional[str] = None) -> Dict[str, Any]:
+        """서명되지 않은 퍼블릭 API 요청을 전송합니다 (캐시 대상 GET은 동시 요청을 합치고 TTL 동안 재사용)."""
+        ttl = self.public_cache.ttl_for(http_method, path)
+        if ttl > 0:
+            key = self.public_cache.make_key(http_method, path, params)
+            return await self.public_cache.acall(
+                key, ttl, lambda: self._request_public(http_method, path, params, weight_category, weight, priority)
+            )
+        return await self._request_public(http_method, path, params, weight_category, weight, priority)
+
+    async def _request_public(self, http_method: str, path: str, params: Optional[dict],
+                              weight_category: str, weight: int, priority: Optional[str]) -> Dict[str, Any]:
+        await rate_limit_manager.acquire(category=weight_category, weight=weight, priority=priority)
+
+        try:
+            url = f"{path}?{urllib.parse.urlencode(params or {})}"
+            response = await self._get_http().request(http_method, url)
+            rate_limit_manager.observe_response(response.status_code, response.headers)
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            error_details = e.response.text
+            status_code = e.response.status_code
+            logger.error(f"HTTP 오류 발생 ({http_method} {path}): {status_code} - {error_details}")
+            return {"error": error_details, "code": status_code}
+        except httpx.HTTPError as e:
+            logger.error(f"API 요청 중 오류 발생 ({http_method} {path}): {e}")
+            return {"error": str(e), "code": -1}
+
+    async def get_account_info(self) -> Dict[str, Any]:
+        """계좌 정보를 가져옵니다 (잔고, PNL 등)."""
+        return await self._send_signed_request("GET", "/fapi/v2/account", weight_category="general", weight=5)
+
+    async def get_mark_price(self, symbol: str) -> Dict[str, Any]:
+        """특정 심볼의 현재 Mark Price와 Funding Rate 정보를 가져옵니다 (스트림 캐시 우선, stale이면 REST)."""
+        cached = self.mark_prices.get(symbol)
+        if cached is not None:
+            return cached
+        params = {'symbol': symbol}
+        response = await self._send_public_request("GET", "/fapi/v1/premiumIndex", params=params, weight_category="general", weight=1)
+        self.mark_prices.update(response, symbol)
+        return response
+
+    async def get_klines(self, symbol: str, interval: str, limit: int = 500,
+                         start_time: Optional[int] = None, end_time: Optional[int] = None):
+        """캔들스틱 데이터를 가져옵니다."""
+        params = {
+            'symbol': symbol,
+            'interval': interval,
+            'limit': limit
+        }
+        if start_time is not None:
+            params['startTime'] = start_time
+        if end_time is not None:
+            params['endTime'] = end_time
+
+        response = await self._send_public_request("GET", "/fapi/v1/klines", params=params, weight_category="general", weight=1)
+        if "error" not in response:
+            return response
+        return []
+
+    async def get_24hr_ticker(self, symbol: Optional[str] = None):
+        """24시간 가격 변동 통계를 가져옵니다. symbol이 없으면 모든 심볼의 데이터를 가져옵니다."""
+        params = {}
+        if symbol:
+            # 전체 티커가 신선하게 캐시되어 있으면 그 안에서 조회 (요청 없음)
+            cached = self.public_cache.peek(self.public_cache.make_key("GET", "/fapi/v1/ticker/24hr", None))
+            for ticker in cached or ():
+                if ticker.get("symbol") == symbol:
+                    return ticker
+            params['symbol'] = symbol
+            weight = 1
+            priority = None
+        else:
+            # 모든 심볼 조회 시 weight=40
+            weight = 40
+            # 랭킹용 대량 조회는 주문보다 후순위
+            priority = "low"
+
+        response = await self._send_public_request("GET", "/fapi/v1/ticker/24hr", params=params, weight_category="general", weight=weight,
+                                                   priority=priority)
+        if "error" not in response:
+            return response
+        return [] if not symbol else {}
+
+    async def get_exchange_info(self) -> Dict[str, Any]:
+        """거래소 정보를 가져옵니다 (심볼 목록, 상태 등)."""
+        response = await self._send_public_request("GET", "/fapi/v1/exchangeInfo", weight_category="general", weight=1,
+                                                   priority="low")
+        if "error" not in response:
+            return response
+        return {"symbols": []}
+
+    async def ensure_exchange_info(self) -> ExchangeInfoCache:
+        """TTL이 지났으면 exchangeInfo를 다시 받아 인덱스를 갱신하고 반환"""
+        return await self.exchange_info.aensure(self.get_exchange_info)
+
+    async def _get_symbol_filters(self, symbol: str) -> Dict[str, Any]:
+        """심볼의 필터(LOT_SIZE, MARKET_LOT_SIZE, NOTIONAL 등)를 캐시하여 반환"""
+        return (await self.ensure_exchange_info()).filters(symbol)
+
+    async def is_symbol_supported(self, symbol: str) -> Dict[str, Any]:
+        """선물 심볼 지원 여부와 필터 기초 정보 반환."""
+        try:
+            entry = (await self.ensure_exchange_info()).get(symbol)
+            if entry is None:
+                return {"supported": False, "reason": "not_found"}
+            if entry["status"] != "TRADING":
+                return {"supported": False, "reason": f"status={entry['status']}"}
+            return {"supported": True, "reason": "OK", "filters": entry["filters"]}
+        except Exception as e:
+            return {"supported": False, "reason": f"error:{e}"}
+
+    async def _round_qty_by_filters(self, symbol: str, raw_qty: float, price_hint: Optional[float] = None) -> Dict[str, Any]:
+        """시장가 주문용 수량을 거래 필터에 맞춰 내림 반올림하고 유효성 검사."""
+        try:
+            filters = await self._get_symbol_filters(symbol)
+            if not price_hint and needs_price_hint(filters):
+                mp = await self.get_mark_price(symbol)
+                price_hint = float(mp.get("markPrice", 0)) if isinstance(mp, dict) else 0.0
+            return round_qty_by_filters(filters, raw_qty, price_hint)
+        except Exception as e:
+            return {"ok": False, "reason": f"filter_check_error: {e}"}
+
+    async def set_leverage(self, symbol: str, leverage: int) -> Dict[str, Any]:
+        """레버리지 설정 (BinanceClient.set_leverage()와 동일)"""
+        if not 1 <= leverage <= 125:
+            logger.error(f"레버리지 범위 오류: {leverage}x (1~125 사이여야 함)")
+            return {"error": "레버리지는 1~125 사이여야 합니다.", "code": -1}
+
+        params = {
+            "symbol": symbol,
+            "leverage": leverage
+        }
+        logger.info(f"레버리지 설정 요청: {symbol} → {leverage}x")
+        response = await self._send_signed_request("POST", "/fapi/v1/leverage", params=params, weight_category="general", weight=1)
+        if "error" not in response:
+            logger.info(f"✅ 레버리지 설정 성공: {symbol} → {leverage}x")
+        else:
+            logger.error(f"❌ 레버리지 설정 실패: {symbol} → {response}")
+        return response
+
+    async def get_all_positions(self):
+        """모든 포지션 정보 조회 (Position Risk)"""
+        return await self._send_signed_request("GET", "/fapi/v2/positionRisk", weight_category="general", weight=25)
+
+    async def get_open_position(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """심볼의 열린 포지션 (User Data Stream 연결 중이면 메모리 조회, 아니면 positionRisk)"""
+        if self.account_state.is_live():
+            return self.account_state.position(symbol)
+        positions = await self.get_all_positions()
+        if "error" in positions:
+            return positions
+        for pos in positions:
+            if pos.get("symbol") == symbol and float(pos.get("positionAmt", 0)) != 0:
+                return pos
+        return None
+
+    async def create_listen_key(self) -> Dict[str, Any]:
+        """User Data Stream listenKey 발급 (유효한 키가 있으면 같은 키 반환)"""
+        return await self._send_public_request("POST", "/fapi/v1/listenKey", weight_category="general", weight=1)
+
+    async def keepalive_listen_key(self, listen_key: str) -> Dict[str, Any]:
+        """listenKey 유효기간 60분 연장"""
+        return await self._send_public_request("PUT", "/fapi/v1/listenKey", params={'listenKey': listen_key},
+                                               weight_category="general", weight=1)
+
+    async def close_listen_key(self, listen_key: str) -> Dict[str, Any]:
+        """listenKey 종료"""
+        return await self._send_public_request("DELETE", "/fapi/v1/listenKey", params={'listenKey': listen_key},
+                                               weight_category="general", weight=1)
+
+    async def set_margin_type(self, symbol: str, isolated: bool = True) -> Dict[str, Any]:
+        """선물 마진 타입 설정 (BinanceClient.set_margin_type()와 동일, -4046은 정상 처리)"""
+        margin_type = "ISOLATED" if isolated else "CROSSED"
+        params = {
+            "symbol": symbol,
+            "marginType": margin_type,
+        }
+        logger.info(f"마진 타입 설정 요청: {symbol} → {margin_type}")
+        resp = await self._send_signed_request("POST", "/fapi/v1/marginType", params=params, weight_category="general", weight=1)
+        if "error" in resp and is_margin_type_already_set(resp):
+            logger.info(f"마진 타입 이미 설정됨: {symbol} → {margin_type}")
+            return {"symbol": symbol, "marginType": margin_type, "alreadySet": True}
+        return resp
+
+    async def create_market_order(self, symbol: str, side: str, quantity: float) -> Dict[str, Any]:
+        """시장가 주문 생성 (BinanceClient.create_market_order()와 동일)"""
+        if quantity <= 0:
+            logger.error(f"주문 수량 오류: {quantity} (양수여야 함)")
+            return {"error": f"주문 수량은 0보다 커야 합니다: {quantity}", "code": -1}
+
+        # 0) 거래 필터에 맞춰 수량 내림 반올림 및 유효성 검증
+        mp = await self.get_mark_price(symbol)
+        price_hint = float(mp.get("markPrice", 0)) if isinstance(mp, dict) else None
+        norm = await self._round_qty_by_filters(symbol, quantity, price_hint=price_hint)
+        if not norm.get("ok"):
+            reason = norm.get("reason", "quantity normalization failed")
+            logger.error(f"주문 수량 검증 실패: {symbol} {side} | {reason}")
+            return {"error": reason, "code": -1130}
+        quantity = norm.get("qty", quantity)
+
+        params = {
+            'symbol': symbol,
+            'side': side,
+            'type': 'MARKET',
+            'quantity': quantity,
+            'newOrderRespType': 'FULL'
+        }
+        logger.info(f"시장가 주문 생성 요청: {symbol} {side} {quantity}")
+        result = await self._send_signed_request("POST", "/fapi/v1/order", params=params, weight_category="orders", weight=1)
+        if "error" not in result:
+            avg_price = result.get('avgPrice', 'N/A')
+            executed_qty = result.get('executedQty', 'N/A')
+            logger.info(f"✅ 시장가 주문 성공: {symbol} {side} | 수량: {executed_qty} | 평균가: {avg_price}")
+        else:
+            logger.error(f"❌ 시장가 주문 실패: {symbol} {side} | 오류: {result.get('error')}")
+        return result
+
+    async def close_position_market(self, symbol: str, side: str = None) -> Dict[str, Any]:
+        """특정 심볼의 포지션을 시장가로 청산 (BinanceClient.close_position_market()와 동일)"""
+        target_position = await self.get_open_position(symbol)
+        if target_position and "error" in target_position:
+            return target_position
+        if not target_position:
+            return {"error": f"{symbol}에 대한 포지션이 없습니다."}
+
+        position_amt = float(target_position.get("positionAmt", 0))
+        if side is None:
+            side = "SELL" if position_amt > 0 else "BUY"
+
+        params = {
+            'symbol': symbol,
+            'side': side,
+            'type': 'MARKET',
+            'quantity': abs(position_amt),
+            'reduceOnly': True,  # 포지션 청산 전용
+            'newOrderRespType': 'FULL'
+        }
+        result = await self._send_signed_request("POST", "/fapi/v1/order", params=params, weight_category="orders", weight=1)
+        if "error" not in result:
+            logger.info(f"포지션 청산 성공: {symbol}, {side}, 수량: {abs(position_amt)}")
+        else:
+            logger.error(f"포지션 청산 실패: {symbol}, 오류: {result.get('error')}")
+        return result
+
+    async def cancel_all_open_orders(self, symbol: str) -> Dict[str, Any]:
+        """특정 심볼의 모든 미체결 주문 취소"""
+        params = {'symbol': symbol}
+        logger.info(f"미체결 주문 취소 요청: {symbol}")
+        result = await self._send_signed_request("DELETE", "/fapi/v1/allOpenOrders", params=params, weight_category="orders", weight=1)
+        if "error" not in result:
+            logger.info(f"✅ 미체결 주문 취소 성공: {symbol}")
+        else:
+            # -2011 (No such order) 등은 정상적인 상황일 수 있음
+            logger.warning(f"미체결 주문 취소 응답: {symbol} | {result.get('error')}")
+        return result
+
+    async def close_all_positions(self) -> Dict[str, Any]:
+        """모든 선물 포지션을 시장가로 즉시 청산 (심볼별 청산 요청은 동시에 전송)"""
+        logger.warning("긴급 포지션 청산 시작: 모든 선물 포지션 시장가 청산")
+
+        positions = await self.get_all_positions()
+        if "error" in positions:
+            logger.error(f"포지션 조회 실패: {positions.get('error')}")
+            return positions
+
+        targets = []
+        for pos in positions:
+            position_amt = float(pos.get("positionAmt", 0))
+            if position_amt != 0:
+                targets.append((pos.get("symbol"), "SELL" if position_amt > 0 else "BUY", abs(position_amt)))
+
+        results = await asyncio.gather(*(
+            self.close_position_market(symbol, side) for symbol, side, _ in targets
+        ))
+
+        closed_positions: List[Dict[str, Any]] = []
+        errors: List[Dict[str, Any]] = []
+        for (symbol, side, amount), result in zip(targets, results):
+            if "error" not in result:
+                closed_positions.append({"symbol": symbol, "side": side, "amount": amount, "status": "success"})
+            else:
+                errors.append({"symbol": symbol, "error": result.get("error")})
+
+        if closed_positions:
+            logger.info(f"긴급 포지션 청산 완료: {len(closed_positions)}개 포지션 청산 성공")
+        if errors:
+            logger.error(f"긴급 포지션 청산 오류: {len(errors)}개 포지션 청산 실패")
+
+        return {
+            "success": len(errors) == 0,
+            "closed_count": len(closed_positions),
+            "closed_positions": closed_positions,
+            "errors": errors
+        }
@@ -1,6 +1,7 @@
 import requests
 import hmac
 import hashlib
+import json
 import time
 import threading
 import urllib.parse
@@ -8,9 +9,69 @@ from typing import Optional, Dict, Any
 from backend.utils.config_loader import BINANCE_API_KEY, BINANCE_SECRET_KEY, BINANCE_BASE_URL
 from backend.utils.logger import setup_logger
 from backend.api.rate_limit_manager import rate_limit_manager
+from backend.api_client.exchange_info import ExchangeInfoCache
+from backend.api_client.response_cache import PublicResponseCache
+from backend.api_client.mark_price_cache import MarkPriceCache
+from backend.api_client.user_data_stream import AccountState
 
 logger = setup_logger()
 
+
+def needs_price_hint(filters: Dict[str, Any]) -> bool:
+    """minNotional 검증에 가격이 필요한지 여부"""
+    notional_filter = filters.get("NOTIONAL") or filters.get("MIN_NOTIONAL") or {}
+    return float(notional_filter.get("minNotional", 0)) > 0 if notional_filter else False
+
+
+def round_qty_by_filters(filters: Dict[str, Any], raw_qty: float, price_hint: Optional[float] = None) -> Dict[str, Any]:
+    """
+    시장가 주문용 수량을 거래 필터에 맞춰 내림 반올림하고 유효성 검사 (동기/비동기 클라이언트 공용).
+    Returns: { ok: bool, qty: float, reason?: str }
+    """
+    lot = filters.get("MARKET_LOT_SIZE") or filters.get("LOT_SIZE") or {}
+    step = float(lot.get("stepSize", 0)) or 0.0
+    min_qty = float(lot.get("minQty", 0)) if lot else 0.0
+    max_qty = float(lot.get("maxQty", 0)) if lot else 0.0
+
+    qty = float(raw_qty)
+    if step > 0:
+        # floor to step
+        qty = (qty // step) * step
+    
+    # guard against floating point remnants smaller than step
+    if step > 0:
+        qty = float(f"{qty:.12f}")
+
+    if qty <= 0 or (min_qty and qty < min_qty):
+        return {"ok": False, "reason": f"Quantity below minQty ({qty} < {min_qty})", "stepSize": step, "minQty": min_qty}
+    if max_qty and qty > max_qty:
+        qty = max_qty
+
+    # notional/minNotional validation
+    notional_filter = filters.get("NOTIONAL") or filters.get("MIN_NOTIONAL") or {}
+    min_notional = float(notional_filter.get("minNotional", 0)) if notional_filter else 0.0
+    near_min = False
+    notional = None
+    
+    if min_notional > 0:
+        notional = qty * float(price_hint or 0)
+        if notional < min_notional:
+            return {"ok": False, "reason": f"Notional below minNotional ({notional:.8f} < {min_notional})", "stepSize": step, "minQty": min_qty, "minNotional": min_notional, "notional": notional}
+        if notional < min_notional * 1.1:
+            near_min = True
+
+    return {"ok": True, "qty": qty, "stepSize": step, "minQty": min_qty, "minNotional": min_notional, "notional": notional, "nearMinNotional": near_min}
+
+
+def is_margin_type_already_set(resp: Dict[str, Any]) -> bool:
+    """marginType 변경 오류 응답이 'No need to change margin type.'(-4046)인지 여부"""
+    try:
+        data = json.loads(resp.get("error", "{}"))
+        return data.get("code") == -4046 or "No need to change margin type" in data.get("msg", "")
+    except Exception:
+        return False
+
+
 class BinanceClient:
     """바이낸스 선물 API 클라이언트"""
     
@@ -29,7 +90,17 @@ class BinanceClient:
                 'X-MBX-APIKEY': self.api_key
             })
         
-        self.exchange_info_cache = {}
+        # 비동기 변형 (httpx 커넥션 풀, 최초 접근 시 생성)
+        self._aio = None
+
+        # exchangeInfo 심볼 인덱스 (TTL 갱신, 비동기 클라이언트와 공유)
+        self.exchange_info = ExchangeInfoCache()
+        # Mark Price 캐시 (!markPrice@arr@1s 스트림이 갱신, stale이면 REST)
+        self.mark_prices = MarkPriceCache()
+        # 포지션/잔고/체결 상태 (User Data Stream이 갱신, 연결 중이 아니면 REST)
+        self.account_state = AccountState()
+        # 멱등 퍼블릭 GET single-flight + 짧은 TTL 캐시 (경로별 신선도는 public_cache.ttls)
+        self.public_cache = PublicResponseCache()
         self.time_offset = 0  # 바이낸스 서버 시간과의 차이 (ms)
         self._sync_server_time()
         logger.info("BinanceClient 초기화 완료.")
@@ -74,12 +145,13 @@ class BinanceClient:
             logger.warning(f"시간 재동기화 루프 오류: {e}")
     
     def _send_signed_request(self, http_method: str, path: str, params: Optional[dict] = None, 
-                            weight_category: str = "general", weight: int = 1) -> Dict[str, Any]:
+                            weight_category: str = "general", weight: int = 1,
+                            priority: Optional[str] = None) -> Dict[str, Any]:
         """서명된 프라이빗 API 요청을 전송합니다."""
         if not self.api_key or not self.secret_key:
             return {"error": "API 키 또는 시크릿 키가 설정되지 않았습니다."}
         
-        rate_limit_manager.wait_for_permission(category=weight_category, weight=weight)
+        rate_limit_manager.wait_for_permission(category=weight_category, weight=weight, priority=priority)
         
         if params is None:
             params = {}
@@ -94,6 +166,7 @@ class BinanceClient:
                 params['timestamp'] = int(time.time() * 1000) + self.time_offset
                 full_url = f"{self.base_url}{path}?{self._sign_request(dict(params))}"
                 response = self.session.request(http_method, full_url, timeout=10)
+                rate_limit_manager.observe_response(response.status_code, response.headers)
                 response.raise_for_status()
                 return response.json()
             except requests.exceptions.HTTPError as e:
@@ -111,9 +184,20 @@ class BinanceClient:
                 return {"error": str(e), "code": -1}
     
     def _send_public_request(self, http_method: str, path: str, params: Optional[dict] = None,
-                            weight_category: str = "general", weight: int = 1) -> Dict[str, Any]:
-        """서명되지 않은 퍼블릭 API 요청을 전송합니다."""
-        rate_limit_manager.wait_for_permission(category=weight_category, weight=weight)
+                            weight_category: str = "general", weight: int = 1,
+                            priority: Optional[str] = None) -> Dict[str, Any]:
+        """서명되지 않은 퍼블릭 API 요청을 전송합니다 (캐시 대상 GET은 동시 요청을 합치고 TTL 동안 재사용)."""
+        ttl = self.public_cache.ttl_for(http_method, path)
+        if ttl > 0:
+            key = self.public_cache.make_key(http_method, path, params)
+            return self.public_cache.call(
+                key, ttl, lambda: self._request_public(http_method, path, params, weight_category, weight, priority)
+            )
+        return self._request_public(http_method, path, params, weight_category, weight, priority)
+
+    def _request_public(self, http_method: str, path: str, params: Optional[dict],
+                        weight_category: str, weight: int, priority: Optional[str]) -> Dict[str, Any]:
+        rate_limit_manager.wait_for_permission(category=weight_category, weight=weight, priority=priority)
         
         if params is None:
             params = {}
@@ -121,6 +205,7 @@ class BinanceClient:
         try:
             full_url = f"{self.base_url}{path}?{urllib.parse.urlencode(params)}"
             response = self.session.request(http_method, full_url, timeout=10)
+            rate_limit_manager.observe_response(response.status_code, response.headers)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.HTTPError as e:
@@ -132,14 +217,36 @@ class BinanceClient:
             logger.error(f"API 요청 중 오류 발생 ({http_method} {path}): {e}")
             return {"error": str(e), "code": -1}
     
+    @property
+    def aio(self):
+        """
+        같은 키/서버 시간 offset/필터 캐시를 공유하는 AsyncBinanceClient
+
+        async 코드(FastAPI 핸들러, 서비스 루프)에서는 이 변형을 await해 이벤트 루프 블로킹을 피한다.
+        """
+        if self._aio is None:
+            from backend.api_client.async_binance_client import AsyncBinanceClient
+            self._aio = AsyncBinanceClient(self)
+        return self._aio
+
+    async def aclose(self):
+        """비동기 HTTP 커넥션 풀 종료"""
+        if self._aio is not None:
+            await self._aio.aclose()
+
     def get_account_info(self) -> Dict[str, Any]:
         """계좌 정보를 가져옵니다 (잔고, PNL 등)."""
         return self._send_signed_request("GET", "/fapi/v2/account", weight_category="general", weight=5)
     
     def get_mark_price(self, symbol: str) -> Dict[str, Any]:
-        """특정 심볼의 현재 Mark Price와 Funding Rate 정보를 가져옵니다."""
+        """특정 심볼의 현재 Mark Price와 Funding Rate 정보를 가져옵니다 (스트림 캐시 우선, stale이면 REST)."""
+        cached = self.mark_prices.get(symbol)
+        if cached is not None:
+            return cached
         params = {'symbol': symbol}
-        return self._send_public_request("GET", "/fapi/v1/premiumIndex", params=params, weight_category="general", weight=1)
+        response = self._send_public_request("GET", "/fapi/v1/premiumIndex", params=params, weight_category="general", weight=1)
+        self.mark_prices.update(response, symbol)
+        return response
     
     def get_klines(self, symbol: str, interval: str, limit: int = 500, 
                    start_time: Optional[int] = None, end_time: Optional[int] = None) -> Dict[str, Any]:
@@ -158,18 +265,32 @@ class BinanceClient:
         if "error" not in response:
             return response
         return []
+
+    async def get_klines_async(self, symbol: str, interval: str, limit: int = 500,
+                               start_time: Optional[int] = None, end_time: Optional[int] = None):
+        """get_klines()의 비동기 버전 (aio.get_klines() 위임)"""
+        return await self.aio.get_klines(symbol, interval, limit=limit, start_time=start_time, end_time=end_time)
     
     def get_24hr_ticker(self, symbol: Optional[str] = None) -> Dict[str, Any]:
         """24시간 가격 변동 통계를 가져옵니다. symbol이 없으면 모든 심볼의 데이터를 가져옵니다."""
         params = {}
         if symbol:
+            # 전체 티커가 신선하게 캐시되어 있으면 그 안에서 조회 (요청 없음)
+            cached = self.public_cache.peek(self.public_cache.make_key("GET", "/fapi/v1/ticker/24hr", None))
+            for ticker in cached or ():
+                if ticker.get("symbol") == symbol:
+                    return ticker
             params['symbol'] = symbol
             weight = 1
+            priority = None
         else:
             # 모든 심볼 조회 시 weight=40
             weight = 40
+            # 랭킹용 대량 조회는 주문보다 후순위
+            priority = "low"
         
-        response = self._send_public_request("GET", "/fapi/v1/ticker/24hr", params=params, weight_category="general", weight=weight)
+        response = self._send_public_request("GET", "/fapi/v1/ticker/24hr", params=params, weight_category="general", weight=weight,
+                                             priority=priority)
         if "error" not in response:
             return response
         return [] if not symbol else {}
@@ -177,23 +298,19 @@ class BinanceClient:
     def get_exchange_info(self) -> Dict[str, Any]:
         """거래소 정보를 가져옵니다 (심볼 목록, 상태 등)."""
         # exchangeInfo는 weight=1
-        response = self._send_public_request("GET", "/fapi/v1/exchangeInfo", weight_category="general", weight=1)
+        response = self._send_public_request("GET", "/fapi/v1/exchangeInfo", weight_category="general", weight=1,
+                                             priority="low")
         if "error" not in response:
             return response
         return {"symbols": []}
 
+    def ensure_exchange_info(self) -> ExchangeInfoCache:
+        """TTL이 지났으면 exchangeInfo를 다시 받아 인덱스를 갱신하고 반환"""
+        return self.exchange_info.ensure(self.get_exchange_info)
+
     def _get_symbol_filters(self, symbol: str) -> Dict[str, Any]:
         """심볼의 필터(LOT_SIZE, MARKET_LOT_SIZE, NOTIONAL 등)를 캐시하여 반환"""
-        key = f"filters:{symbol}"
-        if key in self.exchange_info_cache:
-            return self.exchange_info_cache[key]
-        info = self.get_exchange_info()
-        for s in info.get("symbols", []):
-            if s.get("symbol") == symbol:
-                filters = {f.get("filterType"): f for f in s.get("filters", [])}
-                self.exchange_info_cache[key] = filters
-                return filters
-        return {}
+        return self.ensure_exchange_info().filters(symbol)
 
     def is_symbol_supported(self, symbol: str) -> Dict[str, Any]:
         """선물 심볼 지원 여부와 필터 기초 정보 반환.
@@ -201,15 +318,12 @@ class BinanceClient:
         Returns: { supported: bool, reason: str, filters?: dict }
         """
         try:
-            info = self.get_exchange_info()
-            for s in info.get("symbols", []):
-                if s.get("symbol") == symbol:
-                    status = s.get("status")
-                    if status != "TRADING":
-                        return {"supported": False, "reason": f"status={status}"}
-                    filters = {f.get("filterType"): f for f in s.get("filters", [])}
-                    return {"supported": True, "reason": "OK", "filters": filters}
-            return {"supported": False, "reason": "not_found"}
+            entry = self.ensure_exchange_info().get(symbol)
+            if entry is None:
+                return {"supported": False, "reason": "not_found"}
+            if entry["status"] != "TRADING":
+                return {"supported": False, "reason": f"status={entry['status']}"}
+            return {"supported": True, "reason": "OK", "filters": entry["filters"]}
         except Exception as e:
             return {"supported": False, "reason": f"error:{e}"}
 
@@ -220,43 +334,11 @@ class BinanceClient:
         """
         try:
             filters = self._get_symbol_filters(symbol)
-            lot = filters.get("MARKET_LOT_SIZE") or filters.get("LOT_SIZE") or {}
-            step = float(lot.get("stepSize", 0)) or 0.0
-            min_qty = float(lot.get("minQty", 0)) if lot else 0.0
-            max_qty = float(lot.get("maxQty", 0)) if lot else 0.0
-
-            qty = float(raw_qty)
-            if step > 0:
-                # floor to step
-                qty = (qty // step) * step
-            
-            # guard against floating point remnants smaller than step
-            if step > 0:
-                qty = float(f"{qty:.12f}")
-
-            if qty <= 0 or (min_qty and qty < min_qty):
-                return {"ok": False, "reason": f"Quantity below minQty ({qty} < {min_qty})", "stepSize": step, "minQty": min_qty}
-            if max_qty and qty > max_qty:
-                qty = max_qty
-
-            # notional/minNotional validation
-            notional_filter = filters.get("NOTIONAL") or filters.get("MIN_NOTIONAL") or {}
-            min_notional = float(notional_filter.get("minNotional", 0)) if notional_filter else 0.0
-            near_min = False
-            notional = None
-            
-            if min_notional > 0:
-                if not price_hint:
-                    # get mark price as a conservative reference
-                    mp = self.get_mark_price(symbol)
-                    price_hint = float(mp.get("markPrice", 0)) if isinstance(mp, dict) else 0.0
-                notional = qty * float(price_hint or 0)
-                if notional < min_notional:
-                    return {"ok": False, "reason": f"Notional below minNotional ({notional:.8f} < {min_notional})", "stepSize": step, "minQty": min_qty, "minNotional": min_notional, "notional": notional}
-                if notional < min_notional * 1.1:
-                    near_min = True
-
-            return {"ok": True, "qty": qty, "stepSize": step, "minQty": min_qty, "minNotional": min_notional, "notional": notional, "nearMinNotional": near_min}
+            if not price_hint and needs_price_hint(filters):
+                # get mark price as a conservative reference
+                mp = self.get_mark_price(symbol)
+                price_hint = float(mp.get("markPrice", 0)) if isinstance(mp, dict) else 0.0
+            return round_qty_by_filters(filters, raw_qty, price_hint)
         except Exception as e:
             return {"ok": False, "reason": f"filter_check_error: {e}"}
     
@@ -311,6 +393,32 @@ class BinanceClient:
     def get_all_positions(self) -> Dict[str, Any]:
         """모든 포지션 정보 조회 (Position Risk)"""
         return self._send_signed_request("GET", "/fapi/v2/positionRisk", weight_category="general", weight=25)
+
+    def get_open_position(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """심볼의 열린 포지션 (User Data Stream 연결 중이면 메모리 조회, 아니면 positionRisk)"""
+        if self.account_state.is_live():
+            return self.account_state.position(symbol)
+        positions = self.get_all_positions()
+        if "error" in positions:
+            return positions
+        for pos in positions:
+            if pos.get("symbol") == symbol and float(pos.get("positionAmt", 0)) != 0:
+                return pos
+        return None
+
+    def create_listen_key(self) -> Dict[str, Any]:
+        """User Data Stream listenKey 발급 (유효한 키가 있으면 같은 키 반환)"""
+        return self._send_public_request("POST", "/fapi/v1/listenKey", weight_category="general", weight=1)
+
+    def keepalive_listen_key(self, listen_key: str) -> Dict[str, Any]:
+        """listenKey 유효기간 60분 연장"""
+        return self._send_public_request("PUT", "/fapi/v1/listenKey", params={'listenKey': listen_key},
+                                         weight_category="general", weight=1)
+
+    def close_listen_key(self, listen_key: str) -> Dict[str, Any]:
+        """listenKey 종료"""
+        return self._send_public_request("DELETE", "/fapi/v1/listenKey", params={'listenKey': listen_key},
+                                         weight_category="general", weight=1)
     
     def set_margin_type(self, symbol: str, isolated: bool = True) -> Dict[str, Any]:
         """
@@ -331,17 +439,9 @@ class BinanceClient:
         resp = self._send_signed_request("POST", "/fapi/v1/marginType", params=params, weight_category="general", weight=1)
         
         # 오류이지만 'No need to change margin type.'인 경우 정상으로 처리
-        if "error" in resp:
-            try:
-                import json
-                data = json.loads(resp.get("error", "{}"))
-                code = data.get("code")
-                msg = data.get("msg", "")
-                if code == -4046 or "No need to change margin type" in msg:
-                    logger.info(f"마진 타입 이미 설정됨: {symbol} → {'ISOLATED' if isolated else 'CROSSED'}")
-                    return {"symbol": symbol, "marginType": "ISOLATED" if isolated else "CROSSED", "alreadySet": True}
-            except Exception:
-                pass
+        if "error" in resp and is_margin_type_already_set(resp):
+            logger.info(f"마진 타입 이미 설정됨: {symbol} → {'ISOLATED' if isolated else 'CROSSED'}")
+            return {"symbol": symbol, "marginType": "ISOLATED" if isolated else "CROSSED", "alreadySet": True}
         return resp
     
     def create_market_order(self, symbol: str, side: str, quantity: float) -> Dict[str, Any]:
@@ -399,7 +499,7 @@ class BinanceClient:
             "POST",
             "/fapi/v1/order",
             params=params,
-            weight_category="general",
+            weight_category="orders",
             weight=1
         )
         
@@ -423,17 +523,10 @@ class BinanceClient:
         Returns:
             주문 결과 딕셔너리
         """
-        # 포지션 정보 조회
-        positions = self.get_all_positions()
-        if "error" in positions:
-            return positions
-        
-        # 해당 심볼의 포지션 찾기
-        target_position = None
-        for pos in positions:
-            if pos.get("symbol") == symbol and float(pos.get("positionAmt", 0)) != 0:
-                target_position = pos
-                break
+        # 포지션 정보 조회 (User Data Stream 연결 중이면 REST 왕복 없음)
+        target_position = self.get_open_position(symbol)
+        if target_position and "error" in target_position:
+            return target_position
         
         if not target_position:
             return {"error": f"{symbol}에 대한 포지션이 없습니다."}
@@ -454,7 +547,7 @@ class BinanceClient:
             'newOrderRespType': 'FULL'
         }
         
-        result = self._send_signed_request("POST", "/fapi/v1/order", params=params, weight_category="general", weight=1)
+        result = self._send_signed_request("POST", "/fapi/v1/order", params=params, weight_category="orders", weight=1)
         
         if "error" not in result:
             logger.info(f"포지션 청산 성공: {symbol}, {side}, 수량: {abs(position_amt)}")
@@ -482,7 +575,7 @@ class BinanceClient:
             "DELETE",
             "/fapi/v1/allOpenOrders",
             params=params,
-            weight_category="general",
+            weight_category="orders",
             weight=1
         )
         
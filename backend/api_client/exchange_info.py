@@ -0,0 +1,200 @@
+import asyncio
+import threading
+import time
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from backend.utils.logger import setup_logger
+
+logger = setup_logger()
+
+ExchangeInfoListener = Callable[[Dict[str, Any]], None]
+
+
+def _index_symbol(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """exchangeInfo 심볼 항목 → 조회용 레코드 (필터는 filterType 기준 dict)"""
+    return {
+        "symbol": raw.get("symbol", ""),
+        "status": raw.get("status", ""),
+        "contractType": raw.get("contractType", ""),
+        "quoteAsset": raw.get("quoteAsset", ""),
+        "onboardDate": int(raw.get("onboardDate", 0) or 0),
+        "filters": {f.get("filterType"): f for f in raw.get("filters", [])},
+    }
+
+
+class ExchangeInfoCache:
+    """
+    exchangeInfo 심볼 인덱스 (TTL 기반, 모든 호출자가 공유)
+
+    - 전체 페이로드는 갱신 시 한 번만 파싱하고 이후 조회는 dict 조회
+    - TTL이 지나면 다음 조회(ensure/aensure) 또는 백그라운드 루프에서 갱신
+    - 갱신마다 이전 인덱스와 비교한 diff(신규 상장/상장 폐지/상태 변경)를 리스너에 전달
+    """
+
+    def __init__(self, ttl: float = 300.0, retry_interval: float = 30.0):
+        self.ttl = ttl
+        self.retry_interval = retry_interval  # 갱신 실패 시 재시도 간격 (기존 인덱스가 있을 때)
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._symbols: Dict[str, Dict[str, Any]] = {}
+        self._by_status: Dict[str, List[str]] = {}
+        self._next_refresh = 0.0  # monotonic
+        self.updated_at = 0.0     # monotonic (0이면 미로드)
+        self._listeners: List[ExchangeInfoListener] = []
+        self._async_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+    def is_stale(self) -> bool:
+        return time.monotonic() >= self._next_refresh
+
+    def add_listener(self, listener: ExchangeInfoListener) -> None:
+        """diff 리스너 등록 (갱신 스레드/루프에서 동기 호출됨)"""
+        self._listeners.append(listener)
+
+    def update(self, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        exchangeInfo 응답으로 인덱스 교체 후 diff 반환.
+        실패 응답(error 또는 빈 symbols)은 무시하고 기존 인덱스를 유지한다.
+        """
+        raw_symbols = payload.get("symbols") if isinstance(payload, dict) else None
+        if not raw_symbols or "error" in payload:
+            with self._lock:
+                if self._symbols:
+                    self._next_refresh = time.monotonic() + min(self.ttl, self.retry_interval)
+            logger.warning("exchangeInfo 갱신 실패: 기존 인덱스 유지")
+            return None
+
+        symbols = {}
+        by_status: Dict[str, List[str]] = {}
+        for raw in raw_symbols:
+            entry = _index_symbol(raw)
+            if not entry["symbol"]:
+                continue
+            symbols[entry["symbol"]] = entry
+            by_status.setdefault(entry["status"], []).append(entry["symbol"])
+        for names in by_status.values():
+            names.sort()
+
+        now = time.monotonic()
+        with self._lock:
+            previous = self._symbols
+            self._symbols = symbols
+            self._by_status = by_status
+            self.updated_at = now
+            self._next_refresh = now + self.ttl
+
+        diff = self._diff(previous, symbols) if previous else None
+        if diff:
+            if diff["added"]:
+                logger.info(f"exchangeInfo 신규 상장: {diff['added']}")
+            for change in diff["status_changed"]:
+                logger.info(f"exchangeInfo 상태 변경: {change['symbol']} {change['old']} → {change['new']}")
+            for listener in list(self._listeners):
+                try:
+                    listener(diff)
+                except Exception as e:
+                    logger.warning(f"exchangeInfo 리스너 오류: {e}")
+        return diff
+
+    @staticmethod
+    def _diff(old: Dict[str, Dict[str, Any]], new: Dict[str, Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        added = sorted(s for s in new if s not in old)
+        removed = sorted(s for s in old if s not in new)
+        status_changed = [
+            {"symbol": s, "old": old[s]["status"], "new": new[s]["status"]}
+            for s in sorted(new)
+            if s in old and old[s]["status"] != new[s]["status"]
+        ]
+        if not (added or removed or status_changed):
+            return None
+        return {"added": added, "removed": removed, "status_changed": status_changed}
+
+    def ensure(self, fetch: Callable[[], Dict[str, Any]]) -> "ExchangeInfoCache":
+        """TTL이 지났으면 동기 갱신 (동시 호출 시 한 번만 요청)"""
+        if self.is_stale():
+            with self._refresh_lock:
+                if self.is_stale():
+                    self.update(fetch())
+        return self
+
+    async def aensure(self, fetch: Callable[[], Awaitable[Dict[str, Any]]]) -> "ExchangeInfoCache":
+        """ensure()의 비동기 버전 (루프별 asyncio.Lock으로 한 번만 요청)"""
+        if self.is_stale():
+            loop = asyncio.get_running_loop()
+            lock = self._async_locks.get(loop)
+            if lock is None:
+                lock = self._async_locks[loop] = asyncio.Lock()
+            async with lock:
+                if self.is_stale():
+                    self.update(await fetch())
+        return self
+
+    def start(self, fetch: Callable[[], Dict[str, Any]], interval: Optional[float] = None) -> None:
+        """백그라운드 갱신 스레드 시작 (TTL 주기, 데몬)"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        period = interval or self.ttl
+
+        def loop():
+            while not self._stop.is_set():
+                try:
+                    self.update(fetch())
+                except Exception as e:
+                    logger.warning(f"exchangeInfo 백그라운드 갱신 오류: {e}")
+                self._stop.wait(period)
+
+        self._thread = threading.Thread(target=loop, name="exchange_info_refresh", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    # ------------------------------------------------------------------
+    # 조회 (dict 조회)
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def get(self, symbol: str) -> Optional[Dict[str, Any]]:
+        return self._symbols.get(symbol)
+
+    def status(self, symbol: str) -> Optional[str]:
+        entry = self._symbols.get(symbol)
+        return entry["status"] if entry else None
+
+    def filters(self, symbol: str) -> Dict[str, Any]:
+        entry = self._symbols.get(symbol)
+        return entry["filters"] if entry else {}
+
+    def onboard_date(self, symbol: str) -> int:
+        entry = self._symbols.get(symbol)
+        return entry["onboardDate"] if entry else 0
+
+    def symbols(self, statuses: Optional[Iterable[str]] = None, quote_asset: Optional[str] = "USDT",
+                contract_type: Optional[str] = "PERPETUAL") -> List[str]:
+        """상태별 인덱스에서 심볼 목록 반환 (정렬됨). statuses=None이면 전체."""
+        with self._lock:
+            symbols = self._symbols
+            names = (
+                [s for status in statuses for s in self._by_status.get(status, [])]
+                if statuses is not None else list(symbols)
+            )
+        result = [
+            s for s in names
+            if (quote_asset is None or symbols[s]["quoteAsset"] == quote_asset)
+            and (contract_type is None or symbols[s]["contractType"] == contract_type)
+        ]
+        result.sort()
+        return result
+
+    def onboard_dates(self, symbols: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """symbol → onboardDate(ms) (0은 제외)"""
+        index = self._symbols
+        names = index.keys() if symbols is None else symbols
+        return {s: index[s]["onboardDate"] for s in names if s in index and index[s]["onboardDate"] > 0}
@@ -0,0 +1,92 @@
+"""Mark Price 캐시 - !markPrice@arr@1s 스트림으로 갱신, 주문 경로에서 REST 왕복 제거"""
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional
+
+from backend.api_client.array_stream import _ArrayStream
+
+MARK_PRICE_STREAM = "!markPrice@arr@1s"
+
+
+def parse_mark_price_event(event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """markPriceUpdate 이벤트 → premiumIndex(REST) 응답과 같은 형태의 dict"""
+    if not isinstance(event, dict) or event.get("e") != "markPriceUpdate":
+        return None
+    return {
+        "symbol": event["s"],
+        "markPrice": event["p"],
+        "indexPrice": event.get("i", "0"),
+        "estimatedSettlePrice": event.get("P", "0"),
+        "lastFundingRate": event.get("r", "0"),
+        "nextFundingTime": int(event.get("T", 0)),
+        "time": int(event.get("E", 0)),
+    }
+
+
+class MarkPriceCache:
+    """
+    심볼별 최신 Mark Price (스레드 안전, O(1) 조회)
+
+    - 스트림 이벤트와 REST 응답을 같은 형태로 저장
+    - 수신 시각(monotonic) 기준 max_age초가 지나면 stale로 간주 → 호출자는 REST로 폴백
+    """
+
+    def __init__(self, max_age: float = 5.0):
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._entries: Dict[str, tuple] = {}  # symbol -> (received_monotonic, data)
+
+    def update(self, data: Dict[str, Any], symbol: Optional[str] = None) -> None:
+        """premiumIndex 형태 dict 저장 (markPrice가 없거나 오류 응답이면 무시)"""
+        if not isinstance(data, dict) or "error" in data or not data.get("markPrice"):
+            return
+        symbol = data.get("symbol") or symbol
+        if not symbol:
+            return
+        with self._lock:
+            self._entries[symbol] = (time.monotonic(), data)
+
+    def update_events(self, events: Iterable[Dict[str, Any]]) -> int:
+        """스트림 이벤트 배열 반영, 반영 건수 반환"""
+        now = time.monotonic()
+        parsed = [p for p in (parse_mark_price_event(e) for e in events) if p is not None]
+        with self._lock:
+            for data in parsed:
+                self._entries[data["symbol"]] = (now, data)
+        return len(parsed)
+
+    def get(self, symbol: str, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """신선한 항목이 있으면 반환, 없거나 stale이면 None"""
+        entry = self._entries.get(symbol)
+        if entry is None:
+            return None
+        limit = self.max_age if max_age is None else max_age
+        if time.monotonic() - entry[0] > limit:
+            return None
+        return entry[1]
+
+    def price(self, symbol: str, max_age: Optional[float] = None) -> float:
+        """신선한 Mark Price (없으면 0.0)"""
+        data = self.get(symbol, max_age)
+        return float(data["markPrice"]) if data else 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class MarkPriceStream(_ArrayStream):
+    """
+    !markPrice@arr@1s 전체 심볼 스트림 수신 → MarkPriceCache 갱신
+
+    - 연결 종료/오류 시 지수 백오프로 자동 재연결 (끊긴 동안은 캐시가 stale → REST 폴백)
+    - url을 로컬 주소로 지정하면 오프라인 테스트용 대체 서버 사용 가능
+    """
+
+    stream_name = MARK_PRICE_STREAM
+
+    def __init__(self, cache: MarkPriceCache, base_url: str, **kwargs):
+        super().__init__(base_url, **kwargs)
+        self.cache = cache
+
+    def _apply(self, events) -> int:
+        return self.cache.update_events(events)
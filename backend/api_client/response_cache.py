@@ -0,0 +1,141 @@
+import asyncio
+import threading
+import time
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from backend.utils.logger import setup_logger
+
+logger = setup_logger()
+
+# 경로별 기본 신선도(초) - 멱등 퍼블릭 GET만 대상 (0/미지정 경로는 캐시하지 않음)
+DEFAULT_PUBLIC_TTLS: Dict[str, float] = {
+    "/fapi/v1/ticker/24hr": 3.0,
+    "/fapi/v1/ticker/price": 1.0,
+}
+
+
+class _Flight:
+    __slots__ = ("event", "result")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+
+
+class PublicResponseCache:
+    """
+    퍼블릭 GET 응답 single-flight + 짧은 TTL 캐시 (동기/비동기 클라이언트 공유)
+
+    - 같은 요청(method, path, params)이 동시에 들어오면 한 번만 전송하고 결과를 공유
+    - 성공 응답은 경로별 TTL 동안 재사용 (오류 응답은 저장하지 않음)
+    - 반환값은 호출자 간에 공유되므로 읽기 전용으로 취급해야 한다
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None):
+        self.ttls = dict(DEFAULT_PUBLIC_TTLS if ttls is None else ttls)
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}  # key -> (만료 monotonic, 응답)
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._async_flights: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Hashable, asyncio.Future]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+        # 상태 카운터 (모니터링용)
+        self.hits = 0
+        self.coalesced = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(method: str, path: str, params: Optional[dict]) -> Hashable:
+        return method, path, tuple(sorted((params or {}).items()))
+
+    def ttl_for(self, method: str, path: str) -> float:
+        return self.ttls.get(path, 0.0) if method == "GET" else 0.0
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """신선한 응답이 있으면 반환 (요청은 보내지 않음)"""
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() < entry[0]:
+            return entry[1]
+        return None
+
+    def _store(self, key: Hashable, ttl: float, result: Any) -> None:
+        if isinstance(result, dict) and "error" in result:
+            return
+        self._entries[key] = (time.monotonic() + ttl, result)
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k[1] == path]:
+                    del self._entries[key]
+
+    def call(self, key: Hashable, ttl: float, fetch: Callable[[], Any]) -> Any:
+        """동기 single-flight: 신선한 응답 → 진행 중 요청 대기 → 직접 요청 순"""
+        with self._lock:
+            cached = self.peek(key)
+            if cached is not None:
+                self.hits += 1
+                return cached
+            flight = self._flights.get(key)
+            owner = flight is None
+            if owner:
+                flight = self._flights[key] = _Flight()
+                self.misses += 1
+            else:
+                self.coalesced += 1
+        if not owner:
+            flight.event.wait()
+            return flight.result
+
+        try:
+            flight.result = fetch()
+            with self._lock:
+                self._store(key, ttl, flight.result)
+            return flight.result
+        except Exception as e:
+            flight.result = {"error": str(e), "code": -1}
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.event.set()
+
+    async def acall(self, key: Hashable, ttl: float, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """비동기 single-flight (같은 이벤트 루프 안의 동시 요청을 하나의 Future로 합침)"""
+        cached = self.peek(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        loop = asyncio.get_running_loop()
+        flights = self._async_flights.setdefault(loop, {})
+        future = flights.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+
+        self.misses += 1
+        future = flights[key] = loop.create_future()
+        try:
+            result = await fetch()
+            with self._lock:
+                self._store(key, ttl, result)
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 대기자가 없으면 "exception was never retrieved" 경고 방지
+            future.exception()
+            raise
+        finally:
+            flights.pop(key, None)
+
+    def get_status(self) -> Dict[str, Any]:
+        return {"hits": self.hits, "coalesced": self.coalesced, "misses": self.misses,
+                "entries": len(self._entries)}
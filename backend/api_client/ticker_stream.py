@@ -0,0 +1,120 @@
+"""전체 심볼 24시간 티커 스트림(!ticker@arr) - 상승률 순위를 증분 정렬로 유지"""
+import bisect
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from backend.api_client.array_stream import _ArrayStream
+from backend.utils.logger import setup_logger
+
+logger = setup_logger()
+
+TICKER_STREAM = "!ticker@arr"
+
+
+def parse_ticker_event(event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """24hrTicker 이벤트 → /fapi/v1/ticker/24hr(REST) 응답과 같은 키의 dict"""
+    if not isinstance(event, dict) or event.get("e") != "24hrTicker":
+        return None
+    return {
+        "symbol": event["s"],
+        "priceChange": event.get("p", "0"),
+        "priceChangePercent": event["P"],
+        "weightedAvgPrice": event.get("w", "0"),
+        "lastPrice": event.get("c", "0"),
+        "lastQty": event.get("Q", "0"),
+        "openPrice": event.get("o", "0"),
+        "highPrice": event.get("h", "0"),
+        "lowPrice": event.get("l", "0"),
+        "volume": event.get("v", "0"),
+        "quoteVolume": event.get("q", "0"),
+        "openTime": int(event.get("O", 0)),
+        "closeTime": int(event.get("C", 0)),
+        "count": int(event.get("n", 0)),
+    }
+
+
+class TickerRanking:
+    """
+    상승률 순위 (증분 정렬 구조, 스레드 안전)
+
+    - 정렬 키 (-priceChangePercent, symbol): 상승률 내림차순, 동률 시 심볼명 오름차순
+    - 상승률이 바뀐 심볼만 bisect로 제거/삽입 (전체 재정렬 없음), 나머지는 티커 값만 교체
+    - !ticker@arr는 최근 1초간 변경된 심볼만 보내므로 REST 전체 티커로 먼저 채운 뒤(load) 증분 반영
+    """
+
+    def __init__(self, max_age: float = 3.0):
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._keys: List[Tuple[float, str]] = []
+        self._tickers: Dict[str, Dict[str, Any]] = {}
+        self._key_of: Dict[str, Tuple[float, str]] = {}
+        self.loaded = False
+        self.stream_updated = 0.0  # monotonic 기준 마지막 스트림 반영 시각
+        self.version = 0  # 순위가 바뀔 때마다 증가
+
+        # 상태 카운터 (모니터링용)
+        self.repositioned = 0
+
+    def _upsert(self, ticker: Dict[str, Any]) -> bool:
+        """락 안에서 호출. 순위(키)가 바뀌었으면 True"""
+        symbol = ticker.get("symbol")
+        if not symbol:
+            return False
+        key = (-float(ticker.get("priceChangePercent", 0.0)), symbol)
+        self._tickers[symbol] = ticker
+        old = self._key_of.get(symbol)
+        if old == key:
+            return False
+        if old is not None:
+            del self._keys[bisect.bisect_left(self._keys, old)]
+        bisect.insort(self._keys, key)
+        self._key_of[symbol] = key
+        return True
+
+    def load(self, tickers: Iterable[Dict[str, Any]]) -> None:
+        """REST 전체 티커로 초기화/보정 (콜드 스타트 폴백)"""
+        with self._lock:
+            for ticker in tickers:
+                self._upsert(ticker)
+            self.loaded = True
+            self.version += 1
+
+    def update_events(self, events: Iterable[Dict[str, Any]]) -> int:
+        """스트림 이벤트 배열 반영, 반영 건수 반환"""
+        parsed = [t for t in (parse_ticker_event(e) for e in events) if t is not None]
+        with self._lock:
+            moved = sum(1 for t in parsed if self._upsert(t))
+            if moved:
+                self.repositioned += moved
+                self.version += 1
+            self.stream_updated = time.monotonic()
+        return len(parsed)
+
+    def is_fresh(self) -> bool:
+        """전체 티커로 채워져 있고 스트림이 max_age초 안에 갱신되었는지"""
+        return self.loaded and time.monotonic() - self.stream_updated <= self.max_age
+
+    def get(self, symbol: str) -> Optional[Dict[str, Any]]:
+        return self._tickers.get(symbol)
+
+    def ranked(self) -> List[Dict[str, Any]]:
+        """정렬된 티커 목록 (정렬 비용 없음)"""
+        with self._lock:
+            return [self._tickers[symbol] for _, symbol in self._keys]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+class TickerStream(_ArrayStream):
+    """!ticker@arr 스트림 수신 → TickerRanking 갱신 (재연결/백오프는 _ArrayStream 공통 루프)"""
+
+    stream_name = TICKER_STREAM
+
+    def __init__(self, ranking: TickerRanking, base_url: str, **kwargs):
+        super().__init__(base_url, **kwargs)
+        self.ranking = ranking
+
+    def _apply(self, events) -> int:
+        return self.ranking.update_events(events)
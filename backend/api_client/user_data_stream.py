@@ -0,0 +1,330 @@
+"""User Data Stream - listenKey 기반 포지션/잔고/체결 상태를 메모리에 유지 (positionRisk/account 폴링 대체)"""
+import asyncio
+import json
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+import websockets
+
+from backend.utils.logger import setup_logger
+
+logger = setup_logger()
+
+FillListener = Callable[[Dict[str, Any]], None]
+
+
+class AccountState:
+    """
+    계좌 상태 (포지션/잔고/최근 체결) - 스레드 안전
+
+    - REST 스냅샷(/fapi/v2/account)으로 초기화하고 ACCOUNT_UPDATE/ORDER_TRADE_UPDATE 이벤트로 갱신
+    - 항목별 updateTime을 기억해 스냅샷보다 오래된 이벤트는 무시 (재동기화 직후 버퍼된 이벤트 대비)
+    - 스트림이 연결되어 스냅샷과 동기화된 동안만 is_live() → 호출자는 그 외에는 REST로 폴백
+    """
+
+    def __init__(self, max_fills: int = 500):
+        self._lock = threading.Lock()
+        self._positions: Dict[Tuple[str, str], Dict[str, Any]] = {}  # (symbol, positionSide) -> position
+        self._balances: Dict[str, Dict[str, Any]] = {}  # asset -> balance
+        self._total_wallet_balance = 0.0
+        self._live = False
+        self.fills: Deque[Dict[str, Any]] = deque(maxlen=max_fills)
+        self._fill_listeners: List[FillListener] = []
+        self.synced_at = 0.0  # time.time() 기준 마지막 스냅샷 시각
+
+    # ------------------------------------------------------------------
+    # 상태 갱신
+    # ------------------------------------------------------------------
+    def is_live(self) -> bool:
+        return self._live
+
+    def set_live(self, live: bool) -> None:
+        self._live = live
+
+    def add_fill_listener(self, listener: FillListener) -> None:
+        self._fill_listeners.append(listener)
+
+    def apply_snapshot(self, account_info: Dict[str, Any]) -> bool:
+        """/fapi/v2/account 응답으로 전체 상태 교체"""
+        if not isinstance(account_info, dict) or "error" in account_info:
+            return False
+        positions = {}
+        for p in account_info.get("positions", []):
+            key = (p.get("symbol"), p.get("positionSide", "BOTH"))
+            positions[key] = {
+                "symbol": key[0],
+                "positionSide": key[1],
+                "positionAmt": float(p.get("positionAmt", 0) or 0),
+                "entryPrice": float(p.get("entryPrice", 0) or 0),
+                "unRealizedProfit": float(p.get("unrealizedProfit", p.get("unRealizedProfit", 0)) or 0),
+                "isolated": bool(p.get("isolated", False)),
+                "updateTime": int(p.get("updateTime", 0) or 0),
+            }
+        balances = {}
+        for a in account_info.get("assets", []):
+            balances[a.get("asset")] = {
+                "asset": a.get("asset"),
+                "walletBalance": float(a.get("walletBalance", 0) or 0),
+                "crossWalletBalance": float(a.get("crossWalletBalance", 0) or 0),
+                "updateTime": int(a.get("updateTime", 0) or 0),
+            }
+        with self._lock:
+            self._positions = positions
+            self._balances = balances
+            self._total_wallet_balance = float(account_info.get("totalWalletBalance", 0) or 0)
+            self.synced_at = time.time()
+        return True
+
+    def apply_event(self, event: Dict[str, Any]) -> Optional[str]:
+        """스트림 이벤트 반영, 이벤트 타입 반환 (처리하지 않은 이벤트는 None)"""
+        etype = event.get("e") if isinstance(event, dict) else None
+        if etype == "ACCOUNT_UPDATE":
+            self._apply_account_update(event)
+        elif etype == "ORDER_TRADE_UPDATE":
+            self._apply_order_update(event)
+        elif etype != "listenKeyExpired":
+            return None
+        return etype
+
+    def _apply_account_update(self, event: Dict[str, Any]) -> None:
+        data = event.get("a", {})
+        ts = int(event.get("T") or event.get("E") or 0)
+        with self._lock:
+            for b in data.get("B", []):
+                asset = b.get("a")
+                current = self._balances.get(asset)
+                if current is not None and ts < current["updateTime"]:
+                    continue
+                wallet = float(b.get("wb", 0) or 0)
+                if asset == "USDT":
+                    previous = current["walletBalance"] if current else 0.0
+                    self._total_wallet_balance += wallet - previous
+                self._balances[asset] = {
+                    "asset": asset,
+                    "walletBalance": wallet,
+                    "crossWalletBalance": float(b.get("cw", 0) or 0),
+                    "updateTime": ts,
+                }
+            for p in data.get("P", []):
+                key = (p.get("s"), p.get("ps", "BOTH"))
+                current = self._positions.get(key)
+                if current is not None and ts < current["updateTime"]:
+                    continue
+                self._positions[key] = {
+                    "symbol": key[0],
+                    "positionSide": key[1],
+                    "positionAmt": float(p.get("pa", 0) or 0),
+                    "entryPrice": float(p.get("ep", 0) or 0),
+                    "unRealizedProfit": float(p.get("up", 0) or 0),
+                    "isolated": p.get("mt") == "isolated",
+                    "updateTime": ts,
+                }
+
+    def _apply_order_update(self, event: Dict[str, Any]) -> None:
+        o = event.get("o", {})
+        if o.get("x") != "TRADE":
+            return
+        fill = {
+            "symbol": o.get("s"),
+            "side": o.get("S"),
+            "orderId": o.get("i"),
+            "clientOrderId": o.get("c"),
+            "price": float(o.get("L", 0) or 0),
+            "qty": float(o.get("l", 0) or 0),
+            "cumQty": float(o.get("z", 0) or 0),
+            "status": o.get("X"),
+            "realizedPnl": float(o.get("rp", 0) or 0),
+            "commission": float(o.get("n", 0) or 0),
+            "time": int(o.get("T") or event.get("T") or 0),
+        }
+        with self._lock:
+            self.fills.append(fill)
+        for listener in list(self._fill_listeners):
+            try:
+                listener(fill)
+            except Exception as e:
+                logger.warning(f"체결 리스너 오류: {e}")
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def position(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """심볼의 열린 포지션 (없으면 None)"""
+        with self._lock:
+            for (sym, _), pos in self._positions.items():
+                if sym == symbol and pos["positionAmt"] != 0:
+                    return dict(pos)
+        return None
+
+    def positions(self) -> List[Dict[str, Any]]:
+        """positionRisk 응답과 같은 키를 갖는 포지션 목록"""
+        with self._lock:
+            return [dict(p) for p in self._positions.values()]
+
+    def account_info(self, mark_prices=None) -> Dict[str, Any]:
+        """
+        /fapi/v2/account 응답과 같은 키(totalWalletBalance/totalUnrealizedProfit/assets)의 dict
+
+        mark_prices(MarkPriceCache)가 주어지면 미실현 손익을 최신 Mark Price로 다시 계산한다.
+        """
+        with self._lock:
+            unrealized = 0.0
+            for pos in self._positions.values():
+                amt = pos["positionAmt"]
+                if amt == 0:
+                    continue
+                mark = mark_prices.price(pos["symbol"]) if mark_prices is not None else 0.0
+                unrealized += amt * (mark - pos["entryPrice"]) if mark > 0 else pos["unRealizedProfit"]
+            return {
+                "totalWalletBalance": self._total_wallet_balance,
+                "totalUnrealizedProfit": unrealized,
+                "assets": [dict(b) for b in self._balances.values()],
+            }
+
+
+class UserDataStream:
+    """
+    listenKey 기반 User Data Stream 관리자
+
+    - 연결 직후 REST 스냅샷으로 재동기화 (최초 연결/재연결/listenKeyExpired 모두 동일)
+    - keepalive_sec마다 listenKey 연장 (Binance 만료 60분)
+    - 연결이 끊긴 동안은 AccountState.is_live()가 False → 호출자는 REST로 폴백
+    - client는 create_listen_key/keepalive_listen_key/close_listen_key/get_account_info를 제공
+      (binance_client.aio가 있으면 비동기 변형 사용, 없으면 스레드에서 동기 메서드 실행)
+    - base_url을 로컬 주소로 지정하면 오프라인 테스트용 대체 서버 사용 가능
+    """
+
+    def __init__(
+        self,
+        client,
+        base_url: str,
+        state: Optional[AccountState] = None,
+        keepalive_sec: float = 1800.0,
+        reconnect_delay_sec: float = 1.0,
+        max_reconnect_delay_sec: float = 30.0,
+    ):
+        self.client = client
+        self.base_url = base_url.rstrip('/')
+        self.state = state or getattr(client, "account_state", None) or AccountState()
+        self.keepalive_sec = keepalive_sec
+        self.reconnect_delay_sec = reconnect_delay_sec
+        self.max_reconnect_delay_sec = max_reconnect_delay_sec
+        self.listen_key: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+        self._keepalive_task: Optional[asyncio.Task] = None
+        self._running = False
+
+        # 상태 카운터 (모니터링용)
+        self.resync_count = 0
+        self.reconnect_count = 0
+        self.events_received = 0
+
+    async def _call(self, method: str, *args):
+        aio = getattr(self.client, "aio", None)
+        if aio is not None:
+            return await getattr(aio, method)(*args)
+        return await asyncio.to_thread(getattr(self.client, method), *args)
+
+    async def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._task = asyncio.create_task(self._run())
+        self._keepalive_task = asyncio.create_task(self._keepalive_loop())
+        logger.info("User Data Stream 시작")
+
+    async def stop(self) -> None:
+        if not self._running:
+            return
+        self._running = False
+        self.state.set_live(False)
+        for task in (self._task, self._keepalive_task):
+            if task is not None:
+                task.cancel()
+        await asyncio.gather(*(t for t in (self._task, self._keepalive_task) if t), return_exceptions=True)
+        self._task = self._keepalive_task = None
+        if self.listen_key:
+            try:
+                await self._call("close_listen_key", self.listen_key)
+            except Exception as e:
+                logger.debug(f"listenKey 종료 실패: {e}")
+            self.listen_key = None
+        logger.info("User Data Stream 중지 완료")
+
+    async def resync(self) -> bool:
+        """REST 스냅샷으로 상태 재동기화"""
+        ok = self.state.apply_snapshot(await self._call("get_account_info"))
+        if ok:
+            self.resync_count += 1
+        else:
+            logger.warning("User Data Stream 재동기화 실패: 계좌 스냅샷 조회 오류")
+        return ok
+
+    async def _keepalive_loop(self) -> None:
+        while self._running:
+            await asyncio.sleep(self.keepalive_sec)
+            if not self.listen_key:
+                continue
+            try:
+                resp = await self._call("keepalive_listen_key", self.listen_key)
+                if isinstance(resp, dict) and "error" in resp:
+                    logger.warning(f"listenKey 연장 실패: {resp.get('error')}")
+            except Exception as e:
+                logger.warning(f"listenKey 연장 오류: {e}")
+
+    def _handle_message(self, raw) -> Optional[str]:
+        try:
+            message = json.loads(raw)
+        except (TypeError, ValueError):
+            logger.warning(f"잘못된 User Data 메시지 수신: {raw!r}")
+            return None
+        event = message.get("data", message) if isinstance(message, dict) else None
+        try:
+            etype = self.state.apply_event(event)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"User Data 메시지 파싱 오류: {e}")
+            return None
+        if etype:
+            self.events_received += 1
+        return etype
+
+    async def _run(self) -> None:
+        delay = self.reconnect_delay_sec
+        connected_once = False
+
+        while self._running:
+            try:
+                resp = await self._call("create_listen_key")
+                if not isinstance(resp, dict) or not resp.get("listenKey"):
+                    raise RuntimeError(f"listenKey 발급 실패: {resp}")
+                self.listen_key = resp["listenKey"]
+
+                async with websockets.connect(f"{self.base_url}/{self.listen_key}") as ws:
+                    # 연결 후 스냅샷: 그 사이 이벤트는 소켓에 버퍼되고 updateTime 비교로 중복 반영 방지
+                    if not await self.resync():
+                        raise RuntimeError("계좌 스냅샷 조회 실패")
+                    self.state.set_live(True)
+                    delay = self.reconnect_delay_sec
+                    if connected_once:
+                        self.reconnect_count += 1
+                        logger.info(f"User Data Stream 재연결/재동기화 완료 (#{self.reconnect_count})")
+                    connected_once = True
+
+                    async for raw in ws:
+                        if self._handle_message(raw) == "listenKeyExpired":
+                            logger.warning("listenKey 만료: 재발급 후 재동기화")
+                            break
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if self._running:
+                    logger.warning(f"User Data Stream 연결 오류: {e}")
+            finally:
+                # 끊긴 구간(gap)은 재연결 시 스냅샷으로 메움
+                self.state.set_live(False)
+
+            if self._running:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_reconnect_delay_sec)
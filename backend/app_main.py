@@ -43,6 +43,11 @@ def create_app() -> FastAPI:
         yona_service.set_broadcaster(ws_manager.broadcast_json)
         app.state.yona_service = yona_service
 
+        # 엔진 매니저는 YonaService와 같은 BinanceClient를 공유 (markPrice/User Data Stream
+        # 캐시가 엔진 주문 경로에 반영되도록, 다른 경로가 싱글톤을 먼저 만들기 전에 생성)
+        db_path = os.path.join(ROOT_DIR, "yona_vanguard.db")
+        get_engine_manager(db_path=db_path, binance_client=yona_service.binance_client)
+
         # API 라우터 포함
         app.include_router(api_router, prefix="/api/v1")
 
@@ -58,9 +63,7 @@ def create_app() -> FastAPI:
                 app.state.yona_service.add_realized_pnl(engine_name, amount)
                 asyncio.create_task(app.state.yona_service._update_header_data())
 
-            # 엔진 매니저 DB 경로 설정 (YonaService와 동일한 경로)
-            db_path = os.path.join(ROOT_DIR, "yona_vanguard.db")
-            engine_manager = get_engine_manager(db_path=db_path)
+            engine_manager = get_engine_manager()
             engine_manager._realized_pnl_callback = on_realized_pnl
             engine_manager.add_message_callback(ws_manager.broadcast_json)
             logger.info("EngineManager 초기화 및 WebSocket 연결 완료.")
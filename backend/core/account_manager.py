@@ -81,7 +81,12 @@ class AccountManager:
     def update_account_info(self) -> bool:
         """바이낸스 API에서 최신 계좌 정보를 조회하여 업데이트합니다."""
         try:
-            account_info = self.binance_client.get_account_info()
+            # User Data Stream이 연결되어 있으면 메모리 상태 사용 (/fapi/v2/account weight 5 절약)
+            state = getattr(self.binance_client, "account_state", None)
+            if state is not None and state.is_live():
+                account_info = state.account_info(getattr(self.binance_client, "mark_prices", None))
+            else:
+                account_info = self.binance_client.get_account_info()
             
             if "error" in account_info:
                 logger.warning(f"계좌 정보 조회 실패: {account_info.get('error')}")
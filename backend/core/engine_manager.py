@@ -8,6 +8,8 @@ import aiosqlite
 from datetime import datetime
 
 from backend.core.strategies import AlphaStrategy, BetaStrategy, GammaStrategy
+from backend.core.new_strategy.scheduler import OrchestratorScheduler
+from backend.core.new_strategy.market_data_hub import get_market_data_hub
 
 
 class EngineManager:
@@ -21,13 +23,15 @@ class EngineManager:
     - 로그 메시지 전송
     """
     
-    def __init__(self, realized_pnl_callback=None, db_path: Optional[str] = None):
+    def __init__(self, realized_pnl_callback=None, db_path: Optional[str] = None, binance_client=None):
         """
         엔진 매니저 초기화
         
         Args:
             realized_pnl_callback: 실현 손익 전달 콜백 (engine_name, amount)
             db_path: 데이터베이스 파일 경로 (거래 기록 저장용)
+            binance_client: 엔진이 공유할 BinanceClient (YonaService 클라이언트 주입 시
+                markPrice/User Data Stream 캐시를 주문 경로에서 그대로 사용). 미제공 시 새로 생성
         """
         self.engines: Dict[str, Any] = {}
         self._message_callbacks = []
@@ -46,12 +50,24 @@ class EngineManager:
             db_path = os.path.join(current_dir, "yona_vanguard.db")
         self._db_path = db_path
         
-        # ✅ 공유 BinanceClient 생성 (핵심: 의존성 주입 패턴)
-        from backend.api_client.binance_client import BinanceClient
-        self._shared_binance_client = BinanceClient()
-        print(f"[EngineManager] ✅ 공유 BinanceClient 생성 완료 (ID: {id(self._shared_binance_client)})")
+        # ✅ 공유 BinanceClient (핵심: 의존성 주입 패턴) - 주입받은 클라이언트는 소유자가 정리
+        self._owns_binance_client = binance_client is None
+        if binance_client is None:
+            from backend.api_client.binance_client import BinanceClient
+            binance_client = BinanceClient()
+            print(f"[EngineManager] ✅ 공유 BinanceClient 생성 완료 (ID: {id(binance_client)})")
+        else:
+            print(f"[EngineManager] ✅ 주입된 BinanceClient 공유 (ID: {id(binance_client)})")
+        self._shared_binance_client = binance_client
         
-        # 3개 엔진 초기화 (공유 클라이언트 주입)
+        # ✅ 공유 스케줄러 (엔진별 스레드 대신 단일 이벤트 루프에서 모든 Orchestrator 구동)
+        self._scheduler = OrchestratorScheduler()
+        self._scheduler.start()
+        
+        # ✅ 공유 시세 허브 (같은 심볼/타임프레임은 엔진 수와 무관하게 1회만 조회/저장)
+        self._market_data_hub = get_market_data_hub(self._shared_binance_client)
+        
+        # 3개 엔진 초기화 (공유 클라이언트/스케줄러/시세 허브 주입)
         self._init_engines()
         
         print("[EngineManager] 엔진 매니저 초기화 완료")
@@ -61,13 +77,19 @@ class EngineManager:
         try:
             # ✅ 동일한 BinanceClient 인스턴스를 모든 엔진에 주입
             self.engines["Alpha"] = AlphaStrategy(
-                binance_client=self._shared_binance_client
+                binance_client=self._shared_binance_client,
+                scheduler=self._scheduler,
+                market_data_hub=self._market_data_hub,
             )
             self.engines["Beta"] = BetaStrategy(
-                binance_client=self._shared_binance_client
+                binance_client=self._shared_binance_client,
+                scheduler=self._scheduler,
+                market_data_hub=self._market_data_hub,
             )
             self.engines["Gamma"] = GammaStrategy(
-                binance_client=self._shared_binance_client
+                binance_client=self._shared_binance_client,
+                scheduler=self._scheduler,
+                market_data_hub=self._market_data_hub,
             )
             
             # 각 엔진의 초기 포지션 상태 설정
@@ -229,6 +251,48 @@ class EngineManager:
             statuses[name] = engine.get_status()
         return statuses
     
+    def get_scheduler_status(self) -> Dict[str, Any]:
+        """
+        공유 스케줄러 및 시세 허브 상태 조회 (심볼별 스텝 수, overrun, 구독 참조 수 등)
+        
+        Returns:
+            스케줄러 상태 딕셔너리
+        """
+        return {
+            **self._scheduler.get_status(),
+            "market_data": self._market_data_hub.get_status(),
+        }
+    
+    def get_latency_metrics(self) -> Dict[str, Any]:
+        """
+        엔진(심볼)별 파이프라인 단계 지연 시간 조회 (p50/p95/p99, ms)
+        
+        Returns:
+            {"engines": {엔진 이름: {"symbol", "running", "stages"}}, "scheduler": 심볼별 overrun 통계}
+        """
+        engines = {}
+        for name, engine in self.engines.items():
+            orchestrator = getattr(engine, "orchestrator", None)
+            if orchestrator is None:
+                continue
+            engines[name] = {
+                "symbol": orchestrator.cfg.symbol,
+                "running": orchestrator.is_running(),
+                "stages": orchestrator.latency.snapshot(),
+            }
+        scheduler = self._scheduler.get_status()
+        return {
+            "engines": engines,
+            "scheduler": {
+                "symbols": scheduler["symbols"],
+                "jobs": [
+                    {k: job[k] for k in ("symbol", "steps", "overruns", "missed_ticks",
+                                         "last_lag_sec", "last_duration_sec", "max_duration_sec")}
+                    for job in scheduler["jobs"]
+                ],
+            },
+        }
+    
     def start_all_engines(self) -> List[Dict[str, Any]]:
         """
         모든 엔진 시작
@@ -471,8 +535,11 @@ class EngineManager:
         self.stop_all_engines()
         self._is_monitoring = False
         
-        # ✅ 공유 BinanceClient 정리
-        if hasattr(self, '_shared_binance_client'):
+        # 공유 스케줄러 정지
+        self._scheduler.stop()
+        
+        # ✅ 공유 BinanceClient 정리 (직접 생성한 경우만)
+        if hasattr(self, '_shared_binance_client') and self._owns_binance_client:
             if hasattr(self._shared_binance_client, 'session'):
                 try:
                     self._shared_binance_client.session.close()
@@ -487,17 +554,20 @@ class EngineManager:
 _engine_manager_instance = None
 
 
-def get_engine_manager(db_path: Optional[str] = None) -> EngineManager:
+def get_engine_manager(db_path: Optional[str] = None, binance_client=None) -> EngineManager:
     """
     엔진 매니저 싱글톤 인스턴스 반환
     
     Args:
         db_path: 데이터베이스 파일 경로 (거래 기록 저장용, 선택적)
+        binance_client: 최초 생성 시 엔진에 주입할 BinanceClient (선택적)
     
     Returns:
         EngineManager 인스턴스
     """
     global _engine_manager_instance
     if _engine_manager_instance is None:
-        _engine_manager_instance = EngineManager(db_path=db_path)
+        _engine_manager_instance = EngineManager(db_path=db_path, binance_client=binance_client)
+    elif binance_client is not None and _engine_manager_instance._shared_binance_client is not binance_client:
+        print("[EngineManager] ⚠️  이미 생성된 엔진 매니저가 다른 BinanceClient를 사용 중입니다")
     return _engine_manager_instance
@@ -24,10 +24,24 @@ from .data_fetcher import (
     MarketDataCache,
     BinanceDataFetcher,
 )
+from .candle_buffer import (
+    CandleRingBuffer,
+    CandleColumns,
+)
+from .kline_stream import (
+    KlineStream,
+    parse_kline_message,
+)
 
 from .indicator_engine import (
     IndicatorEngine,
 )
+from .incremental_indicator_engine import (
+    IncrementalIndicatorEngine,
+)
+from .indicator_series import (
+    IndicatorSeries,
+)
 from .signal_engine import (
     SignalEngine,
     SignalEngineConfig,
@@ -44,6 +58,22 @@ from .orchestrator import (
     StrategyOrchestrator,
     OrchestratorConfig,
 )
+from .scheduler import (
+    OrchestratorScheduler,
+)
+from .market_data_hub import (
+    MarketDataHub,
+    get_market_data_hub,
+)
+from .latency import (
+    LatencyRecorder,
+    RollingHistogram,
+)
+from .resampler import (
+    CandleResampler,
+    resample_candles,
+    resample_dataframe,
+)
 
 __all__ = [
     # 데이터 구조
@@ -70,9 +100,20 @@ __all__ = [
     # DataFetcher
     "MarketDataCache",
     "BinanceDataFetcher",
+    "CandleRingBuffer",
+    "CandleColumns",
+    "CandleResampler",
+    "resample_candles",
+    "resample_dataframe",
+    
+    # KlineStream
+    "KlineStream",
+    "parse_kline_message",
     
     # IndicatorEngine
     "IndicatorEngine",
+    "IncrementalIndicatorEngine",
+    "IndicatorSeries",
     
     # SignalEngine
     "SignalEngine",
@@ -89,4 +130,9 @@ __all__ = [
     # Orchestrator
     "StrategyOrchestrator",
     "OrchestratorConfig",
+    "OrchestratorScheduler",
+    "MarketDataHub",
+    "get_market_data_hub",
+    "LatencyRecorder",
+    "RollingHistogram",
 ]
@@ -5,7 +5,10 @@ BacktestAdapter: NewStrategy 백테스트 어댑터
 - 성능 메트릭 계산 (PNL, MDD, 승률, Sharpe)
 """
 import logging
-from backend.core.new_strategy.data_structures import Candle
+from backend.core.new_strategy.data_structures import Candle, InsufficientDataError, OrderResult
+from backend.core.new_strategy.indicator_engine import IndicatorEngine
+from backend.core.new_strategy.indicator_series import IndicatorSeries
+from backend.core.new_strategy.resampler import resample_dataframe
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 import asyncio
@@ -121,6 +124,8 @@ class BacktestConfig:
         leverage: int = 10,
         commission_rate: float = 0.0004,  # 0.04% (Maker/Taker 평균)
         slippage_rate: float = 0.0001,    # 0.01% (시뮬레이션 슬리피지)
+        resample_higher_timeframes: bool = False,  # True면 1m만 로드하고 3m/15m은 로컬 리샘플링
+        fast_path: bool = True,  # True면 지표 시계열을 한 번만 계산하고 인덱스로 평가 (캐시 재구성 없음)
     ):
         self.symbol = symbol
         self.start_date = start_date
@@ -129,302 +134,10 @@ class BacktestConfig:
         self.leverage = leverage
         self.commission_rate = commission_rate
         self.slippage_rate = slippage_rate
+        self.resample_higher_timeframes = resample_higher_timeframes
+        self.fast_path = fast_path
 
 
-class BacktestExecutor:
-    """백테스트 실행 엔진"""
-
-    INTERVAL_MS = {
-        "1m": 60 * 1000,
-        "3m": 3 * 60 * 1000,
-        "15m": 15 * 60 * 1000,
-    }
-
-    def __init__(
-        self,
-        orchestrator,
-        config: BacktestConfig,
-        klines_1m: pd.DataFrame,
-        klines_3m: pd.DataFrame,
-        klines_15m: pd.DataFrame,
-    ):
-        self.orchestrator = orchestrator
-        self.config = config
-        self.klines_1m = klines_1m
-        self.klines_3m = klines_3m
-        self.klines_15m = klines_15m
-
-        # 백테스트 상태
-        self.balance = config.initial_balance
-        self.position = None  # SimulatedPosition
-        self.trades = []      # List[Dict[str, Any]]
-        self.equity_curve = [] # List[Dict[str, Any]]
-
-        # 데이터 인덱스
-        self.current_1m_idx = 0
-        self.current_3m_idx = 0
-        self.current_15m_idx = 0
-
-    def _dataframe_to_candles(self, df, symbol, interval):
-        """DataFrame을 Candle 리스트로 변환 (모든 필드 일관성 보장)"""
-        from backend.core.new_strategy.data_structures import Candle
-        interval_ms = self.INTERVAL_MS[interval]
-        candles = []
-        for _, row in df.iterrows():
-            # timestamp 필드가 datetime이면 ms로 변환, int면 그대로 사용
-            if hasattr(row["timestamp"], "timestamp"):
-                open_time = int(row["timestamp"].timestamp() * 1000)
-            else:
-                open_time = int(row["timestamp"])
-            close_time = open_time + interval_ms - 1
-            candle = Candle(
-                symbol=symbol,
-                interval=interval,
-                open_time=open_time,
-                close_time=close_time,
-                open=float(row["open"]),
-                high=float(row["high"]),
-                low=float(row["low"]),
-                close=float(row["close"]),
-                volume=float(row["volume"]),
-                quote_volume=float(row["quote_volume"]) if "quote_volume" in row and row["quote_volume"] is not None else 0.0,
-                trades_count=int(row["trades"]) if "trades" in row and row["trades"] is not None else 0
-            )
-            candles.append(candle)
-        return candles
-
-    def run(self) -> Dict[str, Any]:
-        """
-        백테스트 실행
-        Returns:
-            {
-                "total_pnl": float,
-                "total_trades": int,
-                "win_rate": float,
-                "max_drawdown": float,
-                "sharpe_ratio": float,
-                "trades": List[Dict],
-                "equity_curve": List[Dict]
-            }
-        """
-        logger.info(f"Starting backtest for {self.config.symbol} "
-                   f"from {self.config.start_date} to {self.config.end_date}")
-
-        # 1분봉 기준으로 순회
-        total_candles = len(self.klines_1m)
-
-        for idx in range(total_candles):
-            current_candle = self.klines_1m.iloc[idx]
-            current_time = current_candle["timestamp"]
-            current_price = current_candle["close"]
-
-            # 3분봉/15분봉 인덱스 업데이트
-            self._update_timeframe_indices(current_time)
-
-            # Orchestrator에 현재 데이터 주입 (실제 구현 시 필요)
-            # orchestrator.data_fetcher.cache를 임시로 업데이트
-            self._inject_data_to_orchestrator(idx)
-
-            # Orchestrator step 실행
-            try:
-                result = self.orchestrator.step()
-
-                # 진입 시그널 처리
-                if result.get("entry_triggered") and self.position is None:
-                    self._handle_entry(result, current_price, current_time)
-
-                # 청산 시그널 처리
-                if result.get("exit_triggered") and self.position is not None:
-                    self._handle_exit(result, current_price, current_time)
-
-            except Exception as e:
-                logger.error(f"Backtest step failed at {current_time}: {e}")
-                continue
-
-            # 에퀴티 커브 기록 (매 100번째 캔들)
-            if idx % 100 == 0:
-                current_equity = self.balance
-                if self.position:
-                    current_equity += self.position.calculate_pnl(current_price)
-
-                self.equity_curve.append({
-                    "timestamp": current_time,
-                    "equity": current_equity,
-                    "balance": self.balance,
-                    "position_pnl": self.position.calculate_pnl(current_price) if self.position else 0
-                })
-
-            # 진행률 표시
-            if idx % 1000 == 0:
-                progress = (idx / total_candles) * 100
-                logger.info(f"Backtest progress: {progress:.1f}% ({idx}/{total_candles})")
-
-        # 미청산 포지션 강제 청산
-        if self.position:
-            final_price = self.klines_1m.iloc[-1]["close"]
-            final_time = self.klines_1m.iloc[-1]["timestamp"]
-            self._handle_exit({"exit_reason": "BACKTEST_END"}, final_price, final_time)
-
-        # 성능 메트릭 계산
-        metrics = self._calculate_metrics()
-
-        logger.info(f"Backtest completed: {len(self.trades)} trades, "
-                   f"Total PNL: {metrics['total_pnl']:.2f} USDT "
-                   f"({metrics['total_pnl_pct']:.2f}%)")
-
-        return metrics
-
-    def _update_timeframe_indices(self, current_time: datetime):
-        # 현재 시간에 맞춰 3m/15m 인덱스 업데이트
-        # 3분봉 인덱스
-        while (self.current_3m_idx < len(self.klines_3m) - 1 and
-               self.klines_3m.iloc[self.current_3m_idx]["timestamp"] <= current_time):
-            self.current_3m_idx += 1
-
-        # 15분봉 인덱스
-        while (self.current_15m_idx < len(self.klines_15m) - 1 and
-               self.klines_15m.iloc[self.current_15m_idx]["timestamp"] <= current_time):
-            self.current_15m_idx += 1
-
-    def _inject_data_to_orchestrator(self, idx: int):
-        # Orchestrator의 DataFetcher 캐시에 백테스트 데이터 주입
-        symbol = self.config.symbol
-        # 캐시 초기화 (기존 데이터 제거)
-        self.orchestrator.fetcher.cache.clear(symbol)
-
-        # 1분봉: 현재 인덱스까지의 최신 200개
-        start_1m = max(0, idx + 1 - 200)
-        df_1m_slice = self.klines_1m.iloc[start_1m:idx+1]
-        candles_1m = self._dataframe_to_candles(df_1m_slice, symbol, "1m")
-
-        # 3분봉: 현재 3m 인덱스까지의 최신 200개
-        start_3m = max(0, self.current_3m_idx + 1 - 200)
-        df_3m_slice = self.klines_3m.iloc[start_3m:self.current_3m_idx+1]
-        candles_3m = self._dataframe_to_candles(df_3m_slice, symbol, "3m")
-
-        # 15분봉: 현재 15m 인덱스까지의 최신 200개
-        start_15m = max(0, self.current_15m_idx + 1 - 200)
-        df_15m_slice = self.klines_15m.iloc[start_15m:self.current_15m_idx+1]
-        candles_15m = self._dataframe_to_candles(df_15m_slice, symbol, "15m")
-
-        # 캐시에 주입
-        self.orchestrator.fetcher.cache.add_candles_bulk(candles_1m)
-        self.orchestrator.fetcher.cache.add_candles_bulk(candles_3m)
-        self.orchestrator.fetcher.cache.add_candles_bulk(candles_15m)
-
-        logger.debug(
-            f"[Backtest] 데이터 주입: 1m={len(candles_1m)}, "
-            f"3m={len(candles_3m)}, 15m={len(candles_15m)} @ idx={idx}"
-        )
-
-    def _handle_entry(self, result: Dict, price: float, timestamp: datetime):
-        # 진입 시그널 처리
-        direction = result.get("entry_signal", {}).get("direction", "LONG")
-        quantity = result.get("position_size", 0.001)  # RiskManager 계산 결과
-
-        self.position = SimulatedPosition(
-            direction=direction,
-            quantity=quantity,
-            entry_price=price,
-            commission_rate=self.config.commission_rate,
-            slippage_rate=self.config.slippage_rate,
-        )
-
-        logger.info(f"[ENTRY] {direction} {quantity} @ {price} at {timestamp}")
-
-    def _handle_exit(self, result: Dict, price: float, timestamp: datetime):
-        """청산 시그널 처리"""
-        if not self.position:
-            return
-
-        pnl = self.position.calculate_pnl(price)
-        self.balance += pnl
-
-        exit_reason = result.get("exit_reason", "SIGNAL")
-
-        trade_record = {
-            "entry_time": self.position.entry_time,
-            "exit_time": timestamp,
-            "direction": self.position.direction,
-            "quantity": self.position.quantity,
-            "entry_price": self.position.effective_entry_price,
-            "exit_price": price,
-            "pnl": pnl,
-            "pnl_pct": (pnl / (self.position.effective_entry_price * self.position.quantity)) * 100,
-            "exit_reason": exit_reason,
-        }
-
-        self.trades.append(trade_record)
-
-        logger.info(f"[EXIT] {exit_reason} @ {price} | PNL: {pnl:.2f} USDT ({trade_record['pnl_pct']:.2f}%)")
-
-        self.position = None
-
-    def _calculate_metrics(self) -> Dict[str, Any]:
-        """성능 메트릭 계산"""
-        if not self.trades:
-            return {
-                "total_pnl": 0,
-                "total_pnl_pct": 0,
-                "total_trades": 0,
-                "win_rate": 0,
-                "avg_win": 0,
-                "avg_loss": 0,
-                "max_drawdown": 0,
-                "sharpe_ratio": 0,
-                "trades": [],
-                "equity_curve": self.equity_curve,
-            }
-
-        total_pnl = sum(t["pnl"] for t in self.trades)
-        total_pnl_pct = (total_pnl / self.config.initial_balance) * 100
-
-        wins = [t for t in self.trades if t["pnl"] > 0]
-        losses = [t for t in self.trades if t["pnl"] <= 0]
-
-        win_rate = (len(wins) / len(self.trades)) * 100 if self.trades else 0
-        avg_win = sum(t["pnl"] for t in wins) / len(wins) if wins else 0
-        avg_loss = sum(t["pnl"] for t in losses) / len(losses) if losses else 0
-
-        # 최대 낙폭 (MDD) 계산
-        equity_values = [eq["equity"] for eq in self.equity_curve]
-        if equity_values:
-            peak = equity_values[0]
-            max_dd = 0
-            for equity in equity_values:
-                if equity > peak:
-                    peak = equity
-                dd = (peak - equity) / peak if peak > 0 else 0
-                if dd > max_dd:
-                    max_dd = dd
-            max_drawdown = max_dd * 100
-        else:
-            max_drawdown = 0
-
-        # Sharpe Ratio 계산 (간단 버전)
-        if len(self.trades) > 1:
-            pnl_series = [t["pnl"] for t in self.trades]
-            avg_pnl = np.mean(pnl_series)
-            std_pnl = np.std(pnl_series)
-            sharpe_ratio = (avg_pnl / std_pnl) * np.sqrt(len(self.trades)) if std_pnl > 0 else 0
-        else:
-            sharpe_ratio = 0
-
-        return {
-            "total_pnl": total_pnl,
-            "total_pnl_pct": total_pnl_pct,
-            "total_trades": len(self.trades),
-            "win_rate": win_rate,
-            "winning_trades": len(wins),
-            "losing_trades": len(losses),
-            "avg_win": avg_win,
-            "avg_loss": avg_loss,
-            "profit_factor": abs(avg_win * len(wins) / (avg_loss * len(losses))) if losses else float('inf'),
-            "max_drawdown": max_drawdown,
-            "sharpe_ratio": sharpe_ratio,
-            "trades": self.trades,
-            "equity_curve": self.equity_curve,
-        }
 class SimulatedPosition:
     """시뮬레이션 포지션 (실제 주문 없음)"""
 
@@ -465,13 +178,33 @@ class SimulatedPosition:
         return net_pnl
 
 
+class _BacktestExecution:
+    """백테스트용 주문 실행기 - 거래소 호출 없이 즉시 체결 (체결가는 Orchestrator가 직전 종가로 대체)"""
+
+    def place_market_long(self, symbol: str, quantity: float) -> OrderResult:
+        return OrderResult(ok=True, symbol=symbol, side="BUY", executed_qty=quantity)
+
+    def close_market_long(self, symbol: str) -> OrderResult:
+        return OrderResult(ok=True, symbol=symbol, side="SELL")
+
+
+def _timestamp_ms(ts) -> int:
+    # timestamp 필드가 datetime이면 ms로 변환, int면 그대로 사용
+    if hasattr(ts, "timestamp"):
+        return int(ts.timestamp() * 1000)
+    return int(ts)
+
+
 class BacktestExecutor:
+    """백테스트 실행 엔진"""
+
     # 타임프레임별 밀리초 간격 상수
     INTERVAL_MS = {
         "1m": 60 * 1000,
         "3m": 3 * 60 * 1000,
         "15m": 15 * 60 * 1000,
     }
+    CACHE_WINDOW = 200  # 스텝마다 Orchestrator 캐시에 주입하는 타임프레임별 최근 캔들 수
 
     def _dataframe_to_candles(self, df, symbol, interval):
         """DataFrame을 Candle 리스트로 변환"""
@@ -479,7 +212,7 @@ class BacktestExecutor:
         interval_ms = self.INTERVAL_MS[interval]
         candles = []
         for _, row in df.iterrows():
-            open_time = int(row["timestamp"].timestamp() * 1000)
+            open_time = _timestamp_ms(row["timestamp"])
             close_time = open_time + interval_ms - 1
             candle = Candle(
                 symbol=symbol,
@@ -502,14 +235,15 @@ class BacktestExecutor:
         orchestrator,
         config: BacktestConfig,
         klines_1m: pd.DataFrame,
-        klines_3m: pd.DataFrame,
-        klines_15m: pd.DataFrame,
+        klines_3m: Optional[pd.DataFrame] = None,
+        klines_15m: Optional[pd.DataFrame] = None,
     ):
         self.orchestrator = orchestrator
         self.config = config
         self.klines_1m = klines_1m
-        self.klines_3m = klines_3m
-        self.klines_15m = klines_15m
+        # 상위 타임프레임 미지정 시 1m에서 리샘플링 (실시간 CandleResampler와 동일 구간 규칙)
+        self.klines_3m = klines_3m if klines_3m is not None else resample_dataframe(klines_1m, "3m")
+        self.klines_15m = klines_15m if klines_15m is not None else resample_dataframe(klines_1m, "15m")
 
         # 백테스트 상태
         self.balance = config.initial_balance
@@ -519,12 +253,21 @@ class BacktestExecutor:
 
         # 데이터 인덱스
         self.current_1m_idx = 0
-        self.current_3m_idx = 0
-        self.current_15m_idx = 0
+        self.current_3m_idx = -1   # 마감된 3m/15m 캔들이 아직 없으면 -1
+        self.current_15m_idx = -1
+
+        # fast path 상태 (타임프레임별 지표 시계열, 1분봉 인덱스 -> 상위 타임프레임 인덱스)
+        self._series: Dict[str, IndicatorSeries] = {}
+        self._tf_index: Dict[str, List[int]] = {}
 
     def run(self) -> Dict[str, Any]:
         """
         백테스트 실행
+
+        fast_path가 켜져 있고 Orchestrator가 지원하면 지표 시계열을 한 번만 계산해 인덱스로 평가하고,
+        아니면 매 1분봉마다 캐시를 재구성해 Orchestrator가 지표를 다시 계산한다 (두 경로의 거래는 동일).
+        주문은 실제 거래소가 아닌 _BacktestExecution으로 즉시 체결된다.
+
         Returns:
             {
                 "total_pnl": float,
@@ -541,57 +284,56 @@ class BacktestExecutor:
 
         # 1분봉 기준으로 순회
         total_candles = len(self.klines_1m)
+        timestamps = self.klines_1m["timestamp"].tolist()
+        closes = self.klines_1m["close"].tolist()
 
-        for idx in range(total_candles):
-            current_candle = self.klines_1m.iloc[idx]
-            current_time = current_candle["timestamp"]
-            current_price = current_candle["close"]
-
-            # 3분봉/15분봉 인덱스 업데이트
-            self._update_timeframe_indices(current_time)
-
-            # Orchestrator에 현재 데이터 주입 (실제 구현 시 필요)
-            # orchestrator.data_fetcher.cache를 임시로 업데이트
-            self._inject_data_to_orchestrator(idx)
-
-            # Orchestrator step 실행
-            try:
-                result = self.orchestrator.step()
-
-                # 진입 시그널 처리
-                if result.get("entry_triggered") and self.position is None:
-                    self._handle_entry(result, current_price, current_time)
-
-                # 청산 시그널 처리
-                if result.get("exit_triggered") and self.position is not None:
-                    self._handle_exit(result, current_price, current_time)
-
-            except Exception as e:
-                logger.error(f"Backtest step failed at {current_time}: {e}")
-                continue
-
-            # 에퀴티 커브 기록 (매 100번째 캔들)
-            if idx % 100 == 0:
-                current_equity = self.balance
-                if self.position:
-                    current_equity += self.position.calculate_pnl(current_price)
-
-                self.equity_curve.append({
-                    "timestamp": current_time,
-                    "equity": current_equity,
-                    "balance": self.balance,
-                    "position_pnl": self.position.calculate_pnl(current_price) if self.position else 0
-                })
-
-            # 진행률 표시
-            if idx % 1000 == 0:
-                progress = (idx / total_candles) * 100
-                logger.info(f"Backtest progress: {progress:.1f}% ({idx}/{total_candles})")
+        if self.config.fast_path and self._fast_path_supported():
+            self._prepare_fast_path()
+            step = self._fast_step
+        else:
+            step = self._orchestrator_step
+
+        live_exec = self.orchestrator.exec
+        self.orchestrator.exec = _BacktestExecution()
+        try:
+            for idx in range(total_candles):
+                current_time = timestamps[idx]
+                current_price = closes[idx]
+
+                try:
+                    result = step(idx, current_time, current_price)
+                    self._apply_step_result(result, current_price, current_time)
+                except InsufficientDataError:
+                    # 지표 윈도우 미충족 (warmup 구간)
+                    continue
+                except Exception as e:
+                    logger.error(f"Backtest step failed at {current_time}: {e}")
+                    continue
+
+                # 에퀴티 커브 기록 (매 100번째 캔들)
+                if idx % 100 == 0:
+                    current_equity = self.balance
+                    if self.position:
+                        current_equity += self.position.calculate_pnl(current_price)
+
+                    self.equity_curve.append({
+                        "timestamp": current_time,
+                        "equity": current_equity,
+                        "balance": self.balance,
+                        "position_pnl": self.position.calculate_pnl(current_price) if self.position else 0
+                    })
+
+                # 진행률 표시
+                if idx % 1000 == 0:
+                    progress = (idx / total_candles) * 100
+                    logger.info(f"Backtest progress: {progress:.1f}% ({idx}/{total_candles})")
+        finally:
+            self.orchestrator.exec = live_exec
 
         # 미청산 포지션 강제 청산
         if self.position:
-            final_price = self.klines_1m.iloc[-1]["close"]
-            final_time = self.klines_1m.iloc[-1]["timestamp"]
+            final_price = closes[-1]
+            final_time = timestamps[-1]
             self._handle_exit({"exit_reason": "BACKTEST_END"}, final_price, final_time)
 
         # 성능 메트릭 계산
@@ -603,36 +345,105 @@ class BacktestExecutor:
 
         return metrics
 
+    def _orchestrator_step(self, idx: int, current_time: datetime, current_price: float) -> Dict[str, Any]:
+        # 캐시 재구성 경로: 최근 캔들을 주입하고 Orchestrator가 지표부터 다시 계산
+        # (step()은 REST 캔들 갱신을 포함하므로 주입한 캐시만으로 평가)
+        self._update_timeframe_indices(current_time)
+        self._inject_data_to_orchestrator(idx)
+        return self.orchestrator._evaluate_step()
+
+    def _fast_path_supported(self) -> bool:
+        # 지표 시계열이 IndicatorEngine 결과와 비트 단위로 일치하는 구성인지 확인
+        orch = self.orchestrator
+        indicator = getattr(orch, "indicator", None)
+        cfg = getattr(orch, "cfg", None)
+        if indicator is None or cfg is None or not hasattr(orch, "evaluate_indicators"):
+            return False
+        if getattr(type(indicator), "calculate_columns", None) is not IndicatorEngine.calculate_columns:
+            return False
+        if (cfg.interval_entry, cfg.interval_confirm, cfg.interval_filter) != ("1m", "3m", "15m"):
+            return False
+        return IndicatorSeries.MIN_WINDOW <= indicator.required_candles <= self.CACHE_WINDOW
+
+    def _prepare_fast_path(self):
+        # 타임프레임별 지표 시계열을 한 번만 계산하고, 1분봉 인덱스 -> 3m/15m 인덱스 매핑 준비
+        window = self.orchestrator.indicator.required_candles
+        times_1m = np.array([_timestamp_ms(ts) for ts in self.klines_1m["timestamp"]], dtype=np.int64)
+        for interval, df in (("1m", self.klines_1m), ("3m", self.klines_3m), ("15m", self.klines_15m)):
+            open_ms = np.array([_timestamp_ms(ts) for ts in df["timestamp"]], dtype=np.int64)
+            self._series[interval] = IndicatorSeries(
+                self.config.symbol,
+                open_ms + self.INTERVAL_MS[interval] - 1,
+                df["high"].to_numpy(dtype=np.float64),
+                df["low"].to_numpy(dtype=np.float64),
+                df["close"].to_numpy(dtype=np.float64),
+                df["volume"].to_numpy(dtype=np.float64),
+                window=window,
+            )
+            if interval != "1m":
+                # _update_timeframe_indices와 동일: 현재 1분봉 마감 시각까지 마감된 마지막 캔들 (-1이면 없음 → warmup)
+                close_ms = open_ms + self.INTERVAL_MS[interval]
+                pos = np.searchsorted(close_ms, times_1m + self.INTERVAL_MS["1m"], side="right") - 1
+                self._tf_index[interval] = pos.tolist()
+
+    def _fast_step(self, idx: int, current_time: datetime, current_price: float) -> Dict[str, Any]:
+        # 미리 계산한 지표를 인덱스로 꺼내 SignalEngine/RiskManager 평가 (InsufficientDataError는 warmup)
+        ind_1m = self._series["1m"].at(idx)
+        ind_3m = self._series["3m"].at(self._tf_index["3m"][idx])
+        ind_15m = self._series["15m"].at(self._tf_index["15m"][idx])
+        return self.orchestrator.evaluate_indicators(ind_1m, ind_3m, ind_15m, float(current_price))
+
+    def _apply_step_result(self, result: Dict[str, Any], price: float, timestamp: datetime):
+        # Orchestrator 이벤트(ENTRY/EXIT)를 시뮬레이션 포지션에 반영
+        if result.get("entry_triggered") and self.position is None:
+            self._handle_entry(result, price, timestamp)
+        if result.get("exit_triggered") and self.position is not None:
+            self._handle_exit(result, price, timestamp)
+
+        for event in result.get("events", []):
+            if event.get("type") == "ENTRY" and self.position is None:
+                orch_position = getattr(self.orchestrator, "position", None)
+                quantity = orch_position.quantity if orch_position is not None else self.orchestrator.cfg.order_quantity
+                self._handle_entry({"position_size": quantity}, price, timestamp)
+            elif event.get("type") == "EXIT" and self.position is not None:
+                self._handle_exit({"exit_reason": event.get("reason", "SIGNAL")}, price, timestamp)
+
     def _update_timeframe_indices(self, current_time: datetime):
-        # 현재 시간에 맞춰 3m/15m 인덱스 업데이트
+        # 현재 1분봉 마감 시각까지 마감된 마지막 3m/15m 캔들로 인덱스 업데이트
+        # (형성 중인 상위 캔들을 쓰면 미래 가격을 보게 되므로 close_time <= 현재 1분봉 close_time만 허용)
+        current_close_ms = _timestamp_ms(current_time) + self.INTERVAL_MS["1m"]
+
         # 3분봉 인덱스
         while (self.current_3m_idx < len(self.klines_3m) - 1 and
-               self.klines_3m.iloc[self.current_3m_idx]["timestamp"] <= current_time):
+               _timestamp_ms(self.klines_3m.iloc[self.current_3m_idx + 1]["timestamp"])
+               + self.INTERVAL_MS["3m"] <= current_close_ms):
             self.current_3m_idx += 1
 
         # 15분봉 인덱스
         while (self.current_15m_idx < len(self.klines_15m) - 1 and
-               self.klines_15m.iloc[self.current_15m_idx]["timestamp"] <= current_time):
+               _timestamp_ms(self.klines_15m.iloc[self.current_15m_idx + 1]["timestamp"])
+               + self.INTERVAL_MS["15m"] <= current_close_ms):
             self.current_15m_idx += 1
 
     def _inject_data_to_orchestrator(self, idx: int):
         # Orchestrator의 DataFetcher 캐시에 백테스트 데이터 주입
         symbol = self.config.symbol
+        window = self.CACHE_WINDOW
         # 캐시 초기화 (기존 데이터 제거)
         self.orchestrator.fetcher.cache.clear(symbol)
 
         # 1분봉: 현재 인덱스까지의 최신 200개
-        start_1m = max(0, idx + 1 - 200)
+        start_1m = max(0, idx + 1 - window)
         df_1m_slice = self.klines_1m.iloc[start_1m:idx+1]
         candles_1m = self._dataframe_to_candles(df_1m_slice, symbol, "1m")
 
         # 3분봉: 현재 3m 인덱스까지의 최신 200개
-        start_3m = max(0, self.current_3m_idx + 1 - 200)
+        start_3m = max(0, self.current_3m_idx + 1 - window)
         df_3m_slice = self.klines_3m.iloc[start_3m:self.current_3m_idx+1]
         candles_3m = self._dataframe_to_candles(df_3m_slice, symbol, "3m")
 
         # 15분봉: 현재 15m 인덱스까지의 최신 200개
-        start_15m = max(0, self.current_15m_idx + 1 - 200)
+        start_15m = max(0, self.current_15m_idx + 1 - window)
         df_15m_slice = self.klines_15m.iloc[start_15m:self.current_15m_idx+1]
         candles_15m = self._dataframe_to_candles(df_15m_slice, symbol, "15m")
 
@@ -783,22 +594,26 @@ class BacktestAdapter:
         klines_1m_raw = self.data_loader.load_historical_klines(
             config.symbol, "1m", start_ts, end_ts
         )
-        klines_3m_raw = self.data_loader.load_historical_klines(
-            config.symbol, "3m", start_ts, end_ts
-        )
-        klines_15m_raw = self.data_loader.load_historical_klines(
-            config.symbol, "15m", start_ts, end_ts
-        )
-
         klines_1m = self.data_loader.klines_to_dataframe(klines_1m_raw)
-        klines_3m = self.data_loader.klines_to_dataframe(klines_3m_raw)
-        klines_15m = self.data_loader.klines_to_dataframe(klines_15m_raw)
-
-        logger.info(f"Loaded {len(klines_1m)} 1m, {len(klines_3m)} 3m, {len(klines_15m)} 15m candles")
 
         if klines_1m.empty:
             raise ValueError(f"No data loaded for {config.symbol} in the given date range")
 
+        if config.resample_higher_timeframes:
+            # 1m만 조회하고 3m/15m은 BacktestExecutor에서 리샘플링
+            klines_3m = klines_15m = None
+            logger.info(f"Loaded {len(klines_1m)} 1m candles (3m/15m resampled locally)")
+        else:
+            klines_3m_raw = self.data_loader.load_historical_klines(
+                config.symbol, "3m", start_ts, end_ts
+            )
+            klines_15m_raw = self.data_loader.load_historical_klines(
+                config.symbol, "15m", start_ts, end_ts
+            )
+            klines_3m = self.data_loader.klines_to_dataframe(klines_3m_raw)
+            klines_15m = self.data_loader.klines_to_dataframe(klines_15m_raw)
+            logger.info(f"Loaded {len(klines_1m)} 1m, {len(klines_3m)} 3m, {len(klines_15m)} 15m candles")
+
         # 2. 백테스트 실행
         executor = BacktestExecutor(
             orchestrator=orchestrator,
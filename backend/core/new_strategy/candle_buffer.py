@@ -0,0 +1,162 @@
+"""컬럼형 캔들 링 버퍼 - 필드별 float64 배열에 저장하고 최근 N개를 zero-copy 뷰로 제공"""
+from typing import List, NamedTuple, Optional
+
+import numpy as np
+
+from .data_structures import Candle
+
+# 저장 컬럼 순서 (모두 float64, ms 타임스탬프는 2^53 이하이므로 손실 없음)
+CANDLE_FIELDS = (
+    "open_time", "close_time", "open", "high", "low", "close",
+    "volume", "quote_volume", "trades_count", "is_closed",
+)
+_F = {name: i for i, name in enumerate(CANDLE_FIELDS)}
+
+
+class CandleColumns(NamedTuple):
+    """최근 N개 캔들의 컬럼 뷰 (각 필드는 길이 N의 1-D float64 배열)"""
+    symbol: str
+    interval: str
+    open_time: np.ndarray
+    close_time: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    quote_volume: np.ndarray
+    trades_count: np.ndarray
+    is_closed: np.ndarray
+
+    def __len__(self) -> int:  # type: ignore[override]
+        return len(self.close)
+
+    def candle_at(self, i: int) -> Candle:
+        """i번째 행을 Candle로 변환 (호환 계층)"""
+        return Candle(
+            symbol=self.symbol,
+            interval=self.interval,
+            open_time=int(self.open_time[i]),
+            close_time=int(self.close_time[i]),
+            open=float(self.open[i]),
+            high=float(self.high[i]),
+            low=float(self.low[i]),
+            close=float(self.close[i]),
+            volume=float(self.volume[i]),
+            quote_volume=float(self.quote_volume[i]),
+            trades_count=int(self.trades_count[i]),
+            is_closed=bool(self.is_closed[i]),
+        )
+
+
+class CandleRingBuffer:
+    """
+    단일 (symbol, interval) 캔들 링 버퍼
+
+    - 필드별로 연속된 float64 행(row)을 가진 (필드 수 x 할당 길이) 배열 하나에 저장
+    - 쓰기 위치가 배열 끝에 닿으면 최근 capacity-1개를 앞으로 당겨 압축하므로
+      최근 N개는 항상 연속 구간이며 columns()는 복사 없이 뷰를 반환 (압축은 분할상환 O(1))
+    - 할당 길이는 capacity + slack까지 필요한 만큼만 2배씩 증가
+
+    Note:
+        columns()가 반환한 뷰는 버퍼 메모리를 그대로 참조한다. 이후 add()로 진행 중 캔들이
+        갱신되거나 압축이 일어나면 값이 바뀔 수 있으므로, 보관이 필요하면 복사해서 사용한다.
+    """
+
+    _INITIAL_ROWS = 64
+
+    def __init__(self, symbol: str, interval: str, capacity: int = 2000):
+        if capacity <= 0:
+            raise ValueError(f"capacity는 양수여야 합니다: {capacity}")
+        self.symbol = symbol
+        self.interval = interval
+        self.capacity = capacity
+        self._slack = max(16, capacity // 4)
+        self._data = np.empty((len(CANDLE_FIELDS), min(self._INITIAL_ROWS, capacity + self._slack)))
+        self._start = 0
+        self._end = 0
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    @property
+    def nbytes(self) -> int:
+        return self._data.nbytes
+
+    @property
+    def last_open_time(self) -> Optional[int]:
+        if self._end == self._start:
+            return None
+        return int(self._data[_F["open_time"], self._end - 1])
+
+    def add(self, candle: Candle) -> None:
+        """새 캔들 추가 또는 마지막 캔들 갱신 (같은 open_time). 과거 캔들은 무시."""
+        last = self.last_open_time
+        if last is not None and candle.open_time < last:
+            return
+        if last is None or candle.open_time != last:
+            self._reserve_row()
+            self._end += 1
+            if self._end - self._start > self.capacity:
+                self._start += 1
+        self._write_row(self._end - 1, candle)
+
+    def extend(self, candles: List[Candle]) -> None:
+        for candle in candles:
+            self.add(candle)
+
+    def _write_row(self, pos: int, c: Candle) -> None:
+        self._data[:, pos] = (
+            c.open_time, c.close_time, c.open, c.high, c.low, c.close,
+            c.volume, c.quote_volume, c.trades_count, 1.0 if c.is_closed else 0.0,
+        )
+
+    def _reserve_row(self) -> None:
+        """다음 쓰기 위치 확보 (필요 시 증설 또는 압축)"""
+        alloc = self._data.shape[1]
+        if self._end < alloc:
+            return
+        keep = min(len(self), self.capacity - 1)
+        max_alloc = self.capacity + self._slack
+        if alloc < max_alloc:
+            new_alloc = min(max_alloc, alloc * 2)
+            data = np.empty((len(CANDLE_FIELDS), new_alloc))
+        else:
+            data = self._data
+        data[:, :keep] = self._data[:, self._end - keep:self._end]
+        self._data = data
+        self._start = 0
+        self._end = keep
+
+    def columns(self, count: Optional[int] = None, closed_only: bool = False) -> CandleColumns:
+        """
+        최근 count개(미지정 시 전체) 컬럼 뷰 (시간 오름차순, zero-copy)
+
+        closed_only=True면 마지막 진행 중 캔들을 제외하고 종료된 캔들까지만 반환한다.
+        """
+        end = self._end
+        if closed_only and end > self._start and not self._data[_F["is_closed"], end - 1]:
+            end -= 1
+        n = end - self._start if count is None else min(count, end - self._start)
+        block = self._data[:, end - n:end]
+        return CandleColumns(self.symbol, self.interval, *block)
+
+    def closed_count(self) -> int:
+        """종료된 캔들 수 (마지막 진행 중 캔들 제외)"""
+        n = len(self)
+        if n and not self._data[_F["is_closed"], self._end - 1]:
+            n -= 1
+        return n
+
+    def to_candles(self, count: Optional[int] = None) -> List[Candle]:
+        cols = self.columns(count)
+        return [cols.candle_at(i) for i in range(len(cols))]
+
+    def latest(self) -> Optional[Candle]:
+        if self._end == self._start:
+            return None
+        return self.columns(1).candle_at(0)
+
+    def clear(self) -> None:
+        self._start = 0
+        self._end = 0
@@ -1,56 +1,89 @@
 """데이터 수집 모듈 - Binance 실시간/과거 캔들 데이터 조회"""
 import asyncio
+import inspect
+import time
 from typing import List, Dict, Optional, Callable
-from collections import defaultdict, deque
 import logging
 
 from .data_structures import Candle, APIError, InsufficientDataError
+from .candle_buffer import CandleRingBuffer, CandleColumns
+from .kline_stream import KlineStream
 
 logger = logging.getLogger(__name__)
 
 
 class MarketDataCache:
-    """멀티 심볼/타임프레임 시계열 데이터 캐시"""
+    """멀티 심볼/타임프레임 시계열 데이터 캐시 (컬럼형 NumPy 링 버퍼 기반)"""
     
     def __init__(self, max_candles: int = 2000):
         self.max_candles = max_candles
-        # {symbol: {interval: deque[Candle]}}
-        self._cache: Dict[str, Dict[str, deque]] = defaultdict(lambda: defaultdict(lambda: deque(maxlen=max_candles)))
+        # {symbol: {interval: CandleRingBuffer}}
+        self._cache: Dict[str, Dict[str, CandleRingBuffer]] = {}
+    
+    def _buffer(self, symbol: str, interval: str, create: bool = False) -> Optional[CandleRingBuffer]:
+        by_interval = self._cache.get(symbol)
+        if by_interval is None:
+            if not create:
+                return None
+            by_interval = self._cache[symbol] = {}
+        buf = by_interval.get(interval)
+        if buf is None and create:
+            buf = by_interval[interval] = CandleRingBuffer(symbol, interval, self.max_candles)
+        return buf
     
     def add_candle(self, candle: Candle) -> None:
-        """새 캔들 추가 (최신 데이터는 뒤에 추가)"""
-        cache = self._cache[candle.symbol][candle.interval]
-        
-        # 중복 체크 (같은 open_time)
-        if cache and cache[-1].open_time == candle.open_time:
-            # 기존 캔들 업데이트 (실시간 갱신)
-            cache[-1] = candle
-        else:
-            cache.append(candle)
+        """새 캔들 추가 (최신 데이터는 뒤에 추가, 같은 open_time은 실시간 갱신, 과거 캔들은 무시)"""
+        self._buffer(candle.symbol, candle.interval, create=True).add(candle)
     
     def add_candles_bulk(self, candles: List[Candle]) -> None:
         """과거 데이터 벌크 추가 (오름차순 정렬 가정)"""
         for candle in candles:
             self.add_candle(candle)
     
-    def get_latest_candles(self, symbol: str, interval: str, count: int) -> List[Candle]:
-        """최신 N개 캔들 조회 (시간 순서 오름차순)"""
-        cache = self._cache[symbol][interval]
-        if len(cache) < count:
+    def count(self, symbol: str, interval: str, closed_only: bool = False) -> int:
+        """캐시된 캔들 수 (closed_only면 진행 중 캔들 제외)"""
+        buf = self._buffer(symbol, interval)
+        if buf is None:
+            return 0
+        return buf.closed_count() if closed_only else len(buf)
+    
+    def get_latest_columns(
+        self, symbol: str, interval: str, count: int, closed_only: bool = False
+    ) -> CandleColumns:
+        """최신 N개 캔들 컬럼 뷰 (시간 오름차순, 복사 없음, closed_only면 진행 중 캔들 제외)"""
+        buf = self._buffer(symbol, interval)
+        if buf is None:
+            have = 0
+        else:
+            have = buf.closed_count() if closed_only else len(buf)
+        if have < count:
             raise InsufficientDataError(
-                f"요청 캔들 수({count}) > 캐시 크기({len(cache)}) for {symbol}/{interval}"
+                f"요청 캔들 수({count}) > 캐시 크기({have}) for {symbol}/{interval}"
             )
-        return list(cache)[-count:]
+        return buf.columns(count, closed_only=closed_only)
+    
+    def get_latest_candles(self, symbol: str, interval: str, count: int) -> List[Candle]:
+        """최신 N개 캔들 조회 (시간 오름차순, Candle 호환 계층)"""
+        cols = self.get_latest_columns(symbol, interval, count)
+        return [cols.candle_at(i) for i in range(count)]
     
     def get_latest_candle(self, symbol: str, interval: str) -> Optional[Candle]:
         """최신 캔들 1개 조회"""
-        cache = self._cache[symbol][interval]
-        return cache[-1] if cache else None
+        buf = self._buffer(symbol, interval)
+        return buf.latest() if buf is not None else None
     
     def has_sufficient_data(self, symbol: str, interval: str, required_count: int) -> bool:
         """충분한 데이터 존재 여부"""
-        cache = self._cache[symbol][interval]
-        return len(cache) >= required_count
+        return self.count(symbol, interval) >= required_count
+    
+    def evict(self, symbol: str, interval: str) -> None:
+        """단일 (symbol, interval) 캐시 제거"""
+        by_interval = self._cache.get(symbol)
+        if by_interval is None:
+            return
+        by_interval.pop(interval, None)
+        if not by_interval:
+            del self._cache[symbol]
     
     def clear(self, symbol: Optional[str] = None) -> None:
         """캐시 초기화 (symbol 미지정 시 전체)"""
@@ -67,16 +100,26 @@ class BinanceDataFetcher:
         "1m": "1m", "3m": "3m", "5m": "5m", "15m": "15m",
         "30m": "30m", "1h": "1h", "4h": "4h", "1d": "1d"
     }
+
+    INTERVAL_MS = {
+        "1m": 60 * 1000, "3m": 3 * 60 * 1000, "5m": 5 * 60 * 1000,
+        "15m": 15 * 60 * 1000, "30m": 30 * 60 * 1000, "1h": 60 * 60 * 1000,
+        "4h": 4 * 60 * 60 * 1000, "1d": 24 * 60 * 60 * 1000,
+    }
     
-    def __init__(self, binance_client):
+    def __init__(self, binance_client, ws_url: Optional[str] = None):
         """
         Args:
             binance_client: backend.api_client.binance_client.BinanceClient 인스턴스
+            ws_url: kline WebSocket 엔드포인트 (None이면 BINANCE_WS_BASE_URL_PUBLIC 사용)
         """
         self.client = binance_client
         self.cache = MarketDataCache()
+        self.ws_url = ws_url
         self._running = False
         self._update_tasks: Dict[str, asyncio.Task] = {}
+        self._stream: Optional[KlineStream] = None
+        self._on_candle_update: Optional[Callable[[Candle], None]] = None
     
     async def fetch_historical_candles(
         self,
@@ -106,7 +149,7 @@ class BinanceDataFetcher:
             raise ValueError(f"지원하지 않는 타임프레임: {interval}")
         
         try:
-            klines = self.client.get_klines(
+            klines = await self._request_klines(
                 symbol=symbol,
                 interval=interval,
                 limit=min(limit, 1500),
@@ -114,6 +157,8 @@ class BinanceDataFetcher:
                 end_time=end_time
             )
             
+            # 서버 시간 기준으로 진행 중인 마지막 캔들 구분
+            now_ms = self._server_now_ms()
             candles = []
             for k in klines:
                 candle = Candle(
@@ -127,7 +172,8 @@ class BinanceDataFetcher:
                     close=float(k[4]),
                     volume=float(k[5]),
                     quote_volume=float(k[7]),
-                    trades_count=int(k[8])
+                    trades_count=int(k[8]),
+                    is_closed=int(k[6]) < now_ms
                 )
                 candles.append(candle)
             
@@ -141,6 +187,25 @@ class BinanceDataFetcher:
             logger.error(f"과거 캔들 조회 실패: {symbol}/{interval} - {e}")
             raise APIError(f"Binance Klines API 오류: {e}") from e
     
+    def _server_now_ms(self) -> int:
+        return int(time.time() * 1000) + int(getattr(self.client, "time_offset", 0) or 0)
+    
+    def is_streaming(self) -> bool:
+        """kline WebSocket 스트림 연결 여부 (캐시의 진행 중 캔들이 실시간 갱신되는지)"""
+        return self._stream is not None and self._stream.is_connected()
+    
+    async def _request_klines(self, **kwargs) -> List[List]:
+        """
+        klines REST 호출 (이벤트 루프 비차단)
+
+        클라이언트가 get_klines_async()를 제공하면 그대로 await하고,
+        동기 클라이언트만 있으면 워커 스레드에서 실행해 gather 동시 실행이 가능하도록 한다.
+        """
+        get_async = getattr(self.client, "get_klines_async", None)
+        if inspect.iscoroutinefunction(get_async):
+            return await get_async(**kwargs)
+        return await asyncio.to_thread(self.client.get_klines, **kwargs)
+    
     async def get_latest_candles(self, symbol: str, interval: str, count: int) -> List[Candle]:
         """
         캐시에서 최신 N개 캔들 조회 (부족 시 API 요청)
@@ -178,26 +243,49 @@ class BinanceDataFetcher:
         self,
         symbols: List[str],
         intervals: List[str],
-        on_candle_update: Optional[Callable[[Candle], None]] = None
+        on_candle_update: Optional[Callable[[Candle], None]] = None,
+        mode: str = "websocket"
     ) -> None:
         """
-        실시간 캔들 업데이트 시작 (WebSocket)
+        실시간 캔들 업데이트 시작
         
         Args:
             symbols: 구독할 심볼 리스트
             intervals: 구독할 타임프레임 리스트
             on_candle_update: 캔들 업데이트 시 호출할 콜백 (선택)
+            mode: "websocket" (단일 combined kline 스트림) 또는 "polling" (REST 1초 폴링)
         
         Note:
-            - 현재는 폴링 방식으로 구현 (1초마다 최신 캔들 조회)
-            - 추후 WebSocket으로 전환 가능
+            - websocket 모드는 진행 중/종료 캔들을 모두 캐시에 반영 (Candle.is_closed로 구분)
+            - 연결이 끊기면 자동 재연결/재구독 후 끊긴 구간을 REST로 보정
         """
         if self._running:
             logger.warning("실시간 업데이트가 이미 실행 중입니다")
             return
         
+        if mode not in ("websocket", "polling"):
+            raise ValueError(f"지원하지 않는 실시간 업데이트 모드: {mode}")
+        
         self._running = True
-        logger.info(f"실시간 업데이트 시작: {len(symbols)} symbols, {len(intervals)} intervals")
+        self._on_candle_update = on_candle_update
+        logger.info(f"실시간 업데이트 시작({mode}): {len(symbols)} symbols, {len(intervals)} intervals")
+        
+        if mode == "websocket":
+            for interval in intervals:
+                if interval not in self.KLINE_INTERVALS:
+                    raise ValueError(f"지원하지 않는 타임프레임: {interval}")
+            url = self.ws_url
+            if url is None:
+                from backend.utils.config_loader import BINANCE_WS_BASE_URL_PUBLIC
+                url = BINANCE_WS_BASE_URL_PUBLIC
+            self._stream = KlineStream(
+                url=url,
+                on_candle=self._on_stream_candle,
+                on_reconnect=self._backfill_after_reconnect,
+            )
+            await self._stream.subscribe(symbols, intervals)
+            await self._stream.start()
+            return
         
         # 각 심볼/타임프레임 조합마다 폴링 태스크 생성
         for symbol in symbols:
@@ -208,6 +296,30 @@ class BinanceDataFetcher:
                 )
                 self._update_tasks[key] = task
     
+    def _on_stream_candle(self, candle: Candle) -> None:
+        """WebSocket 캔들 수신 → 캐시 반영 후 콜백 호출"""
+        self.cache.add_candle(candle)
+        if self._on_candle_update:
+            try:
+                self._on_candle_update(candle)
+            except Exception as e:
+                logger.error(f"캔들 업데이트 콜백 오류: {e}")
+    
+    async def _backfill_after_reconnect(self) -> None:
+        """재연결 후 끊긴 구간 캔들을 REST로 보정 (캐시 최신 캔들 시점부터 조회)"""
+        if self._stream is None:
+            return
+        for symbol, interval in self._stream.subscriptions:
+            last = self.cache.get_latest_candle(symbol, interval)
+            if last is None:
+                continue
+            try:
+                await self.fetch_historical_candles(
+                    symbol, interval, limit=1500, start_time=last.open_time
+                )
+            except APIError as e:
+                logger.warning(f"재연결 보정 실패 ({symbol}/{interval}): {e}")
+    
     async def _poll_candle_updates(
         self,
         symbol: str,
@@ -243,6 +355,11 @@ class BinanceDataFetcher:
         
         self._running = False
         
+        # WebSocket 스트림 종료
+        if self._stream is not None:
+            await self._stream.stop()
+            self._stream = None
+        
         # 모든 폴링 태스크 취소
         for task in self._update_tasks.values():
             task.cancel()
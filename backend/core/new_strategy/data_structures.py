@@ -18,6 +18,7 @@ class Candle:
     volume: float
     quote_volume: float  # USDT volume
     trades_count: int = 0
+    is_closed: bool = True  # False: 진행 중인 캔들 (WebSocket 부분 갱신)
 
 
 @dataclass
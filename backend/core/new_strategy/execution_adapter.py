@@ -35,6 +35,7 @@ class ExecutionAdapter:
     def normalize_quantity(self, symbol: str, raw_qty: float, price_hint: Optional[float] = None) -> Dict[str, Any]:
         try:
             if price_hint is None:
+                # markPrice 스트림 캐시가 신선하면 메모리에서 반환 (REST 왕복 없음)
                 mp = self.client.get_mark_price(symbol)
                 price_hint = float(mp.get("markPrice", 0)) if isinstance(mp, dict) else 0.0
             norm = self.client._round_qty_by_filters(symbol, raw_qty, price_hint=price_hint)
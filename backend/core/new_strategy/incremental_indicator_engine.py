@@ -0,0 +1,408 @@
+"""증분 지표 엔진 - (symbol, interval)별 상태를 유지하여 캔들당 O(1) 갱신"""
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+import logging
+
+from .data_structures import Candle, IndicatorSet, InsufficientDataError
+from .candle_buffer import CandleColumns
+from .indicator_engine import IndicatorEngine
+
+logger = logging.getLogger(__name__)
+
+EMA_PERIODS = (5, 10, 20, 60, 120)
+MACD_FAST, MACD_SLOW, MACD_SIGNAL = 12, 26, 9
+RSI_PERIOD = 14
+STOCH_PERIOD = 14
+ATR_PERIOD = 14
+VOLUME_LOOKBACK = 20
+VOLUME_SPIKE_MULTIPLIER = 3.0
+
+# H 재귀를 유지하는 EMA 기간 (지표 EMA + MACD fast/slow)
+_H_PERIODS = EMA_PERIODS + (MACD_FAST, MACD_SLOW)
+_I_FAST = _H_PERIODS.index(MACD_FAST)
+_I_SLOW = _H_PERIODS.index(MACD_SLOW)
+
+
+def _ema_k(period: int) -> float:
+    return 2.0 / (period + 1)
+
+
+class _Row:
+    """캔들 1개 위치의 원본 값과 누적 재귀 값"""
+
+    __slots__ = (
+        "open_time", "close_time", "high", "low", "close", "volume",
+        "pv", "pos_volume", "h", "m", "m9", "tr", "ha", "gain", "loss", "gg", "gl",
+    )
+
+
+class _SeriesState:
+    """
+    단일 (symbol, interval) 시계열의 슬라이딩 윈도우 상태
+
+    IndicatorEngine.calculate()는 최근 N개 캔들 윈도우의 첫 값으로 EMA를 초기화하고
+    윈도우 내 첫 14개 변화량 SMA로 Wilder 평균을 초기화한다. 윈도우와 무관한 누적 재귀
+    H(t) = a*H(t-1) + x(t) 를 위치별로 저장해 두면 윈도우 [s, e] 결과는
+
+        EMA(s, e) = a^(e-s) * (x(s) - k*H(s)) + k*H(e)
+
+    처럼 윈도우 시작/끝 값만으로 닫힌 형태로 계산된다 (Wilder, ATR, MACD signal 동일).
+    재귀 오차는 a < 1로 감쇠하므로 장시간 실행해도 누적되지 않는다.
+    """
+
+    def __init__(self, window: int):
+        self.window = window
+        self.rows: Deque[_Row] = deque(maxlen=window)
+        self._sum_pv = 0.0
+        self._sum_v = 0.0
+        self._appends_since_resync = 0
+
+        n = window - 1
+        self._a = {p: 1.0 - _ema_k(p) for p in _H_PERIODS}
+        self._a_n = {p: self._a[p] ** n for p in _H_PERIODS}
+
+        self._a_atr = 1.0 - _ema_k(ATR_PERIOD)
+        self._a_atr_n = self._a_atr ** n
+
+        # MACD signal: 윈도우 EMA9(MACD) 닫힌 형태 계수
+        a9 = 1.0 - _ema_k(MACD_SIGNAL)
+        self._a9 = a9
+        self._a9_n = a9 ** n
+        self._g_fast = self._geometric(a9, self._a[MACD_FAST], n)
+        self._g_slow = self._geometric(a9, self._a[MACD_SLOW], n)
+
+        # Wilder: avg(r) = aw^(r-p) * (SMA - G(p)/p) + G(r)/p  (r: 윈도우 내 상대 위치)
+        self._aw = (RSI_PERIOD - 1) / RSI_PERIOD
+        self._aw_pow = [self._aw ** (r - RSI_PERIOD) for r in range(window - STOCH_PERIOD, window)]
+
+    @staticmethod
+    def _geometric(a: float, b: float, n: int) -> float:
+        """sum_{j=1..n} a^(n-j) * b^j"""
+        return b * (a ** n - b ** n) / (a - b)
+
+    @property
+    def last_open_time(self) -> Optional[int]:
+        return self.rows[-1].open_time if self.rows else None
+
+    def is_ready(self) -> bool:
+        return len(self.rows) >= self.window
+
+    # ----------------------
+    # 갱신
+    # ----------------------
+    def update(self, candle: Candle) -> None:
+        """새 캔들 추가 또는 진행 중 캔들 갱신 (같은 open_time)"""
+        self.update_values(
+            candle.open_time, candle.close_time,
+            candle.high, candle.low, candle.close, candle.volume,
+        )
+
+    def update_values(
+        self,
+        open_time: int,
+        close_time: int,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+    ) -> None:
+        """update()의 필드 단위 버전 (컬럼 뷰에서 Candle 생성 없이 반영)"""
+        rows = self.rows
+        if rows and rows[-1].open_time == open_time:
+            old = rows.pop()
+            self._sum_pv -= old.pv
+            self._sum_v -= old.pos_volume
+        elif rows and open_time < rows[-1].open_time:
+            # 과거 캔들은 무시 (MarketDataCache와 동일 정책)
+            return
+        elif len(rows) == self.window:
+            dropped = rows[0]
+            self._sum_pv -= dropped.pv
+            self._sum_v -= dropped.pos_volume
+            self._appends_since_resync += 1
+
+        row = self._make_row(open_time, close_time, high, low, close, volume, rows[-1] if rows else None)
+        rows.append(row)
+        self._sum_pv += row.pv
+        self._sum_v += row.pos_volume
+
+        # 슬라이딩 합의 반올림 오차 제거 (윈도우 1회전마다 재합산, 분할상환 O(1))
+        if self._appends_since_resync >= self.window:
+            self._sum_pv = sum(r.pv for r in rows)
+            self._sum_v = sum(r.pos_volume for r in rows)
+            self._appends_since_resync = 0
+
+    def _make_row(
+        self,
+        open_time: int,
+        close_time: int,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+        prev: Optional[_Row],
+    ) -> _Row:
+        row = _Row()
+        row.open_time = open_time
+        row.close_time = close_time
+        row.high = high
+        row.low = low
+        row.close = close
+        row.volume = volume
+
+        row.pos_volume = max(0.0, volume)
+        row.pv = ((high + low + close) / 3.0) * row.pos_volume
+
+        if prev is None:
+            row.h = tuple(close for _ in _H_PERIODS)
+            row.tr = high - low
+            row.ha = row.tr
+            row.gain = row.loss = 0.0
+            row.gg = row.gl = 0.0
+        else:
+            row.h = tuple(self._a[p] * hp + close for p, hp in zip(_H_PERIODS, prev.h))
+            row.tr = max(
+                high - low,
+                abs(high - prev.close),
+                abs(low - prev.close),
+            )
+            row.ha = self._a_atr * prev.ha + row.tr
+            delta = close - prev.close
+            row.gain = max(0.0, delta)
+            row.loss = max(0.0, -delta)
+            row.gg = self._aw * prev.gg + row.gain
+            row.gl = self._aw * prev.gl + row.loss
+
+        row.m = _ema_k(MACD_FAST) * row.h[_I_FAST] - _ema_k(MACD_SLOW) * row.h[_I_SLOW]
+        row.m9 = row.m if prev is None else self._a9 * prev.m9 + row.m
+        return row
+
+    # ----------------------
+    # 조회
+    # ----------------------
+    def _window_ema(self, idx: int, period: int) -> float:
+        s, e = self.rows[0], self.rows[-1]
+        k = _ema_k(period)
+        return self._a_n[period] * (s.close - k * s.h[idx]) + k * e.h[idx]
+
+    def _rsi_tail(self) -> List[float]:
+        """윈도우 내 마지막 STOCH_PERIOD개 RSI 값"""
+        rows = self.rows
+        p = RSI_PERIOD
+        base = rows[p]
+        sma_gain = sum(rows[i].gain for i in range(1, p + 1)) / p
+        sma_loss = sum(rows[i].loss for i in range(1, p + 1)) / p
+        c_gain = sma_gain - base.gg / p
+        c_loss = sma_loss - base.gl / p
+
+        values = []
+        for j, w in zip(range(-STOCH_PERIOD, 0), self._aw_pow):
+            r = rows[j]
+            avg_gain = max(0.0, w * c_gain + r.gg / p)
+            avg_loss = max(0.0, w * c_loss + r.gl / p)
+            if avg_loss == 0:
+                values.append(100.0)
+            else:
+                values.append(100.0 - (100.0 / (1.0 + avg_gain / avg_loss)))
+        return values
+
+    def indicators(self, symbol: str) -> IndicatorSet:
+        rows = self.rows
+        s, e = rows[0], rows[-1]
+
+        emas = {p: self._window_ema(i, p) for i, p in enumerate(_H_PERIODS)}
+
+        # RSI / Stochastic RSI
+        rsi_window = self._rsi_tail()
+        rsi = rsi_window[-1]
+        rsi_min, rsi_max = min(rsi_window), max(rsi_window)
+        if rsi_max > rsi_min:
+            k_values = [(v - rsi_min) / (rsi_max - rsi_min) * 100.0 for v in rsi_window]
+            stoch_k = k_values[-1]
+            stoch_d = sum(k_values[-3:]) / 3.0
+        else:
+            stoch_k = stoch_d = 50.0
+
+        # MACD
+        c_fast = s.close - _ema_k(MACD_FAST) * s.h[_I_FAST]
+        c_slow = s.close - _ema_k(MACD_SLOW) * s.h[_I_SLOW]
+        macd_line = emas[MACD_FAST] - emas[MACD_SLOW]
+        macd_first = s.m + c_fast - c_slow
+        k9 = _ema_k(MACD_SIGNAL)
+        macd_signal = self._a9_n * macd_first + k9 * (
+            e.m9 - self._a9_n * s.m9 + c_fast * self._g_fast - c_slow * self._g_slow
+        )
+
+        # VWAP (윈도우 누적)
+        if self._sum_v > 0:
+            vwap = self._sum_pv / self._sum_v
+        else:
+            vwap = (e.high + e.low + e.close) / 3.0
+
+        # ATR (윈도우 첫 TR은 High - Low)
+        k_atr = _ema_k(ATR_PERIOD)
+        atr = self._a_atr_n * (s.high - s.low) + k_atr * (e.ha - self._a_atr_n * s.ha)
+
+        # 거래량 급증 (현재 제외 최근 20개 평균)
+        volumes = [rows[j].volume for j in range(-(VOLUME_LOOKBACK + 1), -1)]
+        volume_avg = sum(volumes) / VOLUME_LOOKBACK
+        volume_spike = volume_avg > 0 and e.volume > volume_avg * VOLUME_SPIKE_MULTIPLIER
+
+        return IndicatorSet(
+            symbol=symbol,
+            timestamp=e.close_time,
+            ema_5=emas[5],
+            ema_10=emas[10],
+            ema_20=emas[20],
+            ema_60=emas[60],
+            ema_120=emas[120],
+            rsi_14=rsi,
+            stoch_rsi_k=stoch_k,
+            stoch_rsi_d=stoch_d,
+            macd_line=macd_line,
+            macd_signal=macd_signal,
+            macd_histogram=macd_line - macd_signal,
+            vwap=vwap,
+            atr_14=atr,
+            volume_spike=volume_spike,
+            volume_avg_20=volume_avg,
+            trend="NEUTRAL",
+        )
+
+
+class IncrementalIndicatorEngine(IndicatorEngine):
+    """
+    IndicatorEngine과 동일한 결과를 내는 스트리밍 지표 엔진
+
+    - (symbol, interval)별 EMA/Wilder 재귀 상태를 유지
+    - 캔들 종료(새 open_time) 또는 진행 중 캔들 갱신 시 O(1) 업데이트
+    - calculate(candles)는 기존 엔진과 호환: 상태의 마지막 캔들 이후분만 반영하고,
+      연속성이 깨지면(캐시 초기화 등) 전달된 캔들로 상태를 재구성
+    - 결과는 calculate()와 부동소수점 오차 범위 내에서 일치
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._states: Dict[Tuple[str, str], _SeriesState] = {}
+
+    def update(self, candle: Candle) -> None:
+        """단일 캔들 반영 (WebSocket 콜백 등에서 직접 호출)"""
+        key = (candle.symbol, candle.interval)
+        state = self._states.get(key)
+        if state is None:
+            state = _SeriesState(self.required_candles)
+            self._states[key] = state
+        state.update(candle)
+
+    def latest(self, symbol: str, interval: str) -> IndicatorSet:
+        """현재 상태의 최신 지표 조회
+
+        Raises:
+            InsufficientDataError: 윈도우가 아직 채워지지 않은 경우
+        """
+        state = self._states.get((symbol, interval))
+        have = len(state.rows) if state else 0
+        if state is None or not state.is_ready():
+            raise InsufficientDataError(
+                f"지표 계산에 필요한 최소 캔들 수: {self.required_candles}, 현재: {have}"
+            )
+        return self._finalize(state.indicators(symbol))
+
+    def calculate(self, candles: List[Candle]) -> IndicatorSet:
+        """
+        IndicatorEngine.calculate()와 동일한 인터페이스 (drop-in 대체)
+
+        Args:
+            candles: 시간 순서대로 정렬된 캔들 리스트 (오래된 것 -> 최신)
+        """
+        if len(candles) < self.required_candles:
+            raise InsufficientDataError(
+                f"지표 계산에 필요한 최소 캔들 수: {self.required_candles}, 현재: {len(candles)}"
+            )
+
+        last = candles[-1]
+        key = (last.symbol, last.interval)
+        state = self._states.get(key)
+        window = len(candles)
+
+        start = None
+        if state is not None and state.window == window and state.is_ready():
+            start = self._find_resume_index(
+                len(candles), lambda i: candles[i].open_time, state.last_open_time
+            )
+
+        if start is None:
+            state = _SeriesState(window)
+            self._states[key] = state
+            start = 0
+
+        # 상태의 마지막 캔들(진행 중이었을 수 있음) 재반영 후 신규 캔들 추가
+        for i in range(start, window):
+            state.update(candles[i])
+
+        return self._finalize(state.indicators(last.symbol))
+
+    def calculate_columns(self, columns: CandleColumns) -> IndicatorSet:
+        """MarketDataCache 컬럼 뷰 기반 calculate() (신규 행만 읽고 Candle 생성 없음)"""
+        window = len(columns)
+        if window < self.required_candles:
+            raise InsufficientDataError(
+                f"지표 계산에 필요한 최소 캔들 수: {self.required_candles}, 현재: {window}"
+            )
+
+        key = (columns.symbol, columns.interval)
+        state = self._states.get(key)
+        open_times = columns.open_time
+
+        start = None
+        if state is not None and state.window == window and state.is_ready():
+            start = self._find_resume_index(
+                window, lambda i: int(open_times[i]), state.last_open_time
+            )
+
+        if start is None:
+            state = _SeriesState(window)
+            self._states[key] = state
+            start = 0
+
+        tail = slice(start, window)
+        for row in zip(
+            open_times[tail].tolist(), columns.close_time[tail].tolist(),
+            columns.high[tail].tolist(), columns.low[tail].tolist(),
+            columns.close[tail].tolist(), columns.volume[tail].tolist(),
+        ):
+            state.update_values(int(row[0]), int(row[1]), *row[2:])
+
+        return self._finalize(state.indicators(columns.symbol))
+
+    @staticmethod
+    def _find_resume_index(
+        length: int, open_time_at: Callable[[int], int], last_open_time: int
+    ) -> Optional[int]:
+        """뒤에서부터 상태의 마지막 open_time 위치 탐색 (신규 캔들 수만큼만 순회)"""
+        for i in range(length - 1, -1, -1):
+            open_time = open_time_at(i)
+            if open_time == last_open_time:
+                return i
+            if open_time < last_open_time:
+                return None
+        return None
+
+    def reset(self, symbol: Optional[str] = None) -> None:
+        """상태 초기화 (symbol 미지정 시 전체)"""
+        if symbol is None:
+            self._states.clear()
+        else:
+            for key in [k for k in self._states if k[0] == symbol]:
+                del self._states[key]
+
+    def _finalize(self, indicators: IndicatorSet) -> IndicatorSet:
+        indicators.trend = self._determine_trend(
+            indicators.ema_20, indicators.ema_60, indicators.ema_120
+        )
+        logger.debug(
+            f"증분 지표 계산 완료: {indicators.symbol} - Trend={indicators.trend}, "
+            f"RSI={indicators.rsi_14:.2f}, MACD={indicators.macd_line:.4f}, "
+            f"VolSpike={indicators.volume_spike}"
+        )
+        return indicators
@@ -4,6 +4,7 @@ import logging
 from collections import deque
 
 from .data_structures import Candle, IndicatorSet, InsufficientDataError
+from .candle_buffer import CandleColumns
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +54,44 @@ class IndicatorEngine:
         volumes = [c.volume for c in candles]
         typical_prices = [(c.high + c.low + c.close) / 3.0 for c in candles]
         
+        return self._calculate_series(symbol, timestamp, closes, highs, lows, volumes, typical_prices)
+    
+    def calculate_columns(self, columns: CandleColumns) -> IndicatorSet:
+        """
+        MarketDataCache 컬럼 뷰로부터 지표 계산 (calculate()와 동일 결과)
+        
+        Candle 객체를 만들지 않고 배열에서 바로 시계열을 추출한다.
+        
+        Raises:
+            InsufficientDataError: 캔들 데이터 부족 시
+        """
+        if len(columns) < self.required_candles:
+            raise InsufficientDataError(
+                f"지표 계산에 필요한 최소 캔들 수: {self.required_candles}, 현재: {len(columns)}"
+            )
+        
+        typical_prices = ((columns.high + columns.low + columns.close) / 3.0).tolist()
+        return self._calculate_series(
+            columns.symbol,
+            int(columns.close_time[-1]),
+            columns.close.tolist(),
+            columns.high.tolist(),
+            columns.low.tolist(),
+            columns.volume.tolist(),
+            typical_prices,
+        )
+    
+    def _calculate_series(
+        self,
+        symbol: str,
+        timestamp: int,
+        closes: List[float],
+        highs: List[float],
+        lows: List[float],
+        volumes: List[float],
+        typical_prices: List[float],
+    ) -> IndicatorSet:
+        """추출된 가격 시계열로 모든 지표 계산"""
         # 지표 계산
         ema_5_series = self._calculate_ema(closes, 5)
         ema_10_series = self._calculate_ema(closes, 10)
@@ -0,0 +1,227 @@
+"""윈도우 지표 시계열 - 모든 인덱스의 IndicatorEngine 결과를 한 번에 계산 (백테스트 전용)"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .data_structures import IndicatorSet, InsufficientDataError
+
+
+@dataclass
+class _WindowValues:
+    """윈도우 끝 인덱스별 최신 지표 값 (각 필드는 길이 M의 배열)"""
+    ema_5: np.ndarray
+    ema_10: np.ndarray
+    ema_20: np.ndarray
+    ema_60: np.ndarray
+    ema_120: np.ndarray
+    rsi_14: np.ndarray
+    stoch_rsi_k: np.ndarray
+    stoch_rsi_d: np.ndarray
+    macd_line: np.ndarray
+    macd_signal: np.ndarray
+    macd_histogram: np.ndarray
+    vwap: np.ndarray
+    atr_14: np.ndarray
+    volume_spike: np.ndarray
+    volume_avg_20: np.ndarray
+    trend: np.ndarray
+
+
+class IndicatorSeries:
+    """
+    길이 N 캔들 배열의 각 인덱스 t에 대해, t에서 끝나는 최근 window개 캔들로
+    IndicatorEngine.calculate_columns()를 호출한 결과와 같은 IndicatorSet을 제공
+
+    - 윈도우마다 Candle/리스트를 재구성하지 않고, 모든 윈도우의 재귀(EMA/Wilder/누적합)를
+      윈도우 내 위치 j 기준으로 묶어 배열 연산 window회로 진행 (O(window) 회 x O(N) 벡터 연산)
+    - 윈도우 시작값 시드, 합산 순서, 비교 상수를 IndicatorEngine 스칼라 루프와 동일하게
+      유지하므로 결과는 비트 단위로 일치
+    - window는 EMA120 분기(len < period)가 발생하지 않는 MIN_WINDOW 이상이어야 한다
+    """
+
+    MIN_WINDOW = 120
+
+    def __init__(
+        self,
+        symbol: str,
+        close_time: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray,
+        window: int = 200,
+    ):
+        if window < self.MIN_WINDOW:
+            raise ValueError(f"window는 {self.MIN_WINDOW} 이상이어야 합니다: {window}")
+        self.symbol = symbol
+        self.window = int(window)
+        self._close_time = np.asarray(close_time, dtype=np.float64)
+        self._n = len(self._close_time)
+        self._values: Optional[_WindowValues] = None
+        if self._n >= self.window:
+            self._values = self._compute(
+                np.asarray(high, dtype=np.float64),
+                np.asarray(low, dtype=np.float64),
+                np.asarray(close, dtype=np.float64),
+                np.asarray(volume, dtype=np.float64),
+            )
+        self._sets: Dict[int, IndicatorSet] = {}
+
+    def __len__(self) -> int:
+        return self._n
+
+    def available(self, i: int) -> bool:
+        """i에서 끝나는 윈도우가 완전한지 (IndicatorEngine이 InsufficientDataError를 내지 않는지)"""
+        return self.window - 1 <= i < self._n
+
+    def at(self, i: int) -> IndicatorSet:
+        """
+        i번째 캔들까지의 최근 window개로 계산한 IndicatorSet
+
+        Raises:
+            InsufficientDataError: i번째까지 캔들이 window개 미만일 때
+        """
+        if not self.available(i):
+            raise InsufficientDataError(
+                f"지표 계산에 필요한 최소 캔들 수: {self.window}, 현재: {min(i + 1, self._n)}"
+            )
+        cached = self._sets.get(i)
+        if cached is not None:
+            return cached
+        v = self._values
+        w = i - (self.window - 1)
+        ind = IndicatorSet(
+            symbol=self.symbol,
+            timestamp=int(self._close_time[i]),
+            ema_5=float(v.ema_5[w]),
+            ema_10=float(v.ema_10[w]),
+            ema_20=float(v.ema_20[w]),
+            ema_60=float(v.ema_60[w]),
+            ema_120=float(v.ema_120[w]),
+            rsi_14=float(v.rsi_14[w]),
+            stoch_rsi_k=float(v.stoch_rsi_k[w]),
+            stoch_rsi_d=float(v.stoch_rsi_d[w]),
+            macd_line=float(v.macd_line[w]),
+            macd_signal=float(v.macd_signal[w]),
+            macd_histogram=float(v.macd_histogram[w]),
+            vwap=float(v.vwap[w]),
+            atr_14=float(v.atr_14[w]),
+            volume_spike=bool(v.volume_spike[w]),
+            volume_avg_20=float(v.volume_avg_20[w]),
+            trend=str(v.trend[w]),
+        )
+        self._sets[i] = ind
+        return ind
+
+    # ------------------------------------------------------------------
+    # 일괄 계산 (배열 x[j:j+m]은 모든 윈도우의 j번째 캔들)
+    # ------------------------------------------------------------------
+    def _compute(self, high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray) -> _WindowValues:
+        W = self.window
+        m = self._n - W + 1
+
+        def at(x: np.ndarray, j: int) -> np.ndarray:
+            return x[j:j + m]
+
+        # EMA(5/10/20/60/120) + MACD(12, 26, 9): 첫 캔들로 시드 후 첫 캔들부터 다시 반영
+        periods = (5, 10, 20, 60, 120, 12, 26)
+        ks = [2.0 / (p + 1) for p in periods]
+        emas: List[np.ndarray] = [at(close, 0).copy() for _ in periods]
+        k9 = 2.0 / (9 + 1)
+        macd_signal = None
+        macd_line = None
+        for j in range(W):
+            price = at(close, j)
+            for e, k in enumerate(ks):
+                emas[e] = price * k + emas[e] * (1 - k)
+            macd_line = emas[5] - emas[6]
+            if macd_signal is None:
+                macd_signal = macd_line
+            macd_signal = macd_line * k9 + macd_signal * (1 - k9)
+        ema_5, ema_10, ema_20, ema_60, ema_120 = emas[:5]
+
+        rsi_14, stoch_k, stoch_d = self._rsi_stoch(close, m, 14)
+
+        # VWAP (윈도우 누적)
+        typical = (high + low + close) / 3.0
+        clipped = np.maximum(volume, 0.0)
+        cum_pv = np.zeros(m)
+        cum_v = np.zeros(m)
+        for j in range(W):
+            vol = at(clipped, j)
+            cum_pv = cum_pv + at(typical, j) * vol
+            cum_v = cum_v + vol
+        with np.errstate(divide="ignore", invalid="ignore"):
+            vwap = np.where(cum_v > 0, cum_pv / cum_v, at(typical, W - 1))
+
+        # ATR(14): 윈도우 첫 TR은 High - Low, 이후는 직전 종가 포함 True Range
+        hl = high - low
+        tr = hl.copy()
+        tr[1:] = np.maximum(np.maximum(hl[1:], np.abs(high[1:] - close[:-1])), np.abs(low[1:] - close[:-1]))
+        k14 = 2.0 / (14 + 1)
+        atr = at(hl, 0).copy()
+        for j in range(W):
+            atr = (at(hl, 0) if j == 0 else at(tr, j)) * k14 + atr * (1 - k14)
+
+        # 거래량 급증 (현재 제외 최근 20개 평균 대비 3배)
+        acc = np.zeros(m)
+        for j in range(W - 21, W - 1):
+            acc = acc + at(volume, j)
+        volume_avg = acc / 20
+        volume_spike = np.where(volume_avg > 0, at(volume, W - 1) > volume_avg * 3.0, False)
+
+        trend = np.select(
+            [
+                (ema_20 > ema_60 * 1.001) & (ema_60 > ema_120 * 1.001),
+                ema_20 > ema_60,
+                ema_20 < ema_60 * 0.999,
+            ],
+            ["STRONG_UPTREND", "UPTREND", "DOWNTREND"],
+            default="NEUTRAL",
+        )
+
+        return _WindowValues(
+            ema_5=ema_5, ema_10=ema_10, ema_20=ema_20, ema_60=ema_60, ema_120=ema_120,
+            rsi_14=rsi_14, stoch_rsi_k=stoch_k, stoch_rsi_d=stoch_d,
+            macd_line=macd_line, macd_signal=macd_signal, macd_histogram=macd_line - macd_signal,
+            vwap=vwap, atr_14=atr, volume_spike=volume_spike, volume_avg_20=volume_avg, trend=trend,
+        )
+
+    def _rsi_stoch(self, close: np.ndarray, m: int, period: int):
+        """윈도우별 Wilder RSI 최신값과 최근 period개 RSI로 계산한 Stochastic RSI (K, D)"""
+        W = self.window
+        deltas = close[1:] - close[:-1]
+        gains = np.where(deltas > 0, deltas, 0.0)
+        losses = np.where(deltas < 0, -deltas, 0.0)
+
+        # 초기 평균 (SMA, 앞에서부터 순차 합산)
+        avg_gain = np.zeros(m)
+        avg_loss = np.zeros(m)
+        for i in range(period):
+            avg_gain = avg_gain + gains[i:i + m]
+            avg_loss = avg_loss + losses[i:i + m]
+        avg_gain = avg_gain / period
+        avg_loss = avg_loss / period
+
+        # RSI 시계열의 마지막 period개 (모두 Wilder 평활 구간, W >= MIN_WINDOW)
+        tail: List[np.ndarray] = []
+        first_tail = W - 1 - period
+        for i in range(period, W - 1):
+            avg_gain = (avg_gain * (period - 1) + gains[i:i + m]) / period
+            avg_loss = (avg_loss * (period - 1) + losses[i:i + m]) / period
+            if i >= first_tail:
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    rsi = np.where(avg_loss == 0, 100.0, 100.0 - (100.0 / (1.0 + avg_gain / avg_loss)))
+                tail.append(rsi)
+
+        rsi_min = np.minimum.reduce(tail)
+        rsi_max = np.maximum.reduce(tail)
+        spread = rsi_max - rsi_min
+        ok = rsi_max > rsi_min
+        with np.errstate(divide="ignore", invalid="ignore"):
+            k_values = [(r - rsi_min) / spread * 100.0 for r in tail[-3:]]
+        d = (k_values[0] + k_values[1] + k_values[2]) / 3.0
+        stoch_k = np.where(ok, k_values[-1], 50.0)
+        stoch_d = np.where(ok, d, 50.0)
+        return tail[-1], stoch_k, stoch_d
@@ -0,0 +1,217 @@
+"""Binance 선물 kline WebSocket 스트림 - 단일 연결로 다중 심볼/타임프레임 구독"""
+import asyncio
+import json
+import logging
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import websockets
+
+from .data_structures import Candle
+
+logger = logging.getLogger(__name__)
+
+
+def kline_stream_name(symbol: str, interval: str) -> str:
+    """Binance 스트림 이름 (예: btcusdt@kline_1m)"""
+    return f"{symbol.lower()}@kline_{interval}"
+
+
+def parse_kline_message(message: Dict) -> Optional[Candle]:
+    """
+    kline 이벤트를 Candle로 변환
+
+    /ws 엔드포인트의 원본 이벤트와 /stream 엔드포인트의
+    {"stream": ..., "data": {...}} 래핑 형식을 모두 지원한다.
+
+    Returns:
+        Candle (kline 이벤트가 아니면 None)
+    """
+    data = message.get("data", message) if isinstance(message, dict) else None
+    if not isinstance(data, dict) or data.get("e") != "kline":
+        return None
+    k = data.get("k") or {}
+    return Candle(
+        symbol=str(k.get("s") or data.get("s")).upper(),
+        interval=str(k["i"]),
+        open_time=int(k["t"]),
+        close_time=int(k["T"]),
+        open=float(k["o"]),
+        high=float(k["h"]),
+        low=float(k["l"]),
+        close=float(k["c"]),
+        volume=float(k["v"]),
+        quote_volume=float(k.get("q", 0.0)),
+        trades_count=int(k.get("n", 0)),
+        is_closed=bool(k.get("x", False)),
+    )
+
+
+class KlineStream:
+    """
+    Binance 선물 kline 스트림 클라이언트
+
+    - 하나의 WebSocket 연결에서 SUBSCRIBE/UNSUBSCRIBE 메서드로 스트림 관리
+    - 연결 종료/오류 시 지수 백오프로 자동 재연결 후 전체 스트림 재구독
+    - 재연결 직후 on_reconnect 콜백 호출 (끊긴 구간 REST 보정용)
+    - url을 로컬 주소로 지정하면 오프라인 테스트용 대체 서버 사용 가능
+    """
+
+    def __init__(
+        self,
+        url: str,
+        on_candle: Callable[[Candle], None],
+        on_reconnect: Optional[Callable[[], Awaitable[None]]] = None,
+        reconnect_delay_sec: float = 1.0,
+        max_reconnect_delay_sec: float = 30.0,
+    ):
+        """
+        Args:
+            url: WebSocket 엔드포인트 (예: wss://fstream.binance.com/ws)
+            on_candle: 캔들(진행 중/종료) 수신 시 호출할 콜백
+            on_reconnect: 재연결 및 재구독 완료 후 호출할 코루틴 함수 (선택)
+            reconnect_delay_sec: 재연결 초기 대기 시간
+            max_reconnect_delay_sec: 재연결 최대 대기 시간
+        """
+        self.url = url
+        self.on_candle = on_candle
+        self.on_reconnect = on_reconnect
+        self.reconnect_delay_sec = reconnect_delay_sec
+        self.max_reconnect_delay_sec = max_reconnect_delay_sec
+
+        # {stream_name: (symbol, interval)}
+        self._streams: Dict[str, Tuple[str, str]] = {}
+        self._ws = None
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+        self._request_id = 0
+
+        # 상태 카운터 (모니터링용)
+        self.reconnect_count = 0
+        self.messages_received = 0
+
+    @property
+    def subscriptions(self) -> List[Tuple[str, str]]:
+        """현재 구독 중인 (symbol, interval) 목록"""
+        return list(self._streams.values())
+
+    def is_connected(self) -> bool:
+        return self._ws is not None
+
+    async def subscribe(self, symbols: List[str], intervals: List[str]) -> None:
+        """스트림 구독 추가 (연결 중이면 즉시 SUBSCRIBE 전송)"""
+        added = []
+        for symbol in symbols:
+            for interval in intervals:
+                name = kline_stream_name(symbol, interval)
+                if name not in self._streams:
+                    self._streams[name] = (symbol.upper(), interval)
+                    added.append(name)
+        if added and self._ws is not None:
+            await self._send_method("SUBSCRIBE", added)
+
+    async def unsubscribe(self, symbols: List[str], intervals: List[str]) -> None:
+        """스트림 구독 해제 (연결 중이면 즉시 UNSUBSCRIBE 전송)"""
+        removed = []
+        for symbol in symbols:
+            for interval in intervals:
+                name = kline_stream_name(symbol, interval)
+                if self._streams.pop(name, None) is not None:
+                    removed.append(name)
+        if removed and self._ws is not None:
+            await self._send_method("UNSUBSCRIBE", removed)
+
+    async def start(self) -> None:
+        """백그라운드 수신 태스크 시작"""
+        if self._running:
+            logger.warning("kline 스트림이 이미 실행 중입니다")
+            return
+        self._running = True
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"kline 스트림 시작: {self.url} ({len(self._streams)} streams)")
+
+    async def stop(self) -> None:
+        """수신 태스크 중지 및 연결 종료"""
+        if not self._running:
+            return
+        self._running = False
+        ws = self._ws
+        if ws is not None:
+            try:
+                await ws.close()
+            except Exception:
+                pass
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self._ws = None
+        logger.info("kline 스트림 중지 완료")
+
+    async def _send_method(self, method: str, params: List[str]) -> None:
+        self._request_id += 1
+        payload = {"method": method, "params": params, "id": self._request_id}
+        try:
+            await self._ws.send(json.dumps(payload))
+        except Exception as e:
+            # 전송 실패 시 재연결 루프에서 전체 재구독
+            logger.warning(f"kline 스트림 {method} 전송 실패: {e}")
+
+    def _handle_message(self, raw) -> None:
+        try:
+            message = json.loads(raw)
+        except (TypeError, ValueError):
+            logger.warning(f"잘못된 kline 메시지 수신: {raw!r}")
+            return
+
+        try:
+            candle = parse_kline_message(message)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"kline 메시지 파싱 오류: {e}")
+            return
+        if candle is None:
+            # SUBSCRIBE 응답 등 비-kline 메시지
+            return
+
+        self.messages_received += 1
+        try:
+            self.on_candle(candle)
+        except Exception as e:
+            logger.error(f"캔들 업데이트 콜백 오류: {e}")
+
+    async def _run(self) -> None:
+        delay = self.reconnect_delay_sec
+        connected_once = False
+
+        while self._running:
+            try:
+                async with websockets.connect(self.url) as ws:
+                    self._ws = ws
+                    delay = self.reconnect_delay_sec
+
+                    if self._streams:
+                        await self._send_method("SUBSCRIBE", list(self._streams))
+
+                    if connected_once:
+                        self.reconnect_count += 1
+                        logger.info(f"kline 스트림 재연결/재구독 완료 (#{self.reconnect_count})")
+                        if self.on_reconnect:
+                            try:
+                                await self.on_reconnect()
+                            except Exception as e:
+                                logger.error(f"재연결 콜백 오류: {e}")
+                    connected_once = True
+
+                    async for raw in ws:
+                        self._handle_message(raw)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if self._running:
+                    logger.warning(f"kline 스트림 연결 오류: {e}")
+            finally:
+                self._ws = None
+
+            if self._running:
+                logger.info(f"kline 스트림 {delay:.1f}초 후 재연결")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_reconnect_delay_sec)
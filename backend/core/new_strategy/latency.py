@@ -0,0 +1,114 @@
+"""파이프라인 단계별 지연 시간 계측 (롤링 p50/p95/p99)"""
+import time
+from typing import Dict, Optional
+
+import numpy as np
+
+
+class RollingHistogram:
+    """
+    최근 window개 샘플(초)을 고정 크기 NumPy 배열에 순환 저장
+
+    기록은 O(1)이며, 백분위는 조회 시점에만 계산한다.
+    """
+
+    __slots__ = ("window", "_samples", "_next", "count", "total", "last", "max")
+
+    def __init__(self, window: int = 1024):
+        self.window = window
+        self._samples = np.zeros(window)
+        self._next = 0
+        self.count = 0  # 누적 샘플 수
+        self.total = 0.0
+        self.last = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        self._samples[self._next] = seconds
+        self._next = (self._next + 1) % self.window
+        self.count += 1
+        self.total += seconds
+        self.last = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def samples(self) -> np.ndarray:
+        """현재 윈도우 샘플 복사본"""
+        return self._samples[:min(self.count, self.window)].copy()
+
+    def summary(self) -> Dict[str, float]:
+        """ms 단위 요약 (윈도우 기준 백분위 + 누적 count/mean/max)"""
+        window = self.samples()
+        if window.size:
+            p50, p95, p99 = np.percentile(window, (50, 95, 99))
+        else:
+            p50 = p95 = p99 = 0.0
+        return {
+            "count": self.count,
+            "last_ms": round(self.last * 1000, 3),
+            "mean_ms": round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            "p50_ms": round(float(p50) * 1000, 3),
+            "p95_ms": round(float(p95) * 1000, 3),
+            "p99_ms": round(float(p99) * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+class _StageTimer:
+    """LatencyRecorder.stage() 컨텍스트 매니저 (예외 발생 시에도 기록)"""
+
+    __slots__ = ("_hist", "_start")
+
+    def __init__(self, hist: RollingHistogram):
+        self._hist = hist
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._hist.record(time.perf_counter() - self._start)
+        return False
+
+
+class LatencyRecorder:
+    """
+    단계(stage)별 지연 시간 기록기 (오케스트레이터 1개 = 심볼 1개당 1개)
+
+    Example:
+        latency = LatencyRecorder()
+        with latency.stage("fetch"):
+            await refresh()
+        latency.snapshot()  # {"fetch": {"p50_ms": ..., "p95_ms": ..., "p99_ms": ...}}
+    """
+
+    def __init__(self, window: int = 1024):
+        self.window = window
+        self._stages: Dict[str, RollingHistogram] = {}
+
+    def histogram(self, name: str) -> RollingHistogram:
+        hist = self._stages.get(name)
+        if hist is None:
+            hist = self._stages[name] = RollingHistogram(self.window)
+        return hist
+
+    def stage(self, name: str) -> _StageTimer:
+        return _StageTimer(self.histogram(name))
+
+    def record(self, name: str, seconds: float) -> None:
+        self.histogram(name).record(seconds)
+
+    def last(self) -> Dict[str, float]:
+        """단계별 마지막 측정값 (ms), overrun 로그용"""
+        return {name: round(hist.last * 1000, 1) for name, hist in list(self._stages.items())}
+
+    def snapshot(self, stage: Optional[str] = None) -> Dict[str, Dict[str, float]]:
+        """단계별 요약 (stage 지정 시 해당 단계만)"""
+        if stage is not None:
+            hist = self._stages.get(stage)
+            return {stage: hist.summary()} if hist is not None else {}
+        return {name: hist.summary() for name, hist in list(self._stages.items())}
+
+    def reset(self) -> None:
+        self._stages.clear()
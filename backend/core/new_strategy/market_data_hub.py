@@ -0,0 +1,204 @@
+"""Market Data Hub - 엔진 간 공유 캔들 캐시 (심볼/타임프레임별 참조 카운트 구독)"""
+import asyncio
+import logging
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .data_fetcher import BinanceDataFetcher
+from .data_structures import Candle
+
+logger = logging.getLogger(__name__)
+
+Key = Tuple[str, str]
+
+
+class MarketDataHub(BinanceDataFetcher):
+    """
+    프로세스 전역 캔들 데이터 허브 (BinanceDataFetcher 호환)
+
+    - 여러 오케스트레이터가 같은 인스턴스를 fetcher로 공유 → 캐시 1벌
+    - (symbol, interval)별 참조 카운트: 마지막 구독자가 해제하면 캐시 제거 및 스트림 구독 해제
+    - 같은 키의 동시 조회는 1회 REST 호출로 합치고(single-flight),
+      같은 캔들 구간 안에서 이미 갱신된 키는 캐시에서 바로 반환
+
+    Note:
+        캐시 쓰기는 호출 이벤트 루프에서 수행되므로 OrchestratorScheduler(단일 루프)와 함께 사용한다.
+    """
+
+    def __init__(self, binance_client, ws_url: Optional[str] = None):
+        super().__init__(binance_client, ws_url=ws_url)
+        self._lock = threading.Lock()
+        self._refs: Dict[Key, int] = {}
+        # 키별 마지막 최신 구간 조회 시각 (서버 기준 캔들 시작 ms)
+        self._fresh_period: Dict[Key, int] = {}
+        # (loop id, 조회 인자) -> 진행 중 조회 Future
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        self._stream_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # 상태 카운터 (모니터링용)
+        self.rest_fetches = 0
+        self.deduplicated = 0
+
+    # ----------------------
+    # 구독 관리
+    # ----------------------
+    def acquire(self, symbol: str, intervals: Iterable[str]) -> None:
+        """(symbol, interval) 구독 등록 (참조 카운트 +1)"""
+        added = []
+        with self._lock:
+            for interval in intervals:
+                key = (symbol, interval)
+                self._refs[key] = self._refs.get(key, 0) + 1
+                if self._refs[key] == 1:
+                    added.append(interval)
+        if added:
+            logger.info(f"[Hub] 구독 추가: {symbol} {added}")
+            self._update_stream("subscribe", symbol, added)
+
+    def release(self, symbol: str, intervals: Iterable[str]) -> None:
+        """(symbol, interval) 구독 해제 (참조 카운트 0이 되면 캐시 제거)"""
+        removed = []
+        with self._lock:
+            for interval in intervals:
+                key = (symbol, interval)
+                count = self._refs.get(key, 0) - 1
+                if count > 0:
+                    self._refs[key] = count
+                    continue
+                if self._refs.pop(key, None) is not None:
+                    self._fresh_period.pop(key, None)
+                    self.cache.evict(symbol, interval)
+                    removed.append(interval)
+        if removed:
+            logger.info(f"[Hub] 구독 해제: {symbol} {removed}")
+            self._update_stream("unsubscribe", symbol, removed)
+
+    def subscribers(self, symbol: str, interval: str) -> int:
+        return self._refs.get((symbol, interval), 0)
+
+    @property
+    def subscriptions(self) -> List[Key]:
+        with self._lock:
+            return list(self._refs)
+
+    def _update_stream(self, method: str, symbol: str, intervals: List[str]) -> None:
+        """스트림 실행 중이면 스트림 루프에서 SUBSCRIBE/UNSUBSCRIBE 전송"""
+        stream, loop = self._stream, self._stream_loop
+        if stream is None or loop is None or loop.is_closed():
+            return
+        coro = getattr(stream, method)([symbol], intervals)
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            loop.create_task(coro)
+        else:
+            asyncio.run_coroutine_threadsafe(coro, loop)
+
+    async def start_realtime_updates(
+        self,
+        symbols: Optional[List[str]] = None,
+        intervals: Optional[List[str]] = None,
+        on_candle_update=None,
+        mode: str = "websocket"
+    ) -> None:
+        """
+        실시간 업데이트 시작 (symbols/intervals 생략 시 현재 구독 키만 websocket으로 구독)
+
+        websocket 모드에서는 이후 acquire/release가 스트림 구독에 그대로 반영된다.
+        """
+        self._stream_loop = asyncio.get_running_loop()
+        if symbols is not None and intervals is not None:
+            await super().start_realtime_updates(symbols, intervals, on_candle_update, mode)
+            return
+        if mode != "websocket":
+            raise ValueError("구독 키 기반 실시간 업데이트는 websocket 모드만 지원합니다")
+        await super().start_realtime_updates([], [], on_candle_update, mode)
+        for symbol, interval in self.subscriptions:
+            await self._stream.subscribe([symbol], [interval])
+
+    # ----------------------
+    # 조회 (중복 제거)
+    # ----------------------
+    async def fetch_historical_candles(
+        self,
+        symbol: str,
+        interval: str,
+        limit: int = 500,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None
+    ) -> List[Candle]:
+        """
+        BinanceDataFetcher.fetch_historical_candles()와 동일 (중복 조회 제거)
+
+        최신 구간 조회(start/end 미지정)는 현재 캔들 구간에 이미 갱신된 키이고
+        캐시가 limit개 이상이면 REST 호출 없이 캐시를 반환한다.
+        """
+        key = (symbol, interval)
+        latest_query = start_time is None and end_time is None
+        period = None
+        if latest_query:
+            period = self._current_period(interval)
+            if self._fresh_period.get(key) == period and self.cache.has_sufficient_data(symbol, interval, limit):
+                self.deduplicated += 1
+                return self.cache.get_latest_candles(symbol, interval, limit)
+
+        flight_key = (id(asyncio.get_running_loop()), symbol, interval, limit, start_time, end_time)
+        future = self._inflight.get(flight_key)
+        if future is not None:
+            self.deduplicated += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[flight_key] = future
+        try:
+            self.rest_fetches += 1
+            candles = await super().fetch_historical_candles(symbol, interval, limit, start_time, end_time)
+            if latest_query:
+                self._fresh_period[key] = period
+            future.set_result(candles)
+            return candles
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 대기자가 없으면 'exception was never retrieved' 경고 방지
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(flight_key, None)
+
+    def _current_period(self, interval: str) -> int:
+        step = self.INTERVAL_MS.get(interval, 60000)
+        return (self._server_now_ms() // step) * step
+
+    def get_status(self) -> Dict:
+        """허브 상태 (구독 키별 참조 수, REST 호출/중복 제거 횟수)"""
+        with self._lock:
+            refs = {f"{s}/{i}": n for (s, i), n in self._refs.items()}
+        return {
+            "subscriptions": refs,
+            "rest_fetches": self.rest_fetches,
+            "deduplicated": self.deduplicated,
+            "streaming": self.is_streaming(),
+        }
+
+
+_hub_instance: Optional[MarketDataHub] = None
+_hub_lock = threading.Lock()
+
+
+def get_market_data_hub(binance_client) -> MarketDataHub:
+    """
+    프로세스 전역 MarketDataHub 반환 (최초 호출 시 생성)
+
+    Args:
+        binance_client: 공유 BinanceClient 인스턴스
+    """
+    global _hub_instance
+    with _hub_lock:
+        if _hub_instance is None:
+            _hub_instance = MarketDataHub(binance_client)
+        return _hub_instance
@@ -1,11 +1,13 @@
 """Strategy Orchestrator - 메인 루프(단일 심볼) 통합"""
 from dataclasses import dataclass
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, Callable, List, Tuple
 import logging
 import time
 import asyncio
 import threading
 
+import numpy as np
+
 from .data_structures import (
     Candle,
     PositionState,
@@ -14,9 +16,12 @@ from .data_structures import (
 )
 from .data_fetcher import BinanceDataFetcher
 from .indicator_engine import IndicatorEngine
+from .incremental_indicator_engine import IncrementalIndicatorEngine
 from .signal_engine import SignalEngine
 from .risk_manager import RiskManager, RiskManagerConfig
 from .execution_adapter import ExecutionAdapter
+from .resampler import CandleResampler
+from .latency import LatencyRecorder
 
 # 전략 전용 로거 사용
 from backend.utils.strategy_logger import (
@@ -40,8 +45,12 @@ class OrchestratorConfig:
     order_quantity: float = 0.001  # 고정 수량 (테스트용)
     isolated_margin: bool = True
     loop_interval_sec: float = 1.0  # 루프 주기
+    evaluation_mode: str = "poll"  # "poll": 매 주기 전체 평가 / "candle_close": 캔들 종료 시에만 평가
+    close_settle_sec: float = 0.5  # candle_close 모드: 서버 기준 캔들 종료 후 평가까지 대기 (확정 봉 반영)
+    resample_from_entry: bool = False  # True면 warmup 이후 confirm/filter 캔들을 진입 타임프레임 종료 캔들로 로컬 집계 (REST 조회 생략)
     enable_trading: bool = True  # False면 신호만 생성 (주문 실행 안함)
     adaptive_enabled: bool = False  # 동적 임계치 사용 여부
+    incremental_indicators: bool = False  # True면 증분(O(1)) 지표 엔진 사용
     protective_pause_enabled: bool = False
     failure_threshold: int = 10  # 보호 모드 진입 실패 횟수 (window 내)
     failure_window_sec: int = 60
@@ -66,12 +75,14 @@ class StrategyOrchestrator:
         auto_prepare_symbol: bool = False,
     ):
         self.client = binance_client
+        self.cfg = config or OrchestratorConfig(symbol="BTCUSDT")
         self.fetcher = fetcher or BinanceDataFetcher(self.client)
-        self.indicator = indicator or IndicatorEngine()
+        self.indicator = indicator or (
+            IncrementalIndicatorEngine() if self.cfg.incremental_indicators else IndicatorEngine()
+        )
         self.signal = signal or SignalEngine()
         self.risk = risk or RiskManager(RiskManagerConfig())
         self.exec = executor or ExecutionAdapter(self.client)
-        self.cfg = config or OrchestratorConfig(symbol="BTCUSDT")
 
         # 상태
         self.position: Optional[PositionState] = None
@@ -99,6 +110,12 @@ class StrategyOrchestrator:
         self._running = False
         self._loop_task: Optional[asyncio.Task] = None
         self._thread: Optional[threading.Thread] = None
+        self._sync_loop: Optional[asyncio.AbstractEventLoop] = None  # step() 전용 장수명 루프
+        self._scheduler = None  # OrchestratorScheduler (공유 루프 모드)
+        self._last_evaluated_close_ms = 0  # candle_close 모드: 마지막으로 평가한 캔들 종료 시각
+        self._data_subscription = None  # 공유 MarketDataHub 구독 (symbol, intervals)
+        self._resampler: Optional[CandleResampler] = None  # resample_from_entry 모드 상위 타임프레임 집계기
+        self.latency = LatencyRecorder()  # 단계별 지연 시간 (fetch/indicators/signal/risk/execution/publish)
         self._event_callback: Optional[Callable[[Dict[str, Any]], None]] = None
 
         # 심볼 준비 (마진/레버리지) - 옵션으로 변경
@@ -111,8 +128,42 @@ class StrategyOrchestrator:
             logger.debug(f"[Orchestrator] 심볼 자동 준비 비활성화 - 수동으로 prepare_symbol() 호출 필요")
 
     def _compute_indicators(self, interval: str):
-        candles = self.fetcher.cache.get_latest_candles(self.cfg.symbol, interval, self.indicator.required_candles)
-        return self.indicator.calculate(candles)
+        with self.latency.stage(f"indicators_{interval}"):
+            columns = self.fetcher.cache.get_latest_columns(
+                self.cfg.symbol, interval, self.indicator.required_candles,
+                closed_only=self._close_driven(),
+            )
+            return self.indicator.calculate_columns(columns)
+
+    def _close_driven(self) -> bool:
+        return self.cfg.evaluation_mode == "candle_close"
+
+    def _server_now_ms(self) -> int:
+        """바이낸스 서버 기준 현재 시각 (ms)"""
+        return int(time.time() * 1000) + int(getattr(self.client, "time_offset", 0) or 0)
+
+    def _entry_interval_ms(self) -> int:
+        return BinanceDataFetcher.INTERVAL_MS.get(self.cfg.interval_entry, 60000)
+
+    def next_close_deadline(self, after: Optional[float] = None) -> float:
+        """
+        after(로컬 epoch sec) 이후 첫 평가 시각 = 진입 타임프레임 캔들 종료(서버 시각) + settle
+
+        Returns:
+            로컬 epoch sec (time.time() 기준)
+        """
+        offset_sec = int(getattr(self.client, "time_offset", 0) or 0) / 1000.0
+        period = self._entry_interval_ms() / 1000.0
+        settle = self.cfg.close_settle_sec
+        server_after = (time.time() if after is None else after) + offset_sec
+        close = (int((server_after - settle) // period) + 1) * period
+        return close + settle - offset_sec
+
+    def _last_settled_close_ms(self) -> int:
+        """settle 대기가 끝난 가장 최근 진입 타임프레임 캔들 종료 시각 (서버 ms)"""
+        period = self._entry_interval_ms()
+        settled_now = self._server_now_ms() - int(self.cfg.close_settle_sec * 1000)
+        return (settled_now // period) * period
 
     def _emit_event(self, payload: Dict[str, Any]):
         if self._event_callback:
@@ -141,8 +192,7 @@ class StrategyOrchestrator:
         req = self.indicator.required_candles
         intervals = []
         for itv in [self.cfg.interval_entry, self.cfg.interval_confirm, self.cfg.interval_filter]:
-            cache = self.fetcher.cache._cache[self.cfg.symbol][itv]
-            have = len(cache)
+            have = self.fetcher.cache.count(self.cfg.symbol, itv)
             intervals.append({"interval": itv, "have": have, "required": req, "ready": have >= req})
         # Ready 여부 중 하나라도 False면 진행률 이벤트 전송
         if not all(x["ready"] for x in intervals):
@@ -186,17 +236,11 @@ class StrategyOrchestrator:
             True: 새 캔들 생성 (API 호출 필요)
             False: 아직 진행 중 (캐시 사용)
         """
-        # 현재 시간 (밀리초)
-        now_ms = int(time.time() * 1000)
+        # 현재 시간 (밀리초, 서버 시각 기준)
+        now_ms = self._server_now_ms()
         
         # 타임프레임별 간격 (밀리초)
-        intervals_ms = {
-            "1m": 60 * 1000,
-            "3m": 3 * 60 * 1000,
-            "15m": 15 * 60 * 1000,
-        }
-        
-        interval_ms = intervals_ms.get(interval, 60000)
+        interval_ms = BinanceDataFetcher.INTERVAL_MS.get(interval, 60000)
         
         # 현재 캔들의 시작 시간 계산
         # 예: 현재 14:32:45 → 1m 캔들은 14:32:00 시작
@@ -217,49 +261,148 @@ class StrategyOrchestrator:
         # 심볼 지원 검사
         if not self._symbol_support_check():
             raise RuntimeError("Unsupported symbol")
-        # 필요한 캔들 캐시에 적재
-        await self.fetcher.fetch_historical_candles(self.cfg.symbol, self.cfg.interval_entry, limit=max(self.indicator.required_candles, self.cfg.candles_required))
-        await self.fetcher.fetch_historical_candles(self.cfg.symbol, self.cfg.interval_confirm, limit=max(self.indicator.required_candles, self.cfg.candles_required))
-        await self.fetcher.fetch_historical_candles(self.cfg.symbol, self.cfg.interval_filter, limit=max(self.indicator.required_candles, self.cfg.candles_required))
+        # 필요한 캔들 캐시에 적재 (타임프레임별 동시 요청)
+        limit = max(self._required_candles(), self.cfg.candles_required)
+        await asyncio.gather(*(
+            self.fetcher.fetch_historical_candles(self.cfg.symbol, interval, limit=limit)
+            for interval in self._intervals()
+        ))
+        # 상위 타임프레임 REST 캔들로 시드한 뒤 진행 중인 상위 구간을 진입 캔들로 재구성
+        self._resampler = None
+        self._sync_resampled()
         self._maybe_emit_data_progress()
 
-    def step(self) -> Dict[str, Any]:
-        """한 스텝 실행 (동기). 사전 warmup 이후 사용 권장."""
+    def _intervals(self):
+        return (self.cfg.interval_entry, self.cfg.interval_confirm, self.cfg.interval_filter)
+
+    def _acquire_market_data(self) -> None:
+        """fetcher가 공유 MarketDataHub면 현재 심볼/타임프레임 구독 등록"""
+        if self._data_subscription is not None or not hasattr(self.fetcher, "acquire"):
+            return
+        self._data_subscription = (self.cfg.symbol, self._intervals())
+        self.fetcher.acquire(*self._data_subscription)
+
+    def _release_market_data(self) -> None:
+        if self._data_subscription is None:
+            return
+        self.fetcher.release(*self._data_subscription)
+        self._data_subscription = None
+
+    def _derived_intervals(self) -> Tuple[str, ...]:
+        """진입 타임프레임에서 로컬 집계하는 상위 타임프레임 (resample_from_entry 모드)"""
+        if not self.cfg.resample_from_entry:
+            return ()
+        return (self.cfg.interval_confirm, self.cfg.interval_filter)
+
+    def _sync_resampled(self) -> None:
+        """
+        아직 반영하지 않은 종료된 진입 캔들을 상위 타임프레임 캔들로 집계해 캐시에 기록
+
+        첫 호출 시에는 가장 긴 상위 구간의 시작부터 다시 집계해 진행 중인 상위 캔들을 재구성한다.
+        """
+        targets = self._derived_intervals()
+        if not targets:
+            return
+        symbol, entry = self.cfg.symbol, self.cfg.interval_entry
+        cache = self.fetcher.cache
+        closed = min(cache.count(symbol, entry, closed_only=True), self._required_candles())
+        if closed == 0:
+            return
+        cols = cache.get_latest_columns(symbol, entry, closed, closed_only=True)
+
+        if self._resampler is None:
+            self._resampler = CandleResampler(symbol, targets, entry)
+        resampler = self._resampler
+        if resampler.last_open_time is None:
+            last_open = int(cols.open_time[-1])
+            start = min(resampler.bucket_start(itv, last_open) for itv in targets)
+            first = int(np.searchsorted(cols.open_time, start, side="left"))
+        else:
+            first = int(np.searchsorted(cols.open_time, resampler.last_open_time, side="right"))
+        for i in range(first, len(cols)):
+            for bar in resampler.add(cols.candle_at(i)):
+                cache.add_candle(bar)
+
+    def _required_candles(self) -> int:
+        """캐시에 유지할 최소 캔들 수 (candle_close 모드는 진행 중 캔들 1개 추가)"""
+        return self.indicator.required_candles + (1 if self._close_driven() else 0)
+
+    async def _refresh_candles(self) -> None:
+        """
+        타임프레임별 캔들 갱신 요청을 동시에 실행 (스텝 대기 시간 = 가장 느린 요청 1건)
+
+        - 캔들 종료 시점에만 최근 캔들 2개 조회 (종료된 봉의 확정값 + 새 진행 중 봉, API 호출 최소화)
+        - 캐시 부족 시 필요한 개수 전체 조회 (Warmup 실패 대비 안전장치)
+        - resample_from_entry 모드: 상위 타임프레임은 조회하지 않고 진입 캔들로 집계
+        """
         symbol = self.cfg.symbol
+        required = self._required_candles()
+        derived = self._derived_intervals()
+        pending = []
+        for interval in self._intervals():
+            sufficient = self.fetcher.cache.has_sufficient_data(symbol, interval, required)
+            if interval in derived and sufficient:
+                continue
+            # 종료 감지 상태는 캐시 부족 여부와 무관하게 매 스텝 갱신
+            closed = self._should_update_candle(interval)
+            if not sufficient:
+                pending.append(self.fetcher.fetch_historical_candles(symbol, interval, limit=required))
+            elif closed:
+                pending.append(self.fetcher.fetch_historical_candles(symbol, interval, limit=2))
+        if pending:
+            results = await asyncio.gather(*pending, return_exceptions=True)
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+        self._sync_resampled()
+
+    async def astep(self) -> Dict[str, Any]:
+        """한 스텝 실행 (비동기). 캔들 갱신은 이벤트 루프를 막지 않고 동시에 수행한다."""
+        with self.latency.stage("step"):
+            with self.latency.stage("fetch"):
+                await self._refresh_candles()
+            return self._evaluate_step()
 
-        # 타임스탬프 기반 스마트 캔들 업데이트
-        # 캔들 종료 시점에만 최신 캔들 1개 API 호출 (API 호출 최소화)
-        
-        # 1분봉 체크 (매 1분마다 업데이트)
-        if self._should_update_candle(self.cfg.interval_entry):
-            asyncio.run(self.fetcher.fetch_historical_candles(
-                symbol, self.cfg.interval_entry, limit=1
-            ))
-        
-        # 3분봉 체크 (매 3분마다 업데이트)
-        if self._should_update_candle(self.cfg.interval_confirm):
-            asyncio.run(self.fetcher.fetch_historical_candles(
-                symbol, self.cfg.interval_confirm, limit=1
-            ))
-        
-        # 15분봉 체크 (매 15분마다 업데이트)
-        if self._should_update_candle(self.cfg.interval_filter):
-            asyncio.run(self.fetcher.fetch_historical_candles(
-                symbol, self.cfg.interval_filter, limit=1
-            ))
-        
-        # 캐시 부족 시 fallback (안전장치 - Warmup 실패 시 대비)
-        if not self.fetcher.cache.has_sufficient_data(symbol, self.cfg.interval_entry, self.indicator.required_candles):
-            asyncio.run(self.fetcher.fetch_historical_candles(symbol, self.cfg.interval_entry, limit=self.indicator.required_candles))
-        if not self.fetcher.cache.has_sufficient_data(symbol, self.cfg.interval_confirm, self.indicator.required_candles):
-            asyncio.run(self.fetcher.fetch_historical_candles(symbol, self.cfg.interval_confirm, limit=self.indicator.required_candles))
-        if not self.fetcher.cache.has_sufficient_data(symbol, self.cfg.interval_filter, self.indicator.required_candles):
-            asyncio.run(self.fetcher.fetch_historical_candles(symbol, self.cfg.interval_filter, limit=self.indicator.required_candles))
+    def step(self) -> Dict[str, Any]:
+        """
+        한 스텝 실행 (동기). 사전 warmup 이후 사용 권장.
+
+        호출 스레드 전용의 장수명 이벤트 루프에서 astep()을 실행한다.
+        이미 이벤트 루프가 실행 중인 스레드에서는 astep()을 await해야 한다.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError("실행 중인 이벤트 루프에서는 step() 대신 await astep()을 사용하세요")
+
+        if self._sync_loop is None or self._sync_loop.is_closed():
+            self._sync_loop = asyncio.new_event_loop()
+        return self._sync_loop.run_until_complete(self.astep())
+
+    def _evaluate_step(self) -> Dict[str, Any]:
+        """캐시된 캔들로 지표/신호/리스크 평가 및 주문 실행"""
+        symbol = self.cfg.symbol
 
         ind_1m = self._compute_indicators(self.cfg.interval_entry)
         ind_3m = self._compute_indicators(self.cfg.interval_confirm)
         ind_15m = self._compute_indicators(self.cfg.interval_filter)
 
+        last_close = float(self.fetcher.cache.get_latest_columns(
+            symbol, self.cfg.interval_entry, 1, closed_only=self._close_driven()
+        ).close[-1])
+
+        return self.evaluate_indicators(ind_1m, ind_3m, ind_15m, last_close)
+
+    def evaluate_indicators(self, ind_1m, ind_3m, ind_15m, last_close: float) -> Dict[str, Any]:
+        """
+        계산된 지표로 신호/리스크 평가 및 주문 실행 (캐시 조회 없음)
+
+        백테스트는 미리 계산한 지표 시계열을 인덱스별로 넘겨 이 메서드를 직접 호출한다.
+        """
+        symbol = self.cfg.symbol
+
         # Adaptive thresholds 적용
         if self._adaptive:
             self._adaptive.add_score(self.last_signal.score if self.last_signal else 0.0)
@@ -279,24 +422,24 @@ class StrategyOrchestrator:
                 "instant": instant_t
             })
 
-        last_close = self.fetcher.cache.get_latest_candle(symbol, self.cfg.interval_entry).close
-
         # 진입/유지 평가
-        sig = self.signal.evaluate(
-            current_1m=ind_1m,
-            last_close=last_close,
-            prev_1m=self.prev_ind_1m,
-            confirm_3m=ind_3m,
-            filter_15m=ind_15m,
-            in_position=self.position is not None,
-        )
+        with self.latency.stage("signal"):
+            sig = self.signal.evaluate(
+                current_1m=ind_1m,
+                last_close=last_close,
+                prev_1m=self.prev_ind_1m,
+                confirm_3m=ind_3m,
+                filter_15m=ind_15m,
+                in_position=self.position is not None,
+            )
 
         events = []
 
         if self.position is None and not self._protective_active():
             # 진입 시도
             if sig.action.name == "BUY_LONG":
-                order = self.exec.place_market_long(symbol, self.cfg.order_quantity)
+                with self.latency.stage("execution"):
+                    order = self.exec.place_market_long(symbol, self.cfg.order_quantity)
                 if order.ok:
                     entry = order.avg_price or last_close
                     ts = ind_1m.timestamp
@@ -330,64 +473,137 @@ class StrategyOrchestrator:
         elif self.position is None and self._protective_active():
             events.append({"type": "PAUSE"})
         else:
-            # 리스크 이벤트 초기화
-            self._risk_events.clear()
-            
-            # 리스크 관리 평가
+            events.extend(self._manage_position(last_close, ind_1m, ind_1m.timestamp))
+
+        self.prev_ind_1m = ind_1m
+        self.last_signal = sig
+
+        return {
+            "signal_action": sig.action.value,
+            "signal_score": sig.score,
+            "events": events,
+            "position": self._position_summary(),
+        }
+
+    def _position_summary(self) -> Optional[Dict[str, Any]]:
+        if self.position is None:
+            return None
+        return {
+            "entry": self.position.entry_price,
+            "stop": self.position.stop_loss_price,
+            "tp": self.position.take_profit_price,
+            "pnl_pct": self.position.unrealized_pnl_pct,
+        }
+
+    def _manage_position(self, price: float, ind_1m, now_ms: int) -> List[Dict[str, Any]]:
+        """보유 포지션 리스크 평가 및 필요 시 청산 (이벤트 리스트 반환)"""
+        events: List[Dict[str, Any]] = []
+
+        # 리스크 이벤트 초기화
+        self._risk_events.clear()
+        
+        # 리스크 관리 평가
+        with self.latency.stage("risk"):
             exit_sig = self.risk.evaluate(
                 position=self.position,
-                current_price=last_close,
+                current_price=price,
                 indicators_1m=ind_1m,
                 last_signal=self.last_signal,
-                now_ms=ind_1m.timestamp,
+                now_ms=now_ms,
             )
-            
-            # 리스크 이벤트 병합 (TRAILING_ACTIVATED 등)
-            events.extend(self._risk_events)
-            
-            if exit_sig:
-                order = self.exec.close_market_long(symbol)
-                if order.ok:
-                    events.append({"type": "EXIT", "reason": exit_sig.reason.value, "price": order.avg_price})
-                else:
-                    events.append({"type": "EXIT_FAIL", "reason": exit_sig.reason.value, "error": order.error_message})
-                self.position = None
+        
+        # 리스크 이벤트 병합 (TRAILING_ACTIVATED 등)
+        events.extend(self._risk_events)
+        
+        if exit_sig:
+            with self.latency.stage("execution"):
+                order = self.exec.close_market_long(self.cfg.symbol)
+            if order.ok:
+                events.append({"type": "EXIT", "reason": exit_sig.reason.value, "price": order.avg_price})
             else:
-                events.append({"type": "HOLD_IN_POSITION", "pnl_pct": self.position.unrealized_pnl_pct})
+                events.append({"type": "EXIT_FAIL", "reason": exit_sig.reason.value, "error": order.error_message})
+            self.position = None
+        else:
+            events.append({"type": "HOLD_IN_POSITION", "pnl_pct": self.position.unrealized_pnl_pct})
+        return events
 
-        self.prev_ind_1m = ind_1m
-        self.last_signal = sig
+    async def _latest_price(self) -> float:
+        """
+        리스크 체크용 최신 가격
 
+        kline 스트림이 연결되어 있으면 캐시의 진행 중 캔들 종가, 아니면 REST mark price 조회
+        """
+        if self.fetcher.is_streaming():
+            candle = self.fetcher.cache.get_latest_candle(self.cfg.symbol, self.cfg.interval_entry)
+            if candle is not None:
+                return candle.close
+        mp = await asyncio.to_thread(self.client.get_mark_price, self.cfg.symbol)
+        price = float(mp.get("markPrice", 0)) if isinstance(mp, dict) else 0.0
+        if price <= 0:
+            raise RuntimeError(f"mark price 조회 실패: {mp}")
+        return price
+
+    async def arisk_tick(self) -> Dict[str, Any]:
+        """
+        가격 기반 리스크 체크만 수행 (지표/신호 재계산 없음)
+
+        직전 캔들 종료 시 계산한 1m 지표를 재사용해 손절/트레일링/시간 제한을 확인한다.
+        """
+        events: List[Dict[str, Any]] = []
+        if self.position is not None and self.prev_ind_1m is not None:
+            with self.latency.stage("risk_tick"):
+                with self.latency.stage("price"):
+                    price = await self._latest_price()
+                events = self._manage_position(price, self.prev_ind_1m, self._server_now_ms())
         return {
-            "signal_action": sig.action.value,
-            "signal_score": sig.score,
+            "signal_action": self.last_signal.action.value if self.last_signal else None,
+            "signal_score": self.last_signal.score if self.last_signal else 0.0,
             "events": events,
-            "position": None if self.position is None else {
-                "entry": self.position.entry_price,
-                "stop": self.position.stop_loss_price,
-                "tp": self.position.take_profit_price,
-                "pnl_pct": self.position.unrealized_pnl_pct,
-            }
+            "position": self._position_summary(),
         }
 
+    async def run_tick(self, step_no: int = 0) -> Optional[Dict[str, Any]]:
+        """
+        주기 틱 1회 처리
+
+        - poll 모드: run_step() (전체 평가)
+        - candle_close 모드: settle이 끝난 새 캔들 종료가 있으면 run_step(),
+          아니면 포지션 보유 시에만 arisk_tick()
+        """
+        if not self._close_driven():
+            return await self.run_step(step_no)
+
+        close_ms = self._last_settled_close_ms()
+        if close_ms > self._last_evaluated_close_ms:
+            self._last_evaluated_close_ms = close_ms
+            return await self.run_step(step_no)
+        if self.position is None:
+            return None
+
+        try:
+            result = await self.arisk_tick()
+        except Exception as e:
+            logger.error(f"[Orchestrator] 리스크 틱 오류 (#{step_no}): {e}", exc_info=True)
+            return None
+        if result["events"]:
+            with self.latency.stage("publish"):
+                self._publish_result(result)
+        return result
+
     def set_event_callback(self, callback: Callable[[Dict[str, Any]], None]):
         """이벤트 발생 시 호출할 콜백 함수 설정"""
         self._event_callback = callback
 
-    async def run_forever(self):
-        """
-        1초 간격 무한 루프 (비동기)
-        Ctrl+C 또는 stop() 호출 시 종료
-        """
-        logger.info(f"[Orchestrator] 연속 실행 시작: {self.cfg.symbol}, {self.cfg.loop_interval_sec}초 간격")
-        
-        # Warmup: 초기 데이터 로드
+    async def warmup_or_report(self) -> bool:
+        """warmup() 실행. 실패 시 WARMUP_FAIL 이벤트를 전송하고 False 반환"""
         try:
             await self.warmup()
             logger.info("[Orchestrator] Warmup 완료")
+            return True
         except Exception as e:
             logger.error(f"[Orchestrator] Warmup 실패: {e}", exc_info=True)
             self._running = False  # 상태 명시적 설정
+            self._release_market_data()
             
             # 에러 이벤트 콜백 전송
             if self._event_callback:
@@ -401,7 +617,64 @@ class StrategyOrchestrator:
                     })
                 except Exception as cb_err:
                     logger.error(f"[Orchestrator] 콜백 전송 실패: {cb_err}")
-            
+            return False
+
+    async def run_step(self, step_no: int = 0) -> Optional[Dict[str, Any]]:
+        """
+        astep() 1회 실행 + 이벤트 콜백/로깅 (예외는 로깅 후 None 반환)
+
+        run_forever()와 OrchestratorScheduler가 공통으로 사용한다.
+        """
+        try:
+            result = await self.astep()
+        except Exception as e:
+            logger.error(f"[Orchestrator] Step 실행 오류 (#{step_no}): {e}", exc_info=True)
+            return None
+        with self.latency.stage("publish"):
+            self._publish_result(result)
+        return result
+
+    def _publish_result(self, result: Dict[str, Any]) -> None:
+        """스텝/틱 결과를 이벤트 콜백으로 전달하고 주요 이벤트 로깅"""
+        # 이벤트 콜백 호출
+        if self._event_callback:
+            try:
+                self._event_callback(result)
+            except Exception as e:
+                logger.error(f"[Orchestrator] 이벤트 콜백 오류: {e}")
+        
+        # 주요 이벤트 로깅
+        for event in result.get("events", []):
+            event_type = event.get("type")
+            if event_type == "ENTRY":
+                log_trade_event(
+                    logger, "ENTRY", self.cfg.symbol,
+                    price=event.get('price'),
+                    order_id=event.get('order_id')
+                )
+            elif event_type == "EXIT":
+                log_trade_event(
+                    logger, "EXIT", self.cfg.symbol,
+                    price=event.get('price'),
+                    reason=event.get('reason')
+                )
+            elif event_type == "ENTRY_FAIL":
+                logger.error(f"❌ 진입 실패: {event.get('error')}")
+            elif event_type == "EXIT_FAIL":
+                logger.error(f"❌ 청산 실패: {event.get('error')}")
+
+    async def run_forever(self):
+        """
+        1초 간격 무한 루프 (비동기)
+        Ctrl+C 또는 stop() 호출 시 종료
+
+        candle_close 모드에서는 캔들 종료(+settle) 시각까지 대기하고,
+        포지션 보유 중에만 loop_interval_sec 간격으로 가격 리스크 체크를 수행한다.
+        """
+        logger.info(f"[Orchestrator] 연속 실행 시작: {self.cfg.symbol}, {self.cfg.loop_interval_sec}초 간격")
+        
+        # Warmup: 초기 데이터 로드
+        if not await self.warmup_or_report():
             return
 
         self._running = True
@@ -412,47 +685,23 @@ class StrategyOrchestrator:
                 step_count += 1
                 start_time = time.time()
 
-                try:
-                    result = self.step()
-                    
-                    # 이벤트 콜백 호출
-                    if self._event_callback:
-                        try:
-                            self._event_callback(result)
-                        except Exception as e:
-                            logger.error(f"[Orchestrator] 이벤트 콜백 오류: {e}")
-                    
-                    # 주요 이벤트 로깅
-                    for event in result.get("events", []):
-                        event_type = event.get("type")
-                        if event_type == "ENTRY":
-                            log_trade_event(
-                                logger, "ENTRY", self.cfg.symbol,
-                                price=event.get('price'),
-                                order_id=event.get('order_id')
-                            )
-                        elif event_type == "EXIT":
-                            log_trade_event(
-                                logger, "EXIT", self.cfg.symbol,
-                                price=event.get('price'),
-                                reason=event.get('reason')
-                            )
-                        elif event_type == "ENTRY_FAIL":
-                            logger.error(f"❌ 진입 실패: {event.get('error')}")
-                        elif event_type == "EXIT_FAIL":
-                            logger.error(f"❌ 청산 실패: {event.get('error')}")
-                
-                except Exception as e:
-                    logger.error(f"[Orchestrator] Step 실행 오류 (#{step_count}): {e}", exc_info=True)
+                await self.run_tick(step_count)
 
                 # 주기 유지
                 elapsed = time.time() - start_time
                 sleep_time = max(0, self.cfg.loop_interval_sec - elapsed)
+                if self._close_driven():
+                    # 포지션이 없으면 다음 캔들 종료까지 유휴, 있으면 틱 주기와 캔들 종료 중 빠른 쪽
+                    until_close = max(0, self.next_close_deadline() - time.time())
+                    sleep_time = until_close if self.position is None else min(sleep_time, until_close)
                 
                 if sleep_time > 0:
                     await asyncio.sleep(sleep_time)
                 else:
-                    logger.warning(f"[Orchestrator] Step 처리 시간 초과: {elapsed:.2f}초 > {self.cfg.loop_interval_sec}초")
+                    logger.warning(
+                        f"[Orchestrator] Step 처리 시간 초과: {elapsed:.2f}초 > {self.cfg.loop_interval_sec}초 "
+                        f"(단계별 ms: {self.latency.last()})"
+                    )
 
         except asyncio.CancelledError:
             logger.info("[Orchestrator] 비동기 태스크 취소됨")
@@ -462,16 +711,27 @@ class StrategyOrchestrator:
             self._running = False
             logger.info(f"[Orchestrator] 연속 실행 종료 (총 {step_count} 스텝)")
 
-    def start(self):
+    def start(self, scheduler=None):
         """
         백그라운드 스레드에서 run_forever() 실행
         
         GUI/Backend와 분리하여 비동기 루프 실행
+
+        Args:
+            scheduler: OrchestratorScheduler (지정 시 전용 스레드 대신 공유 스케줄러 루프에 등록)
         """
         if self._running:
             logger.warning("[Orchestrator] 이미 실행 중입니다")
             return
 
+        self._acquire_market_data()
+
+        if scheduler is not None:
+            self._scheduler = scheduler
+            scheduler.register(self)
+            logger.info("[Orchestrator] 공유 스케줄러에 등록")
+            return
+
         def _run_async_loop():
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
@@ -498,6 +758,14 @@ class StrategyOrchestrator:
             return
 
         logger.info("[Orchestrator] 종료 신호 전송...")
+
+        # 공유 스케줄러 사용 시 진행 중인 스텝 완료 후 해제 (청산 주문과 경합 방지)
+        if self._scheduler is not None:
+            try:
+                self._scheduler.unregister(self)
+            except Exception as e:
+                logger.error(f"[Orchestrator] 스케줄러 해제 실패: {e}")
+            self._scheduler = None
         
         # 포지션 자동 청산 (사용자 의도: 거래 정지 시 포지션 즉시 시장가 청산)
         if self.position and force_close_position:
@@ -552,6 +820,9 @@ class StrategyOrchestrator:
             else:
                 logger.info("[Orchestrator] 스레드 정상 종료")
 
+        # 공유 시세 허브 구독 해제 (마지막 구독자면 캐시 제거)
+        self._release_market_data()
+
     def is_running(self) -> bool:
         """실행 상태 확인"""
         return self._running
@@ -575,5 +846,6 @@ class StrategyOrchestrator:
                 "score": self.last_signal.score,
                 "confidence_pct": self.last_signal.confidence_pct,
                 "triggers": self.last_signal.triggers,
-            }
+            },
+            "latency": self.latency.snapshot(),
         }
@@ -0,0 +1,204 @@
+"""캔들 리샘플러 - 종료된 기준 타임프레임(1m) 캔들로 상위 타임프레임(3m/15m/1h) 캔들을 증분 생성"""
+import logging
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from .data_fetcher import BinanceDataFetcher
+from .data_structures import Candle
+
+logger = logging.getLogger(__name__)
+
+INTERVAL_MS = BinanceDataFetcher.INTERVAL_MS
+
+
+class _Bucket:
+    """상위 타임프레임 캔들 1개 집계 상태"""
+
+    __slots__ = ("open_time", "close_time", "open", "high", "low", "close",
+                 "volume", "quote_volume", "trades_count", "complete")
+
+    def __init__(self, open_time: int, close_time: int, c: Candle):
+        self.open_time = open_time
+        self.close_time = close_time
+        self.open = c.open
+        self.high = c.high
+        self.low = c.low
+        self.close = c.close
+        self.volume = c.volume
+        self.quote_volume = c.quote_volume
+        self.trades_count = c.trades_count
+        self.complete = False
+
+    def merge(self, c: Candle) -> None:
+        self.high = max(self.high, c.high)
+        self.low = min(self.low, c.low)
+        self.close = c.close
+        self.volume += c.volume
+        self.quote_volume += c.quote_volume
+        self.trades_count += c.trades_count
+
+    def to_candle(self, symbol: str, interval: str) -> Candle:
+        return Candle(
+            symbol=symbol,
+            interval=interval,
+            open_time=self.open_time,
+            close_time=self.close_time,
+            open=self.open,
+            high=self.high,
+            low=self.low,
+            close=self.close,
+            volume=self.volume,
+            quote_volume=self.quote_volume,
+            trades_count=self.trades_count,
+            is_closed=self.complete,
+        )
+
+
+class CandleResampler:
+    """
+    기준 타임프레임 종료 캔들 → 상위 타임프레임 캔들 증분 집계
+
+    - 상위 캔들 구간은 Binance와 동일하게 epoch 기준 정렬 (open_time // 구간 길이)
+    - 구간의 마지막 기준 캔들이 들어오면 is_closed=True, 그 전에는 진행 중(is_closed=False) 캔들
+    - 중간 누락 후 다음 구간 캔들이 들어오면 이전 구간을 종료 처리
+    - 진행 중 기준 캔들(is_closed=False)과 이미 반영한 과거 캔들은 무시
+
+    Example:
+        resampler = CandleResampler("BTCUSDT", ["3m", "15m"])
+        for bar in resampler.add(closed_1m_candle):
+            cache.add_candle(bar)  # 같은 open_time은 갱신
+    """
+
+    def __init__(self, symbol: str, target_intervals: Iterable[str], base_interval: str = "1m"):
+        if base_interval not in INTERVAL_MS:
+            raise ValueError(f"지원하지 않는 기준 타임프레임: {base_interval}")
+        self.symbol = symbol
+        self.base_interval = base_interval
+        self.base_ms = INTERVAL_MS[base_interval]
+        self.targets: Dict[str, int] = {}
+        for interval in target_intervals:
+            period = INTERVAL_MS.get(interval)
+            if period is None or period <= self.base_ms or period % self.base_ms:
+                raise ValueError(f"{base_interval}에서 만들 수 없는 타임프레임: {interval}")
+            self.targets[interval] = period
+        self._buckets: Dict[str, Optional[_Bucket]] = {interval: None for interval in self.targets}
+        self.last_open_time: Optional[int] = None
+
+    def add(self, candle: Candle) -> List[Candle]:
+        """
+        종료된 기준 캔들 1개 반영
+
+        Returns:
+            이번 반영으로 바뀐 상위 캔들 목록 (종료된 이전 구간 캔들 포함, 시간 오름차순)
+        """
+        if not candle.is_closed or candle.interval != self.base_interval:
+            return []
+        if self.last_open_time is not None and candle.open_time <= self.last_open_time:
+            return []
+        self.last_open_time = candle.open_time
+
+        updated: List[Candle] = []
+        for interval, period in self.targets.items():
+            start = (candle.open_time // period) * period
+            bucket = self._buckets[interval]
+            if bucket is not None and bucket.open_time != start:
+                if not bucket.complete:
+                    # 구간 끝 캔들이 누락된 채 다음 구간 시작 → 이전 구간 종료 처리
+                    bucket.complete = True
+                    updated.append(bucket.to_candle(self.symbol, interval))
+                bucket = None
+            if bucket is None:
+                bucket = _Bucket(start, start + period - 1, candle)
+                self._buckets[interval] = bucket
+            else:
+                bucket.merge(candle)
+            bucket.complete = candle.open_time + self.base_ms >= start + period
+            updated.append(bucket.to_candle(self.symbol, interval))
+        return updated
+
+    def extend(self, candles: Iterable[Candle]) -> List[Candle]:
+        updated: List[Candle] = []
+        for candle in candles:
+            updated.extend(self.add(candle))
+        return updated
+
+    def current(self, interval: str) -> Optional[Candle]:
+        """현재 집계 중(또는 마지막으로 종료된) 상위 캔들"""
+        bucket = self._buckets.get(interval)
+        return None if bucket is None else bucket.to_candle(self.symbol, interval)
+
+    def bucket_start(self, interval: str, open_time: int) -> int:
+        period = self.targets[interval]
+        return (open_time // period) * period
+
+    def reset(self) -> None:
+        self._buckets = {interval: None for interval in self.targets}
+        self.last_open_time = None
+
+
+def resample_candles(candles: List[Candle], interval: str, base_interval: str = "1m") -> List[Candle]:
+    """기준 캔들 리스트 전체를 상위 타임프레임 캔들 리스트로 변환 (구간별 최종 상태만)"""
+    if not candles:
+        return []
+    resampler = CandleResampler(candles[0].symbol, [interval], base_interval)
+    bars: Dict[int, Candle] = {}
+    for bar in resampler.extend(candles):
+        bars[bar.open_time] = bar
+    return [bars[k] for k in sorted(bars)]
+
+
+def resample_dataframe(df: pd.DataFrame, interval: str, base_interval: str = "1m") -> pd.DataFrame:
+    """
+    백테스트용 klines DataFrame(timestamp/open/high/low/close/volume[/quote_volume/trades])을 상위 타임프레임으로 변환
+
+    CandleResampler와 동일한 구간 규칙을 사용하며, 각 행의 timestamp는 구간 시작 시각이다.
+    """
+    columns = ["timestamp", "open", "high", "low", "close", "volume", "quote_volume", "trades"]
+    if df.empty:
+        return pd.DataFrame(columns=columns)
+
+    base_ms = INTERVAL_MS[base_interval]
+    has_quote = "quote_volume" in df.columns
+    has_trades = "trades" in df.columns
+    tz = getattr(df["timestamp"].dt, "tz", None)
+    open_times = (df["timestamp"].astype("int64") // 1_000_000).tolist()
+    if tz is None:
+        # 백테스트 로더는 로컬 시간 naive datetime을 사용하므로 epoch ms로 환산
+        open_times = [int(ts.timestamp() * 1000) for ts in df["timestamp"]]
+
+    resampler = CandleResampler("", [interval], base_interval)
+    bars: Dict[int, Candle] = {}
+    for i, row in enumerate(df.itertuples(index=False)):
+        candle = Candle(
+            symbol="",
+            interval=base_interval,
+            open_time=open_times[i],
+            close_time=open_times[i] + base_ms - 1,
+            open=float(row.open),
+            high=float(row.high),
+            low=float(row.low),
+            close=float(row.close),
+            volume=float(row.volume),
+            quote_volume=float(row.quote_volume) if has_quote else 0.0,
+            trades_count=int(row.trades) if has_trades else 0,
+        )
+        for bar in resampler.add(candle):
+            bars[bar.open_time] = bar
+
+    ordered = [bars[k] for k in sorted(bars)]
+    out = pd.DataFrame({
+        "timestamp": [b.open_time for b in ordered],
+        "open": [b.open for b in ordered],
+        "high": [b.high for b in ordered],
+        "low": [b.low for b in ordered],
+        "close": [b.close for b in ordered],
+        "volume": [b.volume for b in ordered],
+        "quote_volume": [b.quote_volume for b in ordered],
+        "trades": [b.trades_count for b in ordered],
+    })
+    if tz is None:
+        out["timestamp"] = [pd.Timestamp.fromtimestamp(ms / 1000) for ms in out["timestamp"]]
+    else:
+        out["timestamp"] = pd.to_datetime(out["timestamp"], unit="ms", utc=True).dt.tz_convert(tz)
+    return out
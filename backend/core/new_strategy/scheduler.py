@@ -0,0 +1,289 @@
+"""Orchestrator Scheduler - 단일 이벤트 루프에서 다중 심볼 오케스트레이터 실행"""
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class _Job:
+    """스케줄러에 등록된 오케스트레이터 1개의 실행 상태"""
+    orch: Any
+    deadline: float = 0.0  # 다음 실행 시각 (epoch sec)
+    warmed_up: bool = False
+    running: bool = False  # 스텝 실행 중 여부
+    steps: int = 0
+    overruns: int = 0
+    missed_ticks: int = 0
+    last_lag_sec: float = 0.0  # 마감 시각 대비 시작 지연
+    last_duration_sec: float = 0.0
+    max_duration_sec: float = 0.0
+    idle: Optional[asyncio.Event] = field(default=None, repr=False)
+
+    @property
+    def symbol(self) -> str:
+        return self.orch.cfg.symbol
+
+    @property
+    def in_position(self) -> bool:
+        return self.orch.position is not None
+
+
+class OrchestratorScheduler:
+    """
+    N개 StrategyOrchestrator를 하나의 asyncio 루프(스레드 1개)에서 구동하는 중앙 스케줄러
+
+    - 마감 시각(deadline) 기반 실행
+        - 포지션 보유 심볼: loop_interval_sec 주기 (리스크 관리), 캔들 종료 시각이 더 빠르면 그 시각
+        - 포지션 미보유 심볼: 진입 타임프레임 캔들 종료(서버 시각) + settle 시각 (캐시가 그 사이 변하지 않음)
+        - 틱마다 orch.run_tick() 호출 (평가 모드별 전체 평가/가격 리스크 체크는 오케스트레이터가 결정)
+    - 동시에 마감된 심볼은 포지션 보유 심볼부터 실행 (max_concurrency 제한)
+    - 스텝이 다음 마감 시각을 넘기면 overrun으로 집계하고 SCHEDULER_OVERRUN 이벤트 전송
+
+    Example:
+        scheduler = OrchestratorScheduler()
+        scheduler.start()
+        scheduler.register(orch_btc)
+        scheduler.register(orch_eth)
+    """
+
+    def __init__(self, max_concurrency: int = 16, tick_sec: float = 0.05):
+        """
+        Args:
+            max_concurrency: 동시에 실행할 최대 스텝 수
+            tick_sec: 마감 확인 최소 주기 (다음 마감까지 대기하되 이 값보다 자주 깨어나지 않음)
+        """
+        self.max_concurrency = max_concurrency
+        self.tick_sec = tick_sec
+
+        self._jobs: Dict[int, _Job] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tasks: set = set()
+        self._running = False
+
+    # ----------------------
+    # 수명 주기
+    # ----------------------
+    def start(self) -> None:
+        """백그라운드 스레드 1개에서 스케줄러 루프 시작"""
+        if self._running:
+            logger.warning("[Scheduler] 이미 실행 중입니다")
+            return
+        self._running = True
+        self._ready.clear()
+
+        def _run():
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            self._loop = loop
+            try:
+                loop.run_until_complete(self._main())
+            except Exception as e:
+                logger.error(f"[Scheduler] 루프 오류: {e}", exc_info=True)
+            finally:
+                loop.close()
+                self._loop = None
+
+        self._thread = threading.Thread(target=_run, name="StrategySchedulerThread", daemon=True)
+        self._thread.start()
+        self._ready.wait(timeout=5.0)
+        logger.info("[Scheduler] 시작")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """스케줄러 중지 (실행 중인 스텝은 완료까지 대기)"""
+        if not self._running:
+            return
+        self._running = False
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            if self._thread.is_alive():
+                logger.warning(f"[Scheduler] 스레드 종료 타임아웃 ({timeout}초)")
+        logger.info("[Scheduler] 중지")
+
+    def is_running(self) -> bool:
+        return self._running
+
+    # ----------------------
+    # 등록/해제 (임의 스레드에서 호출 가능)
+    # ----------------------
+    def register(self, orch) -> None:
+        """오케스트레이터 등록 (warmup 후 첫 마감 시각부터 실행)"""
+        if not self._running:
+            raise RuntimeError("스케줄러가 실행 중이 아닙니다. start()를 먼저 호출하세요")
+        self._call(self._add(orch))
+
+    def unregister(self, orch, timeout: float = 10.0) -> None:
+        """오케스트레이터 해제 (진행 중인 스텝이 끝날 때까지 대기)"""
+        if not self._running or self._loop is None:
+            self._jobs.pop(id(orch), None)
+            return
+        self._call(self._remove(orch), timeout)
+
+    def _call(self, coro, timeout: float = 10.0):
+        if self._loop is not None and threading.current_thread() is self._thread:
+            # 스케줄러 루프 내부(예: 이벤트 콜백)에서 호출된 경우 예약만 수행
+            return self._spawn(coro)
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result(timeout)
+
+    async def _add(self, orch) -> None:
+        key = id(orch)
+        if key in self._jobs:
+            logger.warning(f"[Scheduler] 이미 등록된 심볼: {orch.cfg.symbol}")
+            return
+        job = _Job(orch=orch, deadline=time.time(), idle=asyncio.Event())
+        job.idle.set()
+        self._jobs[key] = job
+        orch._running = True
+        self._wakeup.set()
+        logger.info(f"[Scheduler] 등록: {orch.cfg.symbol} (총 {len(self._jobs)}개)")
+
+    async def _remove(self, orch) -> None:
+        job = self._jobs.pop(id(orch), None)
+        if job is None:
+            return
+        await job.idle.wait()
+        logger.info(f"[Scheduler] 해제: {job.symbol} (총 {len(self._jobs)}개)")
+
+    # ----------------------
+    # 메인 루프
+    # ----------------------
+    async def _main(self) -> None:
+        self._wakeup = asyncio.Event()
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._ready.set()
+
+        while self._running:
+            now = time.time()
+            due = [j for j in self._jobs.values() if not j.running and j.deadline <= now]
+            # 포지션 보유 심볼 우선, 그 다음 마감 시각 순
+            due.sort(key=lambda j: (not j.in_position, j.deadline))
+            for job in due:
+                job.running = True
+                job.idle.clear()
+                self._spawn(self._run_job(job))
+
+            pending = [j.deadline for j in self._jobs.values() if not j.running]
+            wait = max(self.tick_sec, min(pending) - time.time()) if pending else 1.0
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=wait)
+            except asyncio.TimeoutError:
+                pass
+
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _spawn(self, coro) -> asyncio.Task:
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _run_job(self, job: _Job) -> None:
+        orch = job.orch
+        try:
+            async with self._semaphore:
+                if not job.warmed_up:
+                    if not await orch.warmup_or_report():
+                        self._jobs.pop(id(orch), None)
+                        return
+                    job.warmed_up = True
+                    job.deadline = time.time()
+                if id(orch) not in self._jobs:
+                    # warmup 도중 해제됨
+                    return
+
+                started = time.time()
+                job.last_lag_sec = max(0.0, started - job.deadline)
+                job.steps += 1
+                await orch.run_tick(job.steps)
+                finished = time.time()
+
+            duration = finished - started
+            job.last_duration_sec = duration
+            job.max_duration_sec = max(job.max_duration_sec, duration)
+
+            next_deadline = self._next_deadline(job, job.deadline)
+            if finished > next_deadline:
+                self._report_overrun(job, next_deadline, finished)
+            # 놓친 마감은 건너뛰고 현재 이후의 다음 마감으로 이동
+            while next_deadline <= finished:
+                next_deadline = self._next_deadline(job, next_deadline)
+            job.deadline = next_deadline
+        except Exception as e:
+            logger.error(f"[Scheduler] {job.symbol} 실행 오류: {e}", exc_info=True)
+            job.deadline = time.time() + orch.cfg.loop_interval_sec
+        finally:
+            job.running = False
+            job.idle.set()
+            if self._wakeup is not None:
+                self._wakeup.set()
+
+    def _next_deadline(self, job: _Job, after: float) -> float:
+        """after 이후의 다음 마감 시각"""
+        close_deadline = job.orch.next_close_deadline(after)
+        if job.in_position:
+            return min(after + job.orch.cfg.loop_interval_sec, close_deadline)
+        return close_deadline
+
+    def _report_overrun(self, job: _Job, deadline: float, finished: float) -> None:
+        over = finished - deadline
+        missed = 1
+        nxt = self._next_deadline(job, deadline)
+        while nxt <= finished:
+            missed += 1
+            nxt = self._next_deadline(job, nxt)
+        job.overruns += 1
+        job.missed_ticks += missed
+        logger.warning(
+            f"[Scheduler] {job.symbol} 스텝 overrun: {job.last_duration_sec:.3f}초 "
+            f"(마감 초과 {over:.3f}초, 누락 {missed}회)"
+        )
+        latency = getattr(job.orch, "latency", None)
+        try:
+            job.orch._emit_event({
+                "type": "SCHEDULER_OVERRUN",
+                "symbol": job.symbol,
+                "duration_sec": round(job.last_duration_sec, 4),
+                "over_sec": round(over, 4),
+                "missed_ticks": missed,
+                # 단계별 마지막 측정값 (ms) - 네트워크/지표/로깅 중 원인 구분용
+                "stages_ms": latency.last() if latency is not None else {},
+            })
+        except Exception as e:
+            logger.error(f"[Scheduler] overrun 이벤트 전송 실패: {e}")
+
+    # ----------------------
+    # 상태 조회
+    # ----------------------
+    def get_status(self) -> Dict[str, Any]:
+        """스케줄러/심볼별 실행 통계 (API/GUI용)"""
+        jobs: List[Dict[str, Any]] = []
+        for job in list(self._jobs.values()):
+            jobs.append({
+                "symbol": job.symbol,
+                "in_position": job.in_position,
+                "warmed_up": job.warmed_up,
+                "next_deadline": job.deadline,
+                "steps": job.steps,
+                "overruns": job.overruns,
+                "missed_ticks": job.missed_ticks,
+                "last_lag_sec": round(job.last_lag_sec, 4),
+                "last_duration_sec": round(job.last_duration_sec, 4),
+                "max_duration_sec": round(job.max_duration_sec, 4),
+            })
+        return {
+            "running": self._running,
+            "symbols": len(jobs),
+            "max_concurrency": self.max_concurrency,
+            "jobs": jobs,
+        }
@@ -20,7 +20,9 @@ class AlphaStrategy(BaseStrategy):
     
     def __init__(self, symbol: str = "BTCUSDT", leverage: int = 50, 
                  order_quantity: float = 0.001, 
-                 binance_client: Optional[Any] = None):
+                 binance_client: Optional[Any] = None,
+                 scheduler: Optional[Any] = None,
+                 market_data_hub: Optional[Any] = None):
         """
         Alpha 전략 초기화
         
@@ -29,6 +31,8 @@ class AlphaStrategy(BaseStrategy):
             leverage: 레버리지
             order_quantity: 주문 수량
             binance_client: BinanceClient 인스턴스 (선택적, EngineManager에서 주입)
+            scheduler: OrchestratorScheduler 인스턴스 (선택적, 미지정 시 전용 스레드로 실행)
+            market_data_hub: 공유 MarketDataHub (선택적, 미지정 시 엔진별 독립 캐시)
         """
         # ✅ BaseStrategy에 binance_client 전달 (의존성 주입)
         super().__init__("Alpha", binance_client=binance_client)
@@ -45,10 +49,14 @@ class AlphaStrategy(BaseStrategy):
         # Orchestrator 초기화 (binance_client는 부모에서 상속)
         self.orchestrator = StrategyOrchestrator(
             binance_client=self.binance_client,
+            fetcher=market_data_hub,
             config=self.orch_config,
             auto_prepare_symbol=False,  # 설정 적용 버튼에서 명시적 호출
         )
         
+        # 공유 스케줄러 (EngineManager에서 주입)
+        self.scheduler = scheduler
+        
         # 이벤트 콜백 설정
         self.orchestrator.set_event_callback(self._on_orchestrator_event)
         
@@ -119,8 +127,8 @@ class AlphaStrategy(BaseStrategy):
         self.is_active = True
         self.is_running = True
         
-        # Orchestrator 백그라운드 시작
-        self.orchestrator.start()
+        # Orchestrator 백그라운드 시작 (공유 스케줄러가 있으면 해당 루프에 등록)
+        self.orchestrator.start(scheduler=self.scheduler)
         
         print(f"[{self.engine_name}] 전략 시작됨 (Orchestrator 백그라운드 실행)")
         return True
@@ -153,6 +161,7 @@ class AlphaStrategy(BaseStrategy):
             "orchestrator_running": orch_status.get("running", False),
             "last_signal_action": last_signal.get("action", "N/A"),
             "last_signal_score": last_signal.get("score", 0),
+            "latency": orch_status.get("latency", {}),
         })
         
         return base_status
@@ -6,6 +6,10 @@ from typing import Optional, Callable, Awaitable, Dict, Any, List
 from backend.core.account_manager import AccountManager
 from backend.core.session_manager import SessionManager
 from backend.api_client.binance_client import BinanceClient
+from backend.api_client.mark_price_cache import MarkPriceStream
+from backend.api_client.ticker_stream import TickerRanking, TickerStream
+from backend.api_client.user_data_stream import UserDataStream
+from backend.utils.config_loader import BINANCE_WS_BASE_URL_PUBLIC, BINANCE_WS_BASE_URL_USER
 from backend.database.db_manager import DatabaseManager
 
 class YonaService:
@@ -23,20 +27,32 @@ class YonaService:
         self._main_task: Optional[asyncio.Task] = None
         self._analysis_active = False  # GUI의 START/STOP 버튼으로 제어
         
-        # 계좌 관리자 및 세션 관리자
-        self.account_manager = AccountManager()
-        self.session_manager = SessionManager()
-        
         # 바이낸스 클라이언트
         self.binance_client = BinanceClient()
         
+        # 계좌 관리자 및 세션 관리자 (계좌 관리자는 같은 클라이언트/계좌 상태 공유)
+        self.account_manager = AccountManager(binance_client=self.binance_client)
+        self.session_manager = SessionManager()
+        # exchangeInfo 변경(신규 상장/상태 변경) 시 심볼 목록 캐시 무효화
+        self.binance_client.exchange_info.add_listener(self._on_exchange_info_diff)
+        # 전체 심볼 markPrice 스트림 → binance_client.mark_prices (주문 경로의 REST 조회 제거)
+        self._mark_price_stream = MarkPriceStream(self.binance_client.mark_prices, BINANCE_WS_BASE_URL_PUBLIC)
+        # 전체 심볼 티커 스트림 → 증분 정렬 랭킹 (REST 전체 티커는 콜드 스타트/끊김 시 폴백)
+        self._ticker_ranking = TickerRanking()
+        self._ticker_stream = TickerStream(self._ticker_ranking, BINANCE_WS_BASE_URL_PUBLIC)
+        # listenKey User Data Stream → binance_client.account_state (포지션/잔고 폴링 대체)
+        self._user_data_stream = UserDataStream(self.binance_client, BINANCE_WS_BASE_URL_USER)
+        
         # 헤더 데이터 업데이트 간격 (초)
         self._header_update_interval = 3.0
         self._last_header_update = 0.0
         
-        # 랭킹 데이터 업데이트 간격 (초)
+        # 랭킹 데이터 업데이트 간격 (초) - !ticker@arr 스트림이 끊겼을 때의 REST 주기
         self._ranking_update_interval = 10.0
         self._last_ranking_update = 0.0
+        # 스트림 연결 중 랭킹 푸시 간격 (초)
+        self._ranking_push_interval = 1.0
+        self._ranking_task: Optional[asyncio.Task] = None
         
         # 심볼 상장일 정보 캐시 (symbol -> onboardDate timestamp)
         self._symbol_onboard_dates: Dict[str, int] = {}
@@ -69,6 +85,17 @@ class YonaService:
         if self._broadcaster:
             await self._broadcaster(message)
 
+    async def _binance(self, method: str, *args, **kwargs):
+        """
+        바이낸스 API 호출 (이벤트 루프 비블로킹)
+
+        비동기 변형(binance_client.aio)이 있으면 await하고, 없으면 동기 메서드를 스레드에서 실행한다.
+        """
+        aio = getattr(self.binance_client, "aio", None)
+        if aio is not None:
+            return await getattr(aio, method)(*args, **kwargs)
+        return await asyncio.to_thread(getattr(self.binance_client, method), *args, **kwargs)
+
     async def initialize(self):
         self.logger.info("YonaService 비동기 초기화 시작...")
         self._running = True
@@ -86,6 +113,13 @@ class YonaService:
         await self._load_engine_settings()
         await self._load_app_settings()
         
+        # exchangeInfo 인덱스 백그라운드 갱신 (TTL 주기)
+        self.binance_client.exchange_info.start(self.binance_client.get_exchange_info)
+        await self._mark_price_stream.start()
+        await self._ticker_stream.start()
+        if self.binance_client.api_key:
+            await self._user_data_stream.start()
+        
         # 초기 상태를 connected_inactive로 브로드캐스트 (타이틀 주황색 설정)
         await self._broadcast({"type": "APP_STATUS_UPDATE", "data": {"status": "connected_inactive"}})
         
@@ -95,6 +129,21 @@ class YonaService:
         if not self._main_task or self._main_task.done():
             self._main_task = asyncio.create_task(self._main_loop())
             self.logger.info("YonaService 메인 루프 시작.")
+        if not self._ranking_task or self._ranking_task.done():
+            self._ranking_task = asyncio.create_task(self._ranking_push_loop())
+
+    async def _ranking_push_loop(self):
+        """!ticker@arr 스트림이 신선한 동안 랭킹을 짧은 주기로 푸시 (REST 호출 없음)"""
+        last_version = -1
+        while self._running:
+            try:
+                ranking = self._ticker_ranking
+                if self._analysis_active and ranking.is_fresh() and ranking.version != last_version:
+                    last_version = ranking.version
+                    await self._update_ranking_data()
+            except Exception as e:
+                self.logger.error(f"랭킹 푸시 루프 오류: {e}", exc_info=True)
+            await asyncio.sleep(self._ranking_push_interval)
 
     async def _main_loop(self):
         import time
@@ -109,9 +158,10 @@ class YonaService:
                 
                 # _analysis_active가 True일 때만 랭킹/SETTLING 업데이트 (START 버튼 클릭 후)
                 if self._analysis_active:
-                    # 랭킹 데이터 업데이트
+                    # 랭킹 데이터 업데이트 (스트림이 신선하면 _ranking_push_loop가 담당)
                     if current_time - self._last_ranking_update >= self._ranking_update_interval:
-                        await self._update_ranking_data()
+                        if not self._ticker_ranking.is_fresh():
+                            await self._update_ranking_data()
                         self._last_ranking_update = current_time
                         
                         # SETTLING 코인 자동 검색 및 전송
@@ -192,25 +242,32 @@ class YonaService:
             active_symbols = [s for s in symbols if s not in self._blacklist]
             self.logger.debug(f"활성 심볼: {len(active_symbols)}개 (전체: {len(symbols)}개, 블랙리스트: {len(self._blacklist)}개)")
             
-            # 바이낸스에서 24시간 티커 데이터 조회
-            ticker_data = self.binance_client.get_24hr_ticker()
-            
-            if isinstance(ticker_data, dict) and "error" in ticker_data:
-                self.logger.warning(f"24시간 티커 조회 실패: {ticker_data.get('error')}")
-                return
-            
-            if not isinstance(ticker_data, list):
-                self.logger.warning(f"24시간 티커 데이터 형식 오류: {type(ticker_data)}")
-                return
-            
-            # 티커 데이터를 딕셔너리로 변환 (빠른 조회)
-            ticker_dict = {t.get("symbol"): t for t in ticker_data if t.get("symbol")}
+            streamed = self._ticker_ranking.is_fresh()
+            if streamed:
+                # 스트림 랭킹: 이미 상승률 순으로 정렬된 티커 (REST 호출/재정렬 없음)
+                ordered_tickers = self._ticker_ranking.ranked()
+            else:
+                # 바이낸스에서 24시간 티커 데이터 조회 (콜드 스타트/스트림 끊김 폴백)
+                ticker_data = await self._binance("get_24hr_ticker")
+                
+                if isinstance(ticker_data, dict) and "error" in ticker_data:
+                    self.logger.warning(f"24시간 티커 조회 실패: {ticker_data.get('error')}")
+                    return
+                
+                if not isinstance(ticker_data, list):
+                    self.logger.warning(f"24시간 티커 데이터 형식 오류: {type(ticker_data)}")
+                    return
+                
+                # 스트림 증분 반영의 기준 데이터로 사용
+                self._ticker_ranking.load(ticker_data)
+                ordered_tickers = ticker_data
             
             # 활성 심볼에 대해서만 랭킹 데이터 생성
+            active_set = set(active_symbols)
             ranking_items = []
-            for symbol in active_symbols:
-                ticker = ticker_dict.get(symbol)
-                if not ticker:
+            for ticker in ordered_tickers:
+                symbol = ticker.get("symbol")
+                if symbol not in active_set:
                     continue
                 
                 try:
@@ -269,8 +326,10 @@ class YonaService:
                     item["energy_type"] = "데이터 분석 중"
             
             # 정렬: 상승률 내림차순, 동률 시 심볼명 오름차순 (Binance Live vs1 방식)
+            # 스트림 랭킹은 같은 키로 이미 정렬되어 있음 (시간고정 시에는 표시 상승률이 달라 재정렬)
             try:
-                ranking_items.sort(key=lambda x: (-float(x.get("change_percent", 0.0)), str(x.get("symbol", ""))))
+                if not streamed or self._fixed_time:
+                    ranking_items.sort(key=lambda x: (-float(x.get("change_percent", 0.0)), str(x.get("symbol", ""))))
             except Exception as e:
                 self.logger.warning(f"랭킹 정렬 실패: {e}")
                 ranking_items.sort(key=lambda x: x.get("change_percent", 0.0), reverse=True)
@@ -281,7 +340,9 @@ class YonaService:
                 "data": ranking_items
             })
             
-            self.logger.info(f"랭킹 데이터 업데이트 완료: {len(ranking_items)}개 심볼 (블랙리스트 제외)")
+            # 스트림 푸시는 1초 주기이므로 debug 레벨
+            log = self.logger.debug if streamed else self.logger.info
+            log(f"랭킹 데이터 업데이트 완료: {len(ranking_items)}개 심볼 (블랙리스트 제외)")
             
         except Exception as e:
             self.logger.error(f"랭킹 데이터 업데이트 중 오류 발생: {e}", exc_info=True)
@@ -381,7 +442,7 @@ class YonaService:
     
     async def _cache_fixed_prices(self) -> None:
         """시간고정 시 사용할 상승률 캐시 (폴백)"""
-        ticker_data = self.binance_client.get_24hr_ticker()
+        ticker_data = await self._binance("get_24hr_ticker")
         
         if isinstance(ticker_data, list):
             self._fixed_change_percent_cache.clear()
@@ -394,84 +455,38 @@ class YonaService:
                     except Exception:
                         self._fixed_change_percent_cache[symbol] = 0.0
     
+    def _on_exchange_info_diff(self, diff: Dict[str, Any]) -> None:
+        """exchangeInfo diff 수신 (갱신 스레드에서 호출): 거래 가능 심볼 목록 재계산 예약"""
+        self._cached_symbols = None
+    
     async def _load_symbol_onboard_dates(self):
         """바이낸스 exchangeInfo에서 심볼 상장일 정보를 로드합니다. (레거시 메서드 - 호환성 유지)"""
         try:
-            # exchangeInfo API 호출
-            response = self.binance_client._send_public_request(
-                "GET", 
-                "/fapi/v1/exchangeInfo",
-                weight_category="general",
-                weight=1
-            )
-            
-            if isinstance(response, dict) and "error" in response:
-                self.logger.warning(f"exchangeInfo 조회 실패: {response.get('error')}")
-                return
-            
-            symbols_data = response.get("symbols", [])
-            
-            # 각 심볼의 onboardDate 저장
-            count = 0
-            for symbol_info in symbols_data:
-                symbol = symbol_info.get("symbol", "")
-                onboard_date = symbol_info.get("onboardDate", 0)
-                
-                # USDT 선물이고 onboardDate가 있는 경우만 저장
-                if symbol.endswith("USDT") and onboard_date > 0:
-                    self._symbol_onboard_dates[symbol] = onboard_date
-                    count += 1
-            
-            self.logger.info(f"심볼 상장일 정보 로드 완료: {count}개 심볼")
+            info = await self._binance("ensure_exchange_info")
+            onboard_dates = {
+                symbol: date for symbol, date in info.onboard_dates().items() if symbol.endswith("USDT")
+            }
+            self._symbol_onboard_dates.update(onboard_dates)
+            self.logger.info(f"심볼 상장일 정보 로드 완료: {len(onboard_dates)}개 심볼")
             
         except Exception as e:
             self.logger.error(f"심볼 상장일 정보 로드 실패: {e}", exc_info=True)
     
     async def _ensure_trading_symbols(self) -> List[str]:
         """TRADING 또는 SETTLING 상태인 USDT 무기한 선물 심볼 목록 확보 (Binance Live vs1 방식)"""
-        if hasattr(self, '_cached_symbols') and self._cached_symbols:
+        if self._cached_symbols:
             return self._cached_symbols
         
         try:
-            # exchangeInfo API 호출
-            response = self.binance_client._send_public_request(
-                "GET",
-                "/fapi/v1/exchangeInfo",
-                weight_category="general",
-                weight=1
-            )
-            
-            if isinstance(response, dict) and "error" in response:
-                self.logger.warning(f"exchangeInfo 조회 실패: {response.get('error')}")
+            info = await self._binance("ensure_exchange_info")
+            if not len(info):
+                self.logger.warning("exchangeInfo 조회 실패: 심볼 인덱스가 비어 있습니다.")
                 return []
             
-            symbols_data = response.get("symbols", [])
-            symbols = []
-            
-            # onboardDate도 함께 저장
-            self._symbol_onboard_dates = {}
-            
-            for symbol_info in symbols_data:
-                quote_asset = symbol_info.get("quoteAsset", "")
-                contract_type = symbol_info.get("contractType", "")
-                status = symbol_info.get("status", "")
-                symbol = symbol_info.get("symbol", "")
-                
-                # USDT 무기한 선물이면서 TRADING 또는 SETTLING 상태인 심볼만 포함
-                if (
-                    quote_asset == "USDT"
-                    and contract_type == "PERPETUAL"
-                    and status in ["TRADING", "SETTLING"]
-                ):
-                    symbols.append(symbol)
-                    
-                    # 상장일 정보 저장
-                    onboard_date = symbol_info.get("onboardDate", 0)
-                    if onboard_date > 0:
-                        self._symbol_onboard_dates[symbol] = onboard_date
-            
-            # 심볼 목록 정렬 및 캐싱
-            symbols.sort()
+            # USDT 무기한 선물이면서 TRADING 또는 SETTLING 상태인 심볼만 포함 (정렬됨)
+            symbols = info.symbols(statuses=("TRADING", "SETTLING"))
+            # 상장일 정보도 함께 저장
+            self._symbol_onboard_dates = info.onboard_dates(symbols)
             self._cached_symbols = symbols
             
             self.logger.info(f"거래 가능 심볼 로드 완료: {len(symbols)}개 (TRADING/SETTLING)")
@@ -674,13 +689,10 @@ class YonaService:
                             # 2) 포지션 크기 검증 (내부 vs 실제)
                             internal_qty = pos.get("quantity", 0.0)
                             try:
-                                positions = self.binance_client.get_all_positions()
-                                if "error" not in positions:
-                                    actual_qty = 0.0
-                                    for p in positions:
-                                        if p.get("symbol") == symbol and float(p.get("positionAmt", 0)) != 0:
-                                            actual_qty = abs(float(p.get("positionAmt")))
-                                            break
+                                # User Data Stream 연결 중이면 메모리 조회 (positionRisk 호출 없음)
+                                actual = await self._binance("get_open_position", symbol)
+                                if not (actual and "error" in actual):
+                                    actual_qty = abs(float(actual.get("positionAmt", 0))) if actual else 0.0
                                     
                                     if abs(actual_qty - internal_qty) > 0.001:
                                         self.logger.warning(
@@ -692,7 +704,7 @@ class YonaService:
                             
                             # 3) 미체결 주문 취소 (재진입 방지)
                             try:
-                                cancel_result = self.binance_client.cancel_all_open_orders(symbol)
+                                cancel_result = await self._binance("cancel_all_open_orders", symbol)
                                 if "error" in cancel_result:
                                     # -2011 (주문 없음) 등은 정상 상황
                                     self.logger.debug(
@@ -707,7 +719,7 @@ class YonaService:
                             max_retries = 2
                             binance_result = None
                             for attempt in range(max_retries):
-                                binance_result = self.binance_client.close_position_market(symbol)
+                                binance_result = await self._binance("close_position_market", symbol)
                                 if "error" not in binance_result:
                                     break
                                 if attempt < max_retries - 1:
@@ -725,7 +737,7 @@ class YonaService:
                                 try:
                                     exit_price = float(binance_result.get("avgPrice") or 0) or 0.0
                                     if exit_price == 0:
-                                        mp = self.binance_client.get_mark_price(symbol)
+                                        mp = await self._binance("get_mark_price", symbol)
                                         exit_price = float(mp.get("markPrice", 0)) if isinstance(mp, dict) else 0.0
                                 except Exception:
                                     pass
@@ -805,6 +817,14 @@ class YonaService:
                 await self._main_task
             except asyncio.CancelledError:
                 self.logger.info("메인 루프가 성공적으로 취소되었습니다.")
+        if self._ranking_task:
+            self._ranking_task.cancel()
+            await asyncio.gather(self._ranking_task, return_exceptions=True)
+        self.binance_client.exchange_info.stop()
+        await self._mark_price_stream.stop()
+        await self._ticker_stream.stop()
+        await self._user_data_stream.stop()
+        await self.binance_client.aclose()
         self.logger.info("YonaService 리소스 정리 완료.")
     
     # ============================================
@@ -1409,25 +1429,13 @@ class YonaService:
     async def _compute_settling_update(self) -> List[Dict[str, Any]]:
         """SETTLING 상태 코인 목록 자동 검색 및 생성"""
         try:
-            # exchangeInfo에서 SETTLING 상태 코인 목록 가져오기
-            self.logger.info("SETTLING 코인 검색 시작: exchangeInfo 조회 중...")
-            exchange_info = self.binance_client.get_exchange_info()
-            
-            if isinstance(exchange_info, dict) and "error" in exchange_info:
-                self.logger.warning(f"exchangeInfo 조회 실패: {exchange_info.get('error')}")
+            # exchangeInfo 인덱스에서 SETTLING 상태 코인 목록 가져오기 (TTL 내에는 재요청 없음)
+            exchange_info = await self._binance("ensure_exchange_info")
+            if not len(exchange_info):
+                self.logger.warning("exchangeInfo 조회 실패: 심볼 인덱스가 비어 있습니다.")
                 return []
             
-            total_symbols = len(exchange_info.get("symbols", []))
-            self.logger.info(f"총 {total_symbols}개 심볼 조회 완료, SETTLING 상태 필터링 중...")
-            
-            settling_symbols = []
-            for s in exchange_info.get("symbols", []):
-                if (
-                    s.get("quoteAsset") == "USDT"
-                    and s.get("contractType") == "PERPETUAL"
-                    and s.get("status") == "SETTLING"
-                ):
-                    settling_symbols.append(s["symbol"])
+            settling_symbols = exchange_info.symbols(statuses=("SETTLING",))
             
             self.logger.info(f"SETTLING 상태 코인 {len(settling_symbols)}개 발견: {settling_symbols}")
             
@@ -1436,7 +1444,7 @@ class YonaService:
                 return []
             
             # 이미 수집된 24hr ticker 데이터 재활용
-            ticker_data = self.binance_client.get_24hr_ticker()
+            ticker_data = await self._binance("get_24hr_ticker")
             
             if not isinstance(ticker_data, list):
                 self.logger.warning("24hr ticker 데이터 조회 실패")
@@ -1481,9 +1489,11 @@ class YonaService:
         import math
         try:
             # === STEP 1: 다중 시간대 데이터 수집 ===
-            kl_1m = self.binance_client.get_klines(symbol=symbol, interval='1m', limit=120)
-            kl_5m = self.binance_client.get_klines(symbol=symbol, interval='5m', limit=50)
-            kl_15m = self.binance_client.get_klines(symbol=symbol, interval='15m', limit=30)
+            kl_1m, kl_5m, kl_15m = await asyncio.gather(
+                self._binance("get_klines", symbol=symbol, interval='1m', limit=120),
+                self._binance("get_klines", symbol=symbol, interval='5m', limit=50),
+                self._binance("get_klines", symbol=symbol, interval='15m', limit=30),
+            )
             
             if not kl_1m or len(kl_1m) < 50:
                 return self._get_fallback_analysis(symbol)
@@ -0,0 +1,6 @@
+# simulator 패키지 초기화 파일 - 오프라인 부하/지연 테스트용 로컬 Binance 선물 시뮬레이터
+from backend.simulator.app import SimulatorConfig, create_app
+from backend.simulator.exchange import SimExchange
+from backend.simulator.market import ReplayMarket
+
+__all__ = ["SimulatorConfig", "create_app", "SimExchange", "ReplayMarket"]
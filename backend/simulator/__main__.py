@@ -0,0 +1,36 @@
+"""시뮬레이터 실행: python -m backend.simulator --port 9100 --speed 60"""
+import argparse
+
+import uvicorn
+
+from backend.simulator.app import SimulatorConfig, create_app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 Binance 선물 시뮬레이터 (data/*.csv 리플레이)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--data-dir", default="data")
+    parser.add_argument("--symbols", nargs="*", default=None)
+    parser.add_argument("--speed", type=float, default=60.0, help="실제 1초당 가상 경과 초")
+    parser.add_argument("--warmup-bars", type=int, default=500)
+    parser.add_argument("--balance", type=float, default=10000.0)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="429 주입 확률")
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--timestamp-error-rate", type=float, default=0.0, help="-1021 주입 확률")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    config = SimulatorConfig(
+        data_dir=args.data_dir, symbols=args.symbols, speed=args.speed, warmup_bars=args.warmup_bars,
+        initial_balance=args.balance, latency_ms=args.latency_ms, latency_jitter_ms=args.jitter_ms,
+        rate_limit_error_rate=args.rate_limit_rate, retry_after_sec=args.retry_after,
+        timestamp_error_rate=args.timestamp_error_rate, seed=args.seed,
+    )
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
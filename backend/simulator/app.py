@@ -0,0 +1,344 @@
+"""
+로컬 Binance 선물 시뮬레이터 (FastAPI REST + WebSocket)
+
+BinanceClient/AsyncBinanceClient와 스트림 클라이언트가 사용하는 엔드포인트만 구현한다.
+
+실행:
+    python -m backend.simulator --port 9100 --speed 60 --latency-ms 20 --rate-limit-rate 0.01
+
+엔진 연결 (.env 또는 환경변수):
+    BINANCE_BASE_URL=http://127.0.0.1:9100
+    BINANCE_WS_BASE_URL_PUBLIC=ws://127.0.0.1:9100/ws
+    BINANCE_WS_BASE_URL_USER=ws://127.0.0.1:9100/ws
+"""
+import asyncio
+import json
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Tuple
+
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse
+
+from backend.simulator.exchange import SimExchange
+from backend.simulator.market import INTERVAL_MS, ReplayMarket
+from backend.utils.logger import setup_logger
+
+logger = setup_logger()
+
+MARK_PRICE_STREAM = "!markPrice@arr@1s"
+TICKER_STREAM = "!ticker@arr"
+
+# 서명 요청 경로 (timestamp/signature 필수)
+SIGNED_PATHS = {
+    "/fapi/v1/order", "/fapi/v1/allOpenOrders", "/fapi/v2/positionRisk", "/fapi/v2/account",
+    "/fapi/v1/leverage", "/fapi/v1/marginType",
+}
+
+
+@dataclass
+class SimulatorConfig:
+    """시뮬레이터 설정 (오류 주입 비율은 /fapi 요청당 확률)"""
+    data_dir: str = "data"
+    symbols: Optional[List[str]] = None
+    speed: float = 60.0                # 실제 1초당 가상 경과 초
+    warmup_bars: int = 500             # 시작 시 이미 지나간 것으로 보는 봉 수 (지표 워밍업용 과거 데이터)
+    initial_balance: float = 10000.0
+    latency_ms: float = 0.0            # REST 응답 지연
+    latency_jitter_ms: float = 0.0     # 지연에 더해지는 균등 분포 [0, jitter]
+    rate_limit_error_rate: float = 0.0  # 429 응답 확률
+    retry_after_sec: int = 1           # 429 응답의 Retry-After
+    timestamp_error_rate: float = 0.0   # -1021 응답 확률 (서명 요청만)
+    stream_interval_sec: float = 1.0    # 스트림 푸시 주기 (실제 시간)
+    seed: Optional[int] = None
+    stats: Dict[str, int] = field(default_factory=lambda: {
+        "requests": 0, "injected_429": 0, "injected_1021": 0, "orders": 0})
+
+
+def _error(status: int, code: int, msg: str, headers: Optional[Dict[str, str]] = None) -> JSONResponse:
+    return JSONResponse({"code": code, "msg": msg}, status_code=status, headers=headers)
+
+
+class _FaultInjector:
+    """지연/429/-1021 주입 및 1분 가중치 헤더 계산"""
+
+    def __init__(self, config: SimulatorConfig):
+        self.config = config
+        self._rng = random.Random(config.seed)
+        self._weights: Deque[Tuple[float, int]] = deque()
+
+    def used_weight(self, weight: int = 1) -> int:
+        now = time.monotonic()
+        self._weights.append((now, weight))
+        while self._weights and now - self._weights[0][0] > 60.0:
+            self._weights.popleft()
+        return sum(w for _, w in self._weights)
+
+    async def delay(self) -> None:
+        cfg = self.config
+        seconds = (cfg.latency_ms + self._rng.uniform(0.0, cfg.latency_jitter_ms)) / 1000.0
+        if seconds > 0:
+            await asyncio.sleep(seconds)
+
+    def inject(self, signed: bool) -> Optional[JSONResponse]:
+        cfg = self.config
+        if cfg.rate_limit_error_rate and self._rng.random() < cfg.rate_limit_error_rate:
+            cfg.stats["injected_429"] += 1
+            return _error(429, -1003, "Too many requests; (injected by simulator)",
+                          {"Retry-After": str(cfg.retry_after_sec)})
+        if signed and cfg.timestamp_error_rate and self._rng.random() < cfg.timestamp_error_rate:
+            cfg.stats["injected_1021"] += 1
+            return _error(400, -1021, "Timestamp for this request is outside of the recvWindow.")
+        return None
+
+
+def _check_timestamp(params: Dict[str, str]) -> Optional[JSONResponse]:
+    """서명 요청의 timestamp/recvWindow 검증 (서명 자체는 검증하지 않음)"""
+    if "timestamp" not in params or "signature" not in params:
+        return _error(400, -1102, "Mandatory parameter 'timestamp' or 'signature' was not sent.")
+    try:
+        ts = int(params["timestamp"])
+        recv_window = int(params.get("recvWindow", 5000))
+    except ValueError:
+        return _error(400, -1100, "Illegal characters found in parameter 'timestamp'.")
+    server = int(time.time() * 1000)
+    if ts > server + 1000 or server - ts > recv_window:
+        return _error(400, -1021, "Timestamp for this request is outside of the recvWindow.")
+    return None
+
+
+def create_app(config: Optional[SimulatorConfig] = None, market: Optional[ReplayMarket] = None) -> FastAPI:
+    """시뮬레이터 FastAPI 앱 생성 (market을 주면 가상 시계를 테스트에서 제어 가능)"""
+    config = config or SimulatorConfig()
+    market = market or ReplayMarket(config.data_dir, speed=config.speed, warmup_bars=config.warmup_bars,
+                                    symbols=config.symbols)
+    exchange = SimExchange(market, initial_balance=config.initial_balance)
+    faults = _FaultInjector(config)
+
+    app = FastAPI(title="YONA Binance Futures Simulator")
+    app.state.config = config
+    app.state.market = market
+    app.state.exchange = exchange
+
+    @app.middleware("http")
+    async def inject_faults(request: Request, call_next):
+        path = request.url.path
+        if not path.startswith("/fapi"):
+            return await call_next(request)
+        config.stats["requests"] += 1
+        await faults.delay()
+        signed = path in SIGNED_PATHS
+        response = faults.inject(signed)
+        if response is None and signed:
+            response = _check_timestamp(dict(request.query_params))
+        if response is None:
+            response = await call_next(request)
+        response.headers["X-MBX-USED-WEIGHT-1M"] = str(faults.used_weight())
+        return response
+
+    def _symbol_or_error(symbol: Optional[str]) -> Optional[JSONResponse]:
+        if symbol is None or symbol not in market.symbols:
+            return _error(400, -1121, "Invalid symbol.")
+        return None
+
+    # ------------------------------------------------------------------
+    # 퍼블릭 REST
+    # ------------------------------------------------------------------
+    @app.get("/fapi/v1/time")
+    async def server_time():
+        return {"serverTime": int(time.time() * 1000)}
+
+    @app.get("/fapi/v1/exchangeInfo")
+    async def exchange_info():
+        return market.exchange_info()
+
+    @app.get("/fapi/v1/klines")
+    async def klines(symbol: str, interval: str, limit: int = 500, startTime: Optional[int] = None,
+                     endTime: Optional[int] = None):
+        error = _symbol_or_error(symbol)
+        if error is not None:
+            return error
+        if interval not in INTERVAL_MS:
+            return _error(400, -1120, "Invalid interval.")
+        try:
+            return market.klines(symbol, interval, min(max(limit, 1), 1500), startTime, endTime)
+        except KeyError:
+            return _error(400, -1120, "Invalid interval.")
+
+    @app.get("/fapi/v1/ticker/24hr")
+    async def ticker_24hr(symbol: Optional[str] = None):
+        if symbol is None:
+            return [market.ticker_24hr(s) for s in market.symbols]
+        return _symbol_or_error(symbol) or market.ticker_24hr(symbol)
+
+    @app.get("/fapi/v1/ticker/price")
+    async def ticker_price(symbol: Optional[str] = None):
+        def row(s):
+            return {"symbol": s, "price": f"{market.price(s):.8g}", "time": market.now_ms()}
+        if symbol is None:
+            return [row(s) for s in market.symbols]
+        return _symbol_or_error(symbol) or row(symbol)
+
+    @app.get("/fapi/v1/premiumIndex")
+    async def premium_index(symbol: Optional[str] = None):
+        if symbol is None:
+            return [market.premium_index(s) for s in market.symbols]
+        return _symbol_or_error(symbol) or market.premium_index(symbol)
+
+    # ------------------------------------------------------------------
+    # 서명 REST (파라미터는 쿼리스트링으로 전달됨)
+    # ------------------------------------------------------------------
+    @app.post("/fapi/v1/order")
+    async def new_order(request: Request):
+        params = request.query_params
+        symbol = params.get("symbol")
+        error = _symbol_or_error(symbol)
+        if error is not None:
+            return error
+        if params.get("type", "MARKET") != "MARKET":
+            return _error(400, -4000, "Only MARKET orders are supported by the simulator.")
+        side = params.get("side")
+        if side not in ("BUY", "SELL"):
+            return _error(400, -1117, "Invalid side.")
+        try:
+            quantity = float(params.get("quantity", "0"))
+        except ValueError:
+            return _error(400, -1100, "Illegal characters found in parameter 'quantity'.")
+        if quantity <= 0:
+            return _error(400, -4003, "Quantity less than or equal to zero.")
+        reduce_only = params.get("reduceOnly", "false").lower() == "true"
+        try:
+            order = exchange.place_market_order(symbol, side, quantity, reduce_only=reduce_only)
+        except ValueError as e:
+            return _error(400, -2022, str(e))
+        config.stats["orders"] += 1
+        return order
+
+    @app.delete("/fapi/v1/allOpenOrders")
+    async def cancel_all(symbol: str):
+        return _symbol_or_error(symbol) or exchange.cancel_all_open_orders(symbol)
+
+    @app.get("/fapi/v2/positionRisk")
+    async def position_risk(symbol: Optional[str] = None):
+        return exchange.position_risk(symbol)
+
+    @app.get("/fapi/v2/account")
+    async def account():
+        return exchange.account()
+
+    @app.post("/fapi/v1/leverage")
+    async def leverage(symbol: str, leverage: int):
+        error = _symbol_or_error(symbol)
+        if error is not None:
+            return error
+        if not 1 <= leverage <= 125:
+            return _error(400, -4028, "Leverage is not valid.")
+        return exchange.set_leverage(symbol, leverage)
+
+    @app.post("/fapi/v1/marginType")
+    async def margin_type(symbol: str, marginType: str):
+        error = _symbol_or_error(symbol)
+        if error is not None:
+            return error
+        result = exchange.set_margin_type(symbol, marginType)
+        return result if result is not None else _error(400, -4046, "No need to change margin type.")
+
+    # ------------------------------------------------------------------
+    # listenKey
+    # ------------------------------------------------------------------
+    @app.post("/fapi/v1/listenKey")
+    async def create_listen_key():
+        return {"listenKey": exchange.create_listen_key()}
+
+    @app.put("/fapi/v1/listenKey")
+    async def keepalive_listen_key(listenKey: str):
+        if not exchange.has_listen_key(listenKey):
+            return _error(400, -1125, "This listenKey does not exist.")
+        return {"listenKey": listenKey}
+
+    @app.delete("/fapi/v1/listenKey")
+    async def close_listen_key(listenKey: str):
+        exchange.close_listen_key(listenKey)
+        return {}
+
+    # ------------------------------------------------------------------
+    # WebSocket
+    # ------------------------------------------------------------------
+    @app.websocket("/ws")
+    async def kline_streams(ws: WebSocket):
+        """SUBSCRIBE/UNSUBSCRIBE 방식 kline 스트림 (봉 마감 시 x=true 이벤트를 한 번 보냄)"""
+        await ws.accept()
+        streams: Dict[str, Tuple[str, str]] = {}
+        last_open: Dict[str, int] = {}
+
+        async def receive():
+            while True:
+                message = json.loads(await ws.receive_text())
+                method = message.get("method")
+                for name in message.get("params", []):
+                    symbol, _, kind = name.partition("@kline_")
+                    if method == "SUBSCRIBE" and kind in INTERVAL_MS and symbol.upper() in market.symbols:
+                        streams[name] = (symbol.upper(), kind)
+                    elif method == "UNSUBSCRIBE":
+                        streams.pop(name, None)
+                        last_open.pop(name, None)
+                await ws.send_text(json.dumps({"result": None, "id": message.get("id")}))
+
+        receiver = asyncio.create_task(receive())
+        try:
+            while not receiver.done():
+                for name, (symbol, interval) in list(streams.items()):
+                    event = market.kline_event(symbol, interval)
+                    if event is None:
+                        continue
+                    previous = last_open.get(name)
+                    if previous is not None and previous != event["k"]["t"]:
+                        closed = market.kline_event(symbol, interval, previous)
+                        if closed is not None and closed["k"]["x"]:
+                            await ws.send_text(json.dumps(closed))
+                    last_open[name] = event["k"]["t"]
+                    await ws.send_text(json.dumps(event))
+                await asyncio.wait({receiver}, timeout=config.stream_interval_sec)
+        except (WebSocketDisconnect, RuntimeError):
+            pass
+        finally:
+            receiver.cancel()
+
+    @app.websocket("/ws/{name}")
+    async def named_stream(ws: WebSocket, name: str):
+        """!markPrice@arr@1s / !ticker@arr 배열 스트림 또는 listenKey User Data Stream"""
+        if name in (MARK_PRICE_STREAM, TICKER_STREAM):
+            await ws.accept()
+            build = market.mark_price_event if name == MARK_PRICE_STREAM else market.ticker_event
+            try:
+                while True:
+                    await ws.send_text(json.dumps([build(s) for s in market.symbols]))
+                    await asyncio.sleep(config.stream_interval_sec)
+            except (WebSocketDisconnect, RuntimeError):
+                return
+
+        queue = exchange.subscribe(name)
+        if queue is None:
+            await ws.close(code=1008)
+            return
+        await ws.accept()
+        try:
+            while True:
+                event = await queue.get()
+                await ws.send_text(json.dumps(event))
+                if event.get("e") == "listenKeyExpired":
+                    await ws.close()
+                    return
+        except (WebSocketDisconnect, RuntimeError):
+            pass
+        finally:
+            exchange.unsubscribe(name, queue)
+
+    @app.get("/sim/status")
+    async def status():
+        return {"virtualTime": market.now_ms(), "speed": market.speed, "symbols": market.symbols,
+                "stats": dict(config.stats)}
+
+    return app
@@ -0,0 +1,196 @@
+"""가상 선물 계좌 - 시장가 체결, 포지션/잔고 관리, User Data Stream 이벤트 발행"""
+import asyncio
+import secrets
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.simulator.market import ReplayMarket
+from backend.utils.logger import setup_logger
+
+logger = setup_logger()
+
+_Subscriber = Tuple[asyncio.AbstractEventLoop, asyncio.Queue]
+
+
+class SimExchange:
+    """
+    리플레이 시장 위의 단일 계좌 (one-way 모드, USDT 증거금)
+
+    - MARKET 주문은 현재 리플레이 가격에 즉시 전량 체결 (수수료 taker_fee)
+    - 체결마다 ORDER_TRADE_UPDATE/ACCOUNT_UPDATE를 listenKey 구독자에게 발행
+    - 구독자는 서로 다른 이벤트 루프에 있을 수 있으므로 call_soon_threadsafe로 전달
+    """
+
+    def __init__(self, market: ReplayMarket, initial_balance: float = 10000.0, taker_fee: float = 0.0004):
+        self.market = market
+        self.taker_fee = taker_fee
+        self._lock = threading.Lock()
+        self._balance = float(initial_balance)
+        self._positions: Dict[str, Dict[str, Any]] = {}  # symbol -> {amt, entry, leverage, isolated, time}
+        self._order_id = 0
+        self._listen_keys: Dict[str, List[_Subscriber]] = {}
+
+    # ------------------------------------------------------------------
+    # 설정
+    # ------------------------------------------------------------------
+    def _position(self, symbol: str) -> Dict[str, Any]:
+        pos = self._positions.get(symbol)
+        if pos is None:
+            pos = self._positions[symbol] = {"amt": 0.0, "entry": 0.0, "leverage": 20, "isolated": False,
+                                             "time": 0}
+        return pos
+
+    def set_leverage(self, symbol: str, leverage: int) -> Dict[str, Any]:
+        with self._lock:
+            self._position(symbol)["leverage"] = int(leverage)
+        return {"symbol": symbol, "leverage": int(leverage), "maxNotionalValue": "1000000"}
+
+    def set_margin_type(self, symbol: str, margin_type: str) -> Optional[Dict[str, Any]]:
+        """변경 없으면 None (Binance는 -4046 오류로 응답)"""
+        isolated = margin_type.upper() == "ISOLATED"
+        with self._lock:
+            pos = self._position(symbol)
+            if pos["isolated"] == isolated:
+                return None
+            pos["isolated"] = isolated
+        return {"code": 200, "msg": "success"}
+
+    # ------------------------------------------------------------------
+    # 주문
+    # ------------------------------------------------------------------
+    def place_market_order(self, symbol: str, side: str, quantity: float, reduce_only: bool = False) -> Dict[str, Any]:
+        price = self.market.price(symbol)
+        now = self.market.now_ms()
+        sign = 1.0 if side == "BUY" else -1.0
+        with self._lock:
+            pos = self._position(symbol)
+            amt = pos["amt"]
+            if reduce_only:
+                if amt == 0 or amt * sign > 0:
+                    raise ValueError("ReduceOnly Order is rejected.")
+                quantity = min(quantity, abs(amt))
+            delta = sign * quantity
+            realized = 0.0
+            if amt != 0 and amt * delta < 0:
+                closed = min(abs(delta), abs(amt))
+                realized = closed * (price - pos["entry"]) * (1.0 if amt > 0 else -1.0)
+            new_amt = amt + delta
+            if abs(new_amt) < 1e-12:
+                new_amt, entry = 0.0, 0.0
+            elif amt == 0 or amt * new_amt < 0:
+                entry = price
+            elif abs(new_amt) > abs(amt):
+                entry = (pos["entry"] * abs(amt) + price * quantity) / abs(new_amt)
+            else:
+                entry = pos["entry"]
+            commission = quantity * price * self.taker_fee
+            self._balance += realized - commission
+            pos.update(amt=new_amt, entry=entry, time=now)
+            self._order_id += 1
+            order_id = self._order_id
+            balance = self._balance
+            isolated = pos["isolated"]
+
+        order = {
+            "orderId": order_id, "symbol": symbol, "status": "FILLED", "clientOrderId": f"sim-{order_id}",
+            "price": "0", "avgPrice": f"{price:.8g}", "origQty": f"{quantity:.8g}",
+            "executedQty": f"{quantity:.8g}", "cumQuote": f"{quantity * price:.8g}", "timeInForce": "GTC",
+            "type": "MARKET", "reduceOnly": reduce_only, "side": side, "positionSide": "BOTH",
+            "updateTime": now,
+        }
+        self._publish({
+            "e": "ORDER_TRADE_UPDATE", "E": now, "T": now,
+            "o": {"s": symbol, "c": order["clientOrderId"], "S": side, "o": "MARKET", "q": order["origQty"],
+                  "ap": order["avgPrice"], "x": "TRADE", "X": "FILLED", "i": order_id, "l": order["executedQty"],
+                  "z": order["executedQty"], "L": order["avgPrice"], "n": f"{commission:.8g}", "N": "USDT",
+                  "T": now, "R": reduce_only, "ps": "BOTH", "rp": f"{realized:.8g}"},
+        })
+        self._publish({
+            "e": "ACCOUNT_UPDATE", "E": now, "T": now,
+            "a": {"m": "ORDER",
+                  "B": [{"a": "USDT", "wb": f"{balance:.8g}", "cw": f"{balance:.8g}"}],
+                  "P": [{"s": symbol, "pa": f"{new_amt:.8g}", "ep": f"{entry:.8g}", "up": "0",
+                         "mt": "isolated" if isolated else "cross", "ps": "BOTH"}]},
+        })
+        return order
+
+    def cancel_all_open_orders(self, symbol: str) -> Dict[str, Any]:
+        # 시장가 즉시 체결만 지원하므로 미체결 주문은 없다
+        return {"code": 200, "msg": "The operation of cancel all open order is done."}
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def position_risk(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+        with self._lock:
+            items = [(s, dict(p)) for s, p in self._positions.items() if symbol in (None, s)]
+        result = []
+        for s, p in items:
+            mark = self.market.price(s)
+            result.append({
+                "symbol": s, "positionAmt": f"{p['amt']:.8g}", "entryPrice": f"{p['entry']:.8g}",
+                "markPrice": f"{mark:.8g}", "unRealizedProfit": f"{(mark - p['entry']) * p['amt']:.8g}",
+                "leverage": str(p["leverage"]), "marginType": "isolated" if p["isolated"] else "cross",
+                "isolated": p["isolated"], "positionSide": "BOTH", "updateTime": p["time"],
+            })
+        return result
+
+    def account(self) -> Dict[str, Any]:
+        positions = self.position_risk()
+        unrealized = sum(float(p["unRealizedProfit"]) for p in positions)
+        with self._lock:
+            balance = self._balance
+        now = self.market.now_ms()
+        return {
+            "totalWalletBalance": f"{balance:.8g}", "totalUnrealizedProfit": f"{unrealized:.8g}",
+            "totalMarginBalance": f"{balance + unrealized:.8g}", "availableBalance": f"{balance:.8g}",
+            "assets": [{"asset": "USDT", "walletBalance": f"{balance:.8g}", "crossWalletBalance": f"{balance:.8g}",
+                        "unrealizedProfit": f"{unrealized:.8g}", "updateTime": now}],
+            "positions": [{"symbol": p["symbol"], "positionAmt": p["positionAmt"], "entryPrice": p["entryPrice"],
+                           "unrealizedProfit": p["unRealizedProfit"], "isolated": p["isolated"],
+                           "leverage": p["leverage"], "positionSide": "BOTH", "updateTime": p["updateTime"]}
+                          for p in positions],
+        }
+
+    # ------------------------------------------------------------------
+    # User Data Stream
+    # ------------------------------------------------------------------
+    def create_listen_key(self) -> str:
+        key = secrets.token_hex(16)
+        with self._lock:
+            self._listen_keys[key] = []
+        return key
+
+    def has_listen_key(self, key: str) -> bool:
+        return key in self._listen_keys
+
+    def close_listen_key(self, key: str) -> None:
+        """키 삭제 - 연결된 구독자에게 listenKeyExpired 전달"""
+        self._publish({"e": "listenKeyExpired", "E": int(time.time() * 1000)}, key)
+        with self._lock:
+            self._listen_keys.pop(key, None)
+
+    def subscribe(self, key: str) -> Optional[asyncio.Queue]:
+        queue: asyncio.Queue = asyncio.Queue()
+        with self._lock:
+            subscribers = self._listen_keys.get(key)
+            if subscribers is None:
+                return None
+            subscribers.append((asyncio.get_running_loop(), queue))
+        return queue
+
+    def unsubscribe(self, key: str, queue: asyncio.Queue) -> None:
+        with self._lock:
+            subscribers = self._listen_keys.get(key, [])
+            subscribers[:] = [s for s in subscribers if s[1] is not queue]
+
+    def _publish(self, event: Dict[str, Any], key: Optional[str] = None) -> None:
+        with self._lock:
+            targets = [s for k, subs in self._listen_keys.items() if key in (None, k) for s in subs]
+        for loop, queue in targets:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, event)
+            except RuntimeError:
+                # 구독자 루프가 이미 종료됨
+                pass
@@ -0,0 +1,289 @@
+"""CSV 캔들 리플레이 시장 - 가상 시계 기준으로 klines/ticker/mark price 생성"""
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from backend.utils.logger import setup_logger
+
+logger = setup_logger()
+
+INTERVAL_MS = {
+    "1m": 60_000, "3m": 180_000, "5m": 300_000, "15m": 900_000, "30m": 1_800_000,
+    "1h": 3_600_000, "2h": 7_200_000, "4h": 14_400_000, "1d": 86_400_000,
+}
+DAY_MS = 86_400_000
+
+_CSV_NAME = re.compile(r"^([A-Z0-9]+)_(\d+[mhd])\.csv$")
+
+
+class _Bars:
+    """한 심볼/타임프레임의 컬럼형 캔들 (open_time 오름차순)"""
+
+    __slots__ = ("interval_ms", "open_time", "open", "high", "low", "close", "volume")
+
+    def __init__(self, interval_ms: int, open_time, open_, high, low, close, volume):
+        self.interval_ms = interval_ms
+        self.open_time = np.asarray(open_time, dtype=np.int64)
+        self.open = np.asarray(open_, dtype=np.float64)
+        self.high = np.asarray(high, dtype=np.float64)
+        self.low = np.asarray(low, dtype=np.float64)
+        self.close = np.asarray(close, dtype=np.float64)
+        self.volume = np.asarray(volume, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.open_time)
+
+
+def load_csv_bars(path: Path, interval_ms: int) -> _Bars:
+    """data/*.csv (open_time,open,high,low,close,volume; open_time은 UTC 문자열 또는 ms) 로드"""
+    df = pd.read_csv(path, usecols=["open_time", "open", "high", "low", "close", "volume"])
+    if np.issubdtype(df["open_time"].dtype, np.number):
+        open_ms = df["open_time"].to_numpy(dtype=np.int64)
+    else:
+        open_ms = pd.to_datetime(df["open_time"], utc=True).astype("int64").to_numpy() // 1_000_000
+    order = np.argsort(open_ms, kind="stable")
+    return _Bars(interval_ms, open_ms[order], *(df[c].to_numpy(dtype=np.float64)[order]
+                                                for c in ("open", "high", "low", "close", "volume")))
+
+
+def aggregate_bars(base: _Bars, interval_ms: int) -> _Bars:
+    """기본 봉을 더 큰 타임프레임으로 묶음 (open_time 구간 기준 그룹)"""
+    bucket = base.open_time // interval_ms * interval_ms
+    starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    ends = np.r_[starts[1:], len(bucket)] - 1
+    return _Bars(
+        interval_ms, bucket[starts], base.open[starts],
+        np.maximum.reduceat(base.high, starts), np.minimum.reduceat(base.low, starts),
+        base.close[ends], np.add.reduceat(base.volume, starts),
+    )
+
+
+def split_bars(base: _Bars, interval_ms: int) -> _Bars:
+    """
+    기본 봉을 더 작은 타임프레임으로 분할 (결정적 경로)
+
+    종가는 시가→종가 선형 보간, 고가/저가는 1/3·2/3 지점의 하위 봉이 담당한다
+    (양봉은 저가 먼저, 음봉은 고가 먼저). 다시 묶으면 원래 OHLCV와 정확히 일치한다.
+    """
+    k = base.interval_ms // interval_ms
+    n = len(base)
+    step = np.arange(1, k + 1) / k
+    close = base.open[:, None] + (base.close - base.open)[:, None] * step[None, :]
+    close[:, -1] = base.close
+    open_ = np.empty_like(close)
+    open_[:, 0] = base.open
+    open_[:, 1:] = close[:, :-1]
+    high = np.maximum(open_, close)
+    low = np.minimum(open_, close)
+    first, second = k // 3, (2 * k) // 3
+    if first == second:
+        second = min(first + 1, k - 1)
+    bullish = base.close >= base.open
+    low_slot = np.where(bullish, first, second)
+    high_slot = np.where(bullish, second, first)
+    rows = np.arange(n)
+    high[rows, high_slot] = np.maximum(high[rows, high_slot], base.high)
+    low[rows, low_slot] = np.minimum(low[rows, low_slot], base.low)
+    volume = np.repeat((base.volume / k)[:, None], k, axis=1)
+    open_time = base.open_time[:, None] + np.arange(k)[None, :] * interval_ms
+    return _Bars(interval_ms, open_time.ravel(), open_.ravel(), high.ravel(), low.ravel(),
+                 close.ravel(), volume.ravel())
+
+
+class ReplayMarket:
+    """
+    data/*.csv 리플레이 시장
+
+    - 가상 시각 = 데이터 시작 + warmup_bars 봉 + (실제 경과 시간 × speed), 데이터 끝에서 멈춤
+    - 요청 타임프레임이 CSV보다 크면 묶고, 작으면 결정적 경로로 분할 (캐시)
+    - 진행 중인 봉은 경과 비율만큼 시가→종가를 보간한 부분 봉으로 노출
+    """
+
+    def __init__(self, data_dir: str = "data", speed: float = 60.0, warmup_bars: int = 500,
+                 symbols: Optional[List[str]] = None, clock: Callable[[], float] = time.time):
+        self.speed = float(speed)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._base: Dict[str, _Bars] = {}
+        self._derived: Dict[tuple, _Bars] = {}
+
+        wanted = {s.upper() for s in symbols} if symbols else None
+        for path in sorted(Path(data_dir).glob("*.csv")):
+            m = _CSV_NAME.match(path.name)
+            if not m or m.group(2) not in INTERVAL_MS:
+                continue
+            symbol = m.group(1)
+            if (wanted and symbol not in wanted) or symbol in self._base:
+                continue
+            self._base[symbol] = load_csv_bars(path, INTERVAL_MS[m.group(2)])
+        if not self._base:
+            raise ValueError(f"리플레이할 CSV가 없습니다: {data_dir}")
+
+        # 모든 심볼이 같은 가상 시각을 공유 (가장 늦게 시작하는 심볼 기준)
+        self.data_start = max(int(b.open_time[0]) for b in self._base.values())
+        self.data_end = max(int(b.open_time[-1]) + b.interval_ms for b in self._base.values())
+        base_ms = max(b.interval_ms for b in self._base.values())
+        self.start_time = min(self.data_start + warmup_bars * base_ms, self.data_end)
+        self._started = clock()
+        logger.info(f"리플레이 시장 준비: {sorted(self._base)} (속도 x{self.speed})")
+
+    @property
+    def symbols(self) -> List[str]:
+        return sorted(self._base)
+
+    def now_ms(self) -> int:
+        """현재 가상 시각 (ms)"""
+        elapsed = (self._clock() - self._started) * self.speed * 1000
+        return min(self.start_time + int(elapsed), self.data_end - 1)
+
+    def bars(self, symbol: str, interval: str) -> _Bars:
+        base = self._base[symbol]
+        interval_ms = INTERVAL_MS[interval]
+        if interval_ms == base.interval_ms:
+            return base
+        key = (symbol, interval_ms)
+        with self._lock:
+            bars = self._derived.get(key)
+            if bars is None:
+                if interval_ms > base.interval_ms:
+                    bars = aggregate_bars(base, interval_ms)
+                elif base.interval_ms % interval_ms == 0:
+                    bars = split_bars(base, interval_ms)
+                else:
+                    raise KeyError(interval)
+                self._derived[key] = bars
+        return bars
+
+    @staticmethod
+    def _partial(bars: _Bars, i: int, now: int) -> tuple:
+        """i번째 봉의 now 시점 OHLCV (진행 중이면 경과 비율만큼 보간)"""
+        o, h, l, c, v = bars.open[i], bars.high[i], bars.low[i], bars.close[i], bars.volume[i]
+        frac = (now - bars.open_time[i] + 1) / bars.interval_ms
+        if frac >= 1.0:
+            return o, h, l, c, v
+        c = o + (c - o) * frac
+        return o, max(o, c), min(o, c), c, v * frac
+
+    def klines(self, symbol: str, interval: str, limit: int = 500, start_time: Optional[int] = None,
+               end_time: Optional[int] = None) -> List[list]:
+        """/fapi/v1/klines 응답 형식 (가상 시각 이후 봉은 노출하지 않음)"""
+        bars = self.bars(symbol, interval)
+        now = self.now_ms()
+        hi = int(np.searchsorted(bars.open_time, now, side="right"))
+        if end_time is not None:
+            hi = min(hi, int(np.searchsorted(bars.open_time, end_time, side="right")))
+        if start_time is not None:
+            lo = int(np.searchsorted(bars.open_time, start_time, side="left"))
+            hi = min(hi, lo + limit)
+        else:
+            lo = max(0, hi - limit)
+        rows = []
+        for i in range(lo, hi):
+            o, h, l, c, v = self._partial(bars, i, now)
+            t = int(bars.open_time[i])
+            rows.append([t, f"{o:.8g}", f"{h:.8g}", f"{l:.8g}", f"{c:.8g}", f"{v:.8g}",
+                         t + bars.interval_ms - 1, f"{v * c:.8g}", 0, "0", "0", "0"])
+        return rows
+
+    def kline_event(self, symbol: str, interval: str, open_time: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """kline 스트림 이벤트 (open_time 지정 시 해당 봉, 없으면 현재 봉)"""
+        bars = self.bars(symbol, interval)
+        now = self.now_ms()
+        target = now if open_time is None else open_time
+        i = int(np.searchsorted(bars.open_time, target, side="right")) - 1
+        if i < 0:
+            return None
+        o, h, l, c, v = self._partial(bars, i, now)
+        t = int(bars.open_time[i])
+        close_time = t + bars.interval_ms - 1
+        return {
+            "e": "kline", "E": now, "s": symbol,
+            "k": {"t": t, "T": close_time, "s": symbol, "i": interval,
+                  "o": f"{o:.8g}", "h": f"{h:.8g}", "l": f"{l:.8g}", "c": f"{c:.8g}",
+                  "v": f"{v:.8g}", "q": f"{v * c:.8g}", "n": 0, "x": now >= close_time},
+        }
+
+    def price(self, symbol: str) -> float:
+        """현재 가격 (기본 봉의 부분 종가)"""
+        bars = self._base[symbol]
+        now = self.now_ms()
+        i = max(int(np.searchsorted(bars.open_time, now, side="right")) - 1, 0)
+        return float(self._partial(bars, i, now)[3])
+
+    def ticker_24hr(self, symbol: str) -> Dict[str, Any]:
+        """/fapi/v1/ticker/24hr 단일 심볼 응답 형식"""
+        bars = self._base[symbol]
+        now = self.now_ms()
+        hi = int(np.searchsorted(bars.open_time, now, side="right"))
+        lo = int(np.searchsorted(bars.open_time, now - DAY_MS, side="right"))
+        hi = max(hi, 1)
+        lo = min(lo, hi - 1)
+        last = self.price(symbol)
+        open_ = float(bars.open[lo])
+        high = max(float(bars.high[lo:hi - 1].max()) if hi - 1 > lo else last, last)
+        low = min(float(bars.low[lo:hi - 1].min()) if hi - 1 > lo else last, last)
+        volume = float(bars.volume[lo:hi].sum())
+        change = last - open_
+        pct = change / open_ * 100 if open_ else 0.0
+        return {
+            "symbol": symbol, "priceChange": f"{change:.8g}", "priceChangePercent": f"{pct:.3f}",
+            "weightedAvgPrice": f"{last:.8g}", "lastPrice": f"{last:.8g}", "lastQty": "0",
+            "openPrice": f"{open_:.8g}", "highPrice": f"{high:.8g}", "lowPrice": f"{low:.8g}",
+            "volume": f"{volume:.8g}", "quoteVolume": f"{volume * last:.8g}",
+            "openTime": now - DAY_MS, "closeTime": now, "count": hi - lo,
+        }
+
+    def ticker_event(self, symbol: str) -> Dict[str, Any]:
+        """!ticker@arr 이벤트 형식"""
+        t = self.ticker_24hr(symbol)
+        return {
+            "e": "24hrTicker", "E": t["closeTime"], "s": symbol, "p": t["priceChange"],
+            "P": t["priceChangePercent"], "w": t["weightedAvgPrice"], "c": t["lastPrice"], "Q": "0",
+            "o": t["openPrice"], "h": t["highPrice"], "l": t["lowPrice"], "v": t["volume"],
+            "q": t["quoteVolume"], "O": t["openTime"], "C": t["closeTime"], "n": t["count"],
+        }
+
+    def premium_index(self, symbol: str) -> Dict[str, Any]:
+        """/fapi/v1/premiumIndex 응답 형식 (mark = index = 현재 가격)"""
+        now = self.now_ms()
+        price = f"{self.price(symbol):.8g}"
+        next_funding = (now // 28_800_000 + 1) * 28_800_000
+        return {"symbol": symbol, "markPrice": price, "indexPrice": price, "estimatedSettlePrice": price,
+                "lastFundingRate": "0.00010000", "interestRate": "0.00010000",
+                "nextFundingTime": next_funding, "time": now}
+
+    def mark_price_event(self, symbol: str) -> Dict[str, Any]:
+        """!markPrice@arr@1s 이벤트 형식"""
+        p = self.premium_index(symbol)
+        return {"e": "markPriceUpdate", "E": p["time"], "s": symbol, "p": p["markPrice"],
+                "i": p["indexPrice"], "P": p["estimatedSettlePrice"], "r": p["lastFundingRate"],
+                "T": p["nextFundingTime"]}
+
+    def exchange_info(self) -> Dict[str, Any]:
+        """/fapi/v1/exchangeInfo 응답 형식 (필터는 가격 자릿수 기준으로 추정)"""
+        symbols = []
+        for symbol, bars in self._base.items():
+            price = float(bars.close[-1])
+            tick = 10.0 ** (int(np.floor(np.log10(price))) - 4) if price > 0 else 0.0001
+            # 최소 명목가(5 USDT) 근처 수량을 표현할 수 있는 단위, 0.001~1 범위
+            step = 10.0 ** int(np.clip(np.floor(np.log10(5.0 / price)), -3, 0)) if price > 0 else 1.0
+            symbols.append({
+                "symbol": symbol, "pair": symbol, "contractType": "PERPETUAL", "status": "TRADING",
+                "baseAsset": symbol[:-4], "quoteAsset": "USDT", "marginAsset": "USDT",
+                "onboardDate": int(bars.open_time[0]),
+                "filters": [
+                    {"filterType": "PRICE_FILTER", "tickSize": f"{tick:.10g}", "minPrice": f"{tick:.10g}",
+                     "maxPrice": "1000000"},
+                    {"filterType": "LOT_SIZE", "stepSize": f"{step:.10g}", "minQty": f"{step:.10g}",
+                     "maxQty": "100000000"},
+                    {"filterType": "MARKET_LOT_SIZE", "stepSize": f"{step:.10g}", "minQty": f"{step:.10g}",
+                     "maxQty": "100000000"},
+                    {"filterType": "MIN_NOTIONAL", "notional": "5"},
+                ],
+            })
+        return {"timezone": "UTC", "serverTime": int(time.time() * 1000), "symbols": symbols}
@@ -1,14 +1,19 @@
 import os
 import time
 import hmac
+import asyncio
 import hashlib
-from typing import List, Optional, Dict, Any
+from collections import deque
+from typing import Awaitable, Callable, Deque, List, Optional, Dict, Any
 from urllib.parse import urlencode
 
 import httpx
 from dotenv import load_dotenv
 
 from backtesting_backend.api_client.rate_limit_manager import RateLimitManager
+from backtesting_backend.utils.time_utils import interval_to_millis
+
+PageCallback = Callable[[List[Dict[str, Any]]], Awaitable[None]]
 
 
 class BinanceAPIException(Exception):
@@ -68,12 +73,110 @@ class BinanceClient:
             raise BinanceAPIException(f"Binance API error {resp.status_code}: {resp.text}")
         return resp.json()
 
+    @staticmethod
+    def _parse_kline(item: List[Any], symbol: str, interval: str) -> Dict[str, Any]:
+        return {
+            "open_time": int(item[0]),
+            "open": float(item[1]),
+            "high": float(item[2]),
+            "low": float(item[3]),
+            "close": float(item[4]),
+            "volume": float(item[5]),
+            "close_time": int(item[6]),
+            "quote_asset_volume": float(item[7]) if item[7] is not None else None,
+            "number_of_trades": int(item[8]) if item[8] is not None else None,
+            "taker_buy_base_asset_volume": float(item[9]) if item[9] is not None else None,
+            "taker_buy_quote_asset_volume": float(item[10]) if item[10] is not None else None,
+            "ignore": float(item[11]) if item[11] is not None else None,
+            "symbol": symbol,
+            "interval": interval,
+        }
+
+    @staticmethod
+    def _page_windows(interval: str, start_time: int, end_time: int, limit: int) -> Optional[List[tuple]]:
+        """Split [start_time, end_time] into windows holding at most `limit` bars each.
+
+        Returns None when the interval has no fixed length (e.g. '1M').
+        """
+        if interval.endswith("M"):
+            return None
+        interval_ms = interval_to_millis(interval)
+        step = interval_ms * limit
+        return [(w, min(w + step - 1, end_time)) for w in range(int(start_time), int(end_time) + 1, step)]
+
+    async def fetch_klines_concurrent(self, symbol: str, interval: str, start_time: int, end_time: int,
+                                      on_page: PageCallback, limit: int = 1000, concurrency: int = 8) -> int:
+        """Download a known range with up to `concurrency` page requests in flight.
+
+        The range is split into page-aligned windows up front. Pages are handed
+        to `on_page` strictly in time order (and deduplicated by open_time) as
+        soon as they and every earlier page have arrived, so a consumer that
+        persists them always holds a contiguous prefix of the range. At most
+        `concurrency` pages are buffered at any time. Intervals without a fixed
+        length fall back to the sequential get_klines. Returns the number of
+        klines delivered.
+        """
+        windows = self._page_windows(interval, start_time, end_time, limit)
+        if windows is None:
+            rows = await self.get_klines(symbol, interval, start_time=start_time, end_time=end_time, limit=limit)
+            if rows:
+                await on_page(rows)
+            return len(rows)
+
+        async def fetch(window_start: int, window_end: int) -> List[Any]:
+            params = {"symbol": symbol, "interval": interval, "limit": limit,
+                      "startTime": window_start, "endTime": window_end}
+            return await self._send_request("GET", "/fapi/v1/klines", params=params, signed=False)
+
+        pending: Deque[asyncio.Task] = deque()
+        delivered = 0
+        last_open = -1
+
+        async def deliver_head() -> None:
+            nonlocal delivered, last_open
+            data = await pending.popleft()
+            rows = [self._parse_kline(item, symbol, interval) for item in data or [] if int(item[0]) > last_open]
+            if rows:
+                await on_page(rows)
+                delivered += len(rows)
+                last_open = rows[-1]["open_time"]
+
+        try:
+            for window_start, window_end in windows:
+                pending.append(asyncio.create_task(fetch(window_start, window_end)))
+                if len(pending) >= max(1, concurrency):
+                    await deliver_head()
+            while pending:
+                await deliver_head()
+        finally:
+            # on error/cancellation do not leave orphaned requests running
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        return delivered
+
     async def get_klines(self, symbol: str, interval: str, start_time: Optional[int] = None,
-                         end_time: Optional[int] = None, limit: int = 1000) -> List[Dict[str, Any]]:
+                         end_time: Optional[int] = None, limit: int = 1000,
+                         concurrency: int = 8) -> List[Dict[str, Any]]:
         """Fetch klines from Binance futures endpoint with pagination.
 
+        When both ends of the range are known the pages are fetched
+        concurrently (see fetch_klines_concurrent); otherwise pages are
+        followed sequentially from startTime.
+
         Returns list of dicts matching Kline model fields.
         """
+        if start_time is not None and end_time is not None and self._page_windows(interval, start_time, end_time, limit):
+            all_klines: List[Dict[str, Any]] = []
+
+            async def collect(rows: List[Dict[str, Any]]) -> None:
+                all_klines.extend(rows)
+
+            await self.fetch_klines_concurrent(symbol, interval, start_time, end_time, collect,
+                                               limit=limit, concurrency=concurrency)
+            return all_klines
+
         path = "/fapi/v1/klines"
         params: Dict[str, Any] = {"symbol": symbol, "interval": interval, "limit": limit}
         if start_time is not None:
@@ -81,31 +184,14 @@ class BinanceClient:
         if end_time is not None:
             params["endTime"] = int(end_time)
 
-        all_klines: List[Dict[str, Any]] = []
+        all_klines = []
 
         while True:
             data = await self._send_request("GET", path, params=params, signed=False)
             if not data:
                 break
 
-            for item in data:
-                k = {
-                    "open_time": int(item[0]),
-                    "open": float(item[1]),
-                    "high": float(item[2]),
-                    "low": float(item[3]),
-                    "close": float(item[4]),
-                    "volume": float(item[5]),
-                    "close_time": int(item[6]),
-                    "quote_asset_volume": float(item[7]) if item[7] is not None else None,
-                    "number_of_trades": int(item[8]) if item[8] is not None else None,
-                    "taker_buy_base_asset_volume": float(item[9]) if item[9] is not None else None,
-                    "taker_buy_quote_asset_volume": float(item[10]) if item[10] is not None else None,
-                    "ignore": float(item[11]) if item[11] is not None else None,
-                    "symbol": symbol,
-                    "interval": interval,
-                }
-                all_klines.append(k)
+            all_klines.extend(self._parse_kline(item, symbol, interval) for item in data)
 
             if len(data) < limit:
                 break
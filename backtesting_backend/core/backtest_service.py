@@ -1,4 +1,6 @@
 import asyncio
+import functools
+import os
 import uuid
 import time
 from typing import Dict, Any, Optional
@@ -9,10 +11,48 @@ from backtesting_backend.core.data_loader import DataLoader
 from backtesting_backend.core.strategy_simulator import StrategySimulator
 from backtesting_backend.core.parameter_optimizer import ParameterOptimizer
 from backtesting_backend.optimizers.grid_search import GridSearch
+from backtesting_backend.optimizers.staged_simulation import StagedSimulation, stage_key
 from backtesting_backend.database.repositories.backtest_result_repository import BacktestResultRepository
 from backtesting_backend.core.logger import logger
 
 
+# per-combo limit for optimization runs; a combo exceeding it scores -inf
+OPTIMIZATION_TASK_TIMEOUT_SEC = 300.0
+
+
+def _execution_params(request: BacktestRequest) -> Dict[str, Any]:
+    """Global execution params from the request; they override strategy/grid params."""
+    return {
+        "fee_pct": request.fee_pct,
+        "slippage_pct": request.slippage_pct,
+        "position_size": request.position_size,
+        "take_profit_pct": request.take_profit_pct,
+        "trailing_stop_pct": request.trailing_stop_pct,
+    }
+
+
+def _optimization_score(p: Dict[str, Any], df, simulator: StrategySimulator | StagedSimulation, symbol: str, interval: str,
+                        initial_balance: float, leverage: int, base_params: Dict[str, Any],
+                        execution_params: Dict[str, Any]) -> float:
+    """Grid objective (module level so worker processes can unpickle it)."""
+    # merge base parameters and the tested params
+    merged = dict(base_params)
+    merged.update(p)
+    # include global execution params from request
+    merged.update(execution_params)
+
+    # run simulation (synchronous) and return score (profit as objective)
+    try:
+        sim_res = simulator.run_simulation(symbol, interval, df, initial_balance, leverage, merged)
+        # objective: prefer higher net profit but penalize large drawdown
+        profit = float(sim_res.get("profit", 0.0))
+        max_dd = float(sim_res.get("max_drawdown_pct", 0.0))
+        # simple scoring: profit - k * drawdown (k=0.5)
+        return profit - 0.5 * max_dd
+    except Exception:
+        return float("-inf")
+
+
 class BacktestService:
     def __init__(self, data_loader: Optional[DataLoader] = None,
                  simulator: Optional[StrategySimulator] = None,
@@ -53,41 +93,30 @@ class BacktestService:
                 # run optimization using GridSearch for parallel evaluation
                 param_grid = request.optimization_ranges
 
-                def objective(p: Dict[str, Any]) -> float:
-                    # merge base parameters and the tested params
-                    merged = dict(request.parameters or {})
-                    merged.update(p)
-                    # include global execution params from request
-                    merged["fee_pct"] = request.fee_pct
-                    merged["slippage_pct"] = request.slippage_pct
-                    merged["position_size"] = request.position_size
-                    merged["take_profit_pct"] = request.take_profit_pct
-                    merged["trailing_stop_pct"] = request.trailing_stop_pct
-
-                    # run simulation (synchronous) and return score (profit as objective)
-                    try:
-                        sim_res = self.simulator.run_simulation(request.symbol, request.interval, df, request.initial_balance, request.leverage, merged)
-                        # objective: prefer higher net profit but penalize large drawdown
-                        profit = float(sim_res.get("profit", 0.0))
-                        max_dd = float(sim_res.get("max_drawdown_pct", 0.0))
-                        # simple scoring: profit - k * drawdown (k=0.5)
-                        score = profit - 0.5 * max_dd
-                        return score
-                    except Exception:
-                        return float("-inf")
+                # combos sharing indicator/signal params reuse one prepared frame per worker
+                objective = functools.partial(
+                    _optimization_score,
+                    simulator=StagedSimulation(self.simulator),
+                    symbol=request.symbol,
+                    interval=request.interval,
+                    initial_balance=request.initial_balance,
+                    leverage=request.leverage,
+                    base_params=dict(request.parameters or {}),
+                    execution_params=_execution_params(request),
+                )
 
                 gs = GridSearch(param_grid)
-                # allow modest parallelism
-                best_params, best_score, all_results = gs.search(objective, max_workers=4)
+                # evaluate combos in worker processes sharing one copy of the klines;
+                # run in a thread so the event loop keeps serving status requests
+                best_params, best_score, all_results = await asyncio.to_thread(
+                    gs.search, objective, max_workers=os.cpu_count() or 1, executor="process",
+                    data=df, task_timeout=OPTIMIZATION_TASK_TIMEOUT_SEC, stage_key=stage_key,
+                )
 
                 # run final simulation with best params to get full result
                 merged_best = dict(request.parameters or {})
                 merged_best.update(best_params or {})
-                merged_best["fee_pct"] = request.fee_pct
-                merged_best["slippage_pct"] = request.slippage_pct
-                merged_best["position_size"] = request.position_size
-                merged_best["take_profit_pct"] = request.take_profit_pct
-                merged_best["trailing_stop_pct"] = request.trailing_stop_pct
+                merged_best.update(_execution_params(request))
 
                 result = self.simulator.run_simulation(request.symbol, request.interval, df, request.initial_balance, request.leverage, merged_best)
                 best_params = merged_best
@@ -179,6 +208,9 @@ class BacktestService:
             for s_key in ("initial_balance", "leverage"):
                 if s_key in sanitized:
                     sanitized.pop(s_key, None)
+            # the per-bar equity curve is a NumPy array for in-process consumers
+            # (optimizers/analysis); it is not part of the status payload
+            sanitized.pop("equity_curve", None)
 
             self._statuses[run_id]["status"] = "completed"
             self._statuses[run_id]["progress"] = 100
@@ -29,12 +29,13 @@ class DataLoader:
                     logger.info("Data already present for %s %s %s-%s", symbol, interval, start_time, end_time)
                     return
 
-                # fetch from Binance in pages
-                klines = await self.client.get_klines(symbol, interval, start_time=fetch_start, end_time=end_time)
-                if klines:
-                    # convert to list of dicts acceptable to repo
-                    await self.kline_repo.bulk_insert_klines(klines)
-                    logger.info("Inserted %d klines for %s %s", len(klines), symbol, interval)
+                # fetch from Binance in concurrent pages, inserting each page as it
+                # arrives (in order, so an interrupted load resumes from `latest`)
+                inserted = await self.client.fetch_klines_concurrent(
+                    symbol, interval, fetch_start, end_time, on_page=self.kline_repo.bulk_insert_klines
+                )
+                if inserted:
+                    logger.info("Inserted %d klines for %s %s", inserted, symbol, interval)
             except Exception as e:
                 logger.exception("Failed to load historical klines: %s", e)
                 raise
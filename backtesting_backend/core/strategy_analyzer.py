@@ -1,7 +1,9 @@
 from typing import Dict, Any
+import numpy as np
 import pandas as pd
-from typing import Dict, Any
-import pandas as pd
+
+from backtesting_backend.core.support_resistance import sr_proximity_flags
+
 try:
     import pandas_ta as ta
 except Exception:
@@ -50,6 +52,19 @@ except Exception:
     ta.stochrsi = stochrsi
 
 
+def _truthy(df: pd.DataFrame, col: str) -> np.ndarray:
+    """Per-row Python truthiness of `col` (missing column -> all False; NaN counts as True)."""
+    if col not in df.columns:
+        return np.zeros(len(df), dtype=bool)
+    s = df[col]
+    if s.dtype == bool:
+        return s.to_numpy()
+    if pd.api.types.is_numeric_dtype(s.dtype):
+        v = s.to_numpy(dtype=np.float64)
+        return (v != 0) | np.isnan(v)
+    return np.fromiter((bool(x) for x in s), dtype=bool, count=len(s))
+
+
 class StrategyAnalyzer:
     """Calculate indicators and generate basic signals for strategies."""
 
@@ -296,7 +311,68 @@ class StrategyAnalyzer:
             return [], []
 
     def generate_signals(self, df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
-        """Generate buy/sell signals based on indicators and params."""
+        """Generate buy/sell signals based on indicators and params.
+
+        EMA golden/dead crosses, trend/session gating and volume-momentum gating
+        are evaluated as boolean arrays over all bars. The optional S/R filter
+        uses rolling levels (see support_resistance.sr_proximity_flags) and also
+        writes `near_support`/`near_resistance` columns.
+        """
+        df = df.copy()
+        fast = int(params.get("fast_ema_period", 9))
+        slow = int(params.get("slow_ema_period", 21))
+        ema_fast_col = f"ema_fast_{fast}"
+        ema_slow_col = f"ema_slow_{slow}"
+
+        n = len(df)
+        buy = np.zeros(n, dtype=bool)
+        sell = np.zeros(n, dtype=bool)
+        if n > 1 and ema_fast_col in df.columns and ema_slow_col in df.columns:
+            ema_fast = pd.to_numeric(df[ema_fast_col], errors="coerce").to_numpy(dtype=np.float64)
+            ema_slow = pd.to_numeric(df[ema_slow_col], errors="coerce").to_numpy(dtype=np.float64)
+            prev_fast, prev_slow = ema_fast[:-1], ema_slow[:-1]
+            cur_fast, cur_slow = ema_fast[1:], ema_slow[1:]
+
+            # base EMA crossover (bar 0 has no previous bar)
+            ema_gc = np.zeros(n, dtype=bool)
+            ema_dc = np.zeros(n, dtype=bool)
+            ema_gc[1:] = (prev_fast <= prev_slow) & (cur_fast > cur_slow)
+            ema_dc[1:] = (prev_fast >= prev_slow) & (cur_fast < cur_slow)
+
+            # respect trend filter and session filter if present
+            gate = np.ones(n, dtype=bool)
+            for col in ("trend_ok", "session_ok"):
+                if col in df.columns:
+                    gate &= _truthy(df, col)
+
+            # optional volume momentum filter: buys need spike + above VWAP, sells spike + below VWAP
+            if params.get("enable_volume_momentum"):
+                vol_spike = _truthy(df, "VolumeSpike")
+                above_vwap = _truthy(df, "AboveVWAP")
+                gate &= np.where(ema_gc, vol_spike & above_vwap, np.where(ema_dc, vol_spike & ~above_vwap, True))
+
+            # optional support/resistance proximity filter: near resistance blocks longs unless
+            # also near support; near support blocks shorts (levels use past bars only)
+            if params.get("enable_sr_filter") and "close" in df.columns:
+                near_support, near_resistance = sr_proximity_flags(
+                    df,
+                    lookback_period=int(params.get("sr_lookback_period", 100)),
+                    num_levels=int(params.get("sr_num_levels", 3)),
+                    proximity=float(params.get("sr_proximity_threshold", 0.001)),
+                )
+                df["near_support"] = near_support
+                df["near_resistance"] = near_resistance
+                gate &= ~(ema_gc & near_resistance & ~near_support) & ~(ema_dc & near_support)
+
+            buy = ema_gc & gate
+            sell = ema_dc & gate
+
+        df["buy_signal"] = buy
+        df["sell_signal"] = sell
+        return df
+
+    def _generate_signals_reference(self, df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
+        """Per-bar reference implementation of generate_signals (kept for equivalence tests)."""
         df = df.copy()
         fast = int(params.get("fast_ema_period", 9))
         slow = int(params.get("slow_ema_period", 21))
@@ -1,16 +1,42 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+import numpy as np
 import pandas as pd
 from dataclasses import dataclass
-import math
 import logging
 
-from backtesting_backend.core.strategy_analyzer import StrategyAnalyzer
+from backtesting_backend.core.strategy_analyzer import StrategyAnalyzer, _truthy
 
 # Default capital fraction to use when the strategy does not supply a position_size_policy.
 # This is an app-level default (not a strategy parameter) and can be tuned by ops.
 DEFAULT_CAPITAL_FRACTION = 0.01  # 1%
 logger = logging.getLogger(__name__)
 
+# exit-condition search starts with this many bars after entry and doubles,
+# so the cost per trade is proportional to its holding period
+_EXIT_SEARCH_CHUNK = 64
+
+# column block size for equity samples in run_exit_sweep (rows x block floats per step)
+_SWEEP_EQUITY_BLOCK = 1024
+
+# position sizing modes resolved by _ExecutionConfig.sizing() for run_exit_sweep
+_SIZE_FRACTION, _SIZE_RISK, _SIZE_FIXED = 0, 1, 2
+
+# strategy parameters read by the indicator stage (StrategyAnalyzer.calculate_indicators)
+INDICATOR_PARAMS = (
+    "fast_ema_period", "slow_ema_period", "stoch_length",
+    "enable_trend_filter", "trend_tf", "trend_fast", "trend_slow",
+    "enable_session_filter", "allowed_sessions",
+    "enable_volume_momentum", "volume_avg_period", "volume_spike_factor",
+    "enable_sr_detection", "sr_lookback_period", "sr_num_levels",
+)
+# additional parameters read by the signal stage (generate_signals + volume-spike columns);
+# everything else only affects exits and sizing (_ExecutionConfig)
+SIGNAL_PARAMS = (
+    "use_precomputed_signals",
+    "enable_sr_filter", "sr_proximity_threshold",
+    "enable_volume_spike_filter", "vol_spike_lookback",
+)
+
 
 @dataclass
 class TradeRecord:
@@ -21,18 +47,107 @@ class TradeRecord:
     pnl: float | None = None
 
 
+@dataclass
+class _ExecutionConfig:
+    """Risk/execution parameters resolved once per run from strategy_parameters."""
+    stop_loss_pct: float
+    take_profit_pct: float
+    trailing_stop_pct: float
+    fee_pct: float
+    slippage_pct: float
+    position_size_raw: Any
+    position_size_policy: Any
+    no_compounding: bool
+    early_stop_frac: float
+    min_trades_required: int
+    volume_spike_filter: bool
+    vol_spike_threshold: float
+
+    @classmethod
+    def from_params(cls, strategy_parameters: Dict[str, Any]) -> "_ExecutionConfig":
+        # position sizing policy support
+        # legacy: numeric 'position_size' interpreted as units; preferred: dict 'position_size_policy'
+        position_size_raw = strategy_parameters.get("position_size", None)
+        position_size_policy = strategy_parameters.get("position_size_policy", None)
+        if position_size_policy is None and position_size_raw is not None:
+            # support old callers by treating numeric as capital_fraction
+            try:
+                pct = float(position_size_raw)
+                position_size_policy = {"method": "capital_fraction", "value": pct}
+            except Exception:
+                position_size_policy = {"method": "capital_fraction", "value": 1.0}
+
+        # If still None, apply app-level default capital fraction policy (do NOT treat this as a strategy parameter)
+        if position_size_policy is None:
+            position_size_policy = {"method": "capital_fraction", "value": DEFAULT_CAPITAL_FRACTION}
+            logger.debug("No explicit position_size_policy in strategy_parameters; using app default: %s", position_size_policy)
+
+        return cls(
+            stop_loss_pct=float(strategy_parameters.get("stop_loss_pct", 0.005)),  # 0.5% default
+            take_profit_pct=float(strategy_parameters.get("take_profit_pct", 0.0)),
+            trailing_stop_pct=float(strategy_parameters.get("trailing_stop_pct", 0.0)),
+            fee_pct=float(strategy_parameters.get("fee_pct", 0.0)),
+            slippage_pct=float(strategy_parameters.get("slippage_pct", 0.0)),
+            position_size_raw=position_size_raw,
+            position_size_policy=position_size_policy,
+            no_compounding=bool(strategy_parameters.get("no_compounding", False)),
+            # early-stop and minimum trade safeguards
+            early_stop_frac=float(strategy_parameters.get("early_stop_balance_frac", 0.0)),
+            min_trades_required=int(strategy_parameters.get("min_trades", 0)),
+            volume_spike_filter=bool(strategy_parameters.get("enable_volume_spike_filter")),
+            vol_spike_threshold=float(strategy_parameters.get("vol_spike_threshold", 5.0)),
+        )
+
+    def entry_units(self, balance_for_sizing: float, entry_price_effective: float, leverage: int) -> float:
+        """Position size (units) for a new entry according to the sizing policy."""
+        policy = self.position_size_policy
+        if policy and isinstance(policy, dict):
+            method = policy.get("method", "capital_fraction")
+            val = float(policy.get("value", 1.0))
+            if method == "capital_fraction":
+                # allocate val fraction of equity as position notional
+                notional = balance_for_sizing * val
+                # compute exposure = notional * leverage, then derive units = exposure / price
+                # This keeps leverage application explicit and avoids double-counting.
+                exposure = notional * leverage
+                return (exposure) / entry_price_effective if entry_price_effective > 0 else 0.0
+            if method == "risk_per_trade":
+                # val is fraction of capital to risk (e.g., 0.01 for 1%)
+                risk_amount = balance_for_sizing * val
+                # units such that if price moves by stop_loss_pct, loss equals risk_amount: units = risk_amount / (stop_loss_pct * entry_price_effective)
+                sl = self.stop_loss_pct if self.stop_loss_pct > 0 else 0.001
+                return risk_amount / (sl * entry_price_effective) if (sl * entry_price_effective) > 0 else 0.0
+            # fallback: treat as fraction
+            notional = balance_for_sizing * float(policy.get("value", 1.0))
+            return (notional * leverage) / entry_price_effective if entry_price_effective > 0 else 0.0
+        # legacy numeric units or default full unit
+        try:
+            return float(self.position_size_raw) if self.position_size_raw is not None else 1.0
+        except Exception:
+            return 1.0
+
+    def sizing(self, leverage: int) -> Tuple[int, float, float]:
+        """(mode, value, fixed units) form of entry_units for array evaluation."""
+        policy = self.position_size_policy
+        if policy and isinstance(policy, dict):
+            mode = _SIZE_RISK if policy.get("method", "capital_fraction") == "risk_per_trade" else _SIZE_FRACTION
+            return mode, float(policy.get("value", 1.0)), 0.0
+        return _SIZE_FIXED, 0.0, self.entry_units(0.0, 0.0, leverage)
+
+
 class StrategySimulator:
     def __init__(self, analyzer: StrategyAnalyzer | None = None):
         self.analyzer = analyzer or StrategyAnalyzer()
 
-    def run_simulation(self, symbol: str, interval: str, df: pd.DataFrame, initial_balance: float, leverage: int, strategy_parameters: Dict[str, Any]) -> Dict[str, Any]:
-        """Run a simple backtest simulation over the DataFrame.
+    def _prepare_frame(self, df: pd.DataFrame, strategy_parameters: Dict[str, Any]) -> pd.DataFrame:
+        """Indicators, signals and volume-spike columns for a run."""
+        return self._signal_frame(self._indicator_frame(df, strategy_parameters), strategy_parameters)
 
-        This is a simplified simulator for PoC and will approximate PnL using close prices.
-        """
-        results: Dict[str, Any] = {}
+    def _indicator_frame(self, df: pd.DataFrame, strategy_parameters: Dict[str, Any]) -> pd.DataFrame:
+        """Indicator stage of _prepare_frame; always returns a new frame (df is not modified).
 
-        # compute indicators and signals
+        Depends only on the indicator parameters (see INDICATOR_PARAMS).
+        """
         # If the necessary indicator columns already exist on the dataframe (e.g. cached),
         # skip recalculation to save CPU. Detect by checking expected EMA columns and
         # optional volume momentum columns when enabled.
@@ -42,29 +157,31 @@ class StrategySimulator:
         ema_slow_col = f"ema_slow_{slow}"
 
         need_calc = True
-        try:
-            if ema_fast_col in df.columns and ema_slow_col in df.columns:
-                # if volume momentum is requested, ensure its columns are present
-                if strategy_parameters.get("enable_volume_momentum"):
-                    if "VolumeSpike" in df.columns and "VWAP" in df.columns:
-                        need_calc = False
-                else:
+        if ema_fast_col in df.columns and ema_slow_col in df.columns:
+            # if volume momentum is requested, ensure its columns are present
+            if strategy_parameters.get("enable_volume_momentum"):
+                if "VolumeSpike" in df.columns and "VWAP" in df.columns:
                     need_calc = False
-        except Exception:
-            need_calc = True
+            else:
+                need_calc = False
 
         if need_calc:
-            df2 = self.analyzer.calculate_indicators(df, strategy_parameters)
-        else:
-            # use the provided df directly (assumed to already contain indicators)
-            df2 = df.copy()
+            return self.analyzer.calculate_indicators(df, strategy_parameters)
+        # use the provided df directly (assumed to already contain indicators)
+        return df.copy()
+
+    def _signal_frame(self, df_ind: pd.DataFrame, strategy_parameters: Dict[str, Any]) -> pd.DataFrame:
+        """Signal and volume-spike stage of _prepare_frame; df_ind is not modified.
 
+        Depends only on the indicator and signal parameters (see SIGNAL_PARAMS), so
+        one result can be shared by every exit/sizing combination.
+        """
         # allow callers to supply precomputed signals and skip re-generation
+        # (otherwise df2 is assumed to already contain `buy_signal`/`sell_signal`)
         if not strategy_parameters.get("use_precomputed_signals", False):
-            df2 = self.analyzer.generate_signals(df2, strategy_parameters)
+            df2 = self.analyzer.generate_signals(df_ind, strategy_parameters)
         else:
-            # assume df2 already contains `buy_signal`/`sell_signal`
-            df2 = df2
+            df2 = df_ind.copy()
 
         # Volume spike detection: compute rolling median volume and multiplier if requested
         try:
@@ -75,50 +192,435 @@ class StrategySimulator:
                 if med_col not in df2.columns:
                     df2[med_col] = df2["volume"].rolling(window=lookback, min_periods=1).median()
                 if mult_col not in df2.columns:
-                    # avoid division by zero
-                    df2[mult_col] = df2.apply(lambda r: (float(r["volume"]) / float(r[med_col])) if r.get(med_col) and float(r[med_col]) > 0 else 0.0, axis=1)
+                    # avoid division by zero (zero/NaN median -> 0.0)
+                    vol = df2["volume"].to_numpy(dtype=np.float64)
+                    med = df2[med_col].to_numpy(dtype=np.float64)
+                    with np.errstate(divide="ignore", invalid="ignore"):
+                        df2[mult_col] = np.where(med > 0, vol / med, 0.0)
         except Exception:
             # non-fatal: continue without volume spike columns
             pass
+        return df2
 
-        balance = initial_balance
-        position = None
-        trades: List[Dict[str, Any]] = []
-        balance_history: List[float] = [balance]
-        aborted_early = False
+    def run_simulation(self, symbol: str, interval: str, df: pd.DataFrame, initial_balance: float, leverage: int, strategy_parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a simple backtest simulation over the DataFrame.
 
-        # risk and execution parameters
-        stop_loss_pct = float(strategy_parameters.get("stop_loss_pct", 0.005))  # 0.5% default
-        take_profit_pct = float(strategy_parameters.get("take_profit_pct", 0.0))
-        trailing_stop_pct = float(strategy_parameters.get("trailing_stop_pct", 0.0))
-        fee_pct = float(strategy_parameters.get("fee_pct", 0.0))
-        slippage_pct = float(strategy_parameters.get("slippage_pct", 0.0))
+        This is a simplified simulator for PoC and will approximate PnL using close prices.
+        The bar loop runs on NumPy arrays (see _simulate_arrays); the equity curve is
+        returned as `equity_curve` (one value per evaluated bar, plus the initial and,
+        if a position was force-closed, the final balance).
+        """
+        df2 = self._prepare_frame(df, strategy_parameters)
+        return self.run_prepared(df2, initial_balance, leverage, strategy_parameters)
+
+    def run_prepared(self, df2: pd.DataFrame, initial_balance: float, leverage: int,
+                     strategy_parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Simulate on a frame that already went through _prepare_frame for the same
+        indicator/signal parameters; only the exit/sizing parameters are read here."""
+        cfg = _ExecutionConfig.from_params(strategy_parameters)
+        balance, trades, equity, aborted_early = self._simulate_arrays(df2, initial_balance, leverage, cfg)
+        return self._summarize(initial_balance, balance, trades, equity, aborted_early, cfg)
+
+    def run_exit_sweep(self, symbol: str, interval: str, df: pd.DataFrame, initial_balance: float, leverage: int,
+                       strategy_parameters: Dict[str, Any], exit_param_sets: Sequence[Dict[str, Any]]) -> pd.DataFrame:
+        """Evaluate K exit/sizing parameter sets over the same signals in one pass.
+
+        Indicators and signals are prepared once from `strategy_parameters`; each
+        entry of `exit_param_sets` overrides exit/sizing parameters only (stop loss,
+        take profit, trailing stop, fees, slippage, sizing, early stop, volume-spike
+        threshold). Row k of the returned table holds the k-th set followed by the
+        summary values run_simulation reports for `{**strategy_parameters, **set}`
+        (trades and the equity curve are not materialized).
+        """
+        staged = set(INDICATOR_PARAMS) | set(SIGNAL_PARAMS)
+        for params in exit_param_sets:
+            fixed = staged.intersection(params)
+            if fixed:
+                raise ValueError(f"exit_param_sets may only vary exit/sizing parameters, got {sorted(fixed)}")
+        df2 = self._prepare_frame(df, strategy_parameters)
+        cfgs = [_ExecutionConfig.from_params({**strategy_parameters, **params}) for params in exit_param_sets]
+        final_balance, total_trades, wins, max_dd, aborted = self._sweep_arrays(df2, initial_balance, leverage, cfgs)
+
+        profit = final_balance - initial_balance
+        with np.errstate(divide="ignore", invalid="ignore"):
+            profit_pct = (profit / initial_balance) * 100 if initial_balance else np.zeros(len(cfgs))
+            win_rate = np.where(total_trades > 0, (wins / total_trades) * 100, 0.0)
+        min_trades = np.array([cfg.min_trades_required for cfg in cfgs], dtype=np.int64)
+        table = pd.DataFrame(list(exit_param_sets), index=range(len(cfgs)))
+        return table.assign(
+            final_balance=final_balance,
+            profit=profit,
+            profit_percentage=profit_pct,
+            total_trades=total_trades,
+            win_rate=win_rate,
+            max_drawdown_pct=max_dd * 100,
+            aborted_early=aborted,
+            insufficient_trades=(min_trades != 0) & (total_trades < min_trades),
+        )
+
+    def _sweep_arrays(self, df2: pd.DataFrame, initial_balance: float, leverage: int,
+                      cfgs: Sequence[_ExecutionConfig]) -> Tuple[np.ndarray, ...]:
+        """_simulate_arrays for K configs at once: (final balance, trades, wins, max drawdown, aborted) per config.
+
+        Each config is a row of the state arrays. Every iteration moves all rows
+        still running by one trade: next accepted entry (per distinct volume-spike
+        mask), exit scan over a (rows x chunk) window, then the held segment's
+        equity in column blocks, which feeds the running peak/drawdown and the
+        early stop. Arithmetic follows _simulate_arrays and _summarize operation
+        for operation, so every value equals the single-config result.
+        """
+        n = len(df2)
+        K = len(cfgs)
+        close = df2["close"].to_numpy(dtype=np.float64) if n else np.empty(0)
+        sell = _truthy(df2, "sell_signal")
+        buy = _truthy(df2, "buy_signal")
+
+        sl = np.array([cfg.stop_loss_pct for cfg in cfgs], dtype=np.float64)
+        tp = np.array([cfg.take_profit_pct for cfg in cfgs], dtype=np.float64)
+        trail = np.array([cfg.trailing_stop_pct for cfg in cfgs], dtype=np.float64)
+        fee = np.array([cfg.fee_pct for cfg in cfgs], dtype=np.float64)
+        slip = np.array([cfg.slippage_pct for cfg in cfgs], dtype=np.float64)
+        no_compounding = np.array([cfg.no_compounding for cfg in cfgs], dtype=bool)
+        sizing = [cfg.sizing(leverage) for cfg in cfgs]
+        size_mode = np.array([m for m, _, _ in sizing], dtype=np.int64)
+        size_value = np.array([v for _, v, _ in sizing], dtype=np.float64)
+        size_fixed = np.array([u for _, _, u in sizing], dtype=np.float64)
+        risk_sl = np.where(sl > 0, sl, 0.001)
+        has_stop = np.array([bool(cfg.early_stop_frac and initial_balance) for cfg in cfgs], dtype=bool)
+        stop_level = np.where(has_stop, initial_balance * np.array([cfg.early_stop_frac for cfg in cfgs]), np.nan)
+
+        # accepted entries / rejected buys for each distinct volume-spike mask
+        masks: Dict[Any, int] = {}
+        entry_sets: List[Tuple[np.ndarray, np.ndarray]] = []
+        mask_of = np.empty(K, dtype=np.int64)
+        for k, cfg in enumerate(cfgs):
+            key = cfg.vol_spike_threshold if cfg.volume_spike_filter and "vol_mult" in df2.columns else None
+            if key not in masks:
+                blocked = buy & self._entry_blocked(df2, cfg)
+                masks[key] = len(entry_sets)
+                entry_sets.append((np.flatnonzero(buy & ~blocked), np.flatnonzero(blocked)))
+            mask_of[k] = masks[key]
+
+        balance = np.full(K, float(initial_balance))
+        peak = np.full(K, float(initial_balance))
+        max_dd = np.zeros(K)
+        total_trades = np.zeros(K, dtype=np.int64)
+        wins = np.zeros(K, dtype=np.int64)
+        aborted = np.zeros(K, dtype=bool)
+        running = np.ones(K, dtype=bool)
+        resume = np.zeros(K, dtype=np.int64)  # first bar to scan while flat
+
+        def observe(rows: np.ndarray, equity: np.ndarray) -> None:
+            """Fold equity samples (rows x m, NaN = no sample) into the running peak/drawdown."""
+            samples = equity.copy()
+            samples[:, 0] = np.fmax(samples[:, 0], peak[rows])
+            run_peak = np.fmax.accumulate(samples, axis=1)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                dd = np.where(run_peak > 0, (run_peak - equity) / run_peak, 0.0)
+            dd[np.isnan(equity)] = np.nan
+            max_dd[rows] = np.fmax(max_dd[rows], np.fmax.reduce(dd, axis=1))
+            peak[rows] = run_peak[:, -1]
+
+        def close_trades(rows: np.ndarray, exit_price: np.ndarray, entry_eff: np.ndarray,
+                         units: np.ndarray, entry_fee: np.ndarray) -> None:
+            exit_eff = exit_price * (1 - slip[rows])
+            exit_fee = exit_eff * units * fee[rows]
+            net = (exit_eff - entry_eff) * units - (entry_fee + exit_fee)
+            balance[rows] += net
+            total_trades[rows] += 1
+            wins[rows] += net > 0
+            observe(rows, balance[rows][:, None])
+
+        while running.any():
+            rows = np.flatnonzero(running)
+            start = resume[rows]
+
+            # ---- flat: next accepted buy at or after `start`
+            entry = np.full(len(rows), n, dtype=np.int64)
+            flat_count = np.zeros(len(rows), dtype=np.int64)
+            for m, (entries, skipped) in enumerate(entry_sets):
+                sel = mask_of[rows] == m
+                if not sel.any():
+                    continue
+                pos = np.searchsorted(entries, start[sel])
+                e = np.where(pos < len(entries), entries[np.minimum(pos, len(entries) - 1)] if len(entries) else n, n)
+                entry[sel] = e
+                flat_count[sel] = (e - start[sel]) - (np.searchsorted(skipped, e) - np.searchsorted(skipped, start[sel]))
+            stopped = has_stop[rows] & (flat_count > 0) & (balance[rows] <= stop_level[rows])
+            aborted[rows[stopped]] = True
+            running[rows[stopped | (entry >= n)]] = False
+            keep = ~stopped & (entry < n)
+            rows, entry = rows[keep], entry[keep]
+            if not len(rows):
+                break
+
+            # ---- entry at `entry` (market at close, with slippage)
+            entry_price = close[entry]
+            entry_eff = entry_price * (1 + slip[rows])
+            sizing_balance = np.where(no_compounding[rows], initial_balance, balance[rows])
+            value = size_value[rows]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                fraction_units = np.where(entry_eff > 0, (sizing_balance * value * leverage) / entry_eff, 0.0)
+                risk_den = risk_sl[rows] * entry_eff
+                risk_units = np.where(risk_den > 0, (sizing_balance * value) / risk_den, 0.0)
+            mode = size_mode[rows]
+            units = np.where(mode == _SIZE_FRACTION, fraction_units,
+                             np.where(mode == _SIZE_RISK, risk_units, size_fixed[rows]))
+            entry_fee = entry_eff * units * fee[rows]
+
+            # ---- exit scan from entry+1 (TP > trailing > SL > sell, see _find_exit)
+            exit_at = self._sweep_find_exits(close, sell, entry, entry_price, tp[rows], trail[rows], sl[rows])
+
+            # ---- equity while in position: entry .. exit-1 (or the last bar)
+            length = np.where(exit_at >= 0, exit_at, n) - entry
+            stop_hit = np.zeros(len(rows), dtype=bool)
+            offset = 0
+            live = np.arange(len(rows))
+            while len(live):
+                cols = np.arange(min(_SWEEP_EQUITY_BLOCK, int(length[live].max()) - offset))
+                valid = cols < (length[live] - offset)[:, None]
+                idx = np.minimum(entry[live][:, None] + offset + cols, n - 1)
+                r = rows[live]
+                equity = (balance[r][:, None] + (close[idx] - entry_eff[live][:, None]) * units[live][:, None] * leverage
+                          - entry_fee[live][:, None])
+                equity[~valid] = np.nan
+                hit = valid & (equity <= stop_level[r][:, None])
+                hit_any = hit.any(axis=1)
+                if hit_any.any():
+                    after = cols > np.where(hit_any, hit.argmax(axis=1), len(cols))[:, None]
+                    equity[after] = np.nan
+                    stop_hit[live[hit_any]] = True
+                observe(r, equity)
+                offset += len(cols)
+                live = live[~hit_any & (length[live] > offset)]
+
+            # ---- exits; positions left open (no exit / early stop) close at the last price
+            exited = (exit_at >= 0) & ~stop_hit
+            if exited.any():
+                er = rows[exited]
+                close_trades(er, close[exit_at[exited]], entry_eff[exited], units[exited], entry_fee[exited])
+                stopped = has_stop[er] & (balance[er] <= stop_level[er])
+                aborted[er[stopped]] = True
+                running[er[stopped]] = False
+                resume[er] = exit_at[exited] + 1
+            left_open = ~exited
+            if left_open.any():
+                lr = rows[left_open]
+                close_trades(lr, np.full(len(lr), close[-1]), entry_eff[left_open], units[left_open], entry_fee[left_open])
+                aborted[rows[stop_hit]] = True
+                running[lr] = False
+
+        return balance, total_trades, wins, max_dd, aborted
+
+    @staticmethod
+    def _sweep_find_exits(close: np.ndarray, sell: np.ndarray, entry: np.ndarray, entry_price: np.ndarray,
+                          tp: np.ndarray, trail: np.ndarray, sl: np.ndarray) -> np.ndarray:
+        """_find_exit for one position per row; exit bar per row (-1 if never)."""
+        n = len(close)
+        tp_price = np.where(tp > 0, entry_price * (1 + tp), np.nan)
+        sl_price = entry_price * (1 - sl)
+        highest = entry_price.copy()
+        start = entry + 1
+        exit_at = np.full(len(entry), -1, dtype=np.int64)
+        pending = np.flatnonzero(start < n)
+        chunk = _EXIT_SEARCH_CHUNK
+        while len(pending):
+            st = start[pending]
+            cols = np.arange(chunk)
+            idx = st[:, None] + cols
+            valid = idx < n
+            idx = np.minimum(idx, n - 1)
+            c = close[idx]
+            tr = trail[pending][:, None]
+            # highest price is updated with the current bar before the trailing check
+            peak = np.maximum.accumulate(np.maximum(c, highest[pending][:, None]), axis=1)
+            hit = (c >= tp_price[pending][:, None]) | ((tr > 0) & (c <= peak * (1 - tr)))
+            hit |= (c <= sl_price[pending][:, None]) | sell[idx]
+            hit &= valid
+            found = hit.any(axis=1)
+            exit_at[pending[found]] = st[found] + hit[found].argmax(axis=1)
+            more = ~found & (st + chunk < n)
+            highest[pending[more]] = peak[more, -1]
+            start[pending[more]] = st[more] + chunk
+            pending = pending[more]
+            chunk *= 2
+        return exit_at
+
+    @staticmethod
+    def _entry_blocked(df2: pd.DataFrame, cfg: _ExecutionConfig) -> np.ndarray:
+        """Bars where the volume-spike filter rejects a buy signal."""
+        if not cfg.volume_spike_filter or "vol_mult" not in df2.columns:
+            return np.zeros(len(df2), dtype=bool)
+        vm = pd.to_numeric(df2["vol_mult"], errors="coerce").fillna(0.0).to_numpy(dtype=np.float64)
+        return (vm != 0) & (vm >= cfg.vol_spike_threshold)
+
+    @staticmethod
+    def _trade(position: Dict[str, Any], exit_price: float, exit_reason: str, exit_index: Any,
+               cfg: _ExecutionConfig) -> Dict[str, Any]:
+        # apply slippage and fees on exit
+        exit_price_effective = exit_price * (1 - cfg.slippage_pct)
+        units = position["units"]
+        exit_fee = exit_price_effective * units * cfg.fee_pct
+        # gross_pnl computed from price difference * units. 'units' already reflects leveraged exposure.
+        gross_pnl = (exit_price_effective - position["entry_price_effective"]) * units
+        net_pnl = gross_pnl - (position["entry_fee"] + exit_fee)
+        return {
+            "entry_price": position["entry_price"],
+            "exit_price": exit_price,
+            "entry_price_effective": position["entry_price_effective"],
+            "exit_price_effective": exit_price_effective,
+            "entry_fee": position["entry_fee"],
+            "exit_fee": exit_fee,
+            "gross_pnl": gross_pnl,
+            "net_pnl": net_pnl,
+            "exit_reason": exit_reason,
+            "entry_index": position["entry_index"],
+            "exit_index": exit_index,
+        }
 
-        # position sizing policy support
-        # legacy: numeric 'position_size' interpreted as units; preferred: dict 'position_size_policy'
-        position_size_raw = strategy_parameters.get("position_size", None)
-        position_size_policy = strategy_parameters.get("position_size_policy", None)
-        if position_size_policy is None and position_size_raw is not None:
-            # support old callers by treating numeric as capital_fraction
-            try:
-                pct = float(position_size_raw)
-                position_size_policy = {"method": "capital_fraction", "value": pct}
-            except Exception:
-                position_size_policy = {"method": "capital_fraction", "value": 1.0}
+    def _simulate_arrays(self, df2: pd.DataFrame, initial_balance: float, leverage: int,
+                         cfg: _ExecutionConfig) -> Tuple[float, List[Dict[str, Any]], np.ndarray, bool]:
+        """Array-based bar loop: jumps from entry to entry and finds each exit with a vectorized scan.
 
-        # If still None, apply app-level default capital fraction policy (do NOT treat this as a strategy parameter)
-        if position_size_policy is None:
-            position_size_policy = {"method": "capital_fraction", "value": DEFAULT_CAPITAL_FRACTION}
-            try:
-                logger.debug("No explicit position_size_policy in strategy_parameters; using app default: %s", position_size_policy)
-            except Exception:
-                pass
+        Semantics match the original per-row loop (kept as _simulate_rows): one long
+        position at a time; on each bar in position TP > trailing > SL > sell signal;
+        the entry bar is never an exit bar; a buy rejected by the volume-spike filter
+        contributes no equity sample; early stop leaves the position to be closed at
+        the last close.
+        """
+        n = len(df2)
+        index = df2.index
+        close = df2["close"].to_numpy(dtype=np.float64) if n else np.empty(0)
+        sell = _truthy(df2, "sell_signal")
+        buy = _truthy(df2, "buy_signal")
+        blocked = buy & self._entry_blocked(df2, cfg)
+        entries = np.flatnonzero(buy & ~blocked)
+        skipped = np.flatnonzero(blocked)
+        stop_level = initial_balance * cfg.early_stop_frac if (cfg.early_stop_frac and initial_balance) else None
 
-        no_compounding = bool(strategy_parameters.get("no_compounding", False))
+        balance = initial_balance
+        trades: List[Dict[str, Any]] = []
+        segments: List[np.ndarray] = [np.array([balance], dtype=np.float64)]
+        position: Optional[Dict[str, Any]] = None
+        aborted_early = False
+        i = 0
+
+        while i < n:
+            # ---- flat: equity == balance until the next accepted buy signal
+            e = int(np.searchsorted(entries, i))
+            k = int(entries[e]) if e < len(entries) else n
+            if k > i:
+                lo, hi = np.searchsorted(skipped, [i, k])
+                count = (k - i) - int(hi - lo)
+                if count > 0:
+                    if stop_level is not None and balance <= stop_level:
+                        segments.append(np.array([balance]))
+                        aborted_early = True
+                        break
+                    segments.append(np.full(count, balance))
+            if k >= n:
+                break
+
+            # ---- entry at bar k (market at close, with slippage)
+            entry_price = float(close[k])
+            entry_price_effective = entry_price * (1 + cfg.slippage_pct)
+            balance_for_sizing = initial_balance if cfg.no_compounding else balance
+            units = cfg.entry_units(balance_for_sizing, entry_price_effective, leverage)
+            position = {
+                "entry_price": entry_price,
+                "entry_price_effective": entry_price_effective,
+                "entry_fee": entry_price_effective * units * cfg.fee_pct,
+                "entry_index": index[k],
+                "units": units,
+            }
+
+            # ---- exit scan from k+1
+            j, reason = self._find_exit(close, sell, k, entry_price, cfg)
+            last_open = j - 1 if j is not None else n - 1
+            held = close[k:last_open + 1]
+            unreal = (held - entry_price_effective) * units * leverage
+            equity = balance + unreal - position["entry_fee"]
+            if stop_level is not None:
+                hits = np.flatnonzero(equity <= stop_level)
+                if len(hits):
+                    segments.append(equity[: hits[0] + 1])
+                    aborted_early = True
+                    break
+            segments.append(equity)
+            if j is None:
+                break
+
+            trade = self._trade(position, float(close[j]), reason, index[j], cfg)
+            balance += trade["net_pnl"]
+            trades.append(trade)
+            position = None
+            segments.append(np.array([balance]))
+            if stop_level is not None and balance <= stop_level:
+                aborted_early = True
+                break
+            i = j + 1
 
-        # early-stop and minimum trade safeguards
-        early_stop_frac = float(strategy_parameters.get("early_stop_balance_frac", 0.0))
-        min_trades_required = int(strategy_parameters.get("min_trades", 0))
+        # close open position at last price
+        if position is not None:
+            trade = self._trade(position, float(close[-1]), "LAST", index[-1], cfg)
+            balance += trade["net_pnl"]
+            trades.append(trade)
+            # append final balance to equity curve
+            segments.append(np.array([balance]))
+
+        return balance, trades, np.concatenate(segments), aborted_early
+
+    @staticmethod
+    def _find_exit(close: np.ndarray, sell: np.ndarray, k: int, entry_price: float,
+                   cfg: _ExecutionConfig) -> Tuple[Optional[int], Optional[str]]:
+        """First bar after k where TP/trailing/SL/sell fires, with its reason (None if never)."""
+        n = len(close)
+        tp_price = entry_price * (1 + cfg.take_profit_pct) if cfg.take_profit_pct > 0 else None
+        trail = cfg.trailing_stop_pct
+        sl_price = entry_price * (1 - cfg.stop_loss_pct)
+        highest = entry_price
+        start = k + 1
+        chunk = _EXIT_SEARCH_CHUNK
+        while start < n:
+            stop = min(n, start + chunk)
+            c = close[start:stop]
+            tp_hit = c >= tp_price if tp_price is not None else np.zeros(len(c), dtype=bool)
+            if trail > 0:
+                # highest price is updated with the current bar before the trailing check
+                peak = np.maximum.accumulate(np.maximum(c, highest))
+                trail_hit = c <= peak * (1 - trail)
+            else:
+                peak = None
+                trail_hit = np.zeros(len(c), dtype=bool)
+            sl_hit = c <= sl_price
+            any_hit = tp_hit | trail_hit | sl_hit | sell[start:stop]
+            hits = np.flatnonzero(any_hit)
+            if len(hits):
+                h = int(hits[0])
+                if tp_hit[h]:
+                    reason = "TP"
+                elif trail_hit[h]:
+                    reason = "TRAIL"
+                elif sl_hit[h]:
+                    reason = "SL"
+                else:
+                    reason = "SELL"
+                return start + h, reason
+            if peak is not None:
+                highest = float(peak[-1])
+            start = stop
+            chunk *= 2
+        return None, None
+
+    def _simulate_rows(self, df2: pd.DataFrame, initial_balance: float, leverage: int,
+                       cfg: _ExecutionConfig) -> Tuple[float, List[Dict[str, Any]], np.ndarray, bool]:
+        """Reference per-row loop (original implementation); used to validate _simulate_arrays."""
+        balance = initial_balance
+        position = None
+        trades: List[Dict[str, Any]] = []
+        balance_history: List[float] = [balance]
+        aborted_early = False
+        stop_loss_pct = cfg.stop_loss_pct
 
         for idx, row in df2.iterrows():
             price = float(row["close"]) if "close" in row else float(row.close)
@@ -126,10 +628,9 @@ class StrategySimulator:
             if position is None and row.get("buy_signal"):
                 # volume-spike filter: if enabled, skip entries when current volume is anomalously high
                 try:
-                    if strategy_parameters.get("enable_volume_spike_filter"):
-                        thresh = float(strategy_parameters.get("vol_spike_threshold", 5.0))
+                    if cfg.volume_spike_filter:
                         vol_mult = float(row.get("vol_mult") or 0.0)
-                        if vol_mult and vol_mult >= thresh:
+                        if vol_mult and vol_mult >= cfg.vol_spike_threshold:
                             # skip this entry (treat as no signal)
                             continue
                 except Exception:
@@ -137,52 +638,22 @@ class StrategySimulator:
                     pass
                 # Enter long at market price (apply slippage)
                 entry_price = price
-                entry_price_effective = entry_price * (1 + slippage_pct)
-                # determine sizing (units) based on policy
-                balance_for_sizing = initial_balance if no_compounding else balance
-                units = None
-                if position_size_policy and isinstance(position_size_policy, dict):
-                    method = position_size_policy.get("method", "capital_fraction")
-                    val = float(position_size_policy.get("value", 1.0))
-                    if method == "capital_fraction":
-                        # allocate val fraction of equity as position notional
-                        notional = balance_for_sizing * val
-                        # compute exposure = notional * leverage, then derive units = exposure / price
-                        # This keeps leverage application explicit and avoids double-counting.
-                        exposure = notional * leverage
-                        units = (exposure) / entry_price_effective if entry_price_effective > 0 else 0.0
-                    elif method == "risk_per_trade":
-                        # val is fraction of capital to risk (e.g., 0.01 for 1%)
-                        risk_amount = balance_for_sizing * val
-                        # units such that if price moves by stop_loss_pct, loss equals risk_amount: units = risk_amount / (stop_loss_pct * entry_price_effective)
-                        sl = stop_loss_pct if stop_loss_pct > 0 else 0.001
-                        units = risk_amount / (sl * entry_price_effective) if (sl * entry_price_effective) > 0 else 0.0
-                    else:
-                        # fallback: treat as fraction
-                        notional = balance_for_sizing * float(position_size_policy.get("value", 1.0))
-                        units = (notional * leverage) / entry_price_effective if entry_price_effective > 0 else 0.0
-                else:
-                    # legacy numeric units or default full unit
-                    try:
-                        units = float(position_size_raw) if position_size_raw is not None else 1.0
-                    except Exception:
-                        units = 1.0
-
-                entry_fee = entry_price_effective * units * fee_pct
+                entry_price_effective = entry_price * (1 + cfg.slippage_pct)
+                balance_for_sizing = initial_balance if cfg.no_compounding else balance
+                units = cfg.entry_units(balance_for_sizing, entry_price_effective, leverage)
                 position = {
                     "entry_price": entry_price,
                     "entry_price_effective": entry_price_effective,
-                    "entry_fee": entry_fee,
+                    "entry_fee": entry_price_effective * units * cfg.fee_pct,
                     "entry_index": idx,
                     "highest_price": entry_price,
-                    "tp_price": (entry_price * (1 + take_profit_pct)) if take_profit_pct > 0 else None,
-                    "trailing_stop_pct": trailing_stop_pct,
+                    "tp_price": (entry_price * (1 + cfg.take_profit_pct)) if cfg.take_profit_pct > 0 else None,
+                    "trailing_stop_pct": cfg.trailing_stop_pct,
                     "stop_loss_pct": stop_loss_pct,
                     "units": units,
                 }
 
             elif position is not None:
-                exit_price = None
                 exit_reason = None
 
                 # update highest price for trailing stop
@@ -191,117 +662,66 @@ class StrategySimulator:
 
                 # 1) Take profit check
                 if position.get("tp_price") is not None and price >= position.get("tp_price"):
-                    exit_price = price
                     exit_reason = "TP"
                 # 2) Trailing stop check
                 elif position.get("trailing_stop_pct", 0) > 0 and price <= position["highest_price"] * (1 - position.get("trailing_stop_pct")):
-                    exit_price = price
                     exit_reason = "TRAIL"
                 # 3) Stop loss check
                 elif price <= position["entry_price"] * (1 - position.get("stop_loss_pct", stop_loss_pct)):
-                    exit_price = price
                     exit_reason = "SL"
                 # 4) Signal-based close
                 elif row.get("sell_signal"):
-                    exit_price = price
                     exit_reason = "SELL"
 
-                if exit_price is not None:
-                    # apply slippage and fees on exit
-                    exit_price_effective = exit_price * (1 - slippage_pct)
-                    units = position.get("units", 0.0)
-                    exit_fee = exit_price_effective * units * fee_pct
-                    # gross_pnl computed from price difference * units. 'units' already reflects leveraged exposure.
-                    gross_pnl = (exit_price_effective - position["entry_price_effective"]) * units
-                    net_pnl = gross_pnl - (position.get("entry_fee", 0.0) + exit_fee)
-                    balance += net_pnl
-                    trades.append({
-                        "entry_price": position["entry_price"],
-                        "exit_price": exit_price,
-                        "entry_price_effective": position.get("entry_price_effective"),
-                        "exit_price_effective": exit_price_effective,
-                        "entry_fee": position.get("entry_fee", 0.0),
-                        "exit_fee": exit_fee,
-                        "gross_pnl": gross_pnl,
-                        "net_pnl": net_pnl,
-                        "exit_reason": exit_reason,
-                        "entry_index": position.get("entry_index"),
-                        "exit_index": idx,
-                    })
+                if exit_reason is not None:
+                    trade = self._trade(position, price, exit_reason, idx, cfg)
+                    balance += trade["net_pnl"]
+                    trades.append(trade)
                     # do not append here; we'll append per-bar equity below for consistent equity curve
                     position = None
 
             # append current equity for this bar (include unrealized PnL if position open)
-            try:
-                if position is not None:
-                    units = position.get('units', 0.0)
-                    unreal = (price - position.get('entry_price_effective', position.get('entry_price', 0.0))) * units * leverage
-                    equity = balance + unreal - position.get('entry_fee', 0.0)
-                else:
-                    equity = balance
-                balance_history.append(equity)
-                # early-stop: if configured and equity falls below threshold, abort to save time
-                try:
-                    if early_stop_frac and initial_balance and equity <= (initial_balance * early_stop_frac):
-                        aborted_early = True
-                        break
-                except Exception:
-                    pass
-            except Exception:
-                balance_history.append(balance)
+            if position is not None:
+                units = position.get('units', 0.0)
+                unreal = (price - position.get('entry_price_effective', position.get('entry_price', 0.0))) * units * leverage
+                equity = balance + unreal - position.get('entry_fee', 0.0)
+            else:
+                equity = balance
+            balance_history.append(equity)
+            # early-stop: if configured and equity falls below threshold, abort to save time
+            if cfg.early_stop_frac and initial_balance and equity <= (initial_balance * cfg.early_stop_frac):
+                aborted_early = True
+                break
 
         # close open position at last price
         if position is not None:
-            last_price = float(df2.iloc[-1]["close"])
-            exit_price = last_price
-            exit_price_effective = exit_price * (1 - slippage_pct)
-            units = position.get("units", 0.0)
-            exit_fee = exit_price_effective * units * fee_pct
-            # gross_pnl computed from price difference * units. 'units' already reflects leveraged exposure.
-            gross_pnl = (exit_price_effective - position["entry_price_effective"]) * units
-            net_pnl = gross_pnl - (position.get("entry_fee", 0.0) + exit_fee)
-            balance += net_pnl
-            trades.append({
-                "entry_price": position["entry_price"],
-                "exit_price": exit_price,
-                "entry_price_effective": position.get("entry_price_effective"),
-                "exit_price_effective": exit_price_effective,
-                "entry_fee": position.get("entry_fee", 0.0),
-                "exit_fee": exit_fee,
-                "gross_pnl": gross_pnl,
-                "net_pnl": net_pnl,
-                "exit_reason": "LAST",
-                "entry_index": position.get("entry_index"),
-                "exit_index": df2.index[-1],
-            })
+            trade = self._trade(position, float(df2.iloc[-1]["close"]), "LAST", df2.index[-1], cfg)
+            balance += trade["net_pnl"]
+            trades.append(trade)
             # append final balance to equity curve
             balance_history.append(balance)
 
+        return balance, trades, np.asarray(balance_history, dtype=np.float64), aborted_early
+
+    @staticmethod
+    def _summarize(initial_balance: float, balance: float, trades: List[Dict[str, Any]], equity: np.ndarray,
+                   aborted_early: bool, cfg: _ExecutionConfig) -> Dict[str, Any]:
         # mark insufficient trades if below threshold
         total_trades = len(trades)
-        insufficient_trades = False
-        if min_trades_required and total_trades < min_trades_required:
-            insufficient_trades = True
+        insufficient_trades = bool(cfg.min_trades_required and total_trades < cfg.min_trades_required)
         profit = balance - initial_balance
         profit_pct = (profit / initial_balance) * 100 if initial_balance else 0.0
         wins = [t for t in trades if t.get("net_pnl", 0) > 0]
         win_rate = (len(wins) / total_trades) * 100 if total_trades else 0.0
 
-        # compute max drawdown from balance history
-        try:
-            peak = -math.inf
-            max_dd = 0.0
-            for b in balance_history:
-                if b > peak:
-                    peak = b
-                dd = (peak - b) / peak if peak and peak > 0 else 0.0
-                if dd > max_dd:
-                    max_dd = dd
-            max_drawdown_pct = max_dd * 100
-        except Exception:
-            max_drawdown_pct = 0.0
+        # compute max drawdown from the equity curve (running peak, positive peaks only)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            peak = np.fmax.accumulate(equity)
+            dd = np.where(peak > 0, (peak - equity) / peak, 0.0)
+        dd = dd[~np.isnan(dd)]
+        max_drawdown_pct = max(float(dd.max()), 0.0) * 100 if len(dd) else 0.0
 
-        results = {
+        return {
             "initial_balance": initial_balance,
             "final_balance": balance,
             "profit": profit,
@@ -310,9 +730,8 @@ class StrategySimulator:
             "win_rate": win_rate,
             "max_drawdown_pct": max_drawdown_pct,
             "trades": trades,
+            "equity_curve": equity,
             "aborted_early": aborted_early,
             "insufficient_trades": insufficient_trades,
-            "min_trades_required": min_trades_required,
+            "min_trades_required": cfg.min_trades_required,
         }
-
-        return results
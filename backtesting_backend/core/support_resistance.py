@@ -0,0 +1,139 @@
+"""Rolling support/resistance levels.
+
+Incremental equivalent of ``StrategyAnalyzer.identify_support_resistance``
+evaluated on every prefix ``df.iloc[:t+1]``: instead of re-slicing and
+re-scanning the lookback window per bar, pivot levels enter and leave a
+sorted multiset as the window slides.
+"""
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class _SortedLevels:
+    """Distinct rounded levels (ascending) with multiplicities."""
+
+    def __init__(self):
+        self.values: List[float] = []
+        self._counts: Dict[float, int] = {}
+
+    def add(self, value: float) -> None:
+        count = self._counts.get(value, 0)
+        if count == 0:
+            insort(self.values, value)
+        self._counts[value] = count + 1
+
+    def remove(self, value: float) -> None:
+        count = self._counts[value] - 1
+        if count == 0:
+            del self._counts[value]
+            del self.values[bisect_left(self.values, value)]
+        else:
+            self._counts[value] = count
+
+
+class RollingSupportResistance:
+    """Support/resistance levels over a sliding lookback window, one bar at a time.
+
+    A bar is a resistance pivot when its high rose for two consecutive bars and a
+    support pivot when its low fell for two consecutive bars; a pivot counts while
+    it and the two bars before it are inside the window. Each ``update`` costs a
+    binary search per pivot entering/leaving the window plus O(num_levels) for the
+    nearest levels around the close.
+    """
+
+    def __init__(self, lookback_period: int = 50, num_levels: int = 3):
+        self.lookback_period = int(lookback_period)
+        self.num_levels = int(num_levels)
+        self._bars = 0
+        self._highs: Deque[float] = deque(maxlen=2)
+        self._lows: Deque[float] = deque(maxlen=2)
+        self._pivots: Deque[Tuple[int, Optional[float], Optional[float]]] = deque()  # (bar, resistance, support)
+        self._resistances = _SortedLevels()
+        self._supports = _SortedLevels()
+
+    def update(self, high: float, low: float, close: float) -> Tuple[List[float], List[float]]:
+        """Add the next bar and return (supports, resistances) as of that bar."""
+        t = self._bars
+        self._bars += 1
+        resistance = support = None
+        if len(self._highs) == 2:
+            h2, h1 = self._highs
+            l2, l1 = self._lows
+            if high > h1 and h1 > h2:
+                resistance = round(float(high), 6)
+                self._resistances.add(resistance)
+            if low < l1 and l1 < l2:
+                support = round(float(low), 6)
+                self._supports.add(support)
+            if resistance is not None or support is not None:
+                self._pivots.append((t, resistance, support))
+        self._highs.append(high)
+        self._lows.append(low)
+
+        # pivots need their two preceding bars inside the window
+        oldest = t - self.lookback_period + 3
+        while self._pivots and self._pivots[0][0] < oldest:
+            _, r, s = self._pivots.popleft()
+            if r is not None:
+                self._resistances.remove(r)
+            if s is not None:
+                self._supports.remove(s)
+
+        if self._bars < 3 or self.lookback_period <= 0:
+            return [], []
+        return self._levels(float(high), float(low), float(close))
+
+    def _levels(self, high: float, low: float, close: float) -> Tuple[List[float], List[float]]:
+        n = self.num_levels
+        sup = self._supports.values
+        res = self._resistances.values
+        i = bisect_left(sup, close)
+        j = bisect_right(res, close)
+        supports_final = sup[max(0, i - n):i][::-1] if n > 0 else []
+        resistances_final = res[j:j + n] if n > 0 else []
+
+        # pivot-based extras
+        pivot = (high + low + close) / 3.0
+        r1 = (2 * pivot) - low
+        s1 = (2 * pivot) - high
+        r2 = pivot + (high - low)
+        s2 = pivot - (high - low)
+        supports_final = supports_final + [round(s1, 6), round(s2, 6)]
+        resistances_final = resistances_final + [round(r1, 6), round(r2, 6)]
+
+        # final dedupe and size limit
+        limit = max(n + 2, 0)
+        supports_set = sorted(set(round(s, 6) for s in supports_final), reverse=True)[:limit]
+        resistances_set = sorted(set(round(r, 6) for r in resistances_final))[:limit]
+        return supports_set, resistances_set
+
+
+def rolling_support_resistance(df: pd.DataFrame, lookback_period: int = 50,
+                               num_levels: int = 3) -> List[Tuple[List[float], List[float]]]:
+    """Levels for every bar of df, equal to identify_support_resistance(df.iloc[:t+1]) per bar."""
+    close = df["close"].to_numpy(dtype=np.float64)
+    high = df["high"].to_numpy(dtype=np.float64) if "high" in df.columns else close
+    low = df["low"].to_numpy(dtype=np.float64) if "low" in df.columns else close
+    rolling = RollingSupportResistance(lookback_period, num_levels)
+    return [rolling.update(h, l, c) for h, l, c in zip(high.tolist(), low.tolist(), close.tolist())]
+
+
+def sr_proximity_flags(df: pd.DataFrame, lookback_period: int = 50, num_levels: int = 3,
+                       proximity: float = 0.001) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-bar (near_support, near_resistance) flags: close within `proximity` (relative) of a level."""
+    n = len(df)
+    width = max(int(num_levels) + 2, 1)
+    supports = np.full((n, width), np.nan)
+    resistances = np.full((n, width), np.nan)
+    for t, (sup, res) in enumerate(rolling_support_resistance(df, lookback_period, num_levels)):
+        supports[t, :len(sup)] = sup
+        resistances[t, :len(res)] = res
+    price = df["close"].to_numpy(dtype=np.float64)[:, None]
+    with np.errstate(invalid="ignore"):
+        near_support = (np.abs(price - supports) / np.maximum(1e-9, np.abs(supports)) <= proximity).any(axis=1)
+        near_resistance = (np.abs(price - resistances) / np.maximum(1e-9, np.abs(resistances)) <= proximity).any(axis=1)
+    return near_support, near_resistance
@@ -1,7 +1,17 @@
-from typing import Dict, Any, Iterable, Callable, List, Tuple
+from typing import Dict, Any, Hashable, Iterable, Callable, List, Optional, Sequence, Tuple
 import itertools
+import math
+import logging
+import pickle
+import threading
 from multiprocessing.pool import ThreadPool
 
+import pandas as pd
+
+from backtesting_backend.optimizers.process_pool import ProcessGridExecutor
+
+logger = logging.getLogger(__name__)
+
 
 class GridSearch:
     """Simple grid search optimizer.
@@ -11,6 +21,19 @@ class GridSearch:
         best_params, best_score = gs.search(objective_fn, max_workers=4)
 
     The `objective_fn` should accept a single dict of params and return a numeric score (higher is better).
+
+    With ``executor="process"`` combos are evaluated in worker processes (see
+    ``ProcessGridExecutor``); pass the market DataFrame as ``data`` to publish it
+    once through shared memory, in which case the objective is called as
+    ``objective_fn(params, data)`` in either executor. ``cancel()`` stops a
+    running search; combos not evaluated by then are left out of the results.
+
+    ``stage_key`` maps a combo to a tuple of keys of the work it shares with
+    other combos (e.g. ``staged_simulation.stage_key``: indicator config, then
+    signal config). Combos with the same first key are dispatched together as
+    one chunk, ordered by the remaining keys, so an objective that caches its
+    last stage results computes each distinct stage once per chunk. A group is
+    split only when it is larger than an even share of the grid per worker.
     """
 
     def __init__(self, param_grid: Dict[str, Iterable[Any]]):
@@ -20,26 +43,90 @@ class GridSearch:
         values = [list(param_grid[k]) for k in keys]
         self._keys = keys
         self._combos = [dict(zip(keys, prod)) for prod in itertools.product(*values)]
+        self._cancel = threading.Event()
+
+    def cancel(self) -> None:
+        """Stop a running search (safe to call from another thread)."""
+        self._cancel.set()
 
-    def search(self, objective_fn: Callable[[Dict[str, Any]], float], max_workers: int = 1, timeout: float | None = None) -> Tuple[Dict[str, Any], float, List[Tuple[Dict[str, Any], float]]]:
+    def search(self, objective_fn: Callable[..., float], max_workers: int = 1, timeout: float | None = None,
+               executor: str = "thread", data: Optional[pd.DataFrame] = None, chunksize: Optional[int] = None,
+               task_timeout: Optional[float] = None,
+               stage_key: Optional[Callable[[Dict[str, Any]], Tuple[Hashable, ...]]] = None,
+               ) -> Tuple[Dict[str, Any], float, List[Tuple[Dict[str, Any], float]]]:
+        self._cancel.clear()
         results: List[Tuple[Dict[str, Any], float]] = []
+        chunks = None
+        if stage_key is not None:
+            workers = max_workers if max_workers and max_workers > 1 else 1
+            chunks = self._plan(stage_key, chunksize or max(1, math.ceil(len(self._combos) / workers)))
+
+        if executor == "process" and max_workers and max_workers > 1 and not self._picklable(objective_fn):
+            logger.warning("GridSearch objective is not picklable; evaluating with threads instead")
+            executor = "thread"
 
         def _eval(p):
+            if self._cancel.is_set():
+                return None
             try:
-                score = float(objective_fn(p))
+                score = float(objective_fn(p, data) if data is not None else objective_fn(p))
             except Exception:
                 score = float("-inf")
             return (p, score)
 
-        if max_workers and max_workers > 1:
+        def _eval_chunk(idxs):
+            items = []
+            for i in idxs:
+                item = _eval(self._combos[i])
+                if item is None:
+                    break
+                items.append(item)
+            return items
+
+        if executor == "process" and max_workers and max_workers > 1:
+            pool = ProcessGridExecutor(max_workers, chunksize=chunksize, task_timeout=task_timeout)
+            for idx, score in pool.map(objective_fn, self._combos, data=data, timeout=timeout,
+                                       cancel_event=self._cancel, chunks=chunks):
+                results.append((self._combos[idx], score))
+        elif max_workers and max_workers > 1 and chunks is not None:
+            with ThreadPool(processes=max_workers) as pool:
+                for items in pool.imap_unordered(_eval_chunk, chunks):
+                    results.extend(items)
+        elif max_workers and max_workers > 1:
             with ThreadPool(processes=max_workers) as pool:
-                for p, s in pool.imap_unordered(_eval, self._combos):
-                    results.append((p, s))
+                for item in pool.imap_unordered(_eval, self._combos, chunksize or 1):
+                    if item is not None:
+                        results.append(item)
         else:
-            for combo in self._combos:
-                results.append(_eval(combo))
+            order = [i for idxs in chunks for i in idxs] if chunks is not None else range(len(self._combos))
+            for combo in (self._combos[i] for i in order):
+                item = _eval(combo)
+                if item is None:
+                    break
+                results.append(item)
 
         # sort by score desc
         results.sort(key=lambda x: x[1], reverse=True)
         best = results[0] if results else ({}, float("-inf"))
         return best[0], best[1], results
+
+    def _plan(self, stage_key: Callable[[Dict[str, Any]], Tuple[Hashable, ...]],
+              max_chunk: int) -> List[List[int]]:
+        """Combo indices grouped by the first stage key and ordered by the rest (first-seen order)."""
+        groups: Dict[Hashable, Dict[Tuple[Hashable, ...], List[int]]] = {}
+        for i, combo in enumerate(self._combos):
+            first, *rest = stage_key(combo)
+            groups.setdefault(first, {}).setdefault(tuple(rest), []).append(i)
+        chunks: List[List[int]] = []
+        for sub in groups.values():
+            order = [i for idxs in sub.values() for i in idxs]
+            chunks.extend(order[s:s + max_chunk] for s in range(0, len(order), max_chunk))
+        return chunks
+
+    @staticmethod
+    def _picklable(fn: Callable) -> bool:
+        try:
+            pickle.dumps(fn)
+            return True
+        except Exception:
+            return False
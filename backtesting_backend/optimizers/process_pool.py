@@ -0,0 +1,276 @@
+"""Process-based evaluation of optimizer tasks over shared market data.
+
+The market DataFrame is published once into a ``multiprocessing.shared_memory``
+block; each worker process attaches to it when it starts and receives the
+objective once, so a task costs only its params dict on the wire. Tasks are
+dispatched in chunks; a task that exceeds ``task_timeout`` or a worker that
+dies scores ``-inf`` and its worker is replaced, and the whole run can be
+cancelled through an event or stopped by an overall deadline.
+"""
+import logging
+import math
+import multiprocessing as mp
+import time
+from collections import deque
+from dataclasses import dataclass
+from multiprocessing.connection import wait
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+# dtype kinds that can be published (bool, ints, floats, complex, datetime64/timedelta64)
+_SHAREABLE_KINDS = "biufcmM"
+_ALIGN = 64
+# upper bound on how long the dispatcher blocks without checking cancellation
+_POLL_SEC = 0.1
+
+
+@dataclass(frozen=True)
+class SharedFrameHandle:
+    """Picklable description of a SharedFrame: segment name plus column layout."""
+    name: str
+    nrows: int
+    columns: Tuple[Tuple[str, str, int], ...]  # (column, dtype.str, byte offset)
+    index: Optional[Tuple[str, int]] = None    # (dtype.str, byte offset); None means RangeIndex
+
+
+class SharedFrame:
+    """A DataFrame's numeric columns copied once into a shared memory segment.
+
+    Non-numeric columns (e.g. symbol/interval strings from the ORM rows) are not
+    published; a non-default numeric index is kept. The owner must ``close()``
+    (or use it as a context manager) to unlink the segment.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        arrays: List[Tuple[str, np.ndarray]] = []
+        skipped = []
+        for col in df.columns:
+            arr = df[col].to_numpy()
+            if arr.dtype.kind in _SHAREABLE_KINDS:
+                arrays.append((col, np.ascontiguousarray(arr)))
+            else:
+                skipped.append(col)
+        if skipped:
+            logger.debug("SharedFrame: skipping non-numeric columns %s", skipped)
+
+        index_arr = None
+        if not (isinstance(df.index, pd.RangeIndex) and df.index.start == 0 and df.index.step == 1):
+            candidate = df.index.to_numpy()
+            if candidate.dtype.kind in _SHAREABLE_KINDS:
+                index_arr = np.ascontiguousarray(candidate)
+
+        layout = []
+        offset = 0
+        for col, arr in arrays:
+            layout.append((col, arr, offset))
+            offset += -(-arr.nbytes // _ALIGN) * _ALIGN
+        index_offset = offset
+        if index_arr is not None:
+            offset += index_arr.nbytes
+
+        self._shm = SharedMemory(create=True, size=max(offset, 1))
+        for col, arr, off in layout:
+            np.ndarray(arr.shape, arr.dtype, buffer=self._shm.buf, offset=off)[:] = arr
+        if index_arr is not None:
+            np.ndarray(index_arr.shape, index_arr.dtype, buffer=self._shm.buf, offset=index_offset)[:] = index_arr
+
+        self.handle = SharedFrameHandle(
+            name=self._shm.name,
+            nrows=len(df),
+            columns=tuple((col, arr.dtype.str, off) for col, arr, off in layout),
+            index=(index_arr.dtype.str, index_offset) if index_arr is not None else None,
+        )
+
+    def close(self) -> None:
+        if self._shm is None:
+            return
+        self._shm.close()
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+        self._shm = None
+
+    def __enter__(self) -> "SharedFrame":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def attach_frame(handle: SharedFrameHandle) -> Tuple[pd.DataFrame, SharedMemory]:
+    """Open a published frame; columns are read-only views of the shared segment.
+
+    The returned SharedMemory must stay referenced (and be closed) by the caller
+    for as long as the DataFrame is in use.
+    """
+    shm = SharedMemory(name=handle.name)
+    columns = {}
+    for col, dtype, off in handle.columns:
+        arr = np.ndarray((handle.nrows,), np.dtype(dtype), buffer=shm.buf, offset=off)
+        arr.flags.writeable = False
+        columns[col] = arr
+    index = None
+    if handle.index is not None:
+        dtype, off = handle.index
+        index = np.ndarray((handle.nrows,), np.dtype(dtype), buffer=shm.buf, offset=off)
+    df = pd.DataFrame(columns, index=index, copy=False)
+    return df, shm
+
+
+def _worker_main(conn, objective_fn: Callable, handle: Optional[SharedFrameHandle]) -> None:
+    """Worker loop: receive chunks of (task_id, params), reply (task_id, score) per task."""
+    shm = None
+    data = None
+    if handle is not None:
+        data, shm = attach_frame(handle)
+    try:
+        while True:
+            try:
+                chunk = conn.recv()
+            except EOFError:
+                break
+            if chunk is None:
+                break
+            for task_id, params in chunk:
+                try:
+                    score = float(objective_fn(params, data) if handle is not None else objective_fn(params))
+                except Exception:
+                    score = float("-inf")
+                conn.send((task_id, score))
+    finally:
+        del data
+        if shm is not None:
+            shm.close()
+
+
+class _Worker:
+    def __init__(self, ctx, objective_fn: Callable, handle: Optional[SharedFrameHandle]):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main, args=(child_conn, objective_fn, handle), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.outstanding: Deque[int] = deque()  # task ids of the current chunk not yet answered
+        self.task_started = 0.0
+
+    def assign(self, chunk: List[Tuple[int, Dict[str, Any]]]) -> None:
+        self.outstanding.extend(task_id for task_id, _ in chunk)
+        self.task_started = time.monotonic()
+        self.conn.send(chunk)
+
+    def stop(self, graceful: bool) -> None:
+        if graceful and self.process.is_alive():
+            try:
+                self.conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            self.process.join(timeout=1.0)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout=1.0)
+        self.conn.close()
+
+
+class ProcessGridExecutor:
+    """Evaluate ``objective_fn`` over many params dicts in worker processes.
+
+    ``objective_fn`` must be picklable (a module-level function or a
+    functools.partial of one). When ``data`` is given it is published as a
+    SharedFrame and the objective is called as ``objective_fn(params, df)``;
+    otherwise as ``objective_fn(params)``.
+    """
+
+    def __init__(self, max_workers: int, chunksize: Optional[int] = None,
+                 task_timeout: Optional[float] = None, mp_context: Optional[str] = "spawn"):
+        self.max_workers = max(1, int(max_workers))
+        self.chunksize = chunksize
+        self.task_timeout = task_timeout
+        self._ctx = mp.get_context(mp_context)
+
+    def map(self, objective_fn: Callable, tasks: Sequence[Dict[str, Any]], data: Optional[pd.DataFrame] = None,
+            timeout: Optional[float] = None, cancel_event=None,
+            chunks: Optional[Sequence[Sequence[int]]] = None) -> Iterator[Tuple[int, float]]:
+        """Yield (task index, score) as tasks complete.
+
+        ``chunks`` (lists of task indices covering every task once) overrides
+        ``chunksize``; each chunk runs on one worker in the given order.
+        Stops early (without yielding the remaining tasks) when ``cancel_event``
+        is set or ``timeout`` seconds have passed.
+        """
+        if not tasks:
+            return
+        if chunks is None:
+            chunksize = self.chunksize or max(1, math.ceil(len(tasks) / (self.max_workers * 4)))
+            chunks = [range(start, min(start + chunksize, len(tasks))) for start in range(0, len(tasks), chunksize)]
+        pending: Deque[List[Tuple[int, Dict[str, Any]]]] = deque(
+            [(i, tasks[i]) for i in chunk] for chunk in chunks if len(chunk)
+        )
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        shared = SharedFrame(data) if data is not None else None
+        handle = shared.handle if shared is not None else None
+        workers: List[_Worker] = []
+        remaining = len(tasks)
+        stopped = False
+        try:
+            workers = [_Worker(self._ctx, objective_fn, handle)
+                       for _ in range(min(self.max_workers, len(pending)))]
+            while remaining:
+                if cancel_event is not None and cancel_event.is_set():
+                    logger.info("Grid evaluation cancelled with %d task(s) left", remaining)
+                    stopped = True
+                    return
+                now = time.monotonic()
+                if deadline is not None and now >= deadline:
+                    logger.warning("Grid evaluation timed out with %d task(s) left", remaining)
+                    stopped = True
+                    return
+
+                for w in workers:
+                    if not w.outstanding and pending:
+                        w.assign(pending.popleft())
+
+                busy = [w for w in workers if w.outstanding]
+                wait_for = _POLL_SEC
+                if deadline is not None:
+                    wait_for = min(wait_for, max(0.0, deadline - now))
+                if self.task_timeout is not None and busy:
+                    next_expiry = min(w.task_started for w in busy) + self.task_timeout
+                    wait_for = min(wait_for, max(0.0, next_expiry - now))
+                ready = wait([w.conn for w in busy] + [w.process.sentinel for w in busy], timeout=wait_for)
+
+                for w in list(busy):
+                    if w.conn in ready:
+                        try:
+                            while w.conn.poll():
+                                task_id, score = w.conn.recv()
+                                w.outstanding.remove(task_id)
+                                w.task_started = time.monotonic()
+                                remaining -= 1
+                                yield task_id, score
+                        except (EOFError, OSError):
+                            pass
+                    expired = (self.task_timeout is not None and w.outstanding
+                               and time.monotonic() - w.task_started >= self.task_timeout)
+                    if w.outstanding and (expired or not w.process.is_alive()):
+                        # the task in progress is lost with its worker; requeue the rest of the chunk
+                        lost = w.outstanding.popleft()
+                        reason = "timed out" if expired else "crashed"
+                        logger.warning("Grid task %d %s; restarting worker", lost, reason)
+                        if w.outstanding:
+                            pending.appendleft([(i, tasks[i]) for i in w.outstanding])
+                        w.outstanding.clear()
+                        w.stop(graceful=False)
+                        workers[workers.index(w)] = _Worker(self._ctx, objective_fn, handle)
+                        remaining -= 1
+                        yield lost, float("-inf")
+        finally:
+            for w in workers:
+                w.stop(graceful=not stopped)
+            if shared is not None:
+                shared.close()
@@ -0,0 +1,79 @@
+"""Grid evaluation that shares indicator and signal frames between combos.
+
+A simulation is a three-stage pipeline: indicators (depend on INDICATOR_PARAMS),
+signals (additionally on SIGNAL_PARAMS) and the bar loop (exit/sizing params).
+``stage_key`` maps a params dict to its (indicator, signal) keys; GridSearch
+uses it to dispatch each indicator configuration as one chunk with its combos
+ordered by signal configuration, and ``StagedSimulation`` keeps the current
+indicator and signal frames, so within a chunk each distinct configuration is
+computed once and only the bar loop runs per combo.
+"""
+import threading
+from typing import Any, Dict, Hashable, Tuple
+
+import pandas as pd
+
+from backtesting_backend.core.strategy_simulator import INDICATOR_PARAMS, SIGNAL_PARAMS, StrategySimulator
+
+_MISSING = object()
+
+
+def _freeze(value: Any) -> Hashable:
+    """Hashable form of a parameter value (lists/dicts from JSON requests)."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
+
+def stage_key(params: Dict[str, Any]) -> Tuple[Hashable, Hashable]:
+    """(indicator key, signal key) of a params dict; the signal key includes the indicator key.
+
+    An absent parameter is keyed apart from an explicit default, so two combos
+    share a stage only when the stage reads identical inputs.
+    """
+    ind = tuple(_freeze(params.get(k, _MISSING)) for k in INDICATOR_PARAMS)
+    sig = ind + tuple(_freeze(params.get(k, _MISSING)) for k in SIGNAL_PARAMS)
+    return ind, sig
+
+
+class StagedSimulation:
+    """``run_simulation`` with the indicator and signal frames of the previous call reused.
+
+    The cache holds one frame per stage (per thread), keyed by the source frame
+    and the stage key, so callers should evaluate combos grouped by ``stage_key``.
+    Pickling drops the cache, so a copy sent to a worker process starts empty.
+    """
+
+    def __init__(self, simulator: StrategySimulator | None = None):
+        self.simulator = simulator or StrategySimulator()
+        self._local = threading.local()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"simulator": self.simulator}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.simulator = state["simulator"]
+        self._local = threading.local()
+
+    def prepared_frame(self, df: pd.DataFrame, params: Dict[str, Any]) -> pd.DataFrame:
+        """Same frame as ``StrategySimulator._prepare_frame(df, params)``, from cache when possible."""
+        local = self._local
+        ind_key, sig_key = stage_key(params)
+        if getattr(local, "source", None) is not df or local.ind_key != ind_key:
+            local.source = local.ind_key = local.sig_key = local.ind_frame = local.sig_frame = None
+            local.ind_frame = self.simulator._indicator_frame(df, params)
+            # holding `df` keeps its identity from being reused by another frame
+            local.source, local.ind_key = df, ind_key
+        if local.sig_key != sig_key:
+            local.sig_key = local.sig_frame = None
+            local.sig_frame = self.simulator._signal_frame(local.ind_frame, params)
+            local.sig_key = sig_key
+        return local.sig_frame
+
+    def run_simulation(self, symbol: str, interval: str, df: pd.DataFrame, initial_balance: float,
+                       leverage: int, strategy_parameters: Dict[str, Any]) -> Dict[str, Any]:
+        df2 = self.prepared_frame(df, strategy_parameters)
+        return self.simulator.run_prepared(df2, initial_balance, leverage, strategy_parameters)
+
@@ -53,46 +53,48 @@ def main():
     os.makedirs(out_dir, exist_ok=True)
     out_csv = os.path.join(out_dir, f"{symbol.lower()}_grid_search.csv")
 
+    # stop loss / size / take profit only change exits: sweep them together per volume_spike_factor
+    exit_sets = [{'stop_loss_pct': sl, 'position_size': ps, 'take_profit_pct': tp}
+                 for sl in stop_losses for ps in position_sizes for tp in take_profits]
+    rows = {}
+    for vsf in volume_spike_factors:
+        params = {
+            'fast_ema_period': 3,
+            'slow_ema_period': 5,
+            'enable_volume_momentum': True,
+            'enable_sr_detection': True,
+            'enable_sr_filter': True,
+            'volume_spike_factor': vsf,
+            'volume_avg_period': 20,
+        }
+        try:
+            table = sim.run_exit_sweep(symbol, interval, df, initial_balance=1000.0, leverage=1,
+                                       strategy_parameters=params, exit_param_sets=exit_sets)
+            records = table.to_dict(orient='records')
+        except Exception:
+            records = [dict(p) for p in exit_sets]
+        for res in records:
+            rows[(res['stop_loss_pct'], res['position_size'], res['take_profit_pct'], vsf)] = {
+                'stop_loss_pct': res['stop_loss_pct'],
+                'position_size': res['position_size'],
+                'take_profit_pct': res['take_profit_pct'],
+                'volume_spike_factor': vsf,
+                'profit': res.get('profit'),
+                'profit_pct': res.get('profit_percentage'),
+                'total_trades': res.get('total_trades'),
+                'win_rate': res.get('win_rate'),
+                'max_drawdown_pct': res.get('max_drawdown_pct'),
+            }
+
     with open(out_csv, 'w', newline='', encoding='utf-8') as fh:
         fieldnames = ['stop_loss_pct','position_size','take_profit_pct','volume_spike_factor','profit','profit_pct','total_trades','win_rate','max_drawdown_pct']
         writer = csv.DictWriter(fh, fieldnames=fieldnames)
         writer.writeheader()
-
-        total = 0
         for sl in stop_losses:
             for ps in position_sizes:
                 for tp in take_profits:
                     for vsf in volume_spike_factors:
-                        params = {
-                            'fast_ema_period': 3,
-                            'slow_ema_period': 5,
-                            'enable_volume_momentum': True,
-                            'enable_sr_detection': True,
-                            'enable_sr_filter': True,
-                            'stop_loss_pct': sl,
-                            'take_profit_pct': tp,
-                            'position_size': ps,
-                            'volume_spike_factor': vsf,
-                            'volume_avg_period': 20,
-                        }
-                        try:
-                            res = sim.run_simulation(symbol, interval, df.copy(), initial_balance=1000.0, leverage=1, strategy_parameters=params)
-                            row = {
-                                'stop_loss_pct': sl,
-                                'position_size': ps,
-                                'take_profit_pct': tp,
-                                'volume_spike_factor': vsf,
-                                'profit': res.get('profit', 0.0),
-                                'profit_pct': res.get('profit_percentage', 0.0),
-                                'total_trades': res.get('total_trades', 0),
-                                'win_rate': res.get('win_rate', 0.0),
-                                'max_drawdown_pct': res.get('max_drawdown_pct', 0.0),
-                            }
-                        except Exception as e:
-                            row = {'stop_loss_pct': sl,'position_size': ps,'take_profit_pct': tp,'volume_spike_factor': vsf,'profit': None,'profit_pct': None,'total_trades': None,'win_rate': None,'max_drawdown_pct': None}
-                        writer.writerow(row)
-                        fh.flush()
-                        total += 1
+                        writer.writerow(rows[(sl, ps, tp, vsf)])
         print('Grid search finished, wrote', out_csv)
 
 if __name__ == '__main__':
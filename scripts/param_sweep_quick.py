@@ -44,13 +44,11 @@ def load_candidates(wf_csv, max_candidates=3):
     return rows[:max_candidates]
 
 
-def run_sim(symbol, interval, df_market, params, slippage, fee):
+def run_sweep(symbol, interval, df_market, params, exit_sets):
+    """All exit/sizing sets over the candidate's signals in one StrategySimulator pass."""
     sim = StrategySimulator()
-    p = dict(params)
-    p['slippage_pct'] = slippage
-    p['fee_pct'] = fee
-    res = sim.run_simulation(symbol, interval, df_market.copy(), initial_balance=1000.0, leverage=1, strategy_parameters=p)
-    return res
+    return sim.run_exit_sweep(symbol, interval, df_market, initial_balance=1000.0, leverage=1,
+                              strategy_parameters=params, exit_param_sets=exit_sets)
 
 
 def main():
@@ -86,32 +84,36 @@ def main():
     results = []
     for idx, row in enumerate(candidates, start=1):
         base_params = parse_params_from_wf_row(row)
-        for sl, fee, slp, tp, (method, val) in itertools.product(slippages, fees, stop_losses, take_profits, pos_policies):
-            params = dict(base_params)
-            params['stop_loss_pct'] = slp
-            params['take_profit_pct'] = tp
+        rank = int(row.get('rank') or idx)
+        combos = list(itertools.product(slippages, fees, stop_losses, take_profits, pos_policies))
+        exit_sets = []
+        for sl, fee, slp, tp, (method, val) in combos:
+            params = {'slippage_pct': sl, 'fee_pct': fee, 'stop_loss_pct': slp, 'take_profit_pct': tp}
             # set position sizing policy
             if method == 'capital_fraction':
                 params['position_size'] = val
             else:
                 params['position_size_policy'] = {'method': 'risk_per_trade', 'value': val}
-            try:
-                res = run_sim(symbol, args.interval, df_market, params, slippage=sl, fee=fee)
-                results.append({
-                    'rank': int(row.get('rank') or idx),
-                    'stop_loss_pct': slp,
-                    'take_profit_pct': tp,
-                    'position_policy': method,
-                    'position_value': val,
-                    'slippage': sl,
-                    'fee': fee,
-                    'profit_pct': res.get('profit_percentage'),
-                    'total_trades': res.get('total_trades'),
-                    'win_rate': res.get('win_rate'),
-                    'max_drawdown_pct': res.get('max_drawdown_pct'),
-                })
-            except Exception as e:
-                results.append({'rank': int(row.get('rank') or idx), 'error': str(e)})
+            exit_sets.append(params)
+        try:
+            table = run_sweep(symbol, args.interval, df_market, base_params, exit_sets)
+        except Exception as e:
+            results.append({'rank': rank, 'error': str(e)})
+            continue
+        for (sl, fee, slp, tp, (method, val)), res in zip(combos, table.to_dict(orient='records')):
+            results.append({
+                'rank': rank,
+                'stop_loss_pct': slp,
+                'take_profit_pct': tp,
+                'position_policy': method,
+                'position_value': val,
+                'slippage': sl,
+                'fee': fee,
+                'profit_pct': res.get('profit_percentage'),
+                'total_trades': res.get('total_trades'),
+                'win_rate': res.get('win_rate'),
+                'max_drawdown_pct': res.get('max_drawdown_pct'),
+            })
 
     # sort and write best results per rank
     df = pd.DataFrame(results)
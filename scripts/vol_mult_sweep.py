@@ -2,13 +2,13 @@ import os
 import sys
 import csv
 import json
+import numpy as np
 import pandas as pd
 
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
-from backtesting_backend.core.strategy_analyzer import StrategyAnalyzer
 from backtesting_backend.core.strategy_simulator import StrategySimulator
 from pathlib import Path
 
@@ -47,33 +47,6 @@ def load_top_candidate(symbol: str):
     return wf.iloc[0].to_dict()
 
 
-def prepare_df2(df, params, lookback=10):
-    analyzer = StrategyAnalyzer()
-    df2 = analyzer.calculate_indicators(df, params)
-    df2 = analyzer.generate_signals(df2, params)
-    med_col = f"vol_med_{lookback}"
-    mult_col = 'vol_mult'
-    if med_col not in df2.columns:
-        df2[med_col] = df2['volume'].rolling(window=lookback, min_periods=1).median()
-    if mult_col not in df2.columns:
-        df2[mult_col] = df2.apply(lambda r: (float(r['volume']) / float(r[med_col])) if pd.notna(r.get(med_col)) and float(r[med_col]) > 0 else 0.0, axis=1)
-    return df2
-
-
-def mask_by_vol_mult(df2: pd.DataFrame, threshold: float):
-    dfm = df2.copy()
-    if 'buy_signal' not in dfm.columns:
-        dfm['buy_signal'] = False
-    for i in range(len(dfm)):
-        try:
-            vm = float(dfm.iloc[i].get('vol_mult') or 0.0)
-            if vm > threshold:
-                dfm.iat[i, dfm.columns.get_loc('buy_signal')] = False
-        except Exception:
-            continue
-    return dfm
-
-
 def summarize_res(res: dict):
     return {
         'final_balance': res.get('final_balance'),
@@ -95,17 +68,20 @@ def main():
         raise SystemExit('Data missing: ' + df_path)
     df = pd.read_csv(df_path, parse_dates=[0], index_col=0)
 
-    df2 = prepare_df2(df, params, lookback=10)
     sim = StrategySimulator()
 
     thresholds = [1.5, 2.0, 3.0, 4.0, 5.0, 8.0, 10.0]
-    results = []
+    # the simulator's volume-spike filter rejects buys with vol_mult >= threshold; the sweep
+    # masks vol_mult > threshold, i.e. >= the next float above it
+    p = dict(params)
+    p['enable_volume_spike_filter'] = True
+    p['vol_spike_lookback'] = 10
+    exit_sets = [{'vol_spike_threshold': float(np.nextafter(th, np.inf))} for th in thresholds]
+    table = sim.run_exit_sweep(symbol, '5m', df, initial_balance=1000.0, leverage=1,
+                               strategy_parameters=p, exit_param_sets=exit_sets)
 
-    for th in thresholds:
-        dfm = mask_by_vol_mult(df2, th)
-        p = dict(params)
-        p['use_precomputed_signals'] = True
-        res = sim.run_simulation(symbol, '5m', dfm.copy(), initial_balance=1000.0, leverage=1, strategy_parameters=p)
+    results = []
+    for th, res in zip(thresholds, table.to_dict(orient='records')):
         summary = summarize_res(res)
         summary['vol_mult_threshold'] = th
         results.append(summary)
@@ -0,0 +1,151 @@
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+from urllib.parse import parse_qs
+
+import httpx
+
+from backend.api_client.async_binance_client import AsyncBinanceClient
+from backend.api_client.binance_client import BinanceClient
+from backend.api_client.exchange_info import ExchangeInfoCache
+from backend.api_client.mark_price_cache import MarkPriceCache
+from backend.api_client.response_cache import PublicResponseCache
+
+BASE = "https://fapi.test"
+
+
+def make_client(handler):
+    sync = SimpleNamespace(
+        api_key="key", secret_key="secret", base_url=BASE,
+        time_offset=0, exchange_info=ExchangeInfoCache(), mark_prices=MarkPriceCache(),
+        public_cache=PublicResponseCache(),
+    )
+    sync._sign_request = lambda params: BinanceClient._sign_request(sync, params)
+    aio = AsyncBinanceClient(sync, http2=False)
+    requests = []
+
+    def record(request):
+        requests.append(request)
+        return handler(request)
+
+    def bind():
+        # 테스트용 전송 계층 주입 (현재 루프에 바인딩)
+        aio._http_clients[asyncio.get_running_loop()] = httpx.AsyncClient(
+            base_url=BASE, transport=httpx.MockTransport(record))
+
+    return sync, aio, requests, bind
+
+
+def test_public_requests_reuse_one_pooled_client():
+    def handler(request):
+        assert request.url.path == "/fapi/v1/klines"
+        return httpx.Response(200, json=[[1, "1", "2", "0.5", "1.5", "10"]])
+
+    _, aio, requests, bind = make_client(handler)
+
+    async def run():
+        bind()
+        http = aio._http_clients[asyncio.get_running_loop()]
+        results = await asyncio.gather(*(aio.get_klines("BTCUSDT", "1m", limit=3) for _ in range(5)))
+        assert aio._get_http() is http
+        await aio.aclose()
+        return results
+
+    results = asyncio.run(run())
+    assert all(r == [[1, "1", "2", "0.5", "1.5", "10"]] for r in results)
+    assert parse_qs(requests[0].url.query.decode()) == {"symbol": ["BTCUSDT"], "interval": ["1m"], "limit": ["3"]}
+    assert aio._http_clients == {}
+
+
+def test_each_event_loop_keeps_its_own_pool_until_aclose():
+    import threading
+
+    _, aio, _, _ = make_client(lambda request: None)
+    other_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+    thread.start()
+
+    async def get_http():
+        return aio._get_http()
+
+    def on_other_loop():
+        return asyncio.run_coroutine_threadsafe(get_http(), other_loop).result(timeout=5)
+
+    async def run():
+        # 두 루프가 번갈아 사용해도 풀은 루프마다 1개로 유지
+        mine = aio._get_http()
+        other = await asyncio.to_thread(on_other_loop)
+        assert aio._get_http() is mine
+        assert await asyncio.to_thread(on_other_loop) is other
+        assert other is not mine
+        await aio.aclose()
+        return mine, other
+
+    try:
+        mine, other = asyncio.run(run())
+    finally:
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        thread.join(timeout=5)
+        other_loop.close()
+    assert mine.is_closed and other.is_closed
+    assert aio._http_clients == {}
+
+
+def test_signed_request_resyncs_time_on_1021():
+    server_time = int(time.time() * 1000) + 5000
+    order_attempts = []
+
+    def handler(request):
+        if request.url.path == "/fapi/v1/time":
+            return httpx.Response(200, json={"serverTime": server_time})
+        order_attempts.append(parse_qs(request.url.query.decode()))
+        if len(order_attempts) == 1:
+            return httpx.Response(400, text=json.dumps({"code": -1021, "msg": "Timestamp outside recvWindow"}))
+        return httpx.Response(200, json={"orderId": 1})
+
+    sync, aio, _, bind = make_client(handler)
+
+    async def run():
+        bind()
+        return await aio._send_signed_request("POST", "/fapi/v1/order", {"symbol": "BTCUSDT"})
+
+    assert asyncio.run(run()) == {"orderId": 1}
+    assert len(order_attempts) == 2
+    assert 4000 < sync.time_offset <= 5000
+    assert "signature" in order_attempts[1]
+    assert int(order_attempts[1]["timestamp"][0]) >= int(order_attempts[0]["timestamp"][0]) + 4000
+
+
+def test_market_order_quantity_follows_symbol_filters():
+    exchange_info = {"symbols": [{
+        "symbol": "BTCUSDT", "status": "TRADING",
+        "filters": [
+            {"filterType": "MARKET_LOT_SIZE", "stepSize": "0.001", "minQty": "0.001", "maxQty": "100"},
+            {"filterType": "MIN_NOTIONAL", "minNotional": "5"},
+        ],
+    }]}
+    orders = []
+
+    def handler(request):
+        path = request.url.path
+        if path == "/fapi/v1/exchangeInfo":
+            return httpx.Response(200, json=exchange_info)
+        if path == "/fapi/v1/premiumIndex":
+            return httpx.Response(200, json={"markPrice": "50000"})
+        orders.append(parse_qs(request.url.query.decode()))
+        return httpx.Response(200, json={"orderId": 7, "avgPrice": "50000", "executedQty": "0.012"})
+
+    _, aio, _, bind = make_client(handler)
+
+    async def run():
+        bind()
+        ok = await aio.create_market_order("BTCUSDT", "BUY", 0.0129)
+        too_small = await aio.create_market_order("BTCUSDT", "BUY", 0.00001)
+        return ok, too_small
+
+    ok, too_small = asyncio.run(run())
+    assert ok["orderId"] == 7
+    assert orders[0]["quantity"] == ["0.012"]
+    assert too_small["code"] == -1130
+    assert len(orders) == 1
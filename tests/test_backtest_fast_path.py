@@ -0,0 +1,135 @@
+import dataclasses
+import logging
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.core.new_strategy.backtest_adapter import BacktestConfig, BacktestExecutor
+from backend.core.new_strategy.candle_buffer import CandleColumns
+from backend.core.new_strategy.data_structures import InsufficientDataError
+from backend.core.new_strategy.indicator_engine import IndicatorEngine
+from backend.core.new_strategy.indicator_series import IndicatorSeries
+from backend.core.new_strategy.orchestrator import OrchestratorConfig, StrategyOrchestrator
+
+
+def make_frame(n, step_min, start, seed, drift=0.0004):
+    rng = np.random.default_rng(seed)
+    t = np.arange(n)
+    price = 100 * np.exp(np.cumsum(rng.normal(drift, 0.004, n)) + 0.03 * np.sin(t / 25))
+    high = price * (1 + np.abs(rng.normal(0, 0.001, n)))
+    low = price * (1 - np.abs(rng.normal(0, 0.001, n)))
+    volume = rng.exponential(1000, n)
+    volume[::17] *= 6
+    volume[::41] = 0.0
+    start = pd.Timestamp(start)
+    return pd.DataFrame({
+        "timestamp": [start + pd.Timedelta(minutes=step_min * i) for i in range(n)],
+        "open": price, "high": high, "low": low, "close": price,
+        "volume": volume, "quote_volume": volume * price, "trades": 10,
+    })
+
+
+def window_columns(df, end, window):
+    part = df.iloc[end + 1 - window:end + 1]
+    open_time = np.array([ts.timestamp() * 1000 for ts in part["timestamp"]])
+    arr = lambda col: part[col].to_numpy(dtype=np.float64)
+    zeros = np.zeros(window)
+    return CandleColumns(
+        "TESTUSDT", "1m", open_time, open_time + 59999, arr("open"), arr("high"), arr("low"),
+        arr("close"), arr("volume"), arr("quote_volume"), zeros, np.ones(window),
+    )
+
+
+def test_indicator_series_matches_engine_bitwise():
+    df = make_frame(600, 1, "2024-01-05", seed=3)
+    open_ms = np.array([ts.timestamp() * 1000 for ts in df["timestamp"]], dtype=np.int64)
+    series = IndicatorSeries(
+        "TESTUSDT", open_ms + 59999, df["high"].to_numpy(), df["low"].to_numpy(),
+        df["close"].to_numpy(), df["volume"].to_numpy(), window=200,
+    )
+    engine = IndicatorEngine()
+
+    assert not series.available(198)
+    with pytest.raises(InsufficientDataError):
+        series.at(198)
+    for end in list(range(199, 230)) + list(range(230, 600, 37)) + [599]:
+        expected = engine.calculate_columns(window_columns(df, end, 200))
+        assert dataclasses.asdict(series.at(end)) == dataclasses.asdict(expected)
+
+
+def test_indicator_series_rejects_short_window():
+    with pytest.raises(ValueError):
+        IndicatorSeries("TESTUSDT", np.zeros(10), np.zeros(10), np.zeros(10), np.zeros(10), np.zeros(10), window=50)
+
+
+def run_backtest(fast_path, seed=3, window=120):
+    logging.disable(logging.INFO)
+    try:
+        start = pd.Timestamp("2024-01-05")
+        klines_1m = make_frame(window + 100, 1, start, seed)
+        # 상위 타임프레임은 1m 구간 이전 이력을 포함해 첫 스텝부터 윈도우를 채운다
+        klines_3m = make_frame(window + 70, 3, start - pd.Timedelta(minutes=3 * (window + 10)), seed + 1)
+        klines_15m = make_frame(window + 20, 15, start - pd.Timedelta(minutes=15 * (window + 10)), seed + 2, drift=0.001)
+        orchestrator = StrategyOrchestrator(None, config=OrchestratorConfig(symbol="TESTUSDT"))
+        orchestrator.indicator.required_candles = window
+        executor = BacktestExecutor(
+            orchestrator, BacktestConfig(symbol="TESTUSDT", fast_path=fast_path),
+            klines_1m, klines_3m, klines_15m,
+        )
+        executor.CACHE_WINDOW = window
+        return executor.run()
+    finally:
+        logging.disable(logging.NOTSET)
+
+
+def test_fast_path_matches_orchestrator_path():
+    fast = run_backtest(True)
+    slow = run_backtest(False)
+
+    # entry_time은 SimulatedPosition 생성 시각(벽시계)이므로 비교에서 제외
+    strip = lambda trades: [{k: v for k, v in t.items() if k != "entry_time"} for t in trades]
+    assert fast["total_trades"] > 0
+    assert strip(fast["trades"]) == strip(slow["trades"])
+    assert fast["equity_curve"] == slow["equity_curve"]
+    assert fast["total_pnl"] == slow["total_pnl"]
+
+
+def test_backtest_never_calls_live_execution():
+    class ExplodingExecution:
+        def place_market_long(self, *args, **kwargs):
+            raise AssertionError("live order")
+
+        close_market_long = place_market_long
+
+    orchestrator = StrategyOrchestrator(None, config=OrchestratorConfig(symbol="TESTUSDT"), executor=ExplodingExecution())
+    klines_1m = make_frame(3300, 1, "2024-01-05", seed=3)
+    result = BacktestExecutor(orchestrator, BacktestConfig(symbol="TESTUSDT"), klines_1m).run()
+
+    assert result["total_trades"] > 0
+    assert isinstance(orchestrator.exec, ExplodingExecution)
+
+
+def test_higher_timeframe_candle_is_used_only_after_it_closes():
+    start = pd.Timestamp("2024-01-05")
+    klines_1m = make_frame(90, 1, start, seed=3)
+    orchestrator = StrategyOrchestrator(None, config=OrchestratorConfig(symbol="TESTUSDT"))
+    executor = BacktestExecutor(orchestrator, BacktestConfig(symbol="TESTUSDT"), klines_1m)
+    executor._prepare_fast_path()
+
+    for idx, ts in enumerate(klines_1m["timestamp"]):
+        executor._update_timeframe_indices(ts)
+        bar_close = ts + pd.Timedelta(minutes=1)
+        for interval, frame, current in (("3m", executor.klines_3m, executor.current_3m_idx),
+                                         ("15m", executor.klines_15m, executor.current_15m_idx)):
+            period = pd.Timedelta(minutes=int(interval[:-1]))
+            closed = [i for i, open_ts in enumerate(frame["timestamp"]) if open_ts + period <= bar_close]
+            expected = closed[-1] if closed else -1
+            assert executor._tf_index[interval][idx] == expected
+            assert current == expected
+
+    # 첫 3분봉(00:00~00:03)은 00:02 1분봉 마감 시점에야 사용 가능
+    assert executor._tf_index["3m"][:4] == [-1, -1, 0, 0]
+    assert executor._tf_index["15m"][13:15] == [-1, 0]
+    with pytest.raises(InsufficientDataError):
+        executor._series["3m"].at(executor._tf_index["3m"][0])
@@ -0,0 +1,68 @@
+import asyncio
+
+import httpx
+
+from backtesting_backend.api_client.binance_client import BinanceClient
+from backtesting_backend.api_client.rate_limit_manager import RateLimitManager
+
+MINUTE = 60_000
+START = 1_700_000_000_000 // MINUTE * MINUTE
+
+
+def make_client(limit_delay=0.01):
+    state = {"in_flight": 0, "max_in_flight": 0, "requests": []}
+
+    async def handler(request):
+        params = dict(request.url.params)
+        state["requests"].append(params)
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        # 뒤쪽 페이지가 먼저 도착하도록 지연을 역순으로 부여
+        await asyncio.sleep(limit_delay * (10 - len(state["requests"]) % 10))
+        state["in_flight"] -= 1
+        start, end, limit = int(params["startTime"]), int(params["endTime"]), int(params["limit"])
+        step = int(params["interval"][:-1]) * MINUTE
+        # 경계 캔들을 한 개 겹치게 반환 (중복 제거 확인)
+        first = max(START, start - step)
+        times = list(range(first, end + 1, step))[: limit + 1]
+        return httpx.Response(200, json=[[t, "1", "2", "0.5", "1.5", "10", t + step - 1, "15", 3, "5", "7", "0"]
+                                         for t in times])
+
+    client = BinanceClient(api_key="k", api_secret="s", rate_limit_manager=RateLimitManager(), base_url="http://x")
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client, state
+
+
+def test_concurrent_pages_are_streamed_in_order_without_duplicates():
+    client, state = make_client()
+    end = START + 2_500 * MINUTE - 1
+    pages = []
+
+    async def on_page(rows):
+        pages.append(rows)
+
+    async def run():
+        delivered = await client.fetch_klines_concurrent("BTCUSDT", "1m", START, end, on_page,
+                                                         limit=100, concurrency=5)
+        await client.close()
+        return delivered
+
+    delivered = asyncio.run(run())
+    opens = [r["open_time"] for page in pages for r in page]
+    assert delivered == 2_500 and opens == list(range(START, end, MINUTE))
+    assert len(state["requests"]) == 25 and 1 < state["max_in_flight"] <= 5
+    assert pages[0][0]["symbol"] == "BTCUSDT" and pages[0][0]["number_of_trades"] == 3
+
+
+def test_get_klines_uses_concurrent_path_for_closed_range():
+    client, state = make_client(limit_delay=0.0)
+
+    async def run():
+        rows = await client.get_klines("ETHUSDT", "5m", start_time=START, end_time=START + 50 * 5 * MINUTE - 1,
+                                       limit=20)
+        await client.close()
+        return rows
+
+    rows = asyncio.run(run())
+    assert [r["open_time"] for r in rows] == [START + i * 5 * MINUTE for i in range(50)]
+    assert [int(r["startTime"]) for r in state["requests"]] == [START + i * 20 * 5 * MINUTE for i in range(3)]
@@ -0,0 +1,110 @@
+import asyncio
+import time
+
+import httpx
+import numpy as np
+from fastapi.testclient import TestClient
+
+from backend.simulator import ReplayMarket, SimulatorConfig, create_app
+from backend.simulator.market import aggregate_bars
+
+from tests.test_async_binance_client import make_client
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_market(clock, **kwargs):
+    return ReplayMarket("data", speed=60.0, warmup_bars=100, symbols=["BTCUSDT", "LSKUSDT"], clock=clock, **kwargs)
+
+
+def signed(params):
+    return {**params, "timestamp": int(time.time() * 1000), "recvWindow": 60000, "signature": "x"}
+
+
+def test_replay_never_reveals_future_and_split_bars_reaggregate_exactly():
+    clock = FakeClock()
+    market = make_market(clock)
+    base = market.bars("BTCUSDT", "5m")
+    one_minute = market.bars("BTCUSDT", "1m")
+    merged = aggregate_bars(one_minute, base.interval_ms)
+    for col in ("open_time", "open", "high", "low", "close", "volume"):
+        assert np.allclose(getattr(merged, col), getattr(base, col))
+
+    rows = market.klines("BTCUSDT", "1m", limit=5)
+    assert rows[-1][0] <= market.now_ms() < rows[-1][6] + 1
+    # 가상 시계 90초(=1.5분) 진행 → 1분봉 1~2개가 새로 보임
+    clock.now += 1.5
+    later = market.klines("BTCUSDT", "1m", limit=5)
+    assert later[-1][0] > rows[-1][0]
+    assert all(r[0] <= market.now_ms() for r in later)
+    assert market.klines("BTCUSDT", "1m", limit=3, start_time=rows[0][0])[0][0] == rows[0][0]
+
+
+def test_async_client_round_trip_with_time_resync():
+    clock = FakeClock()
+    app = create_app(SimulatorConfig(), market=make_market(clock))
+    sync, aio, _, _ = make_client(lambda request: None)
+    # 로컬 시계가 2분 어긋남 → 실제 -1021 후 /fapi/v1/time 재동기화로 복구
+    sync.time_offset = -120_000
+
+    async def run():
+        aio._http_clients[asyncio.get_running_loop()] = httpx.AsyncClient(
+            base_url="http://sim", transport=httpx.ASGITransport(app=app))
+        info = await aio.ensure_exchange_info()
+        klines = await aio.get_klines("BTCUSDT", "15m", limit=10)
+        mark = await aio.get_mark_price("BTCUSDT")
+        opened = await aio._send_signed_request(
+            "POST", "/fapi/v1/order", {"symbol": "BTCUSDT", "side": "BUY", "type": "MARKET", "quantity": 0.01})
+        positions = await aio._send_signed_request("GET", "/fapi/v2/positionRisk")
+        await aio.aclose()
+        return info, klines, mark, opened, positions
+
+    info, klines, mark, opened, positions = asyncio.run(run())
+    assert info.status("BTCUSDT") == "TRADING" and "LOT_SIZE" in info.filters("BTCUSDT")
+    assert len(klines) == 10 and klines[1][0] - klines[0][0] == 15 * 60_000
+    assert float(mark["markPrice"]) > 0
+    assert opened["status"] == "FILLED" and opened["executedQty"] == "0.01"
+    assert abs(sync.time_offset) < 5_000
+    assert [(p["symbol"], float(p["positionAmt"])) for p in positions] == [("BTCUSDT", 0.01)]
+
+
+def test_fault_injection_and_user_data_events():
+    clock = FakeClock()
+    config = SimulatorConfig(rate_limit_error_rate=1.0, retry_after_sec=3, seed=1)
+    app = create_app(config, market=make_market(clock))
+    with TestClient(app) as client:
+        response = client.get("/fapi/v1/ticker/24hr")
+        assert response.status_code == 429 and response.headers["Retry-After"] == "3"
+        assert "X-MBX-USED-WEIGHT-1M" in response.headers
+
+        config.rate_limit_error_rate = 0.0
+        config.timestamp_error_rate = 1.0
+        assert client.get("/fapi/v2/account", params=signed({})).json()["code"] == -1021
+        assert config.stats["injected_1021"] == 1
+        config.timestamp_error_rate = 0.0
+
+        key = client.post("/fapi/v1/listenKey").json()["listenKey"]
+        with client.websocket_connect(f"/ws/{key}") as ws:
+            order = client.post("/fapi/v1/order", params=signed(
+                {"symbol": "LSKUSDT", "side": "SELL", "type": "MARKET", "quantity": 10}))
+            assert order.status_code == 200
+            trade = ws.receive_json()
+            update = ws.receive_json()
+            assert trade["e"] == "ORDER_TRADE_UPDATE" and trade["o"]["x"] == "TRADE"
+            assert update["a"]["P"][0]["pa"] == "-10"
+
+            # 반대 방향이 아닌 reduceOnly는 거부
+            rejected = client.post("/fapi/v1/order", params=signed(
+                {"symbol": "LSKUSDT", "side": "SELL", "type": "MARKET", "quantity": 1, "reduceOnly": "true"}))
+            assert rejected.json()["code"] == -2022
+            client.delete("/fapi/v1/listenKey", params={"listenKey": key})
+            assert ws.receive_json()["e"] == "listenKeyExpired"
+
+        with client.websocket_connect("/ws/!markPrice@arr@1s") as ws:
+            assert {e["s"] for e in ws.receive_json()} == {"BTCUSDT", "LSKUSDT"}
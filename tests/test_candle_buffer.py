@@ -0,0 +1,92 @@
+import random
+from collections import deque
+
+import numpy as np
+
+from backend.core.new_strategy.candle_buffer import CandleRingBuffer
+from backend.core.new_strategy.data_fetcher import MarketDataCache
+from backend.core.new_strategy.data_structures import Candle
+from backend.core.new_strategy.indicator_engine import IndicatorEngine
+from backend.core.new_strategy.incremental_indicator_engine import IncrementalIndicatorEngine
+
+from tests.test_incremental_indicator_engine import FIELDS, assert_same, make_candle, make_series
+
+
+def test_ring_buffer_matches_deque_across_compaction():
+    rng = random.Random(1)
+    buf = CandleRingBuffer("TEST", "1m", capacity=50)
+    ref = deque(maxlen=50)
+    for i in range(400):
+        live = make_candle(i, 100.0 + i, rng)
+        buf.add(live)
+        ref.append(live)
+        # 같은 open_time은 갱신, 과거 open_time은 무시
+        final = make_candle(i, 101.0 + i, rng)
+        buf.add(final)
+        ref[-1] = final
+        if i > 0:
+            buf.add(make_candle(i - 1, 1.0, rng))
+        assert len(buf) == len(ref)
+        assert buf.latest() == ref[-1]
+
+    assert buf.to_candles() == list(ref)
+    assert buf.to_candles(7) == list(ref)[-7:]
+    # 할당 길이는 capacity + slack 이내
+    assert buf._data.shape[1] <= 50 + max(16, 50 // 4)
+
+
+def test_columns_are_zero_copy_views():
+    buf = CandleRingBuffer("TEST", "1m", capacity=100)
+    rng = random.Random(2)
+    for i in range(80):
+        buf.add(make_candle(i, 100.0, rng))
+    cols = buf.columns(30)
+    assert len(cols) == 30
+    assert np.shares_memory(cols.close, buf._data)
+    assert cols.open_time[-1] == 79 * 60000 and cols.open_time[0] == 50 * 60000
+
+
+def test_cache_columns_and_candle_compat():
+    cache = MarketDataCache(max_candles=300)
+    candles = make_series(350, seed=9)
+    cache.add_candles_bulk(candles)
+    assert cache.count("TEST", "1m") == 300
+    assert cache.count("TEST", "3m") == 0
+    assert cache.get_latest_candles("TEST", "1m", 200) == candles[-200:]
+    cols = cache.get_latest_columns("TEST", "1m", 200)
+    assert cols.close.tolist() == [c.close for c in candles[-200:]]
+
+
+def test_calculate_columns_matches_calculate_exactly():
+    cache = MarketDataCache()
+    candles = make_series(260, seed=4)
+    cache.add_candles_bulk(candles)
+    engine = IndicatorEngine()
+    expected = engine.calculate(candles[-200:])
+    actual = engine.calculate_columns(cache.get_latest_columns("TEST", "1m", 200))
+    for f in FIELDS:
+        assert getattr(expected, f) == getattr(actual, f), f
+    assert expected.trend == actual.trend
+    assert expected.timestamp == actual.timestamp
+
+
+def test_incremental_calculate_columns_follows_cache():
+    cache = MarketDataCache()
+    candles = make_series(450, seed=6)
+    rng = random.Random(8)
+    full = IndicatorEngine()
+    inc = IncrementalIndicatorEngine()
+    cache.add_candles_bulk(candles[:200])
+    for i in range(200, 450):
+        # 진행 중 캔들 갱신 후 종료 캔들 반영
+        live = make_candle(i, candles[i].close * (1 + rng.gauss(0, 0.002)), rng)
+        cache.add_candle(live)
+        assert_same(
+            full.calculate(candles[i - 199:i] + [live]),
+            inc.calculate_columns(cache.get_latest_columns("TEST", "1m", 200)),
+        )
+        cache.add_candle(candles[i])
+        assert_same(
+            full.calculate(candles[i - 199:i + 1]),
+            inc.calculate_columns(cache.get_latest_columns("TEST", "1m", 200)),
+        )
@@ -0,0 +1,87 @@
+import asyncio
+import threading
+
+from backend.api_client.exchange_info import ExchangeInfoCache
+
+
+def symbol(name, status="TRADING", onboard=1_600_000_000_000, contract="PERPETUAL"):
+    return {
+        "symbol": name, "status": status, "quoteAsset": "USDT", "contractType": contract,
+        "onboardDate": onboard,
+        "filters": [{"filterType": "LOT_SIZE", "stepSize": "0.001"}],
+    }
+
+
+PAYLOAD = {"symbols": [symbol("BTCUSDT"), symbol("OLDUSDT", "SETTLING"), symbol("BTCUSDT_250926", contract="CURRENT_QUARTER")]}
+
+
+def test_lookups_hit_index_and_refresh_only_after_ttl():
+    cache = ExchangeInfoCache(ttl=60)
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return PAYLOAD
+
+    for _ in range(5):
+        cache.ensure(fetch)
+    assert len(calls) == 1
+    assert cache.filters("BTCUSDT")["LOT_SIZE"]["stepSize"] == "0.001"
+    assert cache.status("OLDUSDT") == "SETTLING"
+    assert cache.symbols(statuses=("TRADING", "SETTLING")) == ["BTCUSDT", "OLDUSDT"]
+    assert cache.onboard_dates(["BTCUSDT", "MISSING"]) == {"BTCUSDT": 1_600_000_000_000}
+
+    cache._next_refresh = 0.0  # TTL 만료
+    cache.ensure(fetch)
+    assert len(calls) == 2
+
+
+def test_refresh_publishes_listing_and_status_diff_and_keeps_index_on_error():
+    cache = ExchangeInfoCache()
+    diffs = []
+    cache.add_listener(diffs.append)
+    assert cache.update(PAYLOAD) is None  # 최초 로드는 diff 없음
+
+    new_payload = {"symbols": [symbol("BTCUSDT", "SETTLING"), symbol("OLDUSDT", "SETTLING"), symbol("NEWUSDT")]}
+    diff = cache.update(new_payload)
+    assert diff == {
+        "added": ["NEWUSDT"],
+        "removed": ["BTCUSDT_250926"],
+        "status_changed": [{"symbol": "BTCUSDT", "old": "TRADING", "new": "SETTLING"}],
+    }
+    assert diffs == [diff]
+    assert cache.update(new_payload) is None
+
+    assert cache.update({"symbols": [], "error": "timeout"}) is None
+    assert cache.get("NEWUSDT")["status"] == "TRADING"
+    assert not cache.is_stale()
+
+
+def test_concurrent_async_and_thread_callers_fetch_once():
+    cache = ExchangeInfoCache()
+    calls = []
+
+    async def afetch():
+        calls.append("async")
+        await asyncio.sleep(0.02)
+        return PAYLOAD
+
+    async def run():
+        await asyncio.gather(*(cache.aensure(afetch) for _ in range(10)))
+
+    asyncio.run(run())
+    assert calls == ["async"]
+
+    cache._next_refresh = 0.0
+    barrier = threading.Barrier(4)
+
+    def worker():
+        barrier.wait()
+        cache.ensure(lambda: calls.append("sync") or PAYLOAD)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert calls == ["async", "sync"]
@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtesting_backend.core.strategy_analyzer import StrategyAnalyzer
+
+
+def load_df(n):
+    df = pd.read_csv("data/PIPPINUSDT_5m.csv").iloc[:n]
+    df.index = pd.to_datetime(df["open_time"])
+    return df[["open", "high", "low", "close", "volume"]]
+
+
+PARAM_SETS = [
+    {"fast_ema_period": 5, "slow_ema_period": 13},
+    {"fast_ema_period": 3, "slow_ema_period": 8, "enable_volume_momentum": True, "volume_avg_period": 10,
+     "volume_spike_factor": 1.3},
+    {"fast_ema_period": 4, "slow_ema_period": 9, "enable_trend_filter": True, "trend_fast": 5, "trend_slow": 10,
+     "enable_session_filter": True, "allowed_sessions": ["europe", "us"]},
+    {"fast_ema_period": 3, "slow_ema_period": 7, "enable_sr_filter": True, "sr_proximity_threshold": 0.01,
+     "sr_lookback_period": 40, "enable_volume_momentum": True, "volume_spike_factor": 1.1},
+]
+
+
+@pytest.mark.parametrize("params", PARAM_SETS)
+def test_vectorized_signals_match_reference(params):
+    analyzer = StrategyAnalyzer()
+    df = analyzer.calculate_indicators(load_df(1500), params)
+    fast = analyzer.generate_signals(df, params)
+    ref = analyzer._generate_signals_reference(df, params)
+    assert ref["buy_signal"].any() and ref["sell_signal"].any()
+    assert fast["buy_signal"].equals(ref["buy_signal"])
+    assert fast["sell_signal"].equals(ref["sell_signal"])
+
+
+def test_nan_and_object_gates_follow_reference_truthiness():
+    analyzer = StrategyAnalyzer()
+    params = {"fast_ema_period": 3, "slow_ema_period": 6, "enable_volume_momentum": True}
+    df = analyzer.calculate_indicators(load_df(600), params)
+    rng = np.random.default_rng(0)
+    df["trend_ok"] = np.where(rng.random(len(df)) < 0.2, np.nan, rng.random(len(df)) < 0.7)
+    df["session_ok"] = pd.Series(rng.choice([True, False, None], len(df)), index=df.index, dtype=object)
+    df.iloc[:20, df.columns.get_loc("ema_slow_6")] = np.nan
+    fast = analyzer.generate_signals(df, params)
+    ref = analyzer._generate_signals_reference(df, params)
+    assert fast["buy_signal"].equals(ref["buy_signal"])
+    assert fast["sell_signal"].equals(ref["sell_signal"])
+
+
+def test_missing_ema_columns_yield_no_signals():
+    out = StrategyAnalyzer().generate_signals(load_df(50), {"fast_ema_period": 3, "slow_ema_period": 6})
+    assert not out["buy_signal"].any() and not out["sell_signal"].any()
+    assert out["buy_signal"].dtype == bool
@@ -0,0 +1,80 @@
+import math
+import random
+
+from backend.core.new_strategy.data_structures import Candle
+from backend.core.new_strategy.indicator_engine import IndicatorEngine
+from backend.core.new_strategy.incremental_indicator_engine import IncrementalIndicatorEngine
+
+FIELDS = [
+    "ema_5", "ema_10", "ema_20", "ema_60", "ema_120", "rsi_14",
+    "stoch_rsi_k", "stoch_rsi_d", "macd_line", "macd_signal", "macd_histogram",
+    "vwap", "atr_14", "volume_avg_20",
+]
+
+
+def make_candle(i, price, rng, volume=None):
+    high = price * (1 + abs(rng.gauss(0, 0.001)))
+    low = price * (1 - abs(rng.gauss(0, 0.001)))
+    vol = rng.expovariate(1 / 1000) if volume is None else volume
+    return Candle("TEST", "1m", i * 60000, i * 60000 + 59999, price, high, low, price, vol, vol * price)
+
+
+def make_series(n, seed=7):
+    rng = random.Random(seed)
+    price = 100.0
+    candles = []
+    for i in range(n):
+        price *= 1 + rng.gauss(0, 0.003)
+        # 간헐적 거래량 0 / 급증 포함
+        volume = 0.0 if i % 41 == 0 else (15000.0 if i % 53 == 0 else None)
+        candles.append(make_candle(i, price, rng, volume))
+    return candles
+
+
+def assert_same(expected, actual):
+    for f in FIELDS:
+        a, b = getattr(expected, f), getattr(actual, f)
+        assert math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-9), (f, a, b)
+    assert expected.trend == actual.trend
+    assert expected.volume_spike == actual.volume_spike
+    assert expected.timestamp == actual.timestamp
+
+
+def test_incremental_matches_full_calculation_on_sliding_window():
+    candles = make_series(700)
+    full = IndicatorEngine()
+    inc = IncrementalIndicatorEngine()
+    for end in range(200, len(candles) + 1):
+        window = candles[end - 200:end]
+        assert_same(full.calculate(window), inc.calculate(window))
+
+
+def test_live_candle_revision_and_direct_updates():
+    candles = make_series(260, seed=11)
+    rng = random.Random(3)
+    full = IndicatorEngine()
+    inc = IncrementalIndicatorEngine()
+    for c in candles[:200]:
+        inc.update(c)
+
+    for i in range(200, 260):
+        # 진행 중 캔들 3회 갱신 후 종료
+        base = candles[i]
+        for _ in range(3):
+            price = base.close * (1 + rng.gauss(0, 0.002))
+            live = make_candle(i, price, rng)
+            inc.update(live)
+            window = candles[i - 199:i] + [live]
+            assert_same(full.calculate(window), inc.latest("TEST", "1m"))
+        inc.update(base)
+        assert_same(full.calculate(candles[i - 199:i + 1]), inc.latest("TEST", "1m"))
+
+
+def test_calculate_rebuilds_after_discontinuity():
+    candles = make_series(600, seed=5)
+    full = IndicatorEngine()
+    inc = IncrementalIndicatorEngine()
+    inc.calculate(candles[0:200])
+    # 캐시 초기화 등으로 연속성이 깨진 경우 전달된 캔들로 재구성
+    window = candles[400:600]
+    assert_same(full.calculate(window), inc.calculate(window))
@@ -0,0 +1,97 @@
+import asyncio
+import json
+
+import websockets
+
+from backend.core.new_strategy.data_fetcher import BinanceDataFetcher
+from backend.core.new_strategy.kline_stream import parse_kline_message
+
+
+def kline_event(symbol, interval, open_time, close, closed):
+    return {
+        "e": "kline",
+        "E": open_time + 1,
+        "s": symbol,
+        "k": {
+            "t": open_time,
+            "T": open_time + 59_999,
+            "s": symbol,
+            "i": interval,
+            "o": "100.0",
+            "c": str(close),
+            "h": str(max(100.0, close)),
+            "l": "99.0",
+            "v": "10.0",
+            "n": 5,
+            "x": closed,
+            "q": "1000.0",
+        },
+    }
+
+
+class FakeClient:
+    """재연결 보정(REST) 호출만 기록하는 가짜 클라이언트"""
+
+    def __init__(self):
+        self.kline_calls = []
+
+    def get_klines(self, symbol, interval, limit=500, start_time=None, end_time=None):
+        self.kline_calls.append((symbol, interval, start_time))
+        return []
+
+
+def test_parse_kline_message_raw_and_combined():
+    event = kline_event("BTCUSDT", "1m", 60_000, 101.5, False)
+    raw = parse_kline_message(event)
+    wrapped = parse_kline_message({"stream": "btcusdt@kline_1m", "data": event})
+    assert raw == wrapped
+    assert raw.symbol == "BTCUSDT" and raw.interval == "1m"
+    assert raw.close == 101.5 and raw.is_closed is False
+    assert parse_kline_message({"result": None, "id": 1}) is None
+
+
+def test_fetcher_websocket_mode_with_local_server():
+    subscriptions = []
+
+    async def handler(ws, *args):
+        sub = json.loads(await ws.recv())
+        subscriptions.append(sub)
+        await ws.send(json.dumps({"result": None, "id": sub["id"]}))
+        if len(subscriptions) == 1:
+            # 부분 캔들 -> 종료 캔들 전송 후 연결 끊기 (재연결 유도)
+            await ws.send(json.dumps(kline_event("BTCUSDT", "1m", 60_000, 101.0, False)))
+            await ws.send(json.dumps(kline_event("BTCUSDT", "1m", 60_000, 102.0, True)))
+            await ws.close()
+            return
+        await ws.send(json.dumps(kline_event("BTCUSDT", "1m", 120_000, 103.0, False)))
+        await ws.wait_closed()
+
+    async def run():
+        server = await websockets.serve(handler, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        client = FakeClient()
+        fetcher = BinanceDataFetcher(client, ws_url=f"ws://127.0.0.1:{port}")
+        updates = []
+        await fetcher.start_realtime_updates(["BTCUSDT"], ["1m"], on_candle_update=updates.append)
+        for _ in range(100):
+            if len(updates) >= 3:
+                break
+            await asyncio.sleep(0.05)
+        reconnects = fetcher._stream.reconnect_count
+        await fetcher.stop_realtime_updates()
+        server.close()
+        await server.wait_closed()
+        return fetcher, client, updates, reconnects
+
+    fetcher, client, updates, reconnects = asyncio.run(run())
+
+    assert [c.is_closed for c in updates] == [False, True, False]
+    assert reconnects == 1
+    # 재연결 시 동일 스트림 재구독
+    assert [s["params"] for s in subscriptions] == [["btcusdt@kline_1m"]] * 2
+    # 재연결 보정은 캐시 최신 캔들 시점부터 REST 조회
+    assert client.kline_calls == [("BTCUSDT", "1m", 60_000)]
+
+    candles = fetcher.cache.get_latest_candles("BTCUSDT", "1m", 2)
+    assert [c.open_time for c in candles] == [60_000, 120_000]
+    assert candles[0].close == 102.0 and candles[0].is_closed
@@ -0,0 +1,42 @@
+import asyncio
+
+import pytest
+
+from backend.core.new_strategy.latency import LatencyRecorder, RollingHistogram
+from backend.core.new_strategy.orchestrator import OrchestratorConfig, StrategyOrchestrator
+
+from tests.test_orchestrator_async import SlowAsyncClient
+
+
+def test_rolling_histogram_percentiles_over_window():
+    hist = RollingHistogram(window=100)
+    for ms in range(1, 201):
+        hist.record(ms / 1000)
+    summary = hist.summary()
+    # 윈도우에는 최근 100개(101~200ms)만 남음
+    assert summary["count"] == 200
+    assert summary["p50_ms"] == pytest.approx(150.5)
+    assert summary["p99_ms"] == pytest.approx(199.01)
+    assert summary["max_ms"] == pytest.approx(200.0)
+    assert summary["mean_ms"] == pytest.approx(100.5)
+
+
+def test_stage_records_even_when_block_raises():
+    latency = LatencyRecorder()
+    with pytest.raises(ValueError):
+        with latency.stage("fetch"):
+            raise ValueError("boom")
+    assert latency.snapshot()["fetch"]["count"] == 1
+    assert latency.snapshot("signal") == {}
+
+
+def test_orchestrator_step_reports_stage_latency():
+    client = SlowAsyncClient(0.02)
+    orch = StrategyOrchestrator(client, config=OrchestratorConfig(symbol="TEST"))
+    asyncio.run(orch.astep())
+
+    stages = orch.get_status()["latency"]
+    for name in ("step", "fetch", "indicators_1m", "indicators_3m", "indicators_15m", "signal"):
+        assert stages[name]["count"] == 1
+    assert stages["fetch"]["last_ms"] >= 20
+    assert stages["step"]["last_ms"] >= stages["fetch"]["last_ms"]
@@ -0,0 +1,114 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import websockets
+
+from backend.api_client.binance_client import BinanceClient
+from backend.api_client.mark_price_cache import MarkPriceCache, MarkPriceStream
+from backend.core.new_strategy.execution_adapter import ExecutionAdapter
+
+
+def mark_event(symbol, price):
+    return {"e": "markPriceUpdate", "E": 1_700_000_000_000, "s": symbol, "p": str(price),
+            "i": str(price), "P": str(price), "r": "0.0001", "T": 1_700_000_800_000}
+
+
+def make_client(cache):
+    rest_calls = []
+
+    def send_public(method, path, params=None, **kwargs):
+        rest_calls.append(params["symbol"])
+        return {"symbol": params["symbol"], "markPrice": "42.0"}
+
+    client = SimpleNamespace(mark_prices=cache, _send_public_request=send_public)
+    client.get_mark_price = lambda symbol: BinanceClient.get_mark_price(client, symbol)
+    client._round_qty_by_filters = lambda symbol, qty, price_hint=None: {"ok": True, "qty": qty, "price": price_hint}
+    return client, rest_calls
+
+
+def test_stream_feeds_cache_and_order_path_skips_rest():
+    async def handler(ws, *args):
+        await ws.send(json.dumps([mark_event("BTCUSDT", 50000.5), mark_event("ETHUSDT", 3000)]))
+        await ws.wait_closed()
+
+    async def run(cache):
+        server = await websockets.serve(handler, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        stream = MarkPriceStream(cache, f"ws://127.0.0.1:{port}/ws")
+        await stream.start()
+        for _ in range(100):
+            if len(cache) >= 2:
+                break
+            await asyncio.sleep(0.02)
+        await stream.stop()
+        server.close()
+        await server.wait_closed()
+        return stream
+
+    cache = MarkPriceCache()
+    stream = asyncio.run(run(cache))
+    assert stream.url.endswith("/ws/!markPrice@arr@1s")
+    assert stream.messages_received == 1
+
+    client, rest_calls = make_client(cache)
+    norm = ExecutionAdapter(client).normalize_quantity("BTCUSDT", 0.01)
+    assert norm["price"] == 50000.5
+    assert rest_calls == []
+    assert cache.get("ETHUSDT")["nextFundingTime"] == 1_700_000_800_000
+
+
+def test_stale_or_missing_entry_falls_back_to_rest_and_refills():
+    cache = MarkPriceCache(max_age=0.05)
+    cache.update_events([mark_event("BTCUSDT", 1.0)])
+    client, rest_calls = make_client(cache)
+
+    assert client.get_mark_price("BTCUSDT")["markPrice"] == "1.0"
+    cache._entries["BTCUSDT"] = (cache._entries["BTCUSDT"][0] - 1.0, cache._entries["BTCUSDT"][1])
+    assert client.get_mark_price("BTCUSDT")["markPrice"] == "42.0"
+    # REST 결과도 캐시에 반영되어 max_age 동안 재사용
+    assert client.get_mark_price("BTCUSDT")["markPrice"] == "42.0"
+    assert rest_calls == ["BTCUSDT"]
+
+    cache.update({"error": "timeout", "code": -1})
+    assert cache.price("XRPUSDT") == 0.0
+
+
+def test_engine_execution_client_reads_shared_mark_price_cache(tmp_path, monkeypatch):
+    from backend.core.engine_manager import EngineManager
+    from backend.core.new_strategy import market_data_hub
+
+    # 엔진 로그/DB는 tmp_path로, 프로세스 전역 MarketDataHub는 테스트 후 복원
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(market_data_hub, "_hub_instance", None)
+
+    async def handler(ws, *args):
+        await ws.send(json.dumps([mark_event("BTCUSDT", 61000.25)]))
+        await ws.wait_closed()
+
+    async def run(cache):
+        server = await websockets.serve(handler, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        stream = MarkPriceStream(cache, f"ws://127.0.0.1:{port}/ws")
+        await stream.start()
+        for _ in range(100):
+            if len(cache):
+                break
+            await asyncio.sleep(0.02)
+        await stream.stop()
+        server.close()
+        await server.wait_closed()
+
+    # YonaService와 같은 배선: 서비스 스트림이 채우는 캐시를 가진 클라이언트를 엔진에 주입
+    client, rest_calls = make_client(MarkPriceCache())
+    manager = EngineManager(db_path=str(tmp_path / "engines.db"), binance_client=client)
+    try:
+        asyncio.run(run(client.mark_prices))
+        execution = manager.engines["Alpha"].orchestrator.exec
+
+        assert execution.client is client
+        norm = execution.normalize_quantity("BTCUSDT", 0.01)
+        assert norm["price"] == 61000.25
+        assert rest_calls == []
+    finally:
+        manager.shutdown()
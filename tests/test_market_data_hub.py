@@ -0,0 +1,75 @@
+import asyncio
+
+from backend.core.new_strategy.market_data_hub import MarketDataHub
+from backend.core.new_strategy.orchestrator import OrchestratorConfig, StrategyOrchestrator
+
+from tests.test_orchestrator_async import SlowAsyncClient
+
+
+def make_engines(n, symbol="TEST"):
+    client = SlowAsyncClient(0.05)
+    client.is_symbol_supported = lambda s: {"supported": True}
+    hub = MarketDataHub(client)
+    engines = [
+        StrategyOrchestrator(client, fetcher=hub, config=OrchestratorConfig(symbol=symbol))
+        for _ in range(n)
+    ]
+    return client, hub, engines
+
+
+def test_concurrent_warmups_fetch_each_key_once():
+    client, hub, engines = make_engines(3)
+    for orch in engines:
+        orch._acquire_market_data()
+
+    async def run():
+        await asyncio.gather(*(orch.warmup() for orch in engines))
+        # 같은 캔들 구간 내 순차 warmup도 캐시에서 처리
+        await engines[0].warmup()
+
+    asyncio.run(run())
+    assert sorted(client.calls) == [("15m", 200), ("1m", 200), ("3m", 200)]
+    assert hub.rest_fetches == 3
+    assert hub.subscribers("TEST", "1m") == 3
+    assert hub.cache.count("TEST", "1m") == 200
+
+
+def test_release_evicts_only_after_last_subscriber():
+    client, hub, engines = make_engines(2)
+    for orch in engines:
+        orch._acquire_market_data()
+    asyncio.run(engines[0].warmup())
+
+    engines[0]._release_market_data()
+    assert hub.subscribers("TEST", "1m") == 1
+    assert hub.cache.count("TEST", "1m") == 200
+
+    engines[1]._release_market_data()
+    assert hub.subscriptions == []
+    assert hub.cache.count("TEST", "1m") == 0
+    # 중복 해제는 무시
+    engines[1]._release_market_data()
+    assert hub.subscriptions == []
+
+
+def test_failed_fetch_is_shared_and_not_cached():
+    client, hub, engines = make_engines(2)
+    attempts = []
+
+    async def failing(*args, **kwargs):
+        attempts.append(1)
+        await asyncio.sleep(0.01)
+        raise ConnectionError("boom")
+
+    client.get_klines_async = failing
+
+    async def run():
+        return await asyncio.gather(
+            *(hub.fetch_historical_candles("TEST", "1m", limit=5) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(run())
+    assert len(attempts) == 1
+    assert all(isinstance(r, Exception) for r in results)
+    assert hub._inflight == {}
@@ -15,3 +15,141 @@ def test_grid_search_basic():
     assert best_params["a"] == 3
     assert best_params["b"] == 0
     assert best_score == 3
+
+
+def frame_objective(params, df):
+    # depends on shared data: sum of close scaled by param
+    return float(df["close"].sum()) * params["a"] - params["b"]
+
+
+def slow_or_crashing_objective(params):
+    import os
+    import time
+    if params["a"] == 2:
+        time.sleep(30)
+    if params["a"] == 3:
+        os._exit(1)
+    return params["a"] - 2 * params["b"]
+
+
+def test_grid_search_process_pool_with_shared_frame():
+    import pandas as pd
+    df = pd.DataFrame({"close": [1.0, 2.0, 3.0], "symbol": ["X", "X", "X"]}, index=[5, 6, 7])
+    grid = {"a": [1, 2, 3], "b": [0, 1]}
+    best_params, best_score, all_results = GridSearch(grid).search(
+        frame_objective, max_workers=2, executor="process", data=df, chunksize=2)
+    assert best_params == {"a": 3, "b": 0}
+    assert best_score == 18.0
+    assert len(all_results) == 6
+
+
+def test_grid_search_process_pool_task_timeout_and_crash():
+    grid = {"a": [1, 2, 3, 4], "b": [0, 1]}
+    best_params, best_score, all_results = GridSearch(grid).search(
+        slow_or_crashing_objective, max_workers=2, executor="process", task_timeout=2.0, chunksize=3)
+    scores = {(p["a"], p["b"]): s for p, s in all_results}
+    assert len(scores) == 8
+    assert scores[(2, 0)] == float("-inf") and scores[(2, 1)] == float("-inf")
+    assert scores[(3, 0)] == float("-inf") and scores[(3, 1)] == float("-inf")
+    assert scores[(1, 1)] == -1 and scores[(4, 0)] == 4
+    assert best_params == {"a": 4, "b": 0}
+
+
+def test_grid_search_cancel_stops_process_pool():
+    import threading
+    gs = GridSearch({"a": [2] * 4, "b": [0]})
+    threading.Timer(1.0, gs.cancel).start()
+    _, best_score, all_results = gs.search(slow_or_crashing_objective, max_workers=2, executor="process")
+    assert all_results == []
+    assert best_score == float("-inf")
+
+
+def test_shared_frame_roundtrip_is_read_only():
+    import numpy as np
+    import pandas as pd
+    from backtesting_backend.optimizers.process_pool import SharedFrame, attach_frame
+    df = pd.DataFrame({"open_time": np.arange(4, dtype=np.int64) * 60000, "close": [1.0, 2.5, 3.0, 4.0],
+                       "symbol": list("aaaa")}, index=[10, 11, 12, 13])
+    with SharedFrame(df) as shared:
+        view, shm = attach_frame(shared.handle)
+        try:
+            pd.testing.assert_frame_equal(view, df[["open_time", "close"]])
+            assert not view["close"].to_numpy().flags.writeable
+        finally:
+            del view
+            shm.close()
+
+
+def staged_grid_fixture():
+    import functools
+    import pandas as pd
+    from backtesting_backend.core.backtest_service import _optimization_score
+    df = pd.read_csv("data/BTCUSDT_5m.csv").iloc[:1500]
+    df.index = pd.to_datetime(df["open_time"])
+    # risk axes come first, so itertools.product interleaves the indicator/signal configs
+    grid = {"stop_loss_pct": [0.005, 0.01, 0.02], "take_profit_pct": [0.0, 0.01],
+            "fast_ema_period": [5, 9], "vol_spike_lookback": [10, 20]}
+    score = functools.partial(
+        _optimization_score, symbol="BTCUSDT", interval="5m", initial_balance=1000.0, leverage=3,
+        base_params={"slow_ema_period": 21, "enable_volume_spike_filter": True, "vol_spike_threshold": 2.0},
+        execution_params={"fee_pct": 0.0004},
+    )
+    return df, grid, score
+
+
+def test_staged_grid_search_computes_each_stage_once():
+    from backtesting_backend.core.strategy_analyzer import StrategyAnalyzer
+    from backtesting_backend.core.strategy_simulator import StrategySimulator
+    from backtesting_backend.optimizers.staged_simulation import StagedSimulation, stage_key
+
+    class CountingAnalyzer(StrategyAnalyzer):
+        indicator_calls = 0
+        signal_calls = 0
+
+        def calculate_indicators(self, df, params):
+            CountingAnalyzer.indicator_calls += 1
+            return super().calculate_indicators(df, params)
+
+        def generate_signals(self, df, params):
+            CountingAnalyzer.signal_calls += 1
+            return super().generate_signals(df, params)
+
+    df, grid, score = staged_grid_fixture()
+    _, _, expected = GridSearch(grid).search(lambda p, d: score(p, d, simulator=StrategySimulator()), data=df)
+    staged = StagedSimulation(StrategySimulator(CountingAnalyzer()))
+    best_params, best_score, results = GridSearch(grid).search(
+        lambda p, d: score(p, d, simulator=staged), data=df, stage_key=stage_key)
+
+    assert CountingAnalyzer.indicator_calls == 2
+    assert CountingAnalyzer.signal_calls == 4
+    as_map = lambda rs: {tuple(sorted(p.items())): s for p, s in rs}
+    assert as_map(results) == as_map(expected)
+    assert len(results) == 24 and best_score == max(s for _, s in expected)
+
+
+def test_staged_grid_search_process_pool_matches_threads():
+    import functools
+    from backtesting_backend.core.strategy_simulator import StrategySimulator
+    from backtesting_backend.optimizers.staged_simulation import StagedSimulation, stage_key
+
+    df, grid, score = staged_grid_fixture()
+    objective = functools.partial(score, simulator=StagedSimulation(StrategySimulator()))
+    _, _, threaded = GridSearch(grid).search(objective, max_workers=2, data=df, stage_key=stage_key)
+    _, _, pooled = GridSearch(grid).search(objective, max_workers=2, executor="process", data=df, stage_key=stage_key)
+    as_map = lambda rs: {tuple(sorted(p.items())): s for p, s in rs}
+    assert len(pooled) == 24
+    assert as_map(pooled) == as_map(threaded)
+
+
+def test_grid_plan_groups_by_first_stage_key_and_splits_large_groups():
+    gs = GridSearch({"sl": [1, 2, 3], "fast": [5, 9], "sig": ["a", "b"]})
+    key = lambda p: (p["fast"], (p["fast"], p["sig"]))
+    chunks = gs._plan(key, max_chunk=4)
+    combos = [[gs._combos[i] for i in chunk] for chunk in chunks]
+    assert sorted(i for chunk in chunks for i in chunk) == list(range(12))
+    assert [len(c) for c in chunks] == [4, 2, 4, 2]
+    for group in (combos[0] + combos[1], combos[2] + combos[3]):
+        assert len({p["fast"] for p in group}) == 1
+        sigs = [p["sig"] for p in group]
+        runs = [s for k, s in enumerate(sigs) if k == 0 or sigs[k - 1] != s]
+        assert len(runs) == len(set(sigs))  # each signal config is contiguous
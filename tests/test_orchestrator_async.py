@@ -0,0 +1,143 @@
+import asyncio
+import time
+
+import pytest
+
+from backend.core.new_strategy.data_structures import OrderResult, PositionSide, PositionState
+from backend.core.new_strategy.orchestrator import OrchestratorConfig, StrategyOrchestrator
+
+INTERVAL_MS = {"1m": 60_000, "3m": 180_000, "15m": 900_000}
+
+
+class SlowAsyncClient:
+    """요청마다 지연이 있는 비동기 klines 클라이언트"""
+
+    time_offset = 0
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.calls = []
+
+    async def get_klines_async(self, symbol, interval, limit=500, start_time=None, end_time=None):
+        self.calls.append((interval, limit))
+        await asyncio.sleep(self.delay)
+        step = INTERVAL_MS[interval]
+        last_open = (int(time.time() * 1000) // step) * step
+        rows = []
+        for i in range(limit):
+            open_time = last_open - (limit - 1 - i) * step
+            price = 100.0 + i * 0.01
+            rows.append([open_time, price, price + 0.5, price - 0.5, price, 10.0,
+                         open_time + step - 1, 10.0 * price, 5])
+        return rows
+
+    def get_klines(self, *args, **kwargs):
+        raise AssertionError("비동기 경로에서 동기 get_klines 호출 금지")
+
+
+def make_orchestrator(delay):
+    client = SlowAsyncClient(delay)
+    orch = StrategyOrchestrator(client, config=OrchestratorConfig(symbol="TEST"))
+    # 평가 단계는 이 테스트의 관심사가 아님
+    orch._evaluate_step = lambda: {"events": []}
+    return orch, client
+
+
+def test_astep_refreshes_timeframes_concurrently():
+    orch, client = make_orchestrator(delay=0.3)
+
+    async def run():
+        start = time.perf_counter()
+        await orch.astep()
+        return time.perf_counter() - start
+
+    elapsed = asyncio.run(run())
+    assert sorted(client.calls) == [("15m", 200), ("1m", 200), ("3m", 200)]
+    # 순차 실행이면 0.9초 이상
+    assert elapsed < 0.6
+    for interval in ("1m", "3m", "15m"):
+        assert orch.fetcher.cache.count("TEST", interval) == 200
+
+
+def test_step_reuses_one_loop_and_rejects_running_loop():
+    orch, client = make_orchestrator(delay=0.0)
+    orch.step()
+    loop = orch._sync_loop
+    # 캔들 종료 전에는 추가 요청 없음
+    orch._should_update_candle = lambda interval: False
+    orch.step()
+    assert orch._sync_loop is loop and not loop.is_closed()
+    assert len(client.calls) == 3
+
+    async def inside_loop():
+        with pytest.raises(RuntimeError):
+            orch.step()
+
+    asyncio.run(inside_loop())
+
+
+def test_next_close_deadline_uses_server_offset_and_settle():
+    client = SlowAsyncClient(0.0)
+    client.time_offset = 1500  # 서버가 1.5초 빠름
+    orch = StrategyOrchestrator(client, config=OrchestratorConfig(
+        symbol="TEST", evaluation_mode="candle_close", close_settle_sec=0.5,
+    ))
+    # 로컬 600.0 = 서버 601.5 -> 다음 종료 660(서버) + 0.5 -> 로컬 659.0
+    assert orch.next_close_deadline(600.0) == pytest.approx(659.0)
+    # settle 구간 안(서버 660.2)이면 같은 종료 시각을 반환
+    assert orch.next_close_deadline(658.7) == pytest.approx(659.0)
+
+
+def test_candle_close_mode_evaluates_once_per_close_and_ticks_price_only():
+    client = SlowAsyncClient(0.0)
+    client.mark_price = 0.0
+    client.get_mark_price = lambda symbol: {"markPrice": str(client.mark_price)}
+    orch = StrategyOrchestrator(client, config=OrchestratorConfig(
+        symbol="TEST", evaluation_mode="candle_close",
+    ))
+    original_evaluate = orch._evaluate_step
+    evaluations = []
+
+    def counting_evaluate():
+        evaluations.append(1)
+        return original_evaluate()
+
+    orch._evaluate_step = counting_evaluate
+    closes = []
+
+    class FakeExec:
+        def close_market_long(self, symbol):
+            closes.append(symbol)
+            return OrderResult(ok=True, symbol=symbol, avg_price=client.mark_price)
+
+    orch.exec = FakeExec()
+
+    async def run():
+        await orch.run_tick(1)
+        # 같은 캔들 구간 내 재호출: 포지션이 없으면 아무 것도 하지 않음
+        assert await orch.run_tick(2) is None
+        assert len(evaluations) == 1
+
+        # 포지션 보유 중 틱: 지표 재계산 없이 가격만으로 리스크 체크
+        entry = float(orch.fetcher.cache.get_latest_candle("TEST", "1m").close)
+        orch.position = PositionState(
+            symbol="TEST", side=PositionSide.LONG, entry_price=entry, quantity=1.0,
+            leverage=1, opened_at=orch._server_now_ms(), highest_price=entry, lowest_price=entry,
+            unrealized_pnl=0.0, unrealized_pnl_pct=0.0,
+            stop_loss_price=entry * 0.99, take_profit_price=entry * 1.05,
+        )
+        orch.indicator.calculate_columns = None  # 호출되면 실패
+        client.mark_price = entry * 1.001
+        held = await orch.run_tick(3)
+        assert held["events"][-1]["type"] == "HOLD_IN_POSITION"
+        client.mark_price = entry * 0.95
+        exited = await orch.run_tick(4)
+        assert exited["events"][-1]["type"] == "EXIT"
+        assert orch.position is None
+
+    asyncio.run(run())
+    assert len(evaluations) == 1
+    assert closes == ["TEST"]
+    # 평가에 사용된 1m 창은 진행 중 캔들을 제외
+    last_closed = orch.fetcher.cache.get_latest_columns("TEST", "1m", 1, closed_only=True)
+    assert orch.prev_ind_1m.timestamp == int(last_closed.close_time[-1])
@@ -0,0 +1,55 @@
+import threading
+import time
+
+import pytest
+
+from backend.api.rate_limit_manager import RateLimitManager
+
+
+def test_low_priority_bulk_request_cannot_starve_orders():
+    rlm = RateLimitManager()
+    # 랭킹 갱신(weight 40)을 예약분(20%)까지 반복
+    for _ in range(48):
+        rlm.wait_for_permission("general", weight=40, priority="low")
+    status = rlm.get_status()["buckets"]["general"]
+    assert status["available"] == pytest.approx(480, abs=5)
+
+    with rlm._lock:
+        assert rlm._try_acquire("general", 40, 2) > 0  # low는 대기 대상
+    start = time.monotonic()
+    rlm.wait_for_permission("orders", weight=1)
+    assert time.monotonic() - start < 0.05
+    assert rlm.get_status()["buckets"]["orders"]["available"] == pytest.approx(299, abs=1)
+
+
+def test_waiting_caller_does_not_block_other_threads():
+    rlm = RateLimitManager()
+    rlm.observe_response(200, {"X-MBX-USED-WEIGHT-1M": "2399.5"})
+    # general 버킷이 비어 있어 low 요청은 대기, 락은 잡지 않음
+    waiter = threading.Thread(target=rlm.wait_for_permission, args=("general", 40), kwargs={"priority": "low"},
+                              daemon=True)
+    waiter.start()
+    time.sleep(0.05)
+    assert waiter.is_alive()
+
+    acquired = threading.Event()
+    threading.Thread(target=lambda: (rlm.get_status(), acquired.set()), daemon=True).start()
+    assert acquired.wait(0.5)
+    assert rlm.get_status()["waits"]["low"] == 1
+
+
+def test_headers_sync_usage_and_429_blocks_all_requests():
+    rlm = RateLimitManager()
+    rlm.observe_response(200, {"x-mbx-used-weight-1m": "2000", "X-MBX-ORDER-COUNT-10S": "290"})
+    buckets = rlm.get_status()["buckets"]
+    assert buckets["general"]["available"] == pytest.approx(400, abs=2)
+    assert buckets["orders"]["available"] == pytest.approx(10, abs=1)
+
+    # 서버 사용량이 로컬보다 적다고 해서 잔량을 늘리지는 않음
+    rlm.observe_response(200, {"x-mbx-used-weight-1m": "10"})
+    assert rlm.get_status()["buckets"]["general"]["available"] < 500
+
+    rlm.observe_response(429, {"Retry-After": "7"})
+    assert rlm.get_status()["blocked_sec"] == pytest.approx(7, abs=0.5)
+    with rlm._lock:
+        assert rlm._try_acquire("orders", 1, 0) == pytest.approx(7, abs=0.5)
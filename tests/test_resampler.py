@@ -0,0 +1,111 @@
+import asyncio
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from backend.core.new_strategy.data_structures import Candle
+from backend.core.new_strategy.orchestrator import OrchestratorConfig, StrategyOrchestrator
+from backend.core.new_strategy.resampler import CandleResampler, resample_candles, resample_dataframe
+
+from tests.test_orchestrator_async import SlowAsyncClient
+
+DATA = Path(__file__).resolve().parents[1] / "data" / "BTCUSDT_5m.csv"
+
+
+def make_1m(open_time, o, h, l, c, v=1.0, closed=True):
+    return Candle(
+        symbol="TEST", interval="1m", open_time=open_time, close_time=open_time + 59_999,
+        open=o, high=h, low=l, close=c, volume=v, quote_volume=v * c, trades_count=2,
+        is_closed=closed,
+    )
+
+
+def test_incremental_bars_partial_then_closed():
+    base = 1_700_000_100_000 - (1_700_000_100_000 % 180_000)
+    r = CandleResampler("TEST", ["3m"])
+    bars = r.add(make_1m(base, 10, 12, 9, 11))
+    assert len(bars) == 1 and not bars[0].is_closed
+    assert (bars[0].open, bars[0].high, bars[0].low, bars[0].close) == (10, 12, 9, 11)
+
+    # 진행 중 1m 캔들과 중복 캔들은 무시
+    assert r.add(make_1m(base + 60_000, 11, 99, 1, 50, closed=False)) == []
+    assert r.add(make_1m(base, 10, 12, 9, 11)) == []
+
+    r.add(make_1m(base + 60_000, 11, 15, 10, 14, v=2.0))
+    bar = r.add(make_1m(base + 120_000, 14, 14, 8, 13, v=3.0))[0]
+    assert bar.is_closed
+    assert (bar.open_time, bar.close_time) == (base, base + 179_999)
+    assert (bar.open, bar.high, bar.low, bar.close, bar.volume) == (10, 15, 8, 13, 6.0)
+    assert bar.trades_count == 6
+
+
+def test_gap_closes_previous_bucket():
+    base = 1_700_000_100_000 - (1_700_000_100_000 % 180_000)
+    r = CandleResampler("TEST", ["3m"])
+    r.add(make_1m(base, 10, 12, 9, 11))
+    # 구간 마지막 1m 누락 후 다음 구간 시작
+    bars = r.add(make_1m(base + 180_000, 11, 11, 11, 11))
+    assert [(b.open_time, b.is_closed) for b in bars] == [(base, True), (base + 180_000, False)]
+
+
+def test_invalid_target_interval():
+    with pytest.raises(ValueError):
+        CandleResampler("TEST", ["1m"])
+    with pytest.raises(ValueError):
+        CandleResampler("TEST", ["3m"], base_interval="5m")
+
+
+def test_matches_exchange_bars_resampled_by_pandas():
+    """거래소 5m 봉을 15m/1h로 집계한 결과가 pandas 기준 집계와 일치"""
+    raw = pd.read_csv(DATA, parse_dates=["open_time"]).head(2000)
+    df = raw.rename(columns={"open_time": "timestamp"}).assign(
+        timestamp=lambda d: d["timestamp"].dt.tz_localize("UTC")
+    )
+    for interval, rule in (("15m", "15min"), ("1h", "1h")):
+        ours = resample_dataframe(df, interval, base_interval="5m").set_index("timestamp")
+        ref = df.set_index("timestamp").resample(rule).agg(
+            {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
+        ).dropna()
+        assert list(ours.index) == list(ref.index)
+        for col in ("open", "high", "low", "close", "volume"):
+            assert ours[col].to_numpy() == pytest.approx(ref[col].to_numpy())
+
+    candles = [
+        Candle("BTCUSDT", "5m", int(ts.timestamp() * 1000), int(ts.timestamp() * 1000) + 299_999,
+               row.open, row.high, row.low, row.close, row.volume, 0.0)
+        for ts, row in zip(df["timestamp"], df.itertuples())
+    ]
+    hourly = resample_candles(candles, "1h", base_interval="5m")
+    assert hourly[0].open == df["open"].iloc[0]
+    assert all(b.is_closed for b in hourly[:-1])
+
+
+def test_orchestrator_resample_mode_fetches_only_entry_interval():
+    client = SlowAsyncClient(0.0)
+    orch = StrategyOrchestrator(
+        client, config=OrchestratorConfig(symbol="TEST", resample_from_entry=True)
+    )
+    orch._evaluate_step = lambda: {"events": []}
+
+    async def run():
+        await orch.warmup()
+        client.calls.clear()
+        # 모든 타임프레임 캔들 종료 상황에서도 REST는 1m만 조회
+        orch._last_candle_times = {k: 0 for k in orch._last_candle_times}
+        await orch.astep()
+
+    client.is_symbol_supported = lambda s: {"supported": True}
+    asyncio.run(run())
+    assert client.calls == [("1m", 2)]
+
+    # 진행 중이던 1m 봉이 종료되면 해당 3m/15m 구간 캔들을 로컬 집계로 갱신
+    cache = orch.fetcher.cache
+    live = cache.get_latest_candle("TEST", "1m")
+    cache.add_candle(make_1m(live.open_time, 50.0, 200.0, 40.0, 150.0))
+    orch._sync_resampled()
+    for interval, step in (("3m", 180_000), ("15m", 900_000)):
+        bar = cache.get_latest_candle("TEST", interval)
+        assert bar.open_time == (live.open_time // step) * step
+        assert (bar.high, bar.close) == (200.0, 150.0)
+        assert bar.is_closed == (live.open_time + 60_000 == bar.open_time + step)
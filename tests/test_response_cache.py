@@ -0,0 +1,82 @@
+import asyncio
+import threading
+import time
+
+import httpx
+
+from backend.api_client.response_cache import PublicResponseCache
+
+from tests.test_async_binance_client import make_client
+
+TICKERS = [{"symbol": "BTCUSDT", "priceChangePercent": "1.5"}, {"symbol": "ETHUSDT", "priceChangePercent": "-2"}]
+
+
+def test_concurrent_ticker_calls_share_one_request_and_reuse_within_ttl():
+    def handler(request):
+        assert request.url.path == "/fapi/v1/ticker/24hr"
+        return httpx.Response(200, json=TICKERS)
+
+    _, aio, requests, bind = make_client(handler)
+
+    async def run():
+        bind()
+        results = await asyncio.gather(*(aio.get_24hr_ticker() for _ in range(3)))
+        # 랭킹/SETTLING/변동성 계산이 같은 주기에 호출 → 캐시/전체 티커에서 응답
+        again = await aio.get_24hr_ticker()
+        single = await aio.get_24hr_ticker("ETHUSDT")
+        return results, again, single
+
+    results, again, single = asyncio.run(run())
+    assert all(r == TICKERS for r in results) and again == TICKERS
+    assert single == TICKERS[1]
+    assert len(requests) == 1
+    status = aio.public_cache.get_status()
+    assert status["misses"] == 1 and status["hits"] + status["coalesced"] == 3
+
+
+def test_async_single_flight_shares_in_flight_future():
+    cache = PublicResponseCache()
+    key = cache.make_key("GET", "/fapi/v1/ticker/24hr", None)
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.02)
+        return TICKERS
+
+    async def run():
+        return await asyncio.gather(*(cache.acall(key, 3.0, fetch) for _ in range(4)))
+
+    assert asyncio.run(run()) == [TICKERS] * 4
+    assert len(calls) == 1 and cache.coalesced == 3
+
+
+def test_thread_single_flight_and_errors_are_not_cached():
+    cache = PublicResponseCache(ttls={"/fapi/v1/ticker/24hr": 60.0})
+    key = cache.make_key("GET", "/fapi/v1/ticker/24hr", {})
+    calls = []
+
+    def slow_fetch():
+        calls.append(1)
+        time.sleep(0.05)
+        return TICKERS
+
+    barrier = threading.Barrier(5)
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(cache.call(key, 60.0, slow_fetch))
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(calls) == 1 and results == [TICKERS] * 5
+
+    error_key = cache.make_key("GET", "/fapi/v1/ticker/24hr", {"symbol": "X"})
+    assert cache.call(error_key, 60.0, lambda: {"error": "boom", "code": 500})["code"] == 500
+    assert cache.peek(error_key) is None
+    assert cache.ttl_for("POST", "/fapi/v1/ticker/24hr") == 0.0
+    assert cache.ttl_for("GET", "/fapi/v1/klines") == 0.0
@@ -0,0 +1,94 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+from backend.core.new_strategy.scheduler import OrchestratorScheduler
+
+
+class FakeOrchestrator:
+    """스케줄러가 사용하는 인터페이스만 구현한 가짜 오케스트레이터"""
+
+    def __init__(self, symbol, in_position=False, step_sec=0.0, period=0.05, log=None):
+        self.cfg = SimpleNamespace(symbol=symbol, loop_interval_sec=period, interval_entry="1m")
+        self.position = object() if in_position else None
+        self.step_sec = step_sec
+        self.log = log if log is not None else []
+        self.events = []
+        self.threads = set()
+        self._running = False
+
+    async def warmup_or_report(self):
+        return True
+
+    def next_close_deadline(self, after):
+        return (int(after // 60) + 1) * 60
+
+    async def run_tick(self, step_no=0):
+        self.threads.add(threading.get_ident())
+        self.log.append(self.cfg.symbol)
+        await asyncio.sleep(self.step_sec)
+        return {"events": []}
+
+    def _emit_event(self, payload):
+        self.events.append(payload)
+
+
+def test_many_symbols_share_one_loop_thread():
+    scheduler = OrchestratorScheduler()
+    scheduler.start()
+    orchs = [FakeOrchestrator(f"S{i}USDT", in_position=True) for i in range(60)]
+    try:
+        for o in orchs:
+            scheduler.register(o)
+        time.sleep(0.4)
+        status = scheduler.get_status()
+    finally:
+        scheduler.stop()
+
+    assert status["symbols"] == 60
+    assert all(job["steps"] >= 3 for job in status["jobs"])
+    threads = set().union(*(o.threads for o in orchs))
+    assert len(threads) == 1
+
+
+def test_position_symbols_run_first_when_due_together():
+    log = []
+    scheduler = OrchestratorScheduler(max_concurrency=1)
+    flat = [FakeOrchestrator(f"FLAT{i}", log=log) for i in range(3)]
+    held = [FakeOrchestrator(f"POS{i}", in_position=True, log=log, period=10) for i in range(2)]
+    scheduler.start()
+    try:
+        # 루프가 잠시 멈춘 사이 동시에 등록 -> 같은 틱에서 마감
+        fut = asyncio.run_coroutine_threadsafe(_register_all(scheduler, flat + held), scheduler._loop)
+        fut.result(2)
+        time.sleep(0.2)
+    finally:
+        scheduler.stop()
+
+    assert sorted(log[:2]) == ["POS0", "POS1"]
+    assert sorted(log[2:5]) == ["FLAT0", "FLAT1", "FLAT2"]
+
+
+async def _register_all(scheduler, orchs):
+    for o in orchs:
+        await scheduler._add(o)
+
+
+def test_overrun_is_reported_and_unregister_waits_for_step():
+    scheduler = OrchestratorScheduler()
+    slow = FakeOrchestrator("SLOWUSDT", in_position=True, step_sec=0.15, period=0.05)
+    scheduler.start()
+    try:
+        scheduler.register(slow)
+        time.sleep(0.4)
+        scheduler.unregister(slow)
+        steps_after = len(slow.log)
+        time.sleep(0.2)
+    finally:
+        scheduler.stop()
+
+    assert len(slow.log) == steps_after
+    overruns = [e for e in slow.events if e["type"] == "SCHEDULER_OVERRUN"]
+    assert overruns and overruns[0]["missed_ticks"] >= 2
+    assert scheduler.get_status()["symbols"] == 0
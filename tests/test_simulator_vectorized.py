@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtesting_backend.core.strategy_simulator import StrategySimulator, _ExecutionConfig
+
+
+def load_df(n=None):
+    df = pd.read_csv("data/BTCUSDT_5m.csv")
+    df.index = pd.to_datetime(df["open_time"])
+    return df.iloc[:n] if n else df
+
+
+def random_signals(df, seed, p_buy=0.03, p_sell=0.02):
+    rng = np.random.default_rng(seed)
+    df = df.copy()
+    df["buy_signal"] = rng.random(len(df)) < p_buy
+    df["sell_signal"] = rng.random(len(df)) < p_sell
+    return df
+
+
+def run_both(sim, df, params, initial_balance=1000.0, leverage=3):
+    df2 = sim._prepare_frame(df, params)
+    cfg = _ExecutionConfig.from_params(params)
+    fast = sim._simulate_arrays(df2, initial_balance, leverage, cfg)
+    ref = sim._simulate_rows(df2, initial_balance, leverage, cfg)
+    return fast, ref
+
+
+PARAM_SETS = [
+    {"stop_loss_pct": 0.004},
+    {"stop_loss_pct": 0.01, "take_profit_pct": 0.006, "fee_pct": 0.0004, "slippage_pct": 0.0002},
+    {"stop_loss_pct": 0.02, "trailing_stop_pct": 0.003, "position_size_policy": {"method": "risk_per_trade", "value": 0.01}},
+    {"stop_loss_pct": 0.05, "take_profit_pct": 0.01, "trailing_stop_pct": 0.004, "no_compounding": True,
+     "position_size": 0.5, "enable_volume_spike_filter": True, "vol_spike_threshold": 2.0},
+    {"stop_loss_pct": 0.03, "position_size": 1.0, "early_stop_balance_frac": 0.97},
+]
+
+
+@pytest.mark.parametrize("params", PARAM_SETS)
+def test_array_engine_matches_row_reference(params):
+    sim = StrategySimulator()
+    df = random_signals(load_df(3000), seed=len(str(params)))
+    params = dict(params, use_precomputed_signals=True)
+    (bal_a, trades_a, eq_a, abort_a), (bal_r, trades_r, eq_r, abort_r) = run_both(sim, df, params)
+    assert len(trades_r) > 0
+    assert bal_a == bal_r and abort_a == abort_r
+    assert trades_a == trades_r
+    np.testing.assert_array_equal(eq_a, eq_r)
+
+
+def test_nan_signals_and_blocked_entries_follow_row_semantics():
+    sim = StrategySimulator()
+    df = load_df(400)
+    df["buy_signal"] = np.where(np.arange(len(df)) % 50 == 0, 1.0, 0.0)
+    df.loc[df.index[::97], "buy_signal"] = np.nan  # NaN은 참으로 취급 (행 단위 구현과 동일)
+    df["sell_signal"] = np.arange(len(df)) % 7 == 0
+    params = {"use_precomputed_signals": True, "stop_loss_pct": 0.5, "enable_volume_spike_filter": True,
+              "vol_spike_threshold": 1.5}
+    (bal_a, trades_a, eq_a, _), (bal_r, trades_r, eq_r, _) = run_both(sim, df, params)
+    assert trades_a == trades_r and bal_a == bal_r
+    np.testing.assert_array_equal(eq_a, eq_r)
+
+
+def test_full_data_matches_row_reference_and_returns_equity_array():
+    sim = StrategySimulator()
+    df = random_signals(load_df(), seed=3)
+    params = {"use_precomputed_signals": True, "stop_loss_pct": 0.01, "take_profit_pct": 0.01,
+              "trailing_stop_pct": 0.005, "fee_pct": 0.0004}
+    fast, ref = run_both(sim, df, params, leverage=1)
+    assert fast[1] == ref[1]
+    res = sim.run_simulation("BTCUSDT", "5m", df, 1000.0, 1, params)
+    assert isinstance(res["equity_curve"], np.ndarray) and res["equity_curve"][0] == 1000.0
+    assert res["equity_curve"][-1] == pytest.approx(res["final_balance"])
+
+
+SWEEP_COLUMNS = ["final_balance", "profit", "profit_percentage", "total_trades", "win_rate",
+                 "max_drawdown_pct", "aborted_early", "insufficient_trades"]
+
+
+def test_exit_sweep_matches_single_runs():
+    sim = StrategySimulator()
+    df = random_signals(load_df(3000), seed=11)
+    base = {"use_precomputed_signals": True, "enable_volume_spike_filter": True, "position_size": 0.5}
+    extras = [{}, {"position_size_policy": {"method": "risk_per_trade", "value": 0.01}},
+              {"no_compounding": True, "slippage_pct": 0.0002}, {"early_stop_balance_frac": 0.995, "min_trades": 20},
+              {"vol_spike_threshold": 2.0}]
+    sets = [dict(stop_loss_pct=sl, take_profit_pct=tp, trailing_stop_pct=tr, fee_pct=0.0004, **extra)
+            for sl in (0.002, 0.02) for tp in (0.0, 0.006) for tr in (0.0, 0.003) for extra in extras]
+
+    table = sim.run_exit_sweep("BTCUSDT", "5m", df, 1000.0, 3, base, sets)
+    assert len(table) == len(sets) and table["aborted_early"].any()
+    for k, params in enumerate(sets):
+        res = sim.run_simulation("BTCUSDT", "5m", df, 1000.0, 3, {**base, **params})
+        assert table.loc[k, "stop_loss_pct"] == params["stop_loss_pct"]
+        assert [table.loc[k, c] for c in SWEEP_COLUMNS] == [res[c] for c in SWEEP_COLUMNS]
+
+
+def test_exit_sweep_rejects_signal_parameters():
+    with pytest.raises(ValueError):
+        StrategySimulator().run_exit_sweep("BTCUSDT", "5m", load_df(50), 1000.0, 1, {}, [{"fast_ema_period": 5}])
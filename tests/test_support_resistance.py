@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtesting_backend.core.strategy_analyzer import StrategyAnalyzer
+from backtesting_backend.core.support_resistance import rolling_support_resistance, sr_proximity_flags
+
+
+def load_df(n, start=0):
+    df = pd.read_csv("data/LSKUSDT_5m.csv").iloc[start:start + n if n else None]
+    df.index = pd.to_datetime(df["open_time"])
+    return df[["open", "high", "low", "close", "volume"]]
+
+
+@pytest.mark.parametrize("lookback,num_levels", [(50, 3), (100, 3), (200, 5), (3, 0), (2, 3)])
+def test_rolling_levels_match_prefix_recomputation(lookback, num_levels):
+    analyzer = StrategyAnalyzer()
+    df = load_df(320)
+    levels = rolling_support_resistance(df, lookback, num_levels)
+    for t in range(len(df)):
+        assert levels[t] == analyzer.identify_support_resistance(df.iloc[: t + 1], lookback, num_levels), t
+
+
+def test_rolling_levels_with_ties_and_close_only_frames():
+    analyzer = StrategyAnalyzer()
+    df = load_df(250, start=500).round(2)  # 반올림으로 같은 레벨이 여러 번 등장
+    close_only = df[["close"]]
+    for frame in (df, close_only):
+        levels = rolling_support_resistance(frame, 40, 4)
+        for t in range(len(frame)):
+            assert levels[t] == analyzer.identify_support_resistance(frame.iloc[: t + 1], 40, 4), t
+
+
+def test_proximity_flags_match_reference_and_scale():
+    analyzer = StrategyAnalyzer()
+    df = load_df(300)
+    near_s, near_r = sr_proximity_flags(df, lookback_period=60, num_levels=3, proximity=0.002)
+    for t in range(len(df)):
+        supports, resistances = analyzer.identify_support_resistance(df.iloc[: t + 1], 60, 3)
+        price = float(df["close"].iloc[t])
+        assert near_s[t] == any(abs(price - s) / max(1e-9, abs(s)) <= 0.002 for s in supports)
+        assert near_r[t] == any(abs(price - r) / max(1e-9, abs(r)) <= 0.002 for r in resistances)
+    assert near_s.any() and near_r.any()
+
+    # 전체 데이터(1.9k봉) lookback 200도 봉마다 플래그 1개
+    full = load_df(None)
+    near_s, near_r = sr_proximity_flags(full, lookback_period=200, num_levels=3, proximity=0.001)
+    assert len(near_s) == len(near_r) == len(full)
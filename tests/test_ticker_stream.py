@@ -0,0 +1,75 @@
+import asyncio
+import json
+import random
+
+import websockets
+
+from backend.api_client.ticker_stream import TickerRanking, TickerStream
+
+
+def ticker_event(symbol, pct, last="1.0"):
+    return {"e": "24hrTicker", "E": 1, "s": symbol, "P": f"{pct:.2f}", "c": last, "h": "2", "l": "0.5",
+            "q": "1000", "O": 0, "C": 1, "n": 10}
+
+
+def full_sort(tickers):
+    return sorted(tickers.values(), key=lambda t: (-float(t["priceChangePercent"]), t["symbol"]))
+
+
+def test_incremental_ranking_matches_full_resort():
+    rng = random.Random(7)
+    symbols = [f"C{i:03d}USDT" for i in range(200)]
+    rest = [{"symbol": s, "priceChangePercent": f"{rng.uniform(-20, 20):.2f}"} for s in symbols]
+    ranking = TickerRanking()
+    ranking.load(rest)
+    expected = {t["symbol"]: t for t in rest}
+    assert ranking.ranked() == full_sort(expected)
+
+    for _ in range(50):
+        batch = []
+        for s in rng.sample(symbols, 30):
+            # 일부는 상승률 변동 없이 가격만 바뀜 (재배치 대상 아님)
+            pct = float(expected[s]["priceChangePercent"]) if rng.random() < 0.3 else round(rng.uniform(-20, 20), 1)
+            batch.append(ticker_event(s, pct, last=str(rng.random())))
+        before = ranking.repositioned
+        ranking.update_events(batch)
+        for e in batch:
+            expected[e["s"]] = ranking.get(e["s"])
+        assert ranking.repositioned - before <= len(batch)
+        assert ranking.ranked() == full_sort(expected)
+
+    # 상승률이 같으면 순위 변경 없이 값만 교체
+    top = ranking.ranked()[0]
+    version = ranking.version
+    ranking.update_events([ticker_event(top["symbol"], float(top["priceChangePercent"]), last="99")])
+    assert ranking.version == version
+    assert ranking.ranked()[0]["lastPrice"] == "99"
+
+
+def test_stream_keeps_ranking_fresh_after_rest_cold_start():
+    async def handler(ws, *args):
+        await ws.send(json.dumps([ticker_event("AAAUSDT", 30.0), ticker_event("BBBUSDT", -1.0)]))
+        await ws.wait_closed()
+
+    async def run(ranking):
+        server = await websockets.serve(handler, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        stream = TickerStream(ranking, f"ws://127.0.0.1:{port}/ws")
+        await stream.start()
+        for _ in range(100):
+            if ranking.stream_updated:
+                break
+            await asyncio.sleep(0.02)
+        await stream.stop()
+        server.close()
+        await server.wait_closed()
+        return stream
+
+    ranking = TickerRanking()
+    stream = asyncio.run(run(ranking))
+    assert stream.url.endswith("/ws/!ticker@arr")
+    # REST 전체 티커로 채우기 전에는 스트림만으로 신선하다고 보지 않음
+    assert not ranking.is_fresh()
+    ranking.load([{"symbol": "CCCUSDT", "priceChangePercent": "5"}])
+    assert ranking.is_fresh()
+    assert [t["symbol"] for t in ranking.ranked()] == ["AAAUSDT", "CCCUSDT", "BBBUSDT"]
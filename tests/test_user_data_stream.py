@@ -0,0 +1,202 @@
+import asyncio
+import json
+
+import websockets
+
+from backend.api_client.binance_client import BinanceClient
+from backend.api_client.user_data_stream import AccountState, UserDataStream
+from backend.core.account_manager import AccountManager
+
+
+def account_snapshot(amt, wallet, update_time):
+    return {
+        "totalWalletBalance": str(wallet),
+        "assets": [{"asset": "USDT", "walletBalance": str(wallet), "crossWalletBalance": str(wallet),
+                    "updateTime": update_time}],
+        "positions": [{"symbol": "BTCUSDT", "positionSide": "BOTH", "positionAmt": str(amt),
+                       "entryPrice": "50000", "unrealizedProfit": "0", "updateTime": update_time}],
+    }
+
+
+def account_update(amt, wallet, ts):
+    return {"e": "ACCOUNT_UPDATE", "E": ts, "T": ts, "a": {
+        "m": "ORDER",
+        "B": [{"a": "USDT", "wb": str(wallet), "cw": str(wallet), "bc": "0"}],
+        "P": [{"s": "BTCUSDT", "pa": str(amt), "ep": "50000", "up": "0", "mt": "isolated", "ps": "BOTH"}],
+    }}
+
+
+def trade_update(qty, ts):
+    return {"e": "ORDER_TRADE_UPDATE", "E": ts, "T": ts, "o": {
+        "s": "BTCUSDT", "S": "SELL", "x": "TRADE", "X": "FILLED", "i": 7, "c": "exit",
+        "L": "50100", "l": str(qty), "z": str(qty), "rp": "1.0", "n": "0.02", "T": ts,
+    }}
+
+
+class FakeUserClient:
+    """listenKey/계좌 스냅샷 REST 대체 (동기 메서드 → UserDataStream이 스레드에서 실행)"""
+
+    def __init__(self):
+        self.account_state = AccountState()
+        self.snapshots = [account_snapshot(0.0, 1000, 100), account_snapshot(0.0, 1001, 400)]
+        self.calls = []
+
+    def create_listen_key(self):
+        self.calls.append("create")
+        return {"listenKey": f"key{self.calls.count('create')}"}
+
+    def keepalive_listen_key(self, key):
+        self.calls.append(f"keepalive:{key}")
+        return {}
+
+    def close_listen_key(self, key):
+        self.calls.append(f"close:{key}")
+        return {}
+
+    def get_account_info(self):
+        self.calls.append("snapshot")
+        return self.snapshots.pop(0) if len(self.snapshots) > 1 else self.snapshots[0]
+
+
+def test_stream_tracks_positions_fills_and_resyncs_after_gap():
+    paths = []
+
+    async def handler(ws, *args):
+        path = getattr(getattr(ws, "request", None), "path", None) or (args[0] if args else "")
+        paths.append(path)
+        if len(paths) == 1:
+            # 스냅샷보다 오래된 이벤트는 무시되고, 이후 이벤트만 반영
+            await ws.send(json.dumps(account_update(5.0, 10, 50)))
+            await ws.send(json.dumps(account_update(0.01, 995, 200)))
+            await ws.send(json.dumps(trade_update(0.01, 210)))
+            await ws.send(json.dumps({"e": "listenKeyExpired", "E": 300}))
+            await ws.wait_closed()
+            return
+        await ws.wait_closed()
+
+    async def run(client, stream):
+        server = await websockets.serve(handler, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        stream.base_url = f"ws://127.0.0.1:{port}/ws"
+        await stream.start()
+        for _ in range(200):
+            if stream.reconnect_count >= 1 and client.account_state.is_live():
+                break
+            await asyncio.sleep(0.02)
+        await asyncio.sleep(0.1)  # keepalive 주기(0.05초) 경과
+        live_after_resync = client.account_state.is_live()
+        await stream.stop()
+        server.close()
+        await server.wait_closed()
+        return live_after_resync
+
+    client = FakeUserClient()
+    stream = UserDataStream(client, "ws://unused", reconnect_delay_sec=0.01, keepalive_sec=0.05)
+    fills, observed = [], []
+
+    def on_fill(fill):
+        fills.append(fill)
+        observed.append((client.account_state.is_live(), client.account_state.position("BTCUSDT")["positionAmt"]))
+
+    client.account_state.add_fill_listener(on_fill)
+    live_after_resync = asyncio.run(run(client, stream))
+
+    assert observed == [(True, 0.01)]
+    assert fills[0]["qty"] == 0.01 and fills[0]["realizedPnl"] == 1.0
+    # listenKeyExpired → 재발급/재연결 후 스냅샷 재동기화 (포지션 청산 상태, 잔고 1001)
+    assert paths[:2] == ["/ws/key1", "/ws/key2"]
+    assert live_after_resync and stream.resync_count == 2
+    assert client.account_state.position("BTCUSDT") is None
+    assert client.account_state.account_info()["totalWalletBalance"] == 1001
+    assert any(c.startswith("keepalive:") for c in client.calls)
+    assert client.calls[-1] == "close:key2"
+    assert not client.account_state.is_live()
+
+
+def test_live_state_replaces_position_and_account_polling():
+    state = AccountState()
+    state.apply_snapshot(account_snapshot(0.02, 1000, 100))
+    state.set_live(True)
+
+    orders = []
+
+    class Client:
+        account_state = state
+        mark_prices = None
+
+        def get_all_positions(self):
+            raise AssertionError("positionRisk 호출 없음")
+
+        def get_account_info(self):
+            raise AssertionError("account 호출 없음")
+
+        def _send_signed_request(self, method, path, params=None, **kwargs):
+            orders.append(params)
+            return {"orderId": 1}
+
+    client = Client()
+    client.get_open_position = lambda symbol: BinanceClient.get_open_position(client, symbol)
+    assert BinanceClient.close_position_market(client, "BTCUSDT") == {"orderId": 1}
+    assert orders[0]["side"] == "SELL" and orders[0]["quantity"] == 0.02
+
+    manager = AccountManager(binance_client=client, funds_allocation_manager=object())
+    assert manager.update_account_info()
+    assert manager.total_wallet_balance == 1000
+
+
+def test_engine_close_path_uses_shared_user_data_stream(tmp_path, monkeypatch):
+    from backend.core.engine_manager import EngineManager
+    from backend.core.new_strategy import market_data_hub
+
+    # 엔진 로그/DB는 tmp_path로, 프로세스 전역 MarketDataHub는 테스트 후 복원
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(market_data_hub, "_hub_instance", None)
+
+    async def handler(ws, *args):
+        await ws.send(json.dumps(account_update(0.02, 1000, 200)))
+        await ws.wait_closed()
+
+    async def run(client, stream, manager):
+        server = await websockets.serve(handler, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        stream.base_url = f"ws://127.0.0.1:{port}/ws"
+        await stream.start()
+        for _ in range(100):
+            position = client.account_state.position("BTCUSDT")
+            if position and position["positionAmt"] == 0.02:
+                break
+            await asyncio.sleep(0.02)
+        # 스트림 연결 중에 엔진 주문 경로(ExecutionAdapter) 실행
+        result = await asyncio.to_thread(manager.engines["Alpha"].orchestrator.exec.close_market_long, "BTCUSDT")
+        await stream.stop()
+        server.close()
+        await server.wait_closed()
+        return result
+
+    # YonaService와 같은 배선: 서비스 스트림이 채우는 계좌 상태를 가진 클라이언트를 엔진에 주입
+    client = FakeUserClient()
+    orders = []
+
+    def get_all_positions():
+        raise AssertionError("positionRisk 호출 없음")
+
+    def send_signed(method, path, params=None, **kwargs):
+        orders.append(params)
+        return {"orderId": 9, "symbol": "BTCUSDT", "side": "SELL", "status": "FILLED",
+                "executedQty": str(params["quantity"]), "avgPrice": "50100"}
+
+    client.get_all_positions = get_all_positions
+    client._send_signed_request = send_signed
+    client.get_open_position = lambda symbol: BinanceClient.get_open_position(client, symbol)
+    client.close_position_market = lambda symbol, side=None: BinanceClient.close_position_market(client, symbol, side)
+    stream = UserDataStream(client, "ws://unused")
+    manager = EngineManager(db_path=str(tmp_path / "engines.db"), binance_client=client)
+    try:
+        result = asyncio.run(run(client, stream, manager))
+    finally:
+        manager.shutdown()
+
+    assert manager.engines["Alpha"].orchestrator.exec.client is client
+    assert result.ok
+    assert orders == [{"symbol": "BTCUSDT", "side": "SELL", "type": "MARKET", "quantity": 0.02,
+                       "reduceOnly": True, "newOrderRespType": "FULL"}]